@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import psutil
+
+# Fallback history when neither a prior bundle manifest nor a date range is
+# known: ten years of daily bars.
+DEFAULT_ESTIMATE_BARS = 2520
+# Resident bytes per (bar, asset) for the bundle frames and derived features.
+_BUNDLE_BYTES_PER_BAR_ASSET = 96
+# Resident bytes per bar for one in-flight candidate, plus per held asset.
+_CANDIDATE_BYTES_PER_BAR = 48
+_CANDIDATE_BYTES_PER_BAR_ASSET = 16
+# Fixed working set of a job: loaders, payload builders, the engine service.
+_JOB_BASE_MEMORY_BYTES = 256 << 20
+_MINUTES_PER_SESSION_DAY = {"24x7": 1440, "regular": 390}
+_SESSION_DAYS_PER_YEAR = {"24x7": 365.0, "regular": 252.0}
+_BAR_UNIT_MINUTES = {"second": 1 / 60, "minute": 1, "hour": 60}
+_SESSION_DAYS_PER_BAR_UNIT = {"day": 1.0, "week": 5.0, "month": 21.0}
+_DEFAULT_CPU_ADMIT_PERCENT = 90.0
+_DEFAULT_MEMORY_BUDGET_FRACTION = 0.8
+_SAMPLE_TTL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class JobEstimate:
+    """Expected cost of one Run Center job.
+
+    ``work_units`` is bar-asset evaluations summed over candidates and
+    windows; ``peak_memory_bytes`` is the resident set the job is expected to
+    add while it runs.  ``source`` says whether bars and assets came from a
+    previous run's bundle manifest or from the config alone.
+    """
+
+    bars: int
+    assets: int
+    candidates: int
+    windows: int
+    work_units: int
+    peak_memory_bytes: int
+    source: str
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def estimate_job(
+    *,
+    bars: int,
+    assets: int,
+    candidates: int,
+    windows: int = 1,
+    window_bar_fraction: float = 1.0,
+    source: str = "config",
+) -> JobEstimate:
+    """Work units and peak memory for ``candidates`` runs over ``windows`` windows.
+
+    Each window sees ``window_bar_fraction`` of the bars.  Candidates run on
+    at most one thread per core, so only that many timelines are resident at
+    once next to the shared bundle.
+    """
+    bars = max(1, int(bars))
+    assets = max(1, int(assets))
+    candidates = max(1, int(candidates))
+    windows = max(1, int(windows))
+    window_bars = max(1, int(round(bars * min(1.0, max(0.0, float(window_bar_fraction))))))
+    in_flight = min(candidates, os.cpu_count() or 4)
+    peak_memory = (
+        _JOB_BASE_MEMORY_BYTES
+        + bars * assets * _BUNDLE_BYTES_PER_BAR_ASSET
+        + in_flight
+        * window_bars
+        * (_CANDIDATE_BYTES_PER_BAR + assets * _CANDIDATE_BYTES_PER_BAR_ASSET)
+    )
+    return JobEstimate(
+        bars=bars,
+        assets=assets,
+        candidates=candidates,
+        windows=windows,
+        work_units=window_bars * assets * candidates * windows,
+        peak_memory_bytes=int(peak_memory),
+        source=source,
+    )
+
+
+def estimate_bars_from_data_config(data: Dict[str, Any], *, now: Optional[datetime] = None) -> int:
+    """Bar count implied by a strategy config's date range and execution bar spec."""
+    start = _parse_datetime(data.get("start_date"))
+    if start is None:
+        return DEFAULT_ESTIMATE_BARS
+    end = _parse_datetime(data.get("end_date")) or now or datetime.now(timezone.utc)
+    span_days = max(0.0, (end - start).total_seconds() / 86400.0)
+    bar_time = data.get("bar_time") if isinstance(data.get("bar_time"), dict) else {}
+    session_model = (
+        bar_time.get("session_model") if isinstance(bar_time.get("session_model"), dict) else {}
+    )
+    session_scope = "24x7" if str(session_model.get("session_scope") or "") == "24x7" else "regular"
+    session_days = span_days * _SESSION_DAYS_PER_YEAR[session_scope] / 365.0
+    unit, step = _execution_bar_unit(data, bar_time)
+    unit_minutes = _BAR_UNIT_MINUTES.get(unit)
+    if unit_minutes is not None:
+        bars = session_days * _MINUTES_PER_SESSION_DAY[session_scope] / (unit_minutes * step)
+    else:
+        bars = session_days / (_SESSION_DAYS_PER_BAR_UNIT.get(unit, 1.0) * step)
+    return max(1, int(bars))
+
+
+def _execution_bar_unit(data: Dict[str, Any], bar_time: Dict[str, Any]) -> tuple[str, int]:
+    binding = data.get("stream_binding") if isinstance(data.get("stream_binding"), dict) else {}
+    execution_id = str(binding.get("execution_stream_id") or "")
+    streams = [item for item in bar_time.get("streams") or [] if isinstance(item, dict)]
+    stream = next(
+        (item for item in streams if str(item.get("stream_id") or "") == execution_id),
+        next((item for item in streams if item.get("role") == "execution"), {}),
+    )
+    bar_spec = stream.get("bar_spec") if isinstance(stream.get("bar_spec"), dict) else {}
+    unit = str(bar_spec.get("unit") or "day").strip().lower()
+    try:
+        step = max(1, int(bar_spec.get("step") or 1))
+    except (TypeError, ValueError):
+        step = 1
+    return unit, step
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass(frozen=True)
+class HostHeadroom:
+    cpu_percent: float
+    available_bytes: int
+    rss_bytes: int
+
+
+class HostHeadroomProbe:
+    """Cached live CPU and memory readings for scheduler admission.
+
+    ``rss_bytes`` covers this process and its children, so persistent Rust
+    engine services count against the budget.  Readings are reused for
+    ``_SAMPLE_TTL_SECONDS`` because the dispatcher asks on every pass.
+
+    ``LO2CIN4BT_APP_CPU_ADMIT_PERCENT`` (default 90, ``0`` disables) is the
+    system CPU load above which no further job is admitted while others run.
+    ``LO2CIN4BT_APP_MEMORY_BUDGET_BYTES`` caps the app's resident memory
+    (default 80% of physical memory).
+    """
+
+    def __init__(self) -> None:
+        self.cpu_admit_percent = _env_float(
+            "LO2CIN4BT_APP_CPU_ADMIT_PERCENT", _DEFAULT_CPU_ADMIT_PERCENT
+        )
+        total = int(psutil.virtual_memory().total)
+        budget = int(_env_float("LO2CIN4BT_APP_MEMORY_BUDGET_BYTES", 0.0))
+        self.memory_budget_bytes = budget if budget > 0 else int(total * _DEFAULT_MEMORY_BUDGET_FRACTION)
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+        self._sample: Optional[HostHeadroom] = None
+        self._sampled_at = 0.0
+        psutil.cpu_percent(interval=None)
+
+    def sample(self) -> HostHeadroom:
+        with self._lock:
+            now = time.monotonic()
+            if self._sample is None or now - self._sampled_at >= _SAMPLE_TTL_SECONDS:
+                self._sample = HostHeadroom(
+                    cpu_percent=float(psutil.cpu_percent(interval=None)),
+                    available_bytes=int(psutil.virtual_memory().available),
+                    rss_bytes=self._tree_rss_bytes(),
+                )
+                self._sampled_at = now
+            return self._sample
+
+    def cpu_saturated(self, sample: HostHeadroom) -> bool:
+        return self.cpu_admit_percent > 0 and sample.cpu_percent >= self.cpu_admit_percent
+
+    def _tree_rss_bytes(self) -> int:
+        total = 0
+        try:
+            processes = [self._process, *self._process.children(recursive=True)]
+        except psutil.Error:
+            processes = [self._process]
+        for process in processes:
+            try:
+                total += int(process.memory_info().rss)
+            except psutil.Error:
+                continue
+        return total
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "")).strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import io
+import json
 import mimetypes
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List
 
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
@@ -132,21 +133,85 @@ def create_app(repo_root: Path) -> FastAPI:
         except KeyError as exc:
             raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}") from exc
 
+    @app.get("/api/app/batches/{batch_id}/events")
+    async def batch_events(
+        batch_id: str,
+        request: Request,
+        since: int = Query(0, ge=0),
+    ) -> StreamingResponse:
+        cursor = since
+        last_event_id = request.headers.get("last-event-id", "").strip()
+        if last_event_id.isdigit():
+            cursor = int(last_event_id) + 1
+        if service.scheduler.wait_for_events(batch_id, cursor, 0.0) is None:
+            raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}")
+
+        async def stream():
+            nonlocal cursor
+            while not await request.is_disconnected():
+                polled = await asyncio.to_thread(
+                    service.scheduler.wait_for_events, batch_id, cursor, 15.0
+                )
+                if polled is None:
+                    return
+                events, finished = polled
+                if not events and not finished:
+                    yield ": keepalive\n\n"
+                for event in events:
+                    yield f"id: {event['seq']}\ndata: {json.dumps(event, default=str)}\n\n"
+                    cursor = int(event["seq"]) + 1
+                if finished:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"X-Accel-Buffering": "no"},
+        )
+
     @app.websocket("/api/app/batches/{batch_id}/stream")
     async def batch_stream(websocket: WebSocket, batch_id: str) -> None:
         await websocket.accept()
         cursor = 0
         try:
             while True:
-                events = service.scheduler.get_events_since(batch_id, cursor)
-                if events:
-                    for event in events:
-                        await websocket.send_json(event)
-                    cursor += len(events)
-                await asyncio.sleep(0.35)
+                polled = await asyncio.to_thread(
+                    service.scheduler.wait_for_events, batch_id, cursor, 15.0
+                )
+                if polled is None:
+                    await websocket.close()
+                    return
+                events, finished = polled
+                for event in events:
+                    await websocket.send_json(event)
+                    cursor = int(event["seq"]) + 1
+                if finished:
+                    await websocket.close()
+                    return
         except WebSocketDisconnect:
             return
 
+    @app.get("/api/app/runs")
+    def query_runs(
+        module: str | None = None,
+        status: str | None = None,
+        run_type: str | None = None,
+        created_after: str | None = None,
+        created_before: str | None = None,
+        limit: int = Query(100, ge=1, le=1000),
+        offset: int = Query(0, ge=0),
+    ) -> Dict[str, Any]:
+        return service.query_runs(
+            module=module,
+            status=status,
+            run_type=run_type,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            offset=offset,
+        )
+
     @app.get("/api/app/metrics/runs")
     def metrics_runs() -> List[Dict[str, Any]]:
         return service.metrics_runs()
@@ -176,9 +241,21 @@ def create_app(repo_root: Path) -> FastAPI:
         return service.stat_runs()
 
     @app.get("/api/app/metrics/{run_id}/overview", response_model=None)
-    def metrics_overview(run_id: str):
+    def metrics_overview(
+        run_id: str,
+        max_points: int | None = Query(None, ge=3),
+        x_start: str | None = None,
+        x_end: str | None = None,
+    ):
         try:
-            return JSONResponse(service.metrics_overview(run_id))
+            return JSONResponse(
+                service.metrics_overview(
+                    run_id,
+                    max_points=max_points,
+                    x_start=x_start,
+                    x_end=x_end,
+                )
+            )
         except FileNotFoundError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -11,7 +11,7 @@ from typing import Any, Dict, Optional
 import pandas as pd
 
 from app.runtime.registry import AppRegistry
-from .shared_chart_series import SharedChartSeriesStore
+from .shared_chart_series import SharedChartSeriesStore, select_series_window
 from .time_context import strategy_time_summary
 from backtester.EngineRequest_backtester import validate_canonical_candidate_id
 from backtester.StrategyRunConfig_backtester import normalize_strategy_run_config
@@ -99,7 +99,9 @@ class MetricsContractPayloadService:
                 f"metrics overview PlotBundle index not found for run {run_id}"
             )
         plot_index = self._read_json(plot_path, {})
-        plot_bundle = self.shared_series.materialize_plot_bundle(run_id, plot_index)
+        plot_bundle = self.shared_series.materialize_plot_bundle(
+            run_id, plot_index, include_lod=True
+        )
         self._validate_plot_bundle(plot_bundle)
         canonical_path = self._validated_canonical_source(plot_bundle)
         metadata_path = self._artifact_path(run_id, "metricstracker_metadata")
@@ -172,6 +174,8 @@ class MetricsContractPayloadService:
                 "x": list(item["x"]),
                 "y": list(item["y"]),
             }
+            if item.get("lod"):
+                projected["lod"] = list(item["lod"])
             if projected["backtest_id"] == "benchmark":
                 benchmark_series = {
                     "series_id": "benchmark",
@@ -179,6 +183,8 @@ class MetricsContractPayloadService:
                     "x": projected["x"],
                     "y": projected["y"],
                 }
+                if "lod" in projected:
+                    benchmark_series["lod"] = projected["lod"]
             else:
                 series.append(projected)
         series_by_id = {
@@ -265,12 +271,30 @@ class MetricsContractPayloadService:
         )
         return output_path
 
-    def load(self, run_id: str, *, force: bool = False) -> Dict[str, Any]:
+    def load(
+        self,
+        run_id: str,
+        *,
+        force: bool = False,
+        max_points: Optional[int] = None,
+        x_start: Optional[str] = None,
+        x_end: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Materialized overview; series are cut to the requested window and point budget."""
         path = self.ensure(run_id, force=force)
-        return self.shared_series.materialize_metrics_overview(
+        payload = self.shared_series.materialize_metrics_overview(
             run_id,
             self._read_json(path, {}),
         )
+        window = {"max_points": max_points, "x_start": x_start, "x_end": x_end}
+        payload["series"] = [
+            select_series_window(item, **window) for item in payload.get("series") or []
+        ]
+        if isinstance(payload.get("benchmark_series"), dict):
+            payload["benchmark_series"] = select_series_window(
+                payload["benchmark_series"], **window
+            )
+        return payload
 
     def _portfolio_runs(
         self,
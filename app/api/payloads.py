@@ -496,25 +496,6 @@ class AppPayloadService:
             return None
         return value
 
-    def _downsample_xy(
-        self,
-        x_values: List[Any],
-        y_values: List[Any],
-        *,
-        max_points: int,
-    ) -> tuple[List[Any], List[Any]]:
-        if len(x_values) <= max_points or len(y_values) <= max_points:
-            return x_values, y_values
-        if max_points <= 2:
-            return [x_values[0], x_values[-1]], [y_values[0], y_values[-1]]
-        stride = max(1, len(x_values) // (max_points - 1))
-        sampled_x = x_values[::stride]
-        sampled_y = y_values[::stride]
-        if sampled_x[-1] != x_values[-1]:
-            sampled_x.append(x_values[-1])
-            sampled_y.append(y_values[-1])
-        return sampled_x, sampled_y
-
     def ensure_parameter_matrix_payload(
         self,
         run_id: str,
@@ -992,67 +973,88 @@ class AppPayloadService:
     ) -> Dict[str, List[Dict[str, Any]]]:
         if trades_df.empty or "Asset" not in trades_df.columns:
             return {}
-        open_frame = self._normalized_market_frame(market_frames.get("open"))
-        high_frame = self._normalized_market_frame(market_frames.get("high"))
-        low_frame = self._normalized_market_frame(market_frames.get("low"))
-        close_frame = self._normalized_market_frame(market_frames.get("close"))
+        close_frame = self._normalized_market_frame(market_frames.get("close"), "last")
         if close_frame is None:
             return {}
+        # A missing open/high/low table is derived from the close prices,
+        # aggregated per date the same way the table itself would be.
+        daily: List[Optional[pd.DataFrame]] = []
+        for field, how in (("open", "first"), ("high", "max"), ("low", "min")):
+            frame = self._normalized_market_frame(market_frames.get(field), how)
+            if frame is None:
+                frame = self._normalized_market_frame(market_frames.get("close"), how)
+            daily.append(frame)
+        open_frame, high_frame, low_frame = daily
         assets = [
             asset
             for asset in trades_df["Asset"].dropna().astype(str).str.strip().unique().tolist()
             if asset
         ]
+        index = close_frame.index
+        times: Optional[List[Optional[str]]] = None
         output: Dict[str, List[Dict[str, Any]]] = {}
         for asset in assets:
             if asset not in close_frame.columns and len(close_frame.columns) != 1:
                 continue
-            series_rows: List[Dict[str, Any]] = []
-            for timestamp in close_frame.index:
-                open_source = open_frame if open_frame is not None else close_frame
-                high_source = high_frame if high_frame is not None else close_frame
-                low_source = low_frame if low_frame is not None else close_frame
-                row = {
-                    "time": self._to_iso(timestamp),
-                    "open": self._market_price_at(open_source, timestamp, asset),
-                    "high": self._market_price_at(high_source, timestamp, asset),
-                    "low": self._market_price_at(low_source, timestamp, asset),
-                    "close": self._market_price_at(close_frame, timestamp, asset),
-                }
-                if row["close"] is not None:
-                    series_rows.append(row)
-            if series_rows:
-                output[asset] = series_rows
+            close_values = self._market_price_column(close_frame, index, asset)
+            keep = np.flatnonzero(np.isfinite(close_values))
+            if keep.size == 0:
+                continue
+            if times is None:
+                times = [self._to_iso(timestamp) for timestamp in index]
+            columns = [
+                self._market_price_column(
+                    source if source is not None else close_frame, index, asset
+                )[keep]
+                for source in (open_frame, high_frame, low_frame)
+            ]
+            columns.append(close_values[keep])
+            opens, highs, lows, closes = (
+                [value if math.isfinite(value) else None for value in column.tolist()]
+                for column in columns
+            )
+            output[asset] = [
+                {"time": times[position], "open": open_, "high": high, "low": low, "close": close}
+                for position, open_, high, low, close in zip(
+                    keep.tolist(), opens, highs, lows, closes
+                )
+            ]
         return output
 
     @staticmethod
-    def _normalized_market_frame(frame: Any) -> Optional[pd.DataFrame]:
+    def _normalized_market_frame(frame: Any, how: str) -> Optional[pd.DataFrame]:
+        """Prices keyed by calendar date, one row per date.
+
+        Intraday bars on the same date are folded into a daily value with
+        ``how`` (``"first"`` for opens, ``"max"``/``"min"`` for highs and lows,
+        ``"last"`` for closes), so the chart timeline shows each date once.
+        """
         if not isinstance(frame, pd.DataFrame) or frame.empty:
             return None
         normalized = frame.copy()
         normalized.index = pd.to_datetime(normalized.index, errors="coerce").normalize()
         normalized = normalized[~normalized.index.isna()].sort_index()
-        return normalized.apply(pd.to_numeric, errors="coerce")
+        normalized = normalized.apply(pd.to_numeric, errors="coerce")
+        if normalized.index.has_duplicates:
+            normalized = normalized.groupby(level=0).agg(how)
+        return normalized
 
-    def _market_price_at(
-        self,
-        frame: Optional[pd.DataFrame],
-        raw_time: Any,
-        asset: str,
-    ) -> Optional[float]:
-        if frame is None or not asset:
-            return None
-        timestamp = pd.to_datetime(raw_time, errors="coerce")
-        if pd.isna(timestamp):
-            return None
-        date_key = pd.Timestamp(timestamp).normalize()
-        if date_key not in frame.index:
-            return None
+    @staticmethod
+    def _market_price_column(frame: pd.DataFrame, index: pd.Index, asset: str) -> np.ndarray:
+        """One asset's prices aligned to ``index``; NaN where the frame has none.
+
+        A single-column frame stands in for any asset, matching how single
+        asset runs store their prices.
+        """
         if asset in frame.columns:
-            return self._finite_or_none(frame.at[date_key, asset])
-        if len(frame.columns) == 1:
-            return self._finite_or_none(frame.iloc[frame.index.get_loc(date_key), 0])
-        return None
+            series = frame[asset]
+        elif len(frame.columns) == 1:
+            series = frame.iloc[:, 0]
+        else:
+            return np.full(len(index), np.nan)
+        if isinstance(series, pd.DataFrame):
+            series = series.iloc[:, 0]
+        return series.reindex(index).to_numpy(dtype=float)
 
     def _portfolio_allocation_change_events(self, trades_df: pd.DataFrame) -> pd.DataFrame:
         if trades_df.empty:
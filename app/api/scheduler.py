@@ -4,14 +4,23 @@ import json
 import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from app.runtime.batch_journal import BatchJournal
 from app.runtime.registry import AppRegistry
 from app.runtime.module_identity import VALIDATION_WORKFLOW_CANONICAL
 from app.runtime.runtime import AppRuntimeService
 
+from .admission import (
+    HostHeadroomProbe,
+    JobEstimate,
+    estimate_bars_from_data_config,
+    estimate_job,
+)
 from .labels import load_app_config_metadata
 from .payloads import AppPayloadService
 
@@ -26,6 +35,17 @@ _CANCEL_GRACE_SECONDS = max(
     1,
     int(str(os.getenv("LO2CIN4BT_APP_CANCEL_GRACE_SECONDS", "5")).strip() or "5"),
 )
+# Events kept in memory per batch; older events are read back from the journal.
+_EVENT_RING_SIZE = 500
+# Finished batches kept in the journal (and reloaded) across restarts.
+_JOURNAL_BATCH_LIMIT = 200
+# Journaled events kept per batch; a chatty job drops its oldest log lines.
+_JOURNAL_EVENT_LIMIT = 5000
+# job_log events are journaled together at most this often.
+_LOG_FLUSH_SECONDS = 1.0
+_INTERRUPTED_MESSAGE = "Interrupted because the app process stopped before this job completed."
+# Recent runs searched for a bundle manifest matching a submitted config.
+_ESTIMATE_RUN_LOOKBACK = 200
 CONFIG_ROOTS = {
     "autorunner": ("workspace", "runs"),
     "wfa": ("workspace", "wfa"),
@@ -42,6 +62,42 @@ class BatchCancellationRequested(RuntimeError):
 
 
 class AppBatchScheduler:
+    """Weighted job scheduler for Run Center batches.
+
+    Each job gets a ``JobEstimate`` at submit time: bars and assets come from
+    the bundle manifest of the newest finished run of the same config (or the
+    config's date range and bar spec when there is none), multiplied out over
+    candidates and WFA windows.  A job is admitted when its weight fits the
+    free lanes, its estimated peak memory fits the memory budget next to the
+    running jobs, and host CPU is not saturated.  The first job always runs,
+    however large, so an oversized estimate can delay a job but never strand
+    it.  Lighter, cheaper jobs dispatch first.  A heavy job, or any job the
+    host has refused for CPU or memory, that has waited
+    ``_HEAVY_JOB_RESERVATION_SECONDS`` reserves the next admission: lighter
+    jobs are held back until it fits, so a stream of small jobs cannot
+    starve it.
+
+    Capacity is ``cpu_count // 2`` lanes (at least enough for one WFA job).
+    Lanes bound how many jobs run at once, not CPU threads: a Rust batch
+    request spreads its candidates over the engine's own thread budget, so
+    concurrent heavy jobs contend for the same cores.  The live CPU check
+    (``LO2CIN4BT_APP_CPU_ADMIT_PERCENT``) is what holds further jobs back
+    once those cores are saturated.
+
+    Batch and job state is journaled to SQLite: each event writes the batch
+    state row, the job it names (every job for batch-level events) and the
+    event itself.  ``job_log`` events are coalesced and written at most every
+    ``_LOG_FLUSH_SECONDS``, by the next event or by the job heartbeat.  On
+    start the scheduler reloads recent batches: queued jobs go back into the
+    queue, and jobs that were running when the previous process stopped are
+    failed as interrupted.  Each batch keeps a bounded ring of events with
+    contiguous ``seq`` numbers; readers that fall behind the ring are served
+    from the journal, and ``wait_for_events`` lets streaming endpoints block
+    for new events instead of polling.  The journal keeps at most
+    ``_JOURNAL_EVENT_LIMIT`` events per batch, and old finished batches are
+    pruned whenever a batch finishes.
+    """
+
     def __init__(
         self,
         runtime: AppRuntimeService,
@@ -54,15 +110,24 @@ class AppBatchScheduler:
         self.registry = registry
         self.payloads = payloads
         self.server_session_id = str(server_session_id)
-        self.capacity = min(
-            4,
-            max(_MIN_SCHEDULER_CAPACITY, (os.cpu_count() or 4) // 2),
-        )
+        self.capacity = max(_MIN_SCHEDULER_CAPACITY, (os.cpu_count() or 4) // 2)
+        self.host_probe = HostHeadroomProbe()
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
         self._active_weight = 0
+        self._reserved_memory_bytes = 0
         self._batches: Dict[str, Dict[str, Any]] = {}
         self._pending: List[Dict[str, str]] = []
+        # Queued jobs the host has refused for CPU or memory; they age into
+        # the reservation like heavy jobs.
+        self._admission_refused: set[str] = set()
+        self._journal_backlog: Dict[str, Dict[str, Any]] = {}
+        self._journal_flushed_at: Dict[str, float] = {}
+        self.journal = BatchJournal(
+            registry.app_paths["batch_journal"],
+            event_limit=_JOURNAL_EVENT_LIMIT,
+        )
+        self._restore_batches()
         self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
         self._dispatcher.start()
 
@@ -73,7 +138,8 @@ class AppBatchScheduler:
         for index, config_path in enumerate(config_paths):
             job_module, resolved_config_path = self._resolve_job_config(module, config_path)
             metadata = load_app_config_metadata(str(resolved_config_path), job_module)
-            weight = self._job_weight(job_module, resolved_config_path)
+            estimate = self._job_estimate(job_module, resolved_config_path)
+            weight = self._job_weight(job_module, resolved_config_path, estimate=estimate)
             jobs.append(
                 {
                     "job_id": f"{batch_id}_{index + 1:02d}",
@@ -83,6 +149,7 @@ class AppBatchScheduler:
                     "display_label": metadata.get("display_label"),
                     "label_badges": list(metadata.get("badges", [])),
                     "weight": weight,
+                    "estimate": estimate.to_payload(),
                     "status": "queued",
                     "stage": "queued",
                     "stage_message": self._queue_message(job_module, weight),
@@ -101,7 +168,7 @@ class AppBatchScheduler:
                     "result_refs": {},
                 }
             )
-        batch = {
+        batch: Dict[str, Any] = {
             "batch_id": batch_id,
             "module": module,
             "status": "queued",
@@ -109,7 +176,8 @@ class AppBatchScheduler:
             "updated_at": created_at,
             "completed_at": None,
             "jobs": jobs,
-            "events": [],
+            "events": deque(maxlen=_EVENT_RING_SIZE),
+            "next_event_seq": 0,
         }
         with self._condition:
             self._batches[batch_id] = batch
@@ -139,11 +207,57 @@ class AppBatchScheduler:
             return self._public_batch(batch, include_events=True)
 
     def get_events_since(self, batch_id: str, offset: int) -> List[Dict[str, Any]]:
+        """Events whose ``seq`` is at least ``offset``, in order."""
         with self._lock:
             batch = self._batches.get(batch_id)
             if batch is None:
                 return []
-            return batch["events"][offset:]
+            return self._events_since_locked(batch, offset)
+
+    def wait_for_events(
+        self,
+        batch_id: str,
+        offset: int,
+        timeout: float,
+    ) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """Block until events from ``offset`` exist or ``timeout`` elapses.
+
+        Returns ``(events, finished)``, where ``finished`` means the batch is
+        done and ``events`` reaches its last event, or ``None`` for an unknown
+        batch.
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._condition:
+            while True:
+                batch = self._batches.get(batch_id)
+                if batch is None:
+                    return None
+                events = self._events_since_locked(batch, offset)
+                finished = batch["status"] not in {"queued", "running"}
+                if events or finished:
+                    return events, finished
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return [], False
+                self._condition.wait(remaining)
+
+    def _events_since_locked(self, batch: Dict[str, Any], offset: int) -> List[Dict[str, Any]]:
+        ring = batch["events"]
+        cursor = max(0, int(offset))
+        if not ring or cursor >= int(batch["next_event_seq"]):
+            return []
+        first_seq = int(ring[0]["seq"])
+        if cursor >= first_seq:
+            return list(islice(ring, cursor - first_seq, None))
+        if batch["batch_id"] in self._journal_backlog:
+            self._flush_journal_locked(batch["batch_id"])
+        spilled = self.journal.events_since(
+            batch["batch_id"],
+            cursor,
+            limit=first_seq - cursor,
+            before=first_seq,
+        )
+        return spilled + list(ring)
 
     def cancel_batch(self, batch_id: str) -> Dict[str, Any]:
         with self._condition:
@@ -180,6 +294,7 @@ class AppBatchScheduler:
                     cancel_requested_jobs += 1
 
             self._pending = [ref for ref in self._pending if ref["batch_id"] != batch_id]
+            self._admission_refused.difference_update(str(job["job_id"]) for job in batch["jobs"])
             self._append_event(
                 batch_id,
                 "batch_cancel_requested",
@@ -218,7 +333,9 @@ class AppBatchScheduler:
                 if job is None:
                     continue
                 self._pending = [ref for ref in self._pending if ref != next_ref]
+                self._admission_refused.discard(str(job["job_id"]))
                 self._active_weight += int(job["weight"])
+                self._reserved_memory_bytes += self._job_peak_memory(job)
                 now = self._now_iso()
                 job["status"] = "running"
                 job["stage"] = "starting"
@@ -264,6 +381,8 @@ class AppBatchScheduler:
                     batch = self._batches.get(batch_id)
                     if batch is not None:
                         batch["updated_at"] = now
+                    if batch_id in self._journal_backlog:
+                        self._flush_journal_locked(batch_id)
 
         def emit(stage: str, message: str) -> None:
             with self._lock:
@@ -407,6 +526,9 @@ class AppBatchScheduler:
             heartbeat_stop.set()
             with self._condition:
                 self._active_weight = max(0, self._active_weight - int(job["weight"]))
+                self._reserved_memory_bytes = max(
+                    0, self._reserved_memory_bytes - self._job_peak_memory(job)
+                )
                 self._refresh_batch_status(batch_id)
                 self._condition.notify_all()
 
@@ -420,6 +542,7 @@ class AppBatchScheduler:
                 "running" if any(status == "running" for status in statuses) else "queued"
             )
             batch["updated_at"] = self._now_iso()
+            self._flush_journal_locked(batch_id)
             return
         has_completed = any(status == "completed" for status in statuses)
         has_partial = any(status == "partial" for status in statuses)
@@ -441,6 +564,8 @@ class AppBatchScheduler:
             batch["completed_at"] = self._now_iso()
         batch["updated_at"] = batch["completed_at"]
         self._append_event(batch_id, "batch_status", {"status": batch["status"]})
+        self._journal_flushed_at.pop(batch_id, None)
+        self.journal.prune(keep=_JOURNAL_BATCH_LIMIT)
 
     def _force_finalize_stale_cancellations_locked(self) -> None:
         now = self._now_iso()
@@ -516,10 +641,12 @@ class AppBatchScheduler:
         return f"Canceled after stop request timeout ({_CANCEL_GRACE_SECONDS}s)"
 
     def _next_schedulable_job_ref(self) -> Optional[Dict[str, str]]:
-        aged_heavy: List[tuple[float, Dict[str, str], Dict[str, Any]]] = []
+        aged: List[tuple[float, Dict[str, str], Dict[str, Any]]] = []
         for ref in self._pending:
             job = self._locate_job(ref["batch_id"], ref["job_id"])
-            if job is None or not self._is_heavy_job(job):
+            if job is None:
+                continue
+            if not self._is_heavy_job(job) and str(job["job_id"]) not in self._admission_refused:
                 continue
             queued_value = job.get("queued_monotonic")
             queued_monotonic = (
@@ -532,25 +659,79 @@ class AppBatchScheduler:
                 time.monotonic() - queued_monotonic,
             )
             if wait_seconds >= _HEAVY_JOB_RESERVATION_SECONDS:
-                aged_heavy.append((queued_monotonic, ref, job))
-        if aged_heavy:
-            _, reserved_ref, reserved_job = min(aged_heavy, key=lambda item: item[0])
+                aged.append((queued_monotonic, ref, job))
+        if aged:
+            _, reserved_ref, reserved_job = min(aged, key=lambda item: item[0])
             if self._active_weight + int(reserved_job["weight"]) <= self.capacity:
-                return reserved_ref
-            # Stop admitting new light jobs until the reserved heavy job fits.
+                if self._host_admits(reserved_ref, reserved_job):
+                    return reserved_ref
+            # Stop admitting new light jobs until the reserved job fits.
             return None
 
-        schedulable: List[tuple[tuple[Any, ...], Dict[str, str]]] = []
+        schedulable: List[tuple[tuple[Any, ...], Dict[str, str], Dict[str, Any]]] = []
         for index, ref in enumerate(self._pending):
             job = self._locate_job(ref["batch_id"], ref["job_id"])
             if job is None:
                 continue
             if self._active_weight + int(job["weight"]) <= self.capacity:
-                schedulable.append((self._job_dispatch_priority(job, pending_index=index), ref))
-        if not schedulable:
-            return None
+                schedulable.append(
+                    (self._job_dispatch_priority(job, pending_index=index), ref, job)
+                )
         schedulable.sort(key=lambda item: item[0])
-        return schedulable[0][1]
+        for _, ref, job in schedulable:
+            if self._host_admits(ref, job):
+                return ref
+        return None
+
+    def _host_admits(self, ref: Dict[str, str], job: Dict[str, Any]) -> bool:
+        """Live CPU and memory admission for a job whose lanes already fit."""
+        if self._active_weight <= 0:
+            return True
+        sample = self.host_probe.sample()
+        if self.host_probe.cpu_saturated(sample):
+            self._mark_admission_wait(
+                ref,
+                job,
+                f"Queued: host CPU is {sample.cpu_percent:.0f}% busy; waiting for headroom.",
+            )
+            return False
+        # Running jobs may not have reached their peak yet, so count whichever
+        # is larger: what they reserved or what the process tree holds now.
+        committed = max(sample.rss_bytes, self._reserved_memory_bytes)
+        limit = min(
+            self.host_probe.memory_budget_bytes,
+            sample.rss_bytes + sample.available_bytes,
+        )
+        needed = self._job_peak_memory(job)
+        if committed + needed > limit:
+            self._mark_admission_wait(
+                ref,
+                job,
+                f"Queued: needs about {needed >> 20} MiB; "
+                f"{max(0, limit - committed) >> 20} MiB of memory headroom is free.",
+            )
+            return False
+        return True
+
+    def _mark_admission_wait(self, ref: Dict[str, str], job: Dict[str, Any], message: str) -> None:
+        if job.get("status") != "queued":
+            return
+        self._admission_refused.add(str(job["job_id"]))
+        if job.get("stage_message") == message:
+            return
+        job["stage_message"] = message
+        self._mark_journal_dirty(ref["batch_id"], job["job_id"])
+        self._flush_journal_locked(ref["batch_id"])
+
+    @staticmethod
+    def _job_peak_memory(job: Dict[str, Any]) -> int:
+        estimate = job.get("estimate")
+        if not isinstance(estimate, dict):
+            return 0
+        try:
+            return max(0, int(estimate.get("peak_memory_bytes") or 0))
+        except (TypeError, ValueError):
+            return 0
 
     def _locate_job(self, batch_id: str, job_id: str) -> Optional[Dict[str, Any]]:
         batch = self._batches.get(batch_id)
@@ -565,15 +746,98 @@ class AppBatchScheduler:
         batch = self._batches.get(batch_id)
         if batch is None:
             return
-        batch["events"].append(
-            {
-                "type": event_type,
-                "timestamp": self._now_iso(),
-                **payload,
-            }
-        )
-        batch["updated_at"] = batch["events"][-1]["timestamp"]
-        batch["events"] = batch["events"][-500:]
+        event = {
+            "seq": int(batch["next_event_seq"]),
+            "type": event_type,
+            "timestamp": self._now_iso(),
+            **payload,
+        }
+        batch["next_event_seq"] = event["seq"] + 1
+        batch["events"].append(event)
+        batch["updated_at"] = event["timestamp"]
+        job_id = payload.get("job_id")
+        backlog = self._mark_journal_dirty(batch_id, None if job_id is None else str(job_id))
+        backlog["events"].append(event)
+        flushed_at = self._journal_flushed_at.get(batch_id, 0.0)
+        if event_type != "job_log" or time.monotonic() - flushed_at >= _LOG_FLUSH_SECONDS:
+            self._flush_journal_locked(batch_id)
+        self._condition.notify_all()
+
+    def _mark_journal_dirty(self, batch_id: str, job_id: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a job (every job when ``job_id`` is None) for the next journal write."""
+        backlog = self._journal_backlog.setdefault(batch_id, {"events": [], "job_ids": set()})
+        if job_id is None:
+            backlog["job_ids"].update(job["job_id"] for job in self._batches[batch_id]["jobs"])
+        else:
+            backlog["job_ids"].add(job_id)
+        return backlog
+
+    def _flush_journal_locked(self, batch_id: str) -> None:
+        """Write the batch state row plus any queued jobs and events."""
+        batch = self._batches.get(batch_id)
+        backlog = self._journal_backlog.pop(batch_id, {"events": [], "job_ids": set()})
+        if batch is None:
+            return
+        state = {
+            key: value
+            for key, value in batch.items()
+            if key not in {"events", "next_event_seq", "jobs"}
+        }
+        jobs = [
+            (position, {key: value for key, value in job.items() if key != "queued_monotonic"})
+            for position, job in enumerate(batch["jobs"])
+            if job["job_id"] in backlog["job_ids"]
+        ]
+        self.journal.save(state, jobs, backlog["events"])
+        self._journal_flushed_at[batch_id] = time.monotonic()
+
+    def _restore_batches(self) -> None:
+        now = self._now_iso()
+        with self._condition:
+            for state, next_seq, events in self.journal.load_batches(
+                limit=_JOURNAL_BATCH_LIMIT,
+                event_limit=_EVENT_RING_SIZE,
+            ):
+                batch_id = str(state["batch_id"])
+                batch = {
+                    **state,
+                    "events": deque(events, maxlen=_EVENT_RING_SIZE),
+                    "next_event_seq": next_seq,
+                }
+                self._batches[batch_id] = batch
+                # Older journals embed the jobs in the state row; the first
+                # write after a restart moves every job into its own row.
+                self._mark_journal_dirty(batch_id)
+                requeued = 0
+                interrupted = 0
+                for job in batch["jobs"]:
+                    status = str(job.get("status") or "")
+                    if status == "queued":
+                        job["queued_monotonic"] = time.monotonic()
+                        self._pending.append({"batch_id": batch_id, "job_id": job["job_id"]})
+                        requeued += 1
+                    elif status == "running":
+                        self._record_stage_duration(job, now)
+                        job["status"] = "failed"
+                        job["stage"] = "failed"
+                        job["stage_message"] = _INTERRUPTED_MESSAGE
+                        job["error"] = _INTERRUPTED_MESSAGE
+                        job["updated_at"] = now
+                        job["completed_at"] = now
+                        job["logs"] = (
+                            job.get("logs", []) + [f"[failed] {_INTERRUPTED_MESSAGE}"]
+                        )[-250:]
+                        self._append_event(
+                            batch_id,
+                            "job_failed",
+                            {"job_id": job["job_id"], "error": _INTERRUPTED_MESSAGE},
+                        )
+                        interrupted += 1
+                if requeued:
+                    self._append_event(batch_id, "batch_resumed", {"queued_jobs": requeued})
+                if requeued or interrupted:
+                    self._refresh_batch_status(batch_id)
+        self.journal.prune(keep=_JOURNAL_BATCH_LIMIT)
 
     def _public_batch(self, batch: Dict[str, Any], *, include_events: bool) -> Dict[str, Any]:
         payload = {
@@ -595,6 +859,7 @@ class AppBatchScheduler:
                     "stage": job["stage"],
                     "stage_message": job.get("stage_message"),
                     "weight": job.get("weight"),
+                    "estimate": dict(job.get("estimate") or {}),
                     "run_id": job["run_id"],
                     "created_at": job.get("created_at"),
                     "started_at": job.get("started_at"),
@@ -644,29 +909,108 @@ class AppBatchScheduler:
             ) from exc
         return job_module, resolved
 
-    def _job_weight(self, job_module: str, config_path: Path) -> int:
+    def _job_weight(
+        self,
+        job_module: str,
+        config_path: Path,
+        *,
+        estimate: Optional[JobEstimate] = None,
+    ) -> int:
+        """Scheduler lanes: large candidate sets fan out over most cores."""
         base_weight = int(JOB_WEIGHTS[job_module])
-        config = self._load_json_config(config_path)
-        if job_module == "wfa":
-            candidate_count = self._wfa_candidate_count(config, config_path)
-            if candidate_count >= _LARGE_MATRIX_VARIANT_THRESHOLD:
-                return max(base_weight, self.capacity - 1)
+        if job_module not in {"autorunner", "wfa"}:
             return base_weight
-        if job_module != "autorunner":
-            return base_weight
-        raw_platform = config.get("platform")
-        platform: Dict[str, Any] = raw_platform if isinstance(raw_platform, dict) else {}
-        workflow_id = str(platform.get("workflow_id") or "").strip().lower()
-        raw_domains = config.get("parameter_domains")
-        domains: Dict[str, Any] = raw_domains if isinstance(raw_domains, dict) else {}
-        variant_count = self._parameter_variant_count(domains)
-        if workflow_id == "parameter_matrix" and variant_count >= _LARGE_MATRIX_VARIANT_THRESHOLD:
+        if estimate is None:
+            estimate = self._job_estimate(job_module, config_path)
+        if estimate.candidates >= _LARGE_MATRIX_VARIANT_THRESHOLD:
             return max(base_weight, self.capacity - 1)
         return base_weight
 
+    def _job_estimate(self, job_module: str, config_path: Path) -> JobEstimate:
+        config = self._load_json_config(config_path)
+        windows = 1
+        window_bar_fraction = 1.0
+        if job_module == "wfa":
+            strategy_config = self._workflow_strategy_run_config(config, config_path)
+            candidates = self._wfa_candidate_count(config, config_path)
+            raw_windowing = config.get("windowing")
+            windowing: Dict[str, Any] = raw_windowing if isinstance(raw_windowing, dict) else {}
+            windows = self._positive_int(windowing.get("target_window_count"), default=1)
+            if str(windowing.get("size_mode") or "") == "ratio":
+                try:
+                    window_bar_fraction = float(windowing.get("train_ratio") or 0.0) + float(
+                        windowing.get("test_ratio") or 0.0
+                    )
+                except (TypeError, ValueError):
+                    window_bar_fraction = 1.0
+                if window_bar_fraction <= 0:
+                    window_bar_fraction = 1.0
+            lookup_names = {config_path.name}
+            strategy_path = self.runtime._workflow_strategy_run_path(  # noqa: SLF001 - single compatibility entrypoint.
+                config,
+                config_file=config_path,
+            )
+            if strategy_path:
+                lookup_names.add(Path(str(strategy_path)).name)
+        else:
+            strategy_config = config
+            candidates = 1
+            if job_module == "autorunner":
+                raw_platform = config.get("platform")
+                platform: Dict[str, Any] = raw_platform if isinstance(raw_platform, dict) else {}
+                if str(platform.get("workflow_id") or "").strip().lower() == "parameter_matrix":
+                    raw_domains = config.get("parameter_domains")
+                    domains: Dict[str, Any] = raw_domains if isinstance(raw_domains, dict) else {}
+                    candidates = self._parameter_variant_count(domains)
+            lookup_names = {config_path.name}
+
+        manifest = self._prior_bundle_manifest(lookup_names)
+        if manifest is not None:
+            bars = self._positive_int(manifest.get("row_count"), default=1)
+            assets = len(manifest.get("symbols") or []) or 1
+            source = "bundle_manifest"
+        else:
+            raw_data = strategy_config.get("data")
+            data: Dict[str, Any] = raw_data if isinstance(raw_data, dict) else {}
+            raw_universe = strategy_config.get("universe")
+            universe: Dict[str, Any] = raw_universe if isinstance(raw_universe, dict) else {}
+            bars = estimate_bars_from_data_config(data)
+            assets = len(universe.get("symbols") or []) or 1
+            source = "config"
+        return estimate_job(
+            bars=bars,
+            assets=assets,
+            candidates=candidates,
+            windows=windows,
+            window_bar_fraction=window_bar_fraction,
+            source=source,
+        )
+
+    def _prior_bundle_manifest(self, config_names: set[str]) -> Optional[Dict[str, Any]]:
+        """Manifest of the newest finished run launched from one of ``config_names``."""
+        for summary in self.registry.query_runs(limit=_ESTIMATE_RUN_LOOKBACK)["runs"]:
+            if summary.get("config_filename") not in config_names:
+                continue
+            if summary.get("status") not in {"completed", "partial"}:
+                continue
+            try:
+                entry = self.registry.load_registry_entry(str(summary.get("run_id") or ""))
+                manifest_path = str(entry.get("market_data_bundle_manifest") or "")
+                if not manifest_path:
+                    continue
+                manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(manifest, dict) and manifest.get("row_count"):
+                return manifest
+        return None
+
     def _job_dispatch_priority(self, job: Dict[str, Any], *, pending_index: int) -> tuple[Any, ...]:
+        estimate = job.get("estimate")
+        work_units = estimate.get("work_units") if isinstance(estimate, dict) else None
         return (
             int(job.get("weight") or 1),
+            int(work_units or 0),
             str(job.get("created_at") or ""),
             pending_index,
         )
@@ -400,6 +400,11 @@ class AppAPIService:
         )
         return "xdg-open"
 
+    def query_runs(self, **filters: Any) -> Dict[str, Any]:
+        page = self.registry.query_runs(**filters)
+        page["runs"] = [self._decorate_run(row) for row in page["runs"]]
+        return page
+
     def metrics_runs(self) -> List[Dict[str, Any]]:
         autorunner_runs = [
             self._decorate_run(row)
@@ -462,8 +467,8 @@ class AppAPIService:
             )
         ]
 
-    def metrics_overview(self, run_id: str) -> Dict[str, Any]:
-        return self.metrics_contract_payload.load(run_id)
+    def metrics_overview(self, run_id: str, **window: Any) -> Dict[str, Any]:
+        return self.metrics_contract_payload.load(run_id, **window)
 
     def parameter_matrix(self, run_id: str) -> Dict[str, Any]:
         default_overrides = self._default_parameter_review_overrides()
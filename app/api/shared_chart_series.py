@@ -7,8 +7,9 @@ import json
 import os
 import re
 import secrets
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from app.runtime.registry import AppRegistry
 
@@ -79,7 +80,24 @@ class SharedChartSeriesStore:
             raise ValueError("shared series content hash does not match its value")
         return envelope.get("value")
 
-    def compact_plot_bundle(self, run_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def compact_plot_bundle(
+        self,
+        run_id: str,
+        payload: Dict[str, Any],
+        *,
+        lod: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> Dict[str, Any]:
+        """Index a PlotBundle; ``lod`` pyramids by series id are stored with its chart_xy."""
+        if lod:
+            payload = {
+                **payload,
+                "series": [
+                    {**item, "lod": lod[item["series_id"]]}
+                    if isinstance(item, dict) and lod.get(item.get("series_id"))
+                    else item
+                    for item in payload.get("series") or []
+                ],
+            }
         return self._compact_series_payload(
             run_id,
             payload,
@@ -87,13 +105,30 @@ class SharedChartSeriesStore:
             contract_id="lo2cin4bt.plot_bundle_index.v1",
         )
 
-    def materialize_plot_bundle(self, run_id: str, index: Dict[str, Any]) -> Dict[str, Any]:
-        return self._materialize_series_payload(
+    def materialize_plot_bundle(
+        self,
+        run_id: str,
+        index: Dict[str, Any],
+        *,
+        include_lod: bool = False,
+    ) -> Dict[str, Any]:
+        """The stored PlotBundle; series carry ``lod`` only when ``include_lod`` is set.
+
+        ``plot_bundle.v1`` series have no ``lod`` field, so the default result
+        is a valid chart-payload-v1 document.
+        """
+        payload = self._materialize_series_payload(
             run_id,
             index,
             schema_version="plot_bundle_index.v1",
             contract_id="lo2cin4bt.plot_bundle_index.v1",
         )
+        if not include_lod:
+            payload["series"] = [
+                {key: value for key, value in item.items() if key != "lod"}
+                for item in payload["series"]
+            ]
+        return payload
 
     def compact_metrics_overview(
         self, run_id: str, payload: Dict[str, Any]
@@ -210,12 +245,11 @@ class SharedChartSeriesStore:
             return None
         if not isinstance(item, dict) or not isinstance(item.get("x"), list) or not isinstance(item.get("y"), list):
             raise ValueError("chart series must contain x and y lists")
-        compact = {key: value for key, value in item.items() if key not in {"x", "y"}}
-        compact["data_ref"] = self.put(
-            run_id,
-            "chart_xy",
-            {"x": item["x"], "y": item["y"]},
-        )
+        compact = {key: value for key, value in item.items() if key not in {"x", "y", "lod"}}
+        data: Dict[str, Any] = {"x": item["x"], "y": item["y"]}
+        if item.get("lod"):
+            data["lod"] = item["lod"]
+        compact["data_ref"] = self.put(run_id, "chart_xy", data)
         return compact
 
     def _materialize_one_series(self, run_id: str, item: Any) -> Any:
@@ -295,3 +329,51 @@ class SharedChartSeriesStore:
             sort_keys=True,
             separators=(",", ":"),
         ).encode("utf-8")
+
+
+def select_series_window(
+    series: Dict[str, Any],
+    *,
+    max_points: Optional[int] = None,
+    x_start: Optional[str] = None,
+    x_end: Optional[str] = None,
+) -> Dict[str, Any]:
+    """A series cut to ``[x_start, x_end]`` and served from its LTTB pyramid.
+
+    ``x`` values are compared as text, so ``x_end`` also includes every label
+    it prefixes (``"2024-01-31"`` keeps that whole day). When the window holds
+    more than ``max_points`` points, the finest ``lod`` level that fits is
+    used. A budget below the coarsest level is clamped to that level, and a
+    series without a pyramid is served whole, so points are only ever
+    dropped by LTTB and never by a plain stride. The ``lod`` field itself is
+    never returned.
+    """
+    x_values = list(series.get("x") or [])
+    y_values = list(series.get("y") or [])
+    first = bisect_left(x_values, x_start) if x_start else 0
+    stop = bisect_right(x_values, f"{x_end}\uffff") if x_end else len(x_values)
+    indices: Any = range(first, max(first, stop))
+    if max_points is not None and len(indices) > max_points:
+        levels = sorted(
+            (level for level in series.get("lod") or [] if isinstance(level, dict)),
+            key=lambda level: int(level.get("max_points") or 0),
+        )
+        chosen: Optional[list] = None
+        for level in levels:
+            level_indices = list(level.get("indices") or [])
+            window = level_indices[
+                bisect_left(level_indices, first) : bisect_left(level_indices, stop)
+            ]
+            if chosen is not None and len(window) > max_points:
+                break
+            chosen = window
+        if chosen is not None:
+            indices = chosen
+    selected = {key: value for key, value in series.items() if key not in {"x", "y", "lod"}}
+    if isinstance(indices, range):
+        selected["x"] = x_values[indices.start : indices.stop]
+        selected["y"] = y_values[indices.start : indices.stop]
+    else:
+        selected["x"] = [x_values[index] for index in indices]
+        selected["y"] = [y_values[index] for index in indices]
+    return selected
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class BatchJournal:
+    """SQLite journal of Run Center batches and their event logs.
+
+    A batch is stored as a small state row plus one row per job, so a job
+    update rewrites only that job and queued jobs survive an API restart.
+    Events are appended to their own table keyed by ``(batch_id, seq)``;
+    the scheduler keeps only a bounded ring of recent events in memory and
+    reads older ones back from here.  Each batch keeps at most
+    ``event_limit`` journaled events; older ones are dropped as new ones
+    arrive.
+    """
+
+    ACTIVE_STATUSES = ("queued", "running")
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS batches (
+            batch_id TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            status TEXT NOT NULL,
+            state TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS batches_created ON batches (created_at DESC, batch_id DESC)",
+        """
+        CREATE TABLE IF NOT EXISTS batch_jobs (
+            batch_id TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            job TEXT NOT NULL,
+            PRIMARY KEY (batch_id, job_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS batch_events (
+            batch_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            event TEXT NOT NULL,
+            PRIMARY KEY (batch_id, seq)
+        )
+        """,
+    )
+
+    def __init__(self, db_path: Path, *, event_limit: int = 5000):
+        self.db_path = Path(db_path)
+        self.event_limit = max(1, int(event_limit))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def save(
+        self,
+        state: Dict[str, Any],
+        jobs: Iterable[Tuple[int, Dict[str, Any]]] = (),
+        events: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        """Upsert a batch state row, the given ``(position, job)`` rows and new events.
+
+        ``state`` excludes the jobs; only the jobs passed here are rewritten.
+        Everything lands in one transaction.
+        """
+        batch_id = str(state["batch_id"])
+        job_rows = [
+            (
+                batch_id,
+                str(job["job_id"]),
+                int(position),
+                json.dumps(job, ensure_ascii=False, default=str),
+            )
+            for position, job in jobs
+        ]
+        event_rows = [
+            (batch_id, int(event["seq"]), json.dumps(event, ensure_ascii=False, default=str))
+            for event in events
+        ]
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?)",
+                (
+                    batch_id,
+                    str(state.get("created_at") or ""),
+                    str(state.get("status") or ""),
+                    json.dumps(state, ensure_ascii=False, default=str),
+                ),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO batch_jobs VALUES (?, ?, ?, ?)",
+                job_rows,
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO batch_events VALUES (?, ?, ?)",
+                event_rows,
+            )
+            if event_rows:
+                last_seq = max(row[1] for row in event_rows)
+                if last_seq >= self.event_limit:
+                    connection.execute(
+                        "DELETE FROM batch_events WHERE batch_id = ? AND seq <= ?",
+                        (batch_id, last_seq - self.event_limit),
+                    )
+
+    def load_batches(
+        self,
+        *,
+        limit: int,
+        event_limit: int,
+    ) -> List[Tuple[Dict[str, Any], int, List[Dict[str, Any]]]]:
+        """Return ``(state, next_seq, recent_events)`` oldest first.
+
+        Every active batch is returned, plus the newest ``limit`` batches.
+        """
+        marks = ", ".join("?" for _ in self.ACTIVE_STATUSES)
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"""
+                SELECT batch_id, state FROM batches
+                WHERE status IN ({marks})
+                   OR batch_id IN (
+                       SELECT batch_id FROM batches
+                       ORDER BY created_at DESC, batch_id DESC LIMIT ?
+                   )
+                ORDER BY created_at ASC, batch_id ASC
+                """,
+                [*self.ACTIVE_STATUSES, max(0, int(limit))],
+            ).fetchall()
+            loaded: List[Tuple[Dict[str, Any], int, List[Dict[str, Any]]]] = []
+            for batch_id, raw_state in rows:
+                state = json.loads(raw_state)
+                job_rows = connection.execute(
+                    "SELECT job FROM batch_jobs WHERE batch_id = ? ORDER BY position",
+                    (batch_id,),
+                ).fetchall()
+                if job_rows:
+                    state["jobs"] = [json.loads(row[0]) for row in job_rows]
+                else:
+                    # Journals written before jobs had their own rows embed them.
+                    state.setdefault("jobs", [])
+                recent = connection.execute(
+                    "SELECT event FROM batch_events WHERE batch_id = ? ORDER BY seq DESC LIMIT ?",
+                    (batch_id, max(0, int(event_limit))),
+                ).fetchall()
+                events = [json.loads(row[0]) for row in reversed(recent)]
+                next_seq = int(events[-1]["seq"]) + 1 if events else 0
+                loaded.append((state, next_seq, events))
+        return loaded
+
+    def events_since(
+        self,
+        batch_id: str,
+        seq: int,
+        *,
+        limit: int,
+        before: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return journaled events from ``seq`` on, stopping short of ``before``."""
+        query = "SELECT event FROM batch_events WHERE batch_id = ? AND seq >= ?"
+        params: List[Any] = [str(batch_id), max(0, int(seq))]
+        if before is not None:
+            query += " AND seq < ?"
+            params.append(int(before))
+        params.append(max(0, int(limit)))
+        with closing(self._connect()) as connection:
+            rows = connection.execute(f"{query} ORDER BY seq LIMIT ?", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def prune(self, *, keep: int) -> None:
+        """Drop finished batches older than the newest ``keep`` and their events."""
+        marks = ", ".join("?" for _ in self.ACTIVE_STATUSES)
+        with closing(self._connect()) as connection, connection:
+            stale = connection.execute(
+                f"""
+                SELECT batch_id FROM batches
+                WHERE status NOT IN ({marks})
+                  AND batch_id NOT IN (
+                      SELECT batch_id FROM batches
+                      ORDER BY created_at DESC, batch_id DESC LIMIT ?
+                  )
+                """,
+                [*self.ACTIVE_STATUSES, max(0, int(keep))],
+            ).fetchall()
+            connection.executemany("DELETE FROM batch_events WHERE batch_id = ?", stale)
+            connection.executemany("DELETE FROM batch_jobs WHERE batch_id = ?", stale)
+            connection.executemany("DELETE FROM batches WHERE batch_id = ?", stale)
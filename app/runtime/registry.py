@@ -11,17 +11,28 @@ from utils.path_resolver import (
     build_app_run_paths,
     ensure_app_outputs_structure,
 )
-from .module_identity import canonical_module_id, module_matches
+from .module_identity import canonical_module_id
+from .run_index import RunIndex
+
+LATEST_RUNS_LIMIT = 100
 
 
 class AppRegistry:
     """Filesystem-backed registry for app-managed runs."""
 
     _latest_runs_lock = threading.RLock()
+    _reconciled_indexes: set[str] = set()
+    _latest_runs_signatures: Dict[str, tuple[int, int]] = {}
 
     def __init__(self, repo_root: Path):
         self.repo_root = Path(repo_root).resolve()
         self.app_paths = ensure_app_outputs_structure(self.repo_root)
+        self.run_index = RunIndex(self.app_paths["run_index"])
+        index_key = str(self.app_paths["run_index"])
+        with self._latest_runs_lock:
+            if index_key not in self._reconciled_indexes:
+                self.reconcile_run_index()
+                self._reconciled_indexes.add(index_key)
 
     @staticmethod
     def _read_json(path: Path, default: Any) -> Any:
@@ -77,20 +88,63 @@ class AppRegistry:
         *,
         module: Optional[str] = None,
         status: Optional[str] = None,
+        run_type: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: Optional[int] = LATEST_RUNS_LIMIT,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
-        latest_runs = self._refresh_latest_runs_cache()
-        rows: List[Dict[str, Any]] = []
-        for item in latest_runs:
-            if not isinstance(item, dict):
-                continue
-            if module and not module_matches(str(item.get("module", "")), module):
-                continue
-            if status and str(item.get("status", "")) != status:
-                continue
-            payload = dict(item)
-            payload["module"] = canonical_module_id(str(payload.get("module", "")))
-            rows.append(payload)
-        return rows
+        return self.query_runs(
+            module=module,
+            status=status,
+            run_type=run_type,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            offset=offset,
+        )["runs"]
+
+    def query_runs(
+        self,
+        *,
+        module: Optional[str] = None,
+        status: Optional[str] = None,
+        run_type: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: Optional[int] = LATEST_RUNS_LIMIT,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Filtered, newest-first page of run summaries from the run index."""
+        self._ensure_latest_runs_cache()
+        rows, total = self.run_index.query(
+            module=canonical_module_id(module) if module else None,
+            statuses=[status] if status else None,
+            run_type=run_type,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            offset=offset,
+        )
+        return {"runs": rows, "total": total, "limit": limit, "offset": offset}
+
+    def reconcile_run_index(self) -> None:
+        """Re-index registry files written or removed outside this registry."""
+
+        def summarize(registry_path: Path) -> Optional[Dict[str, Any]]:
+            try:
+                payload = self._read_json(registry_path, {})
+            except ValueError:
+                return None
+            if not isinstance(payload, dict) or not payload.get("run_id"):
+                return None
+            return self._registry_summary(payload, registry_path)
+
+        with self._latest_runs_lock:
+            self.run_index.reconcile(
+                self.app_paths["run_registry"].glob("*.json"), summarize
+            )
+            self._refresh_latest_runs_cache()
 
     def load_registry_entry(self, run_id: str) -> Dict[str, Any]:
         path = self.resolve_run_paths(run_id)["run_registry"]
@@ -130,7 +184,9 @@ class AppRegistry:
                     removed.append(str(path))
             except OSError:
                 continue
-        self._refresh_latest_runs_cache()
+        with self._latest_runs_lock:
+            self.run_index.delete([run_id_text])
+            self._refresh_latest_runs_cache()
         return removed
 
     @staticmethod
@@ -160,7 +216,7 @@ class AppRegistry:
         current_server_session_id: Optional[str] = None,
     ) -> int:
         closed = 0
-        for item in self.list_runs():
+        for item in self.list_runs(limit=None):
             if not isinstance(item, dict):
                 continue
             status = str(item.get("status", "")).lower()
@@ -223,8 +279,11 @@ class AppRegistry:
         return closed
 
     def _update_latest_runs(self, registry_payload: Dict[str, Any], registry_path: Path) -> None:
-        del registry_payload, registry_path
-        self._refresh_latest_runs_cache()
+        with self._latest_runs_lock:
+            self.run_index.upsert(
+                self._registry_summary(registry_payload, registry_path), registry_path
+            )
+            self._refresh_latest_runs_cache()
 
     @staticmethod
     def _registry_summary(
@@ -256,19 +315,24 @@ class AppRegistry:
             "registry_path": str(registry_path),
         }
 
-    def _registry_summaries(self) -> List[Dict[str, Any]]:
-        summaries: List[Dict[str, Any]] = []
-        registry_root = self.app_paths["run_registry"]
-        for registry_path in registry_root.glob("*.json"):
-            payload = self._read_json(registry_path, {})
-            if not isinstance(payload, dict) or not payload.get("run_id"):
-                continue
-            summaries.append(self._registry_summary(payload, registry_path))
-        summaries.sort(key=lambda item: str(item.get("created_at", "")), reverse=True)
-        return summaries[:100]
-
     def _refresh_latest_runs_cache(self) -> List[Dict[str, Any]]:
+        """Rewrite latest_runs.json from the newest indexed summaries."""
         with self._latest_runs_lock:
-            summaries = self._registry_summaries()
-            self._write_json(self.app_paths["latest_runs"], summaries[:100])
+            summaries, _total = self.run_index.query(limit=LATEST_RUNS_LIMIT)
+            path = self.app_paths["latest_runs"]
+            self._write_json(path, summaries)
+            stat = path.stat()
+            self._latest_runs_signatures[str(path)] = (stat.st_size, stat.st_mtime_ns)
             return summaries
+
+    def _ensure_latest_runs_cache(self) -> None:
+        """Rebuild latest_runs.json if something else rewrote it since our last write."""
+        path = self.app_paths["latest_runs"]
+        with self._latest_runs_lock:
+            try:
+                stat = path.stat()
+                signature: Optional[tuple[int, int]] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                signature = None
+            if signature is None or self._latest_runs_signatures.get(str(path)) != signature:
+                self._refresh_latest_runs_cache()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class RunIndex:
+    """SQLite index of run registry summaries.
+
+    The registry JSON files stay the source of truth.  Each registry write
+    upserts one summary row, so listing runs is an indexed query instead of a
+    scan over every registry file.  ``reconcile`` re-parses only files whose
+    size or mtime changed since they were indexed.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            module TEXT NOT NULL,
+            status TEXT NOT NULL,
+            run_type TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            registry_path TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            file_mtime_ns INTEGER NOT NULL,
+            summary TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS runs_created ON runs (created_at DESC, run_id DESC)",
+        "CREATE INDEX IF NOT EXISTS runs_status_created ON runs (status, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS runs_module_created ON runs (module, created_at DESC)",
+    )
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    @staticmethod
+    def _row(summary: Dict[str, Any], registry_path: Path) -> Tuple[Any, ...]:
+        stat = registry_path.stat()
+        return (
+            str(summary.get("run_id") or ""),
+            str(summary.get("module") or ""),
+            str(summary.get("status") or ""),
+            str(summary.get("run_type") or ""),
+            str(summary.get("created_at") or ""),
+            str(registry_path),
+            int(stat.st_size),
+            int(stat.st_mtime_ns),
+            json.dumps(summary, ensure_ascii=False, default=str),
+        )
+
+    def upsert(self, summary: Dict[str, Any], registry_path: Path) -> None:
+        self.upsert_many([(summary, registry_path)])
+
+    def upsert_many(self, items: Iterable[Tuple[Dict[str, Any], Path]]) -> None:
+        rows = [self._row(summary, path) for summary, path in items]
+        if not rows:
+            return
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, run_ids: Iterable[str]) -> None:
+        keys = [(str(run_id),) for run_id in run_ids]
+        if not keys:
+            return
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("DELETE FROM runs WHERE run_id = ?", keys)
+
+    def query(
+        self,
+        *,
+        module: Optional[str] = None,
+        statuses: Optional[Iterable[str]] = None,
+        run_type: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return one page of summaries, newest first, and the filtered total.
+
+        ``created_after``/``created_before`` compare against the ISO-8601
+        ``created_at`` text, inclusive.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if module:
+            clauses.append("module = ?")
+            params.append(module)
+        status_values = [str(status) for status in statuses or []]
+        if status_values:
+            clauses.append(f"status IN ({', '.join('?' for _ in status_values)})")
+            params.extend(status_values)
+        if run_type:
+            clauses.append("run_type = ?")
+            params.append(run_type)
+        if created_after:
+            clauses.append("created_at >= ?")
+            params.append(created_after)
+        if created_before:
+            clauses.append("created_at <= ?")
+            params.append(created_before)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        page = " LIMIT ? OFFSET ?"
+        page_params = [-1 if limit is None else max(0, int(limit)), max(0, int(offset))]
+        with closing(self._connect()) as connection:
+            total = int(
+                connection.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+            )
+            rows = connection.execute(
+                f"SELECT summary FROM runs{where} ORDER BY created_at DESC, run_id DESC{page}",
+                [*params, *page_params],
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows], total
+
+    def reconcile(
+        self,
+        registry_paths: Iterable[Path],
+        summarize: Callable[[Path], Optional[Dict[str, Any]]],
+    ) -> None:
+        """Bring the index in line with the registry files on disk."""
+        with closing(self._connect()) as connection:
+            indexed = {
+                str(path): (str(run_id), int(size), int(mtime_ns))
+                for run_id, path, size, mtime_ns in connection.execute(
+                    "SELECT run_id, registry_path, file_size, file_mtime_ns FROM runs"
+                )
+            }
+        present: set[str] = set()
+        changed: List[Tuple[Dict[str, Any], Path]] = []
+        for path in registry_paths:
+            key = str(path)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            known = indexed.get(key)
+            if known is not None and known[1:] == (int(stat.st_size), int(stat.st_mtime_ns)):
+                present.add(known[0])
+                continue
+            summary = summarize(path)
+            if summary is None:
+                continue
+            present.add(str(summary.get("run_id") or ""))
+            changed.append((summary, path))
+        stale = {run_id for run_id, _size, _mtime in indexed.values()} - present
+        self.delete(sorted(stale))
+        self.upsert_many(changed)
@@ -60,6 +60,9 @@ INCLUDED_STRATEGY_EXAMPLE_FILENAMES = frozenset(
     }
 )
 
+# Coarsest level of the LTTB pyramid stored with each asset curve series.
+PLOT_LOD_MIN_POINTS = 256
+
 _STAGE_ORDER = [
     "config_validation",
     "dataloader",
@@ -3828,7 +3831,10 @@ class AppRuntimeService:
         projection = projection.dropna(subset=["Time", "Equity_value"])
         if projection.empty:
             raise ValueError("metricstracker output has no finite strategy equity rows")
-        from backtester.RustCoreBridge_backtester import run_plot_bundle_via_cli
+        from backtester.RustCoreBridge_backtester import (
+            run_plot_bundle_via_cli,
+            run_plot_lod_via_cli,
+        )
 
         plot_series: List[Dict[str, Any]] = []
         if "Backtest_id" in projection.columns:
@@ -3886,6 +3892,16 @@ class AppRuntimeService:
             },
             timeout=60,
         )
+        lod = run_plot_lod_via_cli(
+            {
+                "series": [
+                    {"series_id": item["series_id"], "y": item["y"]}
+                    for item in plot_series
+                ],
+                "min_points": PLOT_LOD_MIN_POINTS,
+            },
+            timeout=60,
+        )
 
         chart_path = (
             self.registry.build_run_paths(run_id)["chart_payload_dir"]
@@ -3894,7 +3910,14 @@ class AppRuntimeService:
         shared_series = SharedChartSeriesStore(self.registry)
         shared_series.write_json(
             chart_path,
-            shared_series.compact_plot_bundle(run_id, payload),
+            shared_series.compact_plot_bundle(
+                run_id,
+                payload,
+                lod={
+                    str(item["series_id"]): list(item["levels"])
+                    for item in lod.get("series") or []
+                },
+            ),
         )
         rows.append(
             {
@@ -4413,34 +4436,89 @@ class AppRuntimeService:
         trades: pd.DataFrame,
         frames: Dict[str, pd.DataFrame],
     ) -> Dict[str, List[Dict[str, Any]]]:
+        """Per traded asset, the OHLC rows of every bar with a finite close.
+
+        The traded columns of each wide OHLC table are reindexed onto the
+        close timeline in one pass; a missing or non-finite open, high, or low
+        falls back to that bar's close.
+        """
         close = frames.get("close")
         if trades.empty or close is None or close.empty or "Asset" not in trades.columns:
             return {}
+        assets = [
+            asset
+            for asset in trades["Asset"].dropna().astype(str).unique()
+            if asset in close.columns
+        ]
+        if not assets:
+            return {}
+        close_block = self._detail_price_block(close, close.index, assets)
+        field_blocks = {
+            field: (
+                self._detail_price_block(frames[field], close.index, assets)
+                if frames.get(field) is not None
+                else close_block
+            )
+            for field in ("open", "high", "low")
+        }
+        times: Optional[np.ndarray] = None
         output: Dict[str, List[Dict[str, Any]]] = {}
-        for asset in trades["Asset"].dropna().astype(str).unique():
-            if asset not in close.columns:
+        for position, asset in enumerate(assets):
+            close_values = close_block[:, position]
+            keep = np.flatnonzero(np.isfinite(close_values))
+            if keep.size == 0:
                 continue
-            rows: List[Dict[str, Any]] = []
-            for timestamp in close.index:
-                close_value = self._detail_number(close.at[timestamp, asset])
-                if close_value is None:
-                    continue
-                row: Dict[str, Any] = {"time": str(timestamp)}
-                for field in ("open", "high", "low", "close"):
-                    frame = frames.get(field)
-                    value = (
-                        self._detail_number(frame.at[timestamp, asset])
-                        if frame is not None
-                        and timestamp in frame.index
-                        and asset in frame.columns
-                        else close_value
-                    )
-                    row[field] = close_value if value is None else value
-                rows.append(row)
-            if rows:
-                output[str(asset)] = rows
+            if times is None:
+                times = self._detail_time_labels(close.index)
+            close_kept = close_values[keep]
+            columns = []
+            for field in ("open", "high", "low"):
+                values = field_blocks[field][keep, position]
+                columns.append(np.where(np.isfinite(values), values, close_kept).tolist())
+            output[str(asset)] = [
+                {"time": time, "open": open_, "high": high, "low": low, "close": close_}
+                for time, open_, high, low, close_ in zip(
+                    times[keep].tolist(), *columns, close_kept.tolist()
+                )
+            ]
         return output
 
+    @staticmethod
+    def _detail_time_labels(index: pd.Index) -> np.ndarray:
+        """``str(timestamp)`` for every entry, formatted in bulk for whole-second times."""
+        if not isinstance(index, pd.DatetimeIndex) or index.hasnans:
+            return np.array([str(timestamp) for timestamp in index], dtype=object)
+        wall = (index.tz_localize(None) if index.tz is not None else index).as_unit("ns")
+        if (wall.view("i8") % 1_000_000_000).any():
+            return np.array([str(timestamp) for timestamp in index], dtype=object)
+        labels = np.char.replace(np.datetime_as_string(wall.values, unit="s"), "T", " ")
+        if index.tz is not None:
+            utc = index.tz_convert("UTC").tz_localize(None).as_unit("ns")
+            offset_seconds = (wall.view("i8") - utc.view("i8")) // 1_000_000_000
+            offsets, positions = np.unique(offset_seconds, return_inverse=True)
+            suffixes = np.array(
+                [
+                    f"{'-' if offset < 0 else '+'}{abs(int(offset)) // 3600:02d}:"
+                    f"{abs(int(offset)) % 3600 // 60:02d}"
+                    for offset in offsets
+                ]
+            )
+            labels = np.char.add(labels, suffixes[positions])
+        return labels.astype(object)
+
+    @staticmethod
+    def _detail_price_block(
+        frame: pd.DataFrame,
+        index: pd.Index,
+        assets: List[str],
+    ) -> np.ndarray:
+        if frame.index.has_duplicates:
+            frame = frame[~frame.index.duplicated(keep="first")]
+        if frame.columns.has_duplicates:
+            frame = frame.loc[:, ~frame.columns.duplicated(keep="first")]
+        aligned = frame.reindex(index=index, columns=assets)
+        return aligned.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+
     @staticmethod
     def _detail_number(value: Any) -> Optional[float]:
         try:
@@ -0,0 +1,292 @@
+"""Persistent cache of candidate results shared across runs.
+
+A candidate's outcome is fully determined by its resolved EngineRequest, the
+market data it ran against, the Rust engine build, and the Python code that
+shapes the engine output into rows and result tables.  Reruns, WFA windows and
+Optuna trials regularly resubmit identical candidates, so the runner keys each
+result by ``(engine_request_hash, bundle key, engine version)`` and serves
+repeats locally instead of dispatching them to Rust again.
+
+The cache is opt-in: it stays off unless ``LO2CIN4BT_RESULT_CACHE_BYTES`` sets
+a positive budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from utils.path_resolver import outputs_root
+
+CANDIDATE_RESULT_CACHE_SCHEMA_VERSION = "candidate_result_cache.v2"
+CANDIDATE_RESULT_TABLES = (
+    "equity_curve",
+    "execution_equity_curve",
+    "holdings",
+    "rebalance_audit",
+    "rebalance_trades",
+    "risk_gate_events",
+)
+DEFAULT_RESULT_CACHE_BYTES = 1 << 30
+# Row fields that describe how one run presented a candidate, not its outcome.
+# They are stripped before storing and set again by the run serving the hit.
+RUN_SPECIFIC_ROW_FIELDS = ("result_materialization",)
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_CACHES: Dict[tuple[str, int], "CandidateResultCache"] = {}
+_SHAPING_FINGERPRINT: Dict[str, Any] = {"stamp": None, "value": ""}
+
+
+@dataclass(frozen=True)
+class CachedCandidateResult:
+    """One cached candidate: its summary and, when stored, its result tables."""
+
+    summary: Dict[str, Any]
+    has_tables: bool
+    tables: Optional[Dict[str, pd.DataFrame]] = None
+
+
+class CandidateResultCache:
+    """SQLite store of compact candidate summaries and optional result tables.
+
+    Summaries are JSON; tables are parquet blobs, one row per table, so rows
+    that only need the matrix summary never decode a timeline.  Every read
+    refreshes ``last_used_ns``, and writes evict least-recently-used entries
+    until the stored bytes fit ``max_bytes``.  A summary-only write never
+    replaces an entry that already holds tables.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS entries (
+            cache_key TEXT PRIMARY KEY,
+            request_hash TEXT NOT NULL,
+            bundle_key TEXT NOT NULL,
+            engine_version TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            has_tables INTEGER NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            last_used_ns INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS entry_tables (
+            cache_key TEXT NOT NULL,
+            table_name TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (cache_key, table_name)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used_ns)",
+    )
+
+    def __init__(self, db_path: Path, *, max_bytes: int = DEFAULT_RESULT_CACHE_BYTES):
+        self.db_path = Path(db_path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    @staticmethod
+    def cache_key(request_hash: str, bundle_key: str, engine_version: str) -> str:
+        payload = "\x1f".join(
+            [CANDIDATE_RESULT_CACHE_SCHEMA_VERSION, request_hash, bundle_key, engine_version]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CachedCandidateResult]:
+        """Summaries for the cached ``keys``; tables are loaded by ``load_tables``."""
+
+        wanted = list(dict.fromkeys(str(key) for key in keys))
+        found: Dict[str, CachedCandidateResult] = {}
+        if not wanted:
+            return found
+        now = time.time_ns()
+        with closing(self._connect()) as connection, connection:
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start : start + 500]
+                marks = ",".join("?" for _ in chunk)
+                for cache_key, summary, has_tables in connection.execute(
+                    f"SELECT cache_key, summary, has_tables FROM entries WHERE cache_key IN ({marks})",
+                    chunk,
+                ):
+                    found[cache_key] = CachedCandidateResult(
+                        summary=json.loads(summary),
+                        has_tables=bool(has_tables),
+                    )
+                connection.execute(
+                    f"UPDATE entries SET last_used_ns = ? WHERE cache_key IN ({marks})",
+                    [now, *chunk],
+                )
+        return found
+
+    def load_tables(self, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT table_name, data FROM entry_tables WHERE cache_key = ?",
+                (str(key),),
+            ).fetchall()
+        tables = {name: pd.read_parquet(io.BytesIO(data)) for name, data in rows}
+        if set(tables) != set(CANDIDATE_RESULT_TABLES):
+            return None
+        return tables
+
+    def put(
+        self,
+        *,
+        key: str,
+        request_hash: str,
+        bundle_key: str,
+        engine_version: str,
+        summary: Dict[str, Any],
+        tables: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> None:
+        if self.max_bytes <= 0:
+            return
+        summary_text = json.dumps(summary, ensure_ascii=False, default=_json_default)
+        blobs: List[tuple[str, bytes]] = []
+        if tables is not None:
+            for name in CANDIDATE_RESULT_TABLES:
+                buffer = io.BytesIO()
+                tables[name].to_parquet(buffer)
+                blobs.append((name, buffer.getvalue()))
+        size_bytes = len(summary_text.encode("utf-8")) + sum(len(blob) for _, blob in blobs)
+        if size_bytes > self.max_bytes:
+            return
+        row = (
+            str(key),
+            str(request_hash),
+            str(bundle_key),
+            str(engine_version),
+            summary_text,
+            int(bool(blobs)),
+            size_bytes,
+            time.time_ns(),
+        )
+        with closing(self._connect()) as connection, connection:
+            if not blobs:
+                connection.execute("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+            else:
+                connection.execute("DELETE FROM entry_tables WHERE cache_key = ?", (row[0],))
+                connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+                connection.executemany(
+                    "INSERT INTO entry_tables VALUES (?, ?, ?)",
+                    [(row[0], name, blob) for name, blob in blobs],
+                )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total = int(connection.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        victims: List[tuple[str]] = []
+        for cache_key, size_bytes in connection.execute(
+            "SELECT cache_key, size_bytes FROM entries ORDER BY last_used_ns ASC, cache_key ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((cache_key,))
+            total -= int(size_bytes)
+        connection.executemany("DELETE FROM entry_tables WHERE cache_key = ?", victims)
+        connection.executemany("DELETE FROM entries WHERE cache_key = ?", victims)
+
+    def stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as connection:
+            entries, resident = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+            ).fetchone()
+        return {
+            "entries": int(entries),
+            "resident_bytes": int(resident),
+            "budget_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM entry_tables")
+            connection.execute("DELETE FROM entries")
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def result_shaping_fingerprint() -> str:
+    """Content hash of the Python modules that turn engine output into cached rows.
+
+    Compact rows, validation reports and result tables are built in Python
+    from the Rust payload, so a change there must miss entries written by the
+    previous code even when the crate is untouched.  Files are rehashed only
+    when their size or mtime moves.
+    """
+
+    source_paths = sorted(
+        path for path in (_REPO_ROOT / "backtester").glob("*.py") if path.is_file()
+    )
+    stamp = tuple(
+        (str(path), path.stat().st_size, path.stat().st_mtime_ns) for path in source_paths
+    )
+    if _SHAPING_FINGERPRINT["stamp"] != stamp:
+        digest = hashlib.sha256(CANDIDATE_RESULT_CACHE_SCHEMA_VERSION.encode("utf-8"))
+        for path in source_paths:
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+        _SHAPING_FINGERPRINT.update(stamp=stamp, value=digest.hexdigest())
+    return str(_SHAPING_FINGERPRINT["value"])
+
+
+def candidate_result_engine_version() -> str:
+    """Engine version stored with cached candidates: Rust build plus Python shaping."""
+
+    from backtester.RustCoreBridge_backtester import rust_engine_fingerprint
+
+    return f"{rust_engine_fingerprint()}:{result_shaping_fingerprint()}"
+
+
+def strip_run_specific_row_fields(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in row.items() if key not in RUN_SPECIFIC_ROW_FIELDS}
+
+
+def candidate_result_cache_from_env() -> Optional[CandidateResultCache]:
+    """The process-wide cache configured by ``LO2CIN4BT_RESULT_CACHE_*``, if enabled.
+
+    The cache is off unless ``LO2CIN4BT_RESULT_CACHE_BYTES`` is a positive
+    byte budget.
+    """
+
+    raw_budget = os.getenv("LO2CIN4BT_RESULT_CACHE_BYTES", "").strip()
+    try:
+        budget = int(raw_budget) if raw_budget else 0
+    except ValueError:
+        budget = 0
+    if budget <= 0:
+        return None
+    raw_path = os.getenv("LO2CIN4BT_RESULT_CACHE_PATH", "").strip()
+    db_path = (
+        Path(raw_path)
+        if raw_path
+        else outputs_root(_REPO_ROOT) / "cache" / "candidate_results.sqlite3"
+    )
+    cache_id = (str(db_path.resolve()), budget)
+    cache = _CACHES.get(cache_id)
+    if cache is None:
+        cache = CandidateResultCache(db_path, max_bytes=budget)
+        _CACHES[cache_id] = cache
+    return cache
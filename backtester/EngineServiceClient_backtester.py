@@ -9,39 +9,91 @@ import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional
 
+from backtester.EngineServiceFraming_backtester import (
+    FRAMED_TRANSPORT,
+    JSON_LINES_TRANSPORT,
+    encode_frame,
+    read_frame,
+)
+
 
 class EngineServiceError(RuntimeError):
-    def __init__(self, code: str, message: str, *, retryable: bool = False):
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        *,
+        retryable: bool = False,
+        partial: Optional[Dict[str, Any]] = None,
+    ):
         super().__init__(f"{code}: {message}")
         self.code = code
         self.message = message
         self.retryable = retryable
+        # Cancelled, timed-out, or over-budget runs report how far the kernel got.
+        self.partial = dict(partial or {})
 
 
 class EngineServiceClient:
     protocol_version = "engine_service.v1"
+    # The service rejects work with a retryable ``queue_full`` error when its
+    # bounded worker queue is saturated; the client backs off and resubmits.
+    queue_full_initial_backoff_seconds = 0.05
+    queue_full_max_backoff_seconds = 1.0
+    # Wait for a transport ack when ``start`` is called outside a request.
+    negotiate_timeout_seconds = 30.0
 
     def __init__(
         self,
-        process_factory: Callable[[], subprocess.Popen[str]],
+        process_factory: Callable[[], subprocess.Popen[Any]],
         *,
         availability_check: Callable[[], bool],
+        transport: str = JSON_LINES_TRANSPORT,
     ) -> None:
+        """``transport=FRAMED_TRANSPORT`` expects binary pipes from
+        ``process_factory`` and negotiates length-prefixed frames with each new
+        process, staying on JSON lines when the service declines."""
+
+        if transport not in {JSON_LINES_TRANSPORT, FRAMED_TRANSPORT}:
+            raise ValueError(f"unsupported engine service transport: {transport}")
         self._process_factory = process_factory
         self._availability_check = availability_check
+        self._transport = transport
+        self._framed_process: Optional[subprocess.Popen[Any]] = None
         self._lifecycle_lock = threading.RLock()
         self._write_lock = threading.Lock()
         self._pending_lock = threading.Lock()
-        self._process: Optional[subprocess.Popen[str]] = None
+        self._process: Optional[subprocess.Popen[Any]] = None
         self._pending: Dict[str, queue.Queue[Dict[str, Any]]] = {}
         self._active_execute: set[str] = set()
+        self._last_scheduling: Dict[str, Any] = {}
 
     @property
-    def process(self) -> Optional[subprocess.Popen[str]]:
+    def process(self) -> Optional[subprocess.Popen[Any]]:
         with self._lifecycle_lock:
             return self._process
 
-    def start(self) -> subprocess.Popen[str]:
+    @property
+    def transport(self) -> str:
+        """Transport negotiated with the running process."""
+
+        with self._lifecycle_lock:
+            framed = self._process is not None and self._process is self._framed_process
+        return FRAMED_TRANSPORT if framed else JSON_LINES_TRANSPORT
+
+    @property
+    def last_scheduling(self) -> Dict[str, Any]:
+        """Most recent worker-pool queue report sent by the service."""
+
+        with self._pending_lock:
+            return dict(self._last_scheduling)
+
+    def start(self, *, timeout: Optional[float] = None) -> subprocess.Popen[Any]:
+        """Return the running process, spawning one if needed.
+
+        ``timeout`` bounds the wait for the transport ack of a new framed
+        process (default ``negotiate_timeout_seconds``).
+        """
         if not self._availability_check():
             raise RuntimeError("Rust core is unavailable; cargo or crate directory is missing")
         with self._lifecycle_lock:
@@ -55,10 +107,15 @@ class EngineServiceClient:
             if process.stdout is None or process.stdin is None:
                 self._terminate_process(process)
                 raise RuntimeError("Rust engine service requires stdin and stdout pipes")
+            framed = self._transport == FRAMED_TRANSPORT and self._negotiate(
+                process,
+                timeout=self.negotiate_timeout_seconds if timeout is None else timeout,
+            )
+            self._framed_process = process if framed else None
             self._process = process
             threading.Thread(
                 target=self._reader_loop,
-                args=(process,),
+                args=(process, framed),
                 name="lo2cin4bt-engine-service-reader",
                 daemon=True,
             ).start()
@@ -72,6 +129,8 @@ class EngineServiceClient:
         timeout: int,
         request_id: Optional[str] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        priority: int = 0,
+        max_threads: Optional[int] = None,
     ) -> Dict[str, Any]:
         result = self.request(
             "execute",
@@ -80,6 +139,8 @@ class EngineServiceClient:
             operation=operation,
             request_id=request_id,
             progress_callback=progress_callback,
+            priority=priority,
+            max_threads=max_threads,
         )
         if not isinstance(result, dict):
             raise RuntimeError("Rust engine service result must be an object")
@@ -93,18 +154,24 @@ class EngineServiceClient:
         timeout: int,
         artifact_output_dir: Optional[str] = None,
         artifact_run_id: Optional[str] = None,
+        market_data_window: Optional[Dict[str, int]] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        max_threads: Optional[int] = None,
     ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "engine_request": engine_request,
+            "market_data_bundle": market_data_bundle,
+            "artifact_output_dir": artifact_output_dir,
+            "artifact_run_id": artifact_run_id,
+        }
+        if market_data_window is not None:
+            payload["market_data_window"] = market_data_window
         result = self.request(
             "execute_engine_request",
-            {
-                "engine_request": engine_request,
-                "market_data_bundle": market_data_bundle,
-                "artifact_output_dir": artifact_output_dir,
-                "artifact_run_id": artifact_run_id,
-            },
+            payload,
             timeout=timeout,
             progress_callback=progress_callback,
+            max_threads=max_threads,
         )
         if not isinstance(result, dict):
             raise RuntimeError("Rust EngineRequest result must be an object")
@@ -118,18 +185,27 @@ class EngineServiceClient:
         timeout: int,
         artifact_output_dir: Optional[str] = None,
         artifact_run_id: Optional[str] = None,
+        market_data_window: Optional[Dict[str, int]] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        max_threads: Optional[int] = None,
+        retain_top: Optional[int] = None,
     ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "engine_requests": engine_requests,
+            "market_data_bundle": market_data_bundle,
+            "artifact_output_dir": artifact_output_dir,
+            "artifact_run_id": artifact_run_id,
+        }
+        if market_data_window is not None:
+            payload["market_data_window"] = market_data_window
+        if retain_top is not None:
+            payload["retain_top"] = max(0, int(retain_top))
         result = self.request(
             "execute_engine_request_batch",
-            {
-                "engine_requests": engine_requests,
-                "market_data_bundle": market_data_bundle,
-                "artifact_output_dir": artifact_output_dir,
-                "artifact_run_id": artifact_run_id,
-            },
+            payload,
             timeout=timeout,
             progress_callback=progress_callback,
+            max_threads=max_threads,
         )
         if not isinstance(result, dict):
             raise RuntimeError("Rust EngineRequest batch result must be an object")
@@ -144,8 +220,11 @@ class EngineServiceClient:
         operation: Optional[str] = None,
         request_id: Optional[str] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        priority: int = 0,
+        max_threads: Optional[int] = None,
     ) -> Any:
-        process = self.start()
+        timeout_seconds = max(1, int(timeout))
+        process = self.start(timeout=timeout_seconds)
         resolved_request_id = request_id or f"python-{uuid.uuid4().hex}"
         response_queue: queue.Queue[Dict[str, Any]] = queue.Queue()
         with self._pending_lock:
@@ -159,7 +238,9 @@ class EngineServiceClient:
             }:
                 self._active_execute.add(resolved_request_id)
 
-        timeout_seconds = max(1, int(timeout))
+        resource_budget: Dict[str, Any] = {"max_operation_ms": timeout_seconds * 1000}
+        if max_threads is not None:
+            resource_budget["max_threads"] = max(1, int(max_threads))
         envelope = {
             "protocol_version": self.protocol_version,
             "request_id": resolved_request_id,
@@ -167,43 +248,74 @@ class EngineServiceClient:
             "operation": operation,
             "payload": payload,
             "deadline_unix_ms": int(time.time() * 1000) + timeout_seconds * 1000,
-            "resource_budget": {"max_operation_ms": timeout_seconds * 1000},
+            "resource_budget": resource_budget,
+            "priority": int(priority),
         }
         try:
-            self._write(process, envelope)
             deadline = time.monotonic() + timeout_seconds
+            backoff = self.queue_full_initial_backoff_seconds
             while True:
-                remaining = deadline - time.monotonic()
-                if remaining <= 0:
-                    raise subprocess.TimeoutExpired("engine_service_cli", timeout_seconds)
+                self._write(process, envelope)
                 try:
-                    response = response_queue.get(timeout=remaining)
-                except queue.Empty as exc:
-                    raise subprocess.TimeoutExpired(
-                        "engine_service_cli", timeout_seconds
-                    ) from exc
-                status = str(response.get("status") or "")
-                if status == "progress":
-                    progress = response.get("result")
-                    if progress_callback is not None and isinstance(progress, dict):
-                        progress_callback(progress)
-                    continue
-                if status == "error":
-                    raw_error = response.get("error")
-                    error = raw_error if isinstance(raw_error, dict) else {}
-                    raise EngineServiceError(
-                        str(error.get("code") or "operation_failed"),
-                        str(error.get("message") or "Rust engine service operation failed"),
-                        retryable=bool(error.get("retryable")),
+                    return self._await_response(
+                        response_queue,
+                        deadline=deadline,
+                        timeout_seconds=timeout_seconds,
+                        progress_callback=progress_callback,
                     )
-                if status not in {"ok", "shutting_down"}:
-                    raise RuntimeError(f"unknown Rust engine service status: {status}")
-                return response.get("result")
+                except EngineServiceError as exc:
+                    if exc.code != "queue_full" or not exc.retryable:
+                        raise
+                    if deadline - time.monotonic() <= backoff:
+                        raise
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, self.queue_full_max_backoff_seconds)
+                    process = self.start(timeout=timeout_seconds)
         finally:
             with self._pending_lock:
                 self._pending.pop(resolved_request_id, None)
                 self._active_execute.discard(resolved_request_id)
 
+    def _await_response(
+        self,
+        response_queue: queue.Queue[Dict[str, Any]],
+        *,
+        deadline: float,
+        timeout_seconds: int,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> Any:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired("engine_service_cli", timeout_seconds)
+            try:
+                response = response_queue.get(timeout=remaining)
+            except queue.Empty as exc:
+                raise subprocess.TimeoutExpired("engine_service_cli", timeout_seconds) from exc
+            scheduling = response.get("scheduling")
+            if isinstance(scheduling, dict):
+                with self._pending_lock:
+                    self._last_scheduling = dict(scheduling)
+            status = str(response.get("status") or "")
+            if status == "progress":
+                progress = response.get("result")
+                if progress_callback is not None and isinstance(progress, dict):
+                    progress_callback(progress)
+                continue
+            if status == "error":
+                raw_error = response.get("error")
+                error = raw_error if isinstance(raw_error, dict) else {}
+                partial = response.get("result")
+                raise EngineServiceError(
+                    str(error.get("code") or "operation_failed"),
+                    str(error.get("message") or "Rust engine service operation failed"),
+                    retryable=bool(error.get("retryable")),
+                    partial=partial if isinstance(partial, dict) else None,
+                )
+            if status not in {"ok", "shutting_down"}:
+                raise RuntimeError(f"unknown Rust engine service status: {status}")
+            return response.get("result")
+
     def cancel_all(self, *, timeout: int = 2) -> list[str]:
         with self._pending_lock:
             targets = sorted(self._active_execute)
@@ -234,43 +346,80 @@ class EngineServiceClient:
                 self._process = None
         self._terminate_process(process)
 
-    def _write(self, process: subprocess.Popen[str], envelope: Dict[str, Any]) -> None:
+    def _negotiate(self, process: subprocess.Popen[Any], *, timeout: float) -> bool:
+        """Offer frames over the still line-based pipe; the ack is one JSON line.
+
+        A service that declines or answers with something other than an ack
+        stays on JSON lines.  One that sends no line within ``timeout`` is
+        stopped and the start fails, since a late ack would desynchronize the
+        line reader.
+        """
+
         import json
 
-        encoded = json.dumps(envelope, ensure_ascii=False, separators=(",", ":"))
+        envelope = {
+            "protocol_version": self.protocol_version,
+            "request_id": f"python-negotiate-{uuid.uuid4().hex}",
+            "command": "negotiate_transport",
+            "payload": {"transports": [FRAMED_TRANSPORT, JSON_LINES_TRANSPORT]},
+        }
+        encoded = json.dumps(envelope, separators=(",", ":")) + "\n"
+        try:
+            process.stdin.write(encoded.encode("utf-8"))
+            process.stdin.flush()
+        except OSError:
+            return False
+        acks: queue.Queue[Any] = queue.Queue(maxsize=1)
+
+        def read_ack() -> None:
+            try:
+                acks.put(process.stdout.readline())
+            except (OSError, ValueError):
+                acks.put(b"")
+
+        threading.Thread(
+            target=read_ack,
+            name="lo2cin4bt-engine-service-negotiate",
+            daemon=True,
+        ).start()
+        try:
+            line = acks.get(timeout=timeout)
+        except queue.Empty as exc:
+            self._terminate_process(process)
+            raise subprocess.TimeoutExpired("engine_service_cli", timeout) from exc
+        try:
+            response = json.loads(line or b"null")
+        except ValueError:
+            return False
+        if not isinstance(response, dict) or response.get("status") != "ok":
+            return False
+        result = response.get("result")
+        return isinstance(result, dict) and result.get("transport") == FRAMED_TRANSPORT
+
+    def _write(self, process: subprocess.Popen[Any], envelope: Dict[str, Any]) -> None:
+        import json
+
+        if process is self._framed_process:
+            data: Any = encode_frame(envelope)
+        else:
+            data = json.dumps(envelope, ensure_ascii=False, separators=(",", ":")) + "\n"
+            if self._transport != JSON_LINES_TRANSPORT:
+                data = data.encode("utf-8")
         with self._write_lock:
             if process.poll() is not None or process.stdin is None:
                 raise RuntimeError("Rust engine service is not running")
-            process.stdin.write(encoded + "\n")
+            process.stdin.write(data)
             process.stdin.flush()
 
-    def _reader_loop(self, process: subprocess.Popen[str]) -> None:
-        import json
-
+    def _reader_loop(self, process: subprocess.Popen[Any], framed: bool = False) -> None:
         stdout = process.stdout
         if stdout is None:
             return
         try:
-            for line in stdout:
-                try:
-                    response = json.loads(line)
-                except json.JSONDecodeError:
-                    self._fail_pending(
-                        "invalid_service_response",
-                        "Rust engine service emitted invalid JSON",
-                    )
-                    break
-                if not isinstance(response, dict):
-                    self._fail_pending(
-                        "invalid_service_response",
-                        "Rust engine service response must be a JSON object",
-                    )
-                    break
-                request_id = str(response.get("request_id") or "")
-                with self._pending_lock:
-                    target = self._pending.get(request_id)
-                if target is not None:
-                    target.put(response)
+            if framed:
+                self._read_frames(stdout)
+            else:
+                self._read_lines(stdout)
         finally:
             owned_process = False
             with self._lifecycle_lock:
@@ -280,6 +429,48 @@ class EngineServiceClient:
             if owned_process:
                 self._fail_pending("service_exited", "Rust engine service exited")
 
+    def _read_lines(self, stdout: Any) -> None:
+        import json
+
+        for line in stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                self._fail_pending(
+                    "invalid_service_response",
+                    "Rust engine service emitted invalid JSON",
+                )
+                return
+            if not self._dispatch(response):
+                return
+
+    def _read_frames(self, stdout: Any) -> None:
+        while True:
+            try:
+                response = read_frame(stdout)
+            except (ValueError, EOFError):
+                self._fail_pending(
+                    "invalid_service_response",
+                    "Rust engine service emitted an invalid frame",
+                )
+                return
+            if response is None or not self._dispatch(response):
+                return
+
+    def _dispatch(self, response: Any) -> bool:
+        if not isinstance(response, dict):
+            self._fail_pending(
+                "invalid_service_response",
+                "Rust engine service response must be a JSON object",
+            )
+            return False
+        request_id = str(response.get("request_id") or "")
+        with self._pending_lock:
+            target = self._pending.get(request_id)
+        if target is not None:
+            target.put(response)
+        return True
+
     def _fail_pending(self, code: str, message: str) -> None:
         with self._pending_lock:
             targets = list(self._pending.values())
@@ -291,7 +482,7 @@ class EngineServiceClient:
             target.put(frame)
 
     @staticmethod
-    def _terminate_process(process: subprocess.Popen[str]) -> None:
+    def _terminate_process(process: subprocess.Popen[Any]) -> None:
         if process.poll() is not None:
             return
         process.terminate()
@@ -0,0 +1,113 @@
+"""Length-prefixed binary frames for the engine service transport.
+
+Layout, matching ``engine_transport.rs``::
+
+    u32 LE header_len | u64 LE body_len | header (UTF-8 JSON) | body
+
+Lists of at least ``BINARY_ARRAY_MIN_LEN`` floats (or ``i64`` ints) are moved
+into the body as little-endian buffers and replaced in the header by
+``{"$binary": {"dtype", "offset", "count"}}`` placeholders.
+"""
+
+from __future__ import annotations
+
+from array import array
+import json
+import struct
+import sys
+from typing import Any, BinaryIO, List, Optional
+
+JSON_LINES_TRANSPORT = "json_lines"
+FRAMED_TRANSPORT = "framed.v1"
+BINARY_ARRAY_MIN_LEN = 32
+
+_PLACEHOLDER_KEY = "$binary"
+_PREFIX = struct.Struct("<IQ")
+_TYPECODES = {"f64": "d", "i64": "q"}
+_I64_MIN, _I64_MAX = -(2**63), 2**63 - 1
+
+
+def encode_frame(envelope: Any) -> bytes:
+    body: List[bytes] = []
+    header = _lift(envelope, body, [0])
+    encoded = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    payload = b"".join(body)
+    return _PREFIX.pack(len(encoded), len(payload)) + encoded + payload
+
+
+def read_frame(stream: BinaryIO) -> Optional[Any]:
+    """Read one frame; ``None`` on a clean end of stream between frames."""
+
+    prefix = stream.read(_PREFIX.size)
+    if not prefix:
+        return None
+    header_len, body_len = _PREFIX.unpack(_read_exact(stream, _PREFIX.size, prefix))
+    header = json.loads(_read_exact(stream, header_len))
+    body = _read_exact(stream, body_len)
+    return _restore(header, memoryview(body))
+
+
+def _read_exact(stream: BinaryIO, size: int, initial: bytes = b"") -> bytes:
+    chunks = [initial]
+    remaining = size - len(initial)
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            raise EOFError("engine service frame was truncated")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _dtype(items: List[Any]) -> Optional[str]:
+    if all(type(item) is float for item in items):
+        return "f64"
+    if all(type(item) is int and _I64_MIN <= item <= _I64_MAX for item in items):
+        return "i64"
+    return None
+
+
+def _lift(value: Any, body: List[bytes], offset: List[int]) -> Any:
+    if isinstance(value, dict):
+        return {key: _lift(item, body, offset) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        dtype = _dtype(value) if len(value) >= BINARY_ARRAY_MIN_LEN else None
+        if dtype is None:
+            return [_lift(item, body, offset) for item in value]
+        buffer = array(_TYPECODES[dtype], value)
+        if sys.byteorder != "little":
+            buffer.byteswap()
+        raw = buffer.tobytes()
+        body.append(raw)
+        placeholder = {
+            _PLACEHOLDER_KEY: {"dtype": dtype, "offset": offset[0], "count": len(value)}
+        }
+        offset[0] += len(raw)
+        return placeholder
+    return value
+
+
+def _restore(value: Any, body: memoryview) -> Any:
+    if isinstance(value, dict):
+        spec = value.get(_PLACEHOLDER_KEY) if len(value) == 1 else None
+        if isinstance(spec, dict):
+            return _decode(spec, body)
+        return {key: _restore(item, body) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore(item, body) for item in value]
+    return value
+
+
+def _decode(spec: dict, body: memoryview) -> List[Any]:
+    typecode = _TYPECODES.get(str(spec.get("dtype")))
+    offset, count = spec.get("offset"), spec.get("count")
+    if typecode is None or not isinstance(offset, int) or not isinstance(count, int):
+        raise ValueError(f"invalid binary buffer reference: {spec}")
+    end = offset + count * 8
+    if offset < 0 or count < 0 or end > len(body):
+        raise ValueError(f"binary buffer reference exceeds the {len(body)} byte body")
+    buffer = array(typecode)
+    buffer.frombytes(body[offset:end])
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    return buffer.tolist()
@@ -0,0 +1,248 @@
+"""Pool of Rust engine service processes behind one client interface."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import subprocess
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from backtester.EngineServiceClient_backtester import (
+    EngineServiceClient,
+    EngineServiceError,
+)
+from backtester.EngineServiceFraming_backtester import JSON_LINES_TRANSPORT
+
+
+class EngineServicePool:
+    """Route engine service requests across ``size`` member processes.
+
+    Each member is an :class:`EngineServiceClient` with its own process and
+    reader thread, so concurrent jobs do not share one stdout parser and a
+    crash only fails the requests on that member.  Routing picks the member
+    with the fewest outstanding requests; requests carrying a market data
+    bundle stick to the member that last ran that bundle ``content_hash`` (its
+    decoded tables are resident there) unless that member is more than
+    ``affinity_max_extra_outstanding`` requests busier than the least-loaded
+    one.  A request that fails because its member exited is resubmitted once;
+    the member restarts its process on that call.
+    """
+
+    affinity_max_extra_outstanding = 2
+    affinity_capacity = 256
+    _execute_commands = {"execute", "execute_engine_request", "execute_engine_request_batch"}
+
+    def __init__(
+        self,
+        process_factory: Callable[[], subprocess.Popen[Any]],
+        *,
+        availability_check: Callable[[], bool],
+        size: int = 1,
+        transport: str = JSON_LINES_TRANSPORT,
+    ) -> None:
+        self._members = [
+            EngineServiceClient(
+                process_factory,
+                availability_check=availability_check,
+                transport=transport,
+            )
+            for _ in range(max(1, int(size)))
+        ]
+        self._lock = threading.Lock()
+        self._outstanding = [0] * len(self._members)
+        self._affinity: OrderedDict[str, int] = OrderedDict()
+        self._request_members: Dict[str, int] = {}
+        self._last_member = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._members)
+
+    @property
+    def members(self) -> List[EngineServiceClient]:
+        return list(self._members)
+
+    @property
+    def process(self) -> Optional[subprocess.Popen[Any]]:
+        """First running member process, for callers that expect one service."""
+
+        for member in self._members:
+            process = member.process
+            if process is not None:
+                return process
+        return None
+
+    @property
+    def processes(self) -> List[Optional[subprocess.Popen[Any]]]:
+        return [member.process for member in self._members]
+
+    @property
+    def transport(self) -> str:
+        return self._members[self._last_member].transport
+
+    @property
+    def last_scheduling(self) -> Dict[str, Any]:
+        return self._members[self._last_member].last_scheduling
+
+    def outstanding(self) -> List[int]:
+        with self._lock:
+            return list(self._outstanding)
+
+    def start(self) -> subprocess.Popen[Any]:
+        processes = [member.start() for member in self._members]
+        return processes[0]
+
+    def execute(
+        self,
+        operation: str,
+        payload: Dict[str, Any],
+        *,
+        timeout: int,
+        request_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        priority: int = 0,
+        max_threads: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        result = self.request(
+            "execute",
+            payload,
+            timeout=timeout,
+            operation=operation,
+            request_id=request_id,
+            progress_callback=progress_callback,
+            priority=priority,
+            max_threads=max_threads,
+        )
+        if not isinstance(result, dict):
+            raise RuntimeError("Rust engine service result must be an object")
+        return result
+
+    def execute_engine_request(
+        self,
+        engine_request: Dict[str, Any],
+        market_data_bundle: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        member = self._acquire(self._bundle_affinity_key(market_data_bundle))
+        return self._run_on(
+            member,
+            lambda client: client.execute_engine_request(
+                engine_request, market_data_bundle, **kwargs
+            ),
+        )
+
+    def execute_engine_request_batch(
+        self,
+        engine_requests: List[Dict[str, Any]],
+        market_data_bundle: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        member = self._acquire(self._bundle_affinity_key(market_data_bundle))
+        return self._run_on(
+            member,
+            lambda client: client.execute_engine_request_batch(
+                engine_requests, market_data_bundle, **kwargs
+            ),
+        )
+
+    def request(
+        self,
+        command: str,
+        payload: Any,
+        *,
+        timeout: int,
+        operation: Optional[str] = None,
+        request_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        priority: int = 0,
+        max_threads: Optional[int] = None,
+    ) -> Any:
+        if command == "cancel" and isinstance(payload, dict):
+            with self._lock:
+                target = self._request_members.get(str(payload.get("target_request_id") or ""))
+            if target is not None:
+                return self._members[target].request(command, payload, timeout=timeout)
+        resolved_request_id = request_id or f"python-{uuid.uuid4().hex}"
+        affinity_key = (
+            self._bundle_affinity_key(payload.get("market_data_bundle"))
+            if command in self._execute_commands and isinstance(payload, dict)
+            else None
+        )
+        member = self._acquire(affinity_key, request_id=resolved_request_id)
+        return self._run_on(
+            member,
+            lambda client: client.request(
+                command,
+                payload,
+                timeout=timeout,
+                operation=operation,
+                request_id=resolved_request_id,
+                progress_callback=progress_callback,
+                priority=priority,
+                max_threads=max_threads,
+            ),
+            request_id=resolved_request_id,
+            retry_on_exit=command in self._execute_commands,
+        )
+
+    def cancel_all(self, *, timeout: int = 2) -> list[str]:
+        accepted: list[str] = []
+        for member in self._members:
+            accepted.extend(member.cancel_all(timeout=timeout))
+        return accepted
+
+    def close(self, *, graceful: bool = False) -> None:
+        for member in self._members:
+            member.close(graceful=graceful)
+
+    @staticmethod
+    def _bundle_affinity_key(market_data_bundle: Any) -> Optional[str]:
+        if not isinstance(market_data_bundle, dict):
+            return None
+        content_hash = market_data_bundle.get("content_hash")
+        return str(content_hash) if content_hash else None
+
+    def _acquire(self, affinity_key: Optional[str], *, request_id: Optional[str] = None) -> int:
+        with self._lock:
+            least = min(range(len(self._members)), key=lambda index: self._outstanding[index])
+            member = least
+            if affinity_key is not None:
+                bound = self._affinity.get(affinity_key)
+                if (
+                    bound is not None
+                    and self._outstanding[bound] - self._outstanding[least]
+                    <= self.affinity_max_extra_outstanding
+                ):
+                    member = bound
+                self._affinity[affinity_key] = member
+                self._affinity.move_to_end(affinity_key)
+                while len(self._affinity) > self.affinity_capacity:
+                    self._affinity.popitem(last=False)
+            self._outstanding[member] += 1
+            self._last_member = member
+            if request_id is not None:
+                self._request_members[request_id] = member
+            return member
+
+    def _run_on(
+        self,
+        member: int,
+        call: Callable[[EngineServiceClient], Any],
+        *,
+        request_id: Optional[str] = None,
+        retry_on_exit: bool = True,
+    ) -> Any:
+        client = self._members[member]
+        try:
+            try:
+                return call(client)
+            except EngineServiceError as exc:
+                if exc.code != "service_exited" or not retry_on_exit:
+                    raise
+                return call(client)
+        finally:
+            with self._lock:
+                self._outstanding[member] -= 1
+                if request_id is not None:
+                    self._request_members.pop(request_id, None)
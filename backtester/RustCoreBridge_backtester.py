@@ -11,6 +11,7 @@ and exchanges JSON or parquet-backed payloads with them.
 from __future__ import annotations
 
 import atexit
+import hashlib
 import json
 import os
 import shutil
@@ -18,13 +19,30 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from backtester.EngineServiceClient_backtester import EngineServiceClient
+from backtester.EngineServiceFraming_backtester import FRAMED_TRANSPORT, JSON_LINES_TRANSPORT
+from backtester.EngineServicePool_backtester import EngineServicePool
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 _CRATE_DIR = _REPO_ROOT / "rust" / "lo2cin4bt_core"
 _RUST_PROFILE = os.getenv("LO2CIN4BT_RUST_PROFILE", "release").strip().lower() or "release"
 if _RUST_PROFILE not in {"debug", "release"}:
     _RUST_PROFILE = "release"
+# ``json_lines`` pins the text transport; anything else negotiates binary frames.
+_ENGINE_TRANSPORT = (
+    JSON_LINES_TRANSPORT
+    if os.getenv("LO2CIN4BT_ENGINE_TRANSPORT", "").strip().lower() in {"json", "json_lines"}
+    else FRAMED_TRANSPORT
+)
+
+
+def _engine_process_count() -> int:
+    try:
+        return max(1, int(os.getenv("LO2CIN4BT_ENGINE_PROCESSES", "1")))
+    except ValueError:
+        return 1
+
+
+_ENGINE_PROCESSES = _engine_process_count()
 _RUST_BIN_SUFFIX = ".exe" if os.name == "nt" else ""
 _RUST_TARGET_DIR = _CRATE_DIR / "target" / _RUST_PROFILE
 
@@ -60,6 +78,34 @@ def _rust_source_newer_than(binary: Path) -> bool:
     return any(path.exists() and path.stat().st_mtime > binary_mtime for path in source_paths)
 
 
+_ENGINE_FINGERPRINT: Dict[str, Any] = {"stamp": None, "value": ""}
+
+
+def rust_engine_fingerprint() -> str:
+    """Content hash of the Rust crate sources and build profile.
+
+    It stands in for the engine version in cached results: any source edit or
+    profile switch changes it.  Files are rehashed only when their size or
+    mtime moves.
+    """
+
+    source_paths = sorted(
+        path
+        for path in [_CRATE_DIR / "Cargo.toml", _CRATE_DIR / "Cargo.lock", *_CRATE_DIR.glob("src/**/*.rs")]
+        if path.is_file()
+    )
+    stamp = tuple(
+        (str(path), path.stat().st_size, path.stat().st_mtime_ns) for path in source_paths
+    )
+    if _ENGINE_FINGERPRINT["stamp"] != stamp:
+        digest = hashlib.sha256(_RUST_PROFILE.encode("utf-8"))
+        for path in source_paths:
+            digest.update(path.relative_to(_CRATE_DIR).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+        _ENGINE_FINGERPRINT.update(stamp=stamp, value=digest.hexdigest())
+    return str(_ENGINE_FINGERPRINT["value"])
+
+
 def _rust_bin_command(binary: Path, bin_name: str, *, args: Optional[List[str]] = None) -> List[str]:
     extra_args = list(args or [])
     if binary.exists() and not _rust_source_newer_than(binary):
@@ -129,7 +175,7 @@ def _kill_process_tree(process: Optional[subprocess.Popen[str]]) -> None:
 
 
 def _tracked_engine_processes() -> List[Optional[subprocess.Popen[str]]]:
-    return [_ENGINE_SERVICE_CLIENT.process]
+    return _ENGINE_SERVICE_CLIENT.processes
 
 
 def _kill_orphaned_rust_descendants() -> None:
@@ -208,22 +254,36 @@ def cancel_active_rust_work() -> None:
 atexit.register(_close_engine_service)
 
 
-def _spawn_engine_service_process() -> subprocess.Popen[str]:
+def _spawn_engine_service_process() -> subprocess.Popen[Any]:
     command = _rust_bin_command(_ENGINE_SERVICE_BIN, "engine_service_cli")
+    text_pipes = _ENGINE_TRANSPORT == JSON_LINES_TRANSPORT
+    env = None
+    if _ENGINE_PROCESSES > 1:
+        # Split the cores between pool members instead of oversubscribing them.
+        share = str(max(1, (os.cpu_count() or 1) // _ENGINE_PROCESSES))
+        split = {
+            name: share
+            for name in ("LO2CIN4BT_ENGINE_WORKERS", "LO2CIN4BT_CANDIDATE_THREADS")
+            if not os.getenv(name)
+        }
+        env = {**os.environ, **split} if split else None
     return subprocess.Popen(
         command,
         cwd=_CRATE_DIR,
+        env=env,
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+        text=text_pipes,
+        bufsize=1 if text_pipes else -1,
     )
 
 
-_ENGINE_SERVICE_CLIENT = EngineServiceClient(
+_ENGINE_SERVICE_CLIENT = EngineServicePool(
     _spawn_engine_service_process,
     availability_check=rust_core_available,
+    size=_ENGINE_PROCESSES,
+    transport=_ENGINE_TRANSPORT,
 )
 
 
@@ -296,6 +356,12 @@ def run_plot_bundle_via_cli(payload: Dict[str, Any], *, timeout: int = 30) -> Di
     return _run_engine_service_operation("plot_bundle", payload, timeout=timeout)
 
 
+def run_plot_lod_via_cli(payload: Dict[str, Any], *, timeout: int = 30) -> Dict[str, Any]:
+    """Build per-series LTTB level-of-detail pyramids (plot_lod.v1) in Rust."""
+
+    return _run_engine_service_operation("plot_lod", payload, timeout=timeout)
+
+
 def run_backtest_detail_bundle_via_cli(
     payload: Dict[str, Any], *, timeout: int = 30
 ) -> Dict[str, Any]:
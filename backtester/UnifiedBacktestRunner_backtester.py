@@ -30,6 +30,15 @@ from backtester.EngineRequest_backtester import (
     validate_engine_request,
 )
 from backtester.BacktestResult_backtester import MultiAssetBacktestResult
+from backtester.CandidateResultCache_backtester import (
+    CANDIDATE_RESULT_CACHE_SCHEMA_VERSION,
+    CANDIDATE_RESULT_TABLES,
+    CachedCandidateResult,
+    CandidateResultCache,
+    candidate_result_cache_from_env,
+    candidate_result_engine_version,
+    strip_run_specific_row_fields,
+)
 from backtester.MultiAssetPortfolioExporter_backtester import (
     MultiAssetPortfolioExporterBacktester,
 )
@@ -76,6 +85,73 @@ def _risk_gates_cfg(config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+class RustArtifactTables:
+    """Per-candidate views over one Rust artifact bundle.
+
+    Grouped batches write every candidate into shared combined tables. Each
+    table is read and validated once, then split by ``Backtest_id`` so building
+    N candidate results costs one parquet read per table instead of N.
+    """
+
+    def __init__(self, artifact_bundle: Dict[str, Any]) -> None:
+        self.artifact_bundle = artifact_bundle
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._candidate_rows: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def frame(self, table_name: str, *, candidate_id: str = "") -> pd.DataFrame:
+        path = self._table_path(table_name)
+        try:
+            frame = self._table(table_name, path)
+            if not candidate_id:
+                return frame.copy()
+            validate_canonical_candidate_id(candidate_id)
+            rows = self._rows_by_candidate(table_name, frame).get(str(candidate_id))
+            if rows is None:
+                return frame.iloc[0:0].copy()
+            return frame.take(rows)
+        except Exception as exc:
+            raise RuntimeError(f"Unable to read Rust artifact table {path}: {exc}") from exc
+
+    def _table_path(self, table_name: str) -> Path:
+        bundle_paths = _dict_or_empty(self.artifact_bundle.get("bundle_paths"))
+        raw_path = str(bundle_paths.get(table_name) or "").strip()
+        if not raw_path:
+            raise RuntimeError(f"Rust artifact bundle is missing table path: {table_name}")
+        path = Path(raw_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Rust artifact table does not exist: {path}")
+        return path
+
+    def _table(self, table_name: str, path: Path) -> pd.DataFrame:
+        if table_name not in self._tables:
+            if path.suffix.lower() == ".parquet":
+                self._tables[table_name] = pd.read_parquet(path)
+            elif path.suffix.lower() == ".csv":
+                self._tables[table_name] = pd.read_csv(path)
+            else:
+                raise ValueError(
+                    f"Rust artifact table has unsupported format: {path.suffix}"
+                )
+        return self._tables[table_name]
+
+    def _rows_by_candidate(
+        self,
+        table_name: str,
+        frame: pd.DataFrame,
+    ) -> Dict[str, np.ndarray]:
+        if table_name not in self._candidate_rows:
+            if "Backtest_id" not in frame.columns:
+                raise ValueError(f"Rust artifact table {table_name} is missing Backtest_id")
+            for artifact_candidate_id in frame["Backtest_id"].dropna().astype(str).unique():
+                validate_canonical_candidate_id(artifact_candidate_id)
+            keys = frame["Backtest_id"].astype(str).to_numpy()
+            self._candidate_rows[table_name] = {
+                str(key): np.asarray(rows, dtype=np.intp)
+                for key, rows in pd.Series(keys).groupby(keys, sort=False).indices.items()
+            }
+        return self._candidate_rows[table_name]
+
+
 class UnifiedBacktestRunnerBacktester:
     """Run single-as-portfolio and multi-asset portfolio strategies."""
 
@@ -255,11 +331,7 @@ class UnifiedBacktestRunnerBacktester:
             ]
             | None
         )
-        if (
-            retention_limit is not None
-            and retention_limit < len(variants)
-            and chunk_size < len(variants)
-        ):
+        if retention_limit is not None and retention_limit < len(variants):
             rust_full_batch = self._try_run_retained_portfolio_rust_batches(
                 variants=variants,
                 market_data=market_data,
@@ -342,15 +414,17 @@ class UnifiedBacktestRunnerBacktester:
     ) -> Optional[
         tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]
     ]:
-        """Evaluate every candidate in bounded Rust batches, then replay retained winners.
+        """Evaluate every candidate in bounded Rust batches that retain only winners.
 
-        The first pass keeps compact rows for the complete matrix and releases each
-        chunk's full timelines before the next chunk.  The second pass materializes
-        only the globally retained candidates.  Both passes use the same mandatory
-        Rust EngineRequest route.
+        Each chunk asks Rust for its top ``retention_limit`` candidates, so full
+        timelines are materialized once and only for chunk winners; every other
+        candidate contributes its compact row.  The global winners are a subset of
+        the chunk winners, and results that fall out of the running top are
+        released after each chunk.
         """
 
         rows: List[Dict[str, Any]] = []
+        retained_results: List[MultiAssetBacktestResult] = []
         for chunk_index, start in enumerate(range(0, len(variants), chunk_size)):
             chunk = variants[start : start + chunk_size]
             batch = self._try_run_portfolio_rust_batch(
@@ -361,50 +435,56 @@ class UnifiedBacktestRunnerBacktester:
                 portfolio_config=portfolio_config,
                 cache_dir=cache_dir,
                 export_config=export_config,
-                run_id_base=f"{run_id_base}_summary_{chunk_index + 1:03d}",
+                run_id_base=f"{run_id_base}_retained_{chunk_index + 1:03d}",
+                retain_top=retention_limit,
             )
             if batch is None:
                 return None
             chunk_results, chunk_rows, _ = self._normalize_rust_batch_result(batch)
-            if len(chunk_results) != len(chunk) or len(chunk_rows) != len(chunk):
+            if len(chunk_rows) != len(chunk) or len(chunk_results) > len(chunk):
                 raise RuntimeError(
-                    "Rust retained matrix summary batch returned incomplete candidate coverage"
+                    "Rust retained matrix batch returned incomplete candidate coverage"
                 )
             rows.extend(chunk_rows)
-            del chunk_results
-
+            retained_ids = self._retained_matrix_strategy_ids(
+                rows=rows,
+                retention_limit=retention_limit,
+            )
+            retained_results = [
+                result
+                for result in [*retained_results, *chunk_results]
+                if self._required_result_candidate_id(result) in retained_ids
+            ]
         retained_ids = self._retained_matrix_strategy_ids(
             rows=rows,
             retention_limit=retention_limit,
         )
-        retained_variants = [
-            variant
-            for variant in variants
-            if self._required_config_candidate_id(
-                _dict_or_empty(variant.get("config"))
+        if len(retained_results) != len(retained_ids):
+            raise RuntimeError(
+                "Rust retained matrix batch did not materialize every retained candidate"
             )
-            in retained_ids
-        ]
-        if not retained_variants:
-            return [], rows, []
-        retained_batch = self._try_run_portfolio_rust_batch(
-            variants=retained_variants,
-            market_data=market_data,
-            market_data_bundle=market_data_bundle,
-            engine_request=engine_request,
-            portfolio_config=portfolio_config,
-            cache_dir=cache_dir,
-            export_config=export_config,
-            run_id_base=f"{run_id_base}_retained",
-        )
-        if retained_batch is None:
+        return retained_results, rows, []
+
+    @staticmethod
+    def _rust_retained_candidate_ids(
+        *,
+        summary: Dict[str, Any],
+        retain_top: Optional[int],
+    ) -> Optional[set[str]]:
+        if retain_top is None:
             return None
-        retained_results, _, _ = self._normalize_rust_batch_result(retained_batch)
-        if len(retained_results) != len(retained_variants):
+        retention = _dict_or_empty(summary.get("retention"))
+        if retention.get("schema_version") != "candidate_retention.v1":
             raise RuntimeError(
-                "Rust retained matrix replay returned incomplete candidate coverage"
+                "Rust grouped batch did not report candidate_retention.v1 for retain_top"
             )
-        return retained_results, rows, []
+        retained_ids = [
+            validate_canonical_candidate_id(item)
+            for item in _list_or_empty(retention.get("retained_candidate_ids"))
+        ]
+        if len(retained_ids) > max(0, int(retain_top)):
+            raise RuntimeError("Rust grouped batch retained more candidates than requested")
+        return set(retained_ids)
 
     @staticmethod
     def _normalize_rust_batch_result(batch: Any) -> tuple[
@@ -455,6 +535,206 @@ class UnifiedBacktestRunnerBacktester:
         cache_dir: Optional[Path],
         export_config: Optional[Dict[str, Any]] = None,
         run_id_base: str = "portfolio_matrix",
+        retain_top: Optional[int] = None,
+    ) -> Optional[
+        tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]]]
+        | tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]
+    ]:
+        def dispatch(batch_variants: List[Dict[str, Any]], batch_retain_top: Optional[int]) -> Any:
+            return self._dispatch_portfolio_rust_batch(
+                variants=batch_variants,
+                market_data=market_data,
+                market_data_bundle=market_data_bundle,
+                engine_request=engine_request,
+                portfolio_config=portfolio_config,
+                cache_dir=cache_dir,
+                export_config=export_config,
+                run_id_base=run_id_base,
+                retain_top=batch_retain_top,
+            )
+
+        cache = candidate_result_cache_from_env()
+        if cache is None or market_data_bundle is None or engine_request is None or not variants:
+            return dispatch(variants, retain_top)
+        return self._run_portfolio_rust_batch_through_result_cache(
+            cache=cache,
+            variants=variants,
+            market_data_bundle=market_data_bundle,
+            engine_request=engine_request,
+            retain_top=retain_top,
+            dispatch=dispatch,
+        )
+
+    def _run_portfolio_rust_batch_through_result_cache(
+        self,
+        *,
+        cache: CandidateResultCache,
+        variants: List[Dict[str, Any]],
+        market_data_bundle: MarketDataBundle,
+        engine_request: Dict[str, Any],
+        retain_top: Optional[int],
+        dispatch: Callable[[List[Dict[str, Any]], Optional[int]], Any],
+    ) -> Optional[
+        tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]]]
+        | tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]
+    ]:
+        """Serve cached candidates locally and send only the others to Rust.
+
+        Hits need cached tables unless the batch retains winners, in which case a
+        summary row is enough for every candidate outside the top ``retain_top``.
+        Retained hits without tables are materialized by a second, unretained
+        dispatch.  A batch with any hit returns no direct exports, so callers write
+        the artifact bundle from the merged results.  Run-specific row fields are
+        not cached; ``result_materialization`` is set from this batch's retention.
+        """
+
+        requests = self._resolved_engine_requests_for_variants(
+            engine_request=engine_request,
+            variants=variants,
+        )
+        candidate_ids = [
+            str(_dict_or_empty(request.get("strategy")).get("strategy_id") or "")
+            for request in requests
+        ]
+        bundle_key = self._result_cache_bundle_key(market_data_bundle)
+        engine_version = candidate_result_engine_version()
+        keys = [
+            cache.cache_key(str(request.get("request_hash") or ""), bundle_key, engine_version)
+            for request in requests
+        ]
+
+        def store(indices: List[int], batch: Any) -> tuple[
+            Dict[int, MultiAssetBacktestResult],
+            Dict[int, Dict[str, Any]],
+        ]:
+            batch_results, batch_rows, _ = self._normalize_rust_batch_result(batch)
+            position = {candidate_ids[index]: index for index in indices}
+            rows_by_index = {
+                position[self._row_strategy_id(row)]: row
+                for row in batch_rows
+                if self._row_strategy_id(row) in position
+            }
+            results_by_index = {
+                position[self._required_result_candidate_id(result)]: result
+                for result in batch_results
+                if self._required_result_candidate_id(result) in position
+            }
+            for index, row in rows_by_index.items():
+                result = results_by_index.get(index)
+                summary: Dict[str, Any] = {"row": strip_run_specific_row_fields(row)}
+                tables = None
+                if result is not None:
+                    summary["validation_report"] = result.validation_report
+                    summary["feature_cache"] = result.feature_cache
+                    tables = {name: getattr(result, name) for name in CANDIDATE_RESULT_TABLES}
+                cache.put(
+                    key=keys[index],
+                    request_hash=str(requests[index].get("request_hash") or ""),
+                    bundle_key=bundle_key,
+                    engine_version=engine_version,
+                    summary=summary,
+                    tables=tables,
+                )
+            return results_by_index, rows_by_index
+
+        cached = cache.get_many(keys)
+        hits: Dict[int, CachedCandidateResult] = {}
+        for index, key in enumerate(keys):
+            entry = cached.get(key)
+            if entry is None:
+                continue
+            if self._row_strategy_id(_dict_or_empty(entry.summary.get("row"))) != candidate_ids[index]:
+                continue
+            if retain_top is None and not entry.has_tables:
+                continue
+            hits[index] = entry
+        if not hits:
+            batch = dispatch(variants, retain_top)
+            if batch is not None:
+                store(list(range(len(variants))), batch)
+            return batch
+
+        results: Dict[int, MultiAssetBacktestResult] = {}
+        rows: Dict[int, Dict[str, Any]] = {
+            index: dict(entry.summary["row"]) for index, entry in hits.items()
+        }
+        misses = [index for index in range(len(variants)) if index not in hits]
+        if misses:
+            batch = dispatch([variants[index] for index in misses], retain_top)
+            if batch is None:
+                return None
+            miss_results, miss_rows = store(misses, batch)
+            results.update(miss_results)
+            rows.update(miss_rows)
+        if len(rows) != len(variants):
+            raise RuntimeError("Rust matrix batch returned incomplete candidate coverage")
+        ordered_rows = [rows[index] for index in range(len(variants))]
+        if retain_top is None:
+            wanted = set(range(len(variants)))
+        else:
+            retained_ids = self._retained_matrix_strategy_ids(
+                rows=ordered_rows,
+                retention_limit=retain_top,
+            )
+            wanted = {index for index, candidate_id in enumerate(candidate_ids) if candidate_id in retained_ids}
+        results = {index: result for index, result in results.items() if index in wanted}
+        for index, row in enumerate(ordered_rows):
+            row["result_materialization"] = "full" if index in wanted else "summary_only"
+
+        unmaterialized: List[int] = []
+        for index in sorted(wanted & set(hits)):
+            entry = hits[index]
+            tables = cache.load_tables(keys[index]) if entry.has_tables else None
+            if tables is None:
+                unmaterialized.append(index)
+                continue
+            variant_config = _dict_or_empty(variants[index].get("config"))
+            validation_report = dict(_dict_or_empty(entry.summary.get("validation_report")))
+            validation_report["result_cache"] = {
+                "schema_version": CANDIDATE_RESULT_CACHE_SCHEMA_VERSION,
+                "status": "hit",
+            }
+            results[index] = MultiAssetBacktestResult(
+                strategy_id=candidate_ids[index],
+                config={**variant_config, "strategy_id": candidate_ids[index]},
+                validation_report=validation_report,
+                feature_cache={
+                    **_dict_or_empty(entry.summary.get("feature_cache")),
+                    "result_cache_hit": 1,
+                },
+                **tables,
+            )
+        if unmaterialized:
+            batch = dispatch([variants[index] for index in unmaterialized], None)
+            if batch is None:
+                return None
+            materialized, _ = store(unmaterialized, batch)
+            if set(materialized) != set(unmaterialized):
+                raise RuntimeError(
+                    "Rust matrix batch did not materialize every cached candidate"
+                )
+            results.update(materialized)
+        return [results[index] for index in sorted(results)], ordered_rows, []
+
+    @staticmethod
+    def _result_cache_bundle_key(market_data_bundle: MarketDataBundle) -> str:
+        window = market_data_bundle.market_data_window()
+        if not window:
+            return market_data_bundle.content_hash
+        return f"{market_data_bundle.content_hash}:{window['start_row']}-{window['end_row']}"
+
+    def _dispatch_portfolio_rust_batch(
+        self,
+        *,
+        variants: List[Dict[str, Any]],
+        market_data: Dict[str, pd.DataFrame],
+        market_data_bundle: Optional[MarketDataBundle],
+        engine_request: Optional[Dict[str, Any]],
+        portfolio_config: Dict[str, Any],
+        cache_dir: Optional[Path],
+        export_config: Optional[Dict[str, Any]] = None,
+        run_id_base: str = "portfolio_matrix",
+        retain_top: Optional[int] = None,
     ) -> Optional[
         tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]]]
         | tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]
@@ -466,6 +746,7 @@ class UnifiedBacktestRunnerBacktester:
             cache_dir=cache_dir,
             export_config=export_config,
             run_id_base=run_id_base,
+            retain_top=retain_top,
         )
         if grouped is not None:
             return grouped
@@ -540,6 +821,7 @@ class UnifiedBacktestRunnerBacktester:
                 timeout=self._positive_int(fill_model.get("rust_timeout_seconds")) or 180,
                 artifact_output_dir=str(output_dir_raw),
                 artifact_run_id=self._required_config_candidate_id(variant_config),
+                market_data_window=market_data_bundle.market_data_window(),
             )
             artifact_bundle = _dict_or_empty(summary.get("artifact_bundle"))
             if not artifact_bundle:
@@ -658,6 +940,7 @@ class UnifiedBacktestRunnerBacktester:
         cache_dir: Optional[Path],
         export_config: Optional[Dict[str, Any]],
         run_id_base: str,
+        retain_top: Optional[int] = None,
     ) -> Optional[tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]]:
         if len(variants) <= 1 or market_data_bundle is None or engine_request is None:
             return None
@@ -746,6 +1029,8 @@ class UnifiedBacktestRunnerBacktester:
                 timeout=self._positive_int(fill_model.get("rust_timeout_seconds")) or 300,
                 artifact_output_dir=str(output_dir_raw),
                 artifact_run_id=str(run_id_base or "engine_request_batch"),
+                market_data_window=market_data_bundle.market_data_window(),
+                retain_top=retain_top,
             )
             if batch.get("execution_mode") != "grouped":
                 return None
@@ -755,6 +1040,10 @@ class UnifiedBacktestRunnerBacktester:
             artifact_bundle = _dict_or_empty(summary.get("artifact_bundle"))
             if len(items) != len(variants) or not artifact_bundle:
                 return None
+            retained_ids = self._rust_retained_candidate_ids(
+                summary=summary,
+                retain_top=retain_top,
+            )
             producer_fields: Dict[str, Any]
             if shape == "daily_rank":
                 fast_path = "daily_rank_rust_engine_request_batch"
@@ -853,6 +1142,7 @@ class UnifiedBacktestRunnerBacktester:
                 metric_source="rust_engine_request_grouped_batch_bundle",
                 extra_validation_fields=producer_fields,
                 log_message=f"Rust grouped EngineRequest {shape} batch covered",
+                retained_ids=retained_ids,
             )
             if outputs is None:
                 raise RuntimeError("Rust grouped EngineRequest bundle could not be materialized")
@@ -922,7 +1212,9 @@ class UnifiedBacktestRunnerBacktester:
         metric_source: str,
         extra_validation_fields: Optional[Dict[str, Any]] = None,
         log_message: str = "Rust direct bundle covered",
+        retained_ids: Optional[set[str]] = None,
     ) -> Optional[tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]]:
+        artifact_tables = RustArtifactTables(artifact_bundle)
         return self._build_rust_direct_bundle_outputs(
             artifact_bundle=artifact_bundle,
             variants=variants,
@@ -934,6 +1226,7 @@ class UnifiedBacktestRunnerBacktester:
             metric_source=metric_source,
             extra_validation_fields=extra_validation_fields,
             log_message=log_message,
+            retained_ids=retained_ids,
             result_builder=lambda item, variant_config: self._multi_asset_result_from_rust_compact(
                 item=item,
                 assets=assets,
@@ -943,6 +1236,7 @@ class UnifiedBacktestRunnerBacktester:
                 accounting_fast_path=accounting_fast_path,
                 accounting_backend=accounting_backend,
                 accounting_kernel=accounting_kernel,
+                artifact_tables=artifact_tables,
             ),
         )
 
@@ -960,33 +1254,45 @@ class UnifiedBacktestRunnerBacktester:
         metric_source: str = "rust_direct_artifact_bundle",
         extra_validation_fields: Optional[Dict[str, Any]] = None,
         log_message: str = "Rust direct bundle covered",
+        retained_ids: Optional[set[str]] = None,
     ) -> Optional[tuple[List[MultiAssetBacktestResult], List[Dict[str, Any]], List[str]]]:
+        """Build compact rows for every item and full results for retained ones.
+
+        ``retained_ids`` of ``None`` means every candidate carries full tables.
+        """
         if len(items) != len(variants):
             return None
         results: List[MultiAssetBacktestResult] = []
         rows: List[Dict[str, Any]] = []
+        materialized_variants: List[Dict[str, Any]] = []
+        materialized_items: List[Any] = []
         extra_validation_fields = dict(extra_validation_fields or {})
         for variant, item in zip(variants, items):
             if not isinstance(item, dict):
                 return None
             variant_config = dict(variant.get("config") or {})
-            result = result_builder(item, variant_config)
-            result.validation_report.update(extra_validation_fields)
             row = self._portfolio_matrix_row_from_rust_compact(
                 item=item,
                 config=variant_config,
                 metric_source=metric_source,
             )
             canonical_strategy_id = self._row_strategy_id(row)
+            rows.append(row)
+            if retained_ids is not None and canonical_strategy_id not in retained_ids:
+                row["result_materialization"] = "summary_only"
+                continue
+            result = result_builder(item, variant_config)
+            result.validation_report.update(extra_validation_fields)
             result.strategy_id = canonical_strategy_id
             if isinstance(result.config, dict):
                 result.config["strategy_id"] = canonical_strategy_id
             results.append(result)
-            rows.append(row)
+            materialized_variants.append(variant)
+            materialized_items.append(item)
         exported_files = self._export_rust_direct_signal_bundle_metadata(
             artifact_bundle=artifact_bundle,
-            items=items,
-            variants=variants,
+            items=materialized_items,
+            variants=materialized_variants,
             cost_rate=cost_rate,
             accounting_fast_path=accounting_fast_path,
             accounting_backend=accounting_backend,
@@ -1178,7 +1484,9 @@ class UnifiedBacktestRunnerBacktester:
         accounting_backend: str = "rust_timeline",
         accounting_kernel: str = "rust_timeline_v1",
         result_table_kernel: str = "rust_arrow_parquet_bundle.v1",
+        artifact_tables: Optional[RustArtifactTables] = None,
     ) -> MultiAssetBacktestResult:
+        artifact_tables = artifact_tables or RustArtifactTables(artifact_bundle)
         strategy_id = self._required_matching_candidate_id(item=item, config=config)
         validation_report = self._single_asset_rust_direct_validation_report(
             item=item,
@@ -1189,12 +1497,11 @@ class UnifiedBacktestRunnerBacktester:
             accounting_kernel=accounting_kernel,
             result_table_kernel=result_table_kernel,
             config=config,
+            artifact_tables=artifact_tables,
         )
         result_config = dict(config)
         result_config["strategy_id"] = strategy_id
-        artifact_equity_curve = self._artifact_bundle_frame(
-            artifact_bundle, "equity_curve", candidate_id=strategy_id
-        )
+        artifact_equity_curve = artifact_tables.frame("equity_curve", candidate_id=strategy_id)
         if artifact_equity_curve.empty:
             raise RuntimeError(
                 f"Rust artifact bundle has no equity_curve rows for candidate {strategy_id}"
@@ -1202,9 +1509,9 @@ class UnifiedBacktestRunnerBacktester:
         return MultiAssetBacktestResult(
             strategy_id=strategy_id,
             equity_curve=artifact_equity_curve,
-            holdings=self._artifact_bundle_frame(artifact_bundle, "holdings", candidate_id=strategy_id),
-            rebalance_audit=self._artifact_bundle_frame(artifact_bundle, "rebalance_audit", candidate_id=strategy_id),
-            rebalance_trades=self._artifact_bundle_frame(artifact_bundle, "rebalance_trades", candidate_id=strategy_id),
+            holdings=artifact_tables.frame("holdings", candidate_id=strategy_id),
+            rebalance_audit=artifact_tables.frame("rebalance_audit", candidate_id=strategy_id),
+            rebalance_trades=artifact_tables.frame("rebalance_trades", candidate_id=strategy_id),
             feature_cache={
                 "computed": self._computed_field_count(result_config),
                 "rust_full_batch": 1,
@@ -1212,12 +1519,8 @@ class UnifiedBacktestRunnerBacktester:
             },
             config=result_config,
             validation_report=validation_report,
-            risk_gate_events=self._artifact_bundle_frame(artifact_bundle, "risk_gate_events", candidate_id=strategy_id),
-            execution_equity_curve=self._artifact_bundle_frame(
-                artifact_bundle,
-                "execution_equity_curve",
-                candidate_id=strategy_id,
-            ),
+            risk_gate_events=artifact_tables.frame("risk_gate_events", candidate_id=strategy_id),
+            execution_equity_curve=artifact_tables.frame("execution_equity_curve", candidate_id=strategy_id),
         )
 
     def _multi_asset_result_from_rust_compact(
@@ -1232,7 +1535,9 @@ class UnifiedBacktestRunnerBacktester:
         accounting_backend: str = "rust_timeline",
         accounting_kernel: str = "rust_timeline_v1",
         result_table_kernel: str = "rust_arrow_parquet_bundle.v1",
+        artifact_tables: Optional[RustArtifactTables] = None,
     ) -> MultiAssetBacktestResult:
+        artifact_tables = artifact_tables or RustArtifactTables(artifact_bundle)
         strategy_id = self._required_matching_candidate_id(item=item, config=config)
         validation_report = self._single_asset_rust_direct_validation_report(
             item=item,
@@ -1243,12 +1548,11 @@ class UnifiedBacktestRunnerBacktester:
             accounting_kernel=accounting_kernel,
             result_table_kernel=result_table_kernel,
             config=config,
+            artifact_tables=artifact_tables,
         )
         result_config = dict(config)
         result_config["strategy_id"] = strategy_id
-        artifact_equity_curve = self._artifact_bundle_frame(
-            artifact_bundle, "equity_curve", candidate_id=strategy_id
-        )
+        artifact_equity_curve = artifact_tables.frame("equity_curve", candidate_id=strategy_id)
         if artifact_equity_curve.empty:
             raise RuntimeError(
                 f"Rust artifact bundle has no equity_curve rows for candidate {strategy_id}"
@@ -1256,9 +1560,9 @@ class UnifiedBacktestRunnerBacktester:
         return MultiAssetBacktestResult(
             strategy_id=strategy_id,
             equity_curve=artifact_equity_curve,
-            holdings=self._artifact_bundle_frame(artifact_bundle, "holdings", candidate_id=strategy_id),
-            rebalance_audit=self._artifact_bundle_frame(artifact_bundle, "rebalance_audit", candidate_id=strategy_id),
-            rebalance_trades=self._artifact_bundle_frame(artifact_bundle, "rebalance_trades", candidate_id=strategy_id),
+            holdings=artifact_tables.frame("holdings", candidate_id=strategy_id),
+            rebalance_audit=artifact_tables.frame("rebalance_audit", candidate_id=strategy_id),
+            rebalance_trades=artifact_tables.frame("rebalance_trades", candidate_id=strategy_id),
             feature_cache={
                 "computed": self._computed_field_count(result_config),
                 "rust_full_batch": 1,
@@ -1266,12 +1570,8 @@ class UnifiedBacktestRunnerBacktester:
             },
             config=result_config,
             validation_report=validation_report,
-            risk_gate_events=self._artifact_bundle_frame(artifact_bundle, "risk_gate_events", candidate_id=strategy_id),
-            execution_equity_curve=self._artifact_bundle_frame(
-                artifact_bundle,
-                "execution_equity_curve",
-                candidate_id=strategy_id,
-            ),
+            risk_gate_events=artifact_tables.frame("risk_gate_events", candidate_id=strategy_id),
+            execution_equity_curve=artifact_tables.frame("execution_equity_curve", candidate_id=strategy_id),
         )
 
     def _single_asset_rust_direct_validation_report(
@@ -1285,6 +1585,7 @@ class UnifiedBacktestRunnerBacktester:
         accounting_backend: str = "rust_timeline",
         accounting_kernel: str = "rust_timeline_v1",
         result_table_kernel: str = "rust_arrow_parquet_bundle.v1",
+        artifact_tables: Optional[RustArtifactTables] = None,
     ) -> Dict[str, Any]:
         active_rebalances = self._required_nonnegative_int(
             item.get("active_rebalances"),
@@ -1296,7 +1597,8 @@ class UnifiedBacktestRunnerBacktester:
             minimum=0.0,
         )
         active_turnover = max(0.0, active_rebalances * average_turnover)
-        risk_gate_events = self._artifact_bundle_frame(artifact_bundle, "risk_gate_events")
+        artifact_tables = artifact_tables or RustArtifactTables(artifact_bundle)
+        risk_gate_events = artifact_tables.frame("risk_gate_events")
         risk_gate_column = None
         for candidate in ("gate", "Gate"):
             if isinstance(risk_gate_events, pd.DataFrame) and candidate in risk_gate_events.columns:
@@ -2147,36 +2449,9 @@ class UnifiedBacktestRunnerBacktester:
         *,
         candidate_id: str = "",
     ) -> pd.DataFrame:
-        bundle_paths = _dict_or_empty(artifact_bundle.get("bundle_paths"))
-        raw_path = str(bundle_paths.get(table_name) or "").strip()
-        if not raw_path:
-            raise RuntimeError(f"Rust artifact bundle is missing table path: {table_name}")
-        path = Path(raw_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Rust artifact table does not exist: {path}")
-        try:
-            if path.suffix.lower() == ".parquet":
-                frame = pd.read_parquet(path)
-            elif path.suffix.lower() == ".csv":
-                frame = pd.read_csv(path)
-            else:
-                raise ValueError(
-                    f"Rust artifact table has unsupported format: {path.suffix}"
-                )
-            if candidate_id:
-                validate_canonical_candidate_id(candidate_id)
-                if "Backtest_id" not in frame.columns:
-                    raise ValueError(
-                        f"Rust artifact table {table_name} is missing Backtest_id"
-                    )
-                for artifact_candidate_id in frame["Backtest_id"].dropna().astype(str).unique():
-                    validate_canonical_candidate_id(artifact_candidate_id)
-                frame = frame.loc[
-                    frame["Backtest_id"].astype(str) == str(candidate_id)
-                ].copy()
-            return frame
-        except Exception as exc:
-            raise RuntimeError(f"Unable to read Rust artifact table {path}: {exc}") from exc
+        return RustArtifactTables(artifact_bundle).frame(
+            table_name, candidate_id=candidate_id
+        )
 
     def _supports_single_asset_calendar_same_session_full_batch(self, config: Dict[str, Any]) -> bool:
         execution = _dict_or_empty(config.get("execution"))
@@ -691,7 +691,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars", param="period", default=14),
                 leakage_warnings=["Rolling mean uses current and previous bars only."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -710,7 +710,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 stateful=True,
                 leakage_warnings=["EMA is sequential over past/current bars; do not seed it from future data."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -728,7 +728,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars for rolling mean and standard deviation", param="period", default=14),
                 leakage_warnings=["Rolling z-score uses current and previous bars only; do not standardize with future rows."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -746,7 +746,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars for rolling quantile", param="period", default=14),
                 leakage_warnings=["Rolling percentile must not use future rows outside the configured window."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period", "percentile"],
@@ -764,7 +764,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars for rolling mean and standard deviation", param="period", default=20),
                 leakage_warnings=["Bollinger values are descriptive rolling statistics; do not trade before the source bar is available."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period", "stddev"],
@@ -784,7 +784,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars for pct_change", param="period", default=14),
                 leakage_warnings=["pct_change must not use a future return label as a tradable predictor."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -820,7 +820,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars of returns", param="period", default=14),
                 leakage_warnings=["Rolling volatility is descriptive; do not treat it as known before the bar closes unless the execution contract allows it."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -839,7 +839,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 stateful=True,
                 leakage_warnings=["ATR uses the current bar high and low; do not use it for an entry earlier in the same bar unless the strategy rule is calendar/pre-known and does not depend on that bar's completed range."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields", "average_true_range"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields", "average_true_range"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -857,7 +857,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                 lookback_bars=_lookback("param", "period bars", param="period", default=14),
                 leakage_warnings=["Current RSI support is top-level computed_fields[] only, then referenced by name."],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["period"],
@@ -884,7 +884,7 @@ def _numeric_feature_blocks() -> List[Dict[str, Any]]:
                     "Use output=line, output=signal, or output=histogram; do not use a separate MACD signal op.",
                 ],
             ),
-            implementation=_implementation(path, ["compute_feature_fields_with_market_fields"]),
+            implementation=_implementation(path, ["compute_feature_fields_with_dates_and_market_fields"]),
             evidence_paths=evidence,
             safety_warnings=warnings,
             optimizable_params=["fastperiod", "slowperiod", "signalperiod"],
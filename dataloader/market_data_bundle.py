@@ -7,14 +7,18 @@ infer timestamps, aggregate bars, or translate legacy frequency fields.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
+import functools
 import hashlib
 import json
 import re
 import shutil
 import tempfile
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Mapping, Sequence
+from typing import Any, Dict, Mapping, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -47,6 +51,12 @@ _SCHEMA_PATH = (
     / "runtime"
     / "market-data-bundle-v2.schema.json"
 )
+# resolved path -> (size, mtime_ns, content hash) already verified on read, most
+# recently used last.  A rewritten file replaces its entry; the oldest paths
+# are evicted past the capacity.
+_VERIFIED_TABLE_HASHES: OrderedDict[str, Tuple[int, int, str]] = OrderedDict()
+_VERIFIED_TABLE_HASHES_CAPACITY = 4096
+_VERIFIED_TABLE_HASHES_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -204,11 +214,32 @@ class ExternalMarketData:
     session_windows: Sequence[SessionWindow]
 
 
+@dataclass(frozen=True)
+class MarketDataRowWindow:
+    """Half-open ``[start_row, end_row)`` range of a parent bundle's rows."""
+
+    start_row: int
+    end_row: int
+
+    def to_payload(self) -> Dict[str, int]:
+        return {"start_row": self.start_row, "end_row": self.end_row}
+
+
 @dataclass(frozen=True)
 class MarketDataBundle:
-    """Immutable handle to one validated, file-backed market-data bundle."""
+    """Immutable handle to one validated, file-backed market-data bundle.
+
+    A handle with ``row_window`` is a view over a contiguous row range of the
+    same bundle.  It shares the parent manifest and tables; the Rust engine
+    receives the range next to the manifest and slices its resident frames.
+
+    Sealed manifests are parsed and validated once per file size and mtime,
+    and a table whose file is unchanged since its hash was verified is not
+    re-hashed, so repeated handle access stays off the hot path.
+    """
 
     manifest_path: Path
+    row_window: MarketDataRowWindow | None = None
 
     @classmethod
     def open(cls, manifest_path: Path | str) -> "MarketDataBundle":
@@ -218,22 +249,38 @@ class MarketDataBundle:
 
     @property
     def bundle_id(self) -> str:
-        return str(self.read_manifest()["bundle_id"])
+        return str(self._sealed_manifest()["bundle_id"])
 
     @property
     def content_hash(self) -> str:
-        return str(self.read_manifest()["content_hash"])
+        return str(self._sealed_manifest()["content_hash"])
 
     def read_manifest(self) -> Dict[str, Any]:
-        try:
-            payload = json.loads(self.manifest_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
-            raise ValueError(f"Invalid MarketDataBundle manifest: {self.manifest_path}") from exc
-        validate_market_data_bundle_manifest(payload, manifest_path=self.manifest_path)
-        return payload
+        return copy.deepcopy(self._sealed_manifest())
+
+    def _sealed_manifest(self) -> Dict[str, Any]:
+        """Shared validated manifest; callers must not mutate it."""
+        return _read_sealed_manifest(self.manifest_path)
+
+    def with_row_window(self, start_row: int, end_row: int) -> "MarketDataBundle":
+        """Return a view over rows ``[start_row, end_row)`` of this handle."""
+        if self.row_window is None:
+            offset, limit = 0, int(self._sealed_manifest()["row_count"])
+        else:
+            offset, limit = self.row_window.start_row, self.row_window.end_row
+        start, end = offset + int(start_row), offset + int(end_row)
+        if not offset <= start < end <= limit:
+            raise ValueError(
+                "MarketDataBundle row window must be a non-empty range inside the bundle"
+            )
+        return replace(self, row_window=MarketDataRowWindow(start, end))
+
+    def market_data_window(self) -> Dict[str, int] | None:
+        """Engine service payload for the row window, or None for the full bundle."""
+        return None if self.row_window is None else self.row_window.to_payload()
 
     def load_frames(self) -> Dict[str, pd.DataFrame]:
-        manifest = self.read_manifest()
+        manifest = self._sealed_manifest()
         row_key_kind = str(manifest["execution_stream"]["row_key_kind"])
         frames: Dict[str, pd.DataFrame] = {}
         for name, table in manifest["tables"].items():
@@ -244,22 +291,29 @@ class MarketDataBundle:
             )
         if "close" not in frames:
             raise ValueError("MarketDataBundle requires a close table")
-        return frames
+        return {name: self._windowed(frame) for name, frame in frames.items()}
 
     def load_execution_timeline(self) -> pd.DataFrame:
-        manifest = self.read_manifest()
+        manifest = self._sealed_manifest()
         table = manifest["tables"][manifest["execution_stream"]["timeline_table"]]
         frame = self._load_table(
             TIMELINE_TABLE,
             table,
             row_key_kind=str(manifest["execution_stream"]["row_key_kind"]),
         )
-        return _normalize_execution_timeline(
-            frame,
-            row_key_kind=str(manifest["execution_stream"]["row_key_kind"]),
-            semantics=manifest["execution_stream"]["timestamp_semantics"],
+        return self._windowed(
+            _normalize_execution_timeline(
+                frame,
+                row_key_kind=str(manifest["execution_stream"]["row_key_kind"]),
+                semantics=manifest["execution_stream"]["timestamp_semantics"],
+            )
         )
 
+    def _windowed(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if self.row_window is None:
+            return frame
+        return frame.iloc[self.row_window.start_row : self.row_window.end_row]
+
     def _load_table(
         self,
         name: str,
@@ -279,14 +333,27 @@ class MarketDataBundle:
             raise ValueError(f"MarketDataBundle table path escapes bundle directory: {name}")
         if not path.is_file():
             raise ValueError(f"MarketDataBundle table is missing: {name}")
+        stat = path.stat()
+        file_key = str(path)
+        file_stamp = (int(stat.st_size), int(stat.st_mtime_ns), str(table["content_hash"]))
         transport_frame = pd.read_parquet(path)
         _validate_transport_frame(
             transport_frame,
             name=name,
             row_key_kind=row_key_kind,
         )
-        if _frame_content_hash(transport_frame) != table["content_hash"]:
-            raise ValueError(f"MarketDataBundle table content hash mismatch: {name}")
+        with _VERIFIED_TABLE_HASHES_LOCK:
+            verified = _VERIFIED_TABLE_HASHES.get(file_key) == file_stamp
+            if verified:
+                _VERIFIED_TABLE_HASHES.move_to_end(file_key)
+        if not verified:
+            if _frame_content_hash(transport_frame) != table["content_hash"]:
+                raise ValueError(f"MarketDataBundle table content hash mismatch: {name}")
+            with _VERIFIED_TABLE_HASHES_LOCK:
+                _VERIFIED_TABLE_HASHES[file_key] = file_stamp
+                _VERIFIED_TABLE_HASHES.move_to_end(file_key)
+                while len(_VERIFIED_TABLE_HASHES) > _VERIFIED_TABLE_HASHES_CAPACITY:
+                    _VERIFIED_TABLE_HASHES.popitem(last=False)
         if len(transport_frame.index) != int(table["row_count"]):
             raise ValueError(f"MarketDataBundle table row_count mismatch: {name}")
         if [str(column) for column in transport_frame.columns] != list(table["columns"]):
@@ -301,7 +368,7 @@ class MarketDataBundle:
         return self.load_frames()["close"]
 
     def validate_against_engine_request(self, engine_request: Mapping[str, Any]) -> None:
-        manifest = self.read_manifest()
+        manifest = self._sealed_manifest()
         requirements = dict(engine_request.get("data_requirements") or {})
         if requirements.get("bundle_schema_version") != SCHEMA_VERSION:
             raise ValueError("EngineRequest does not require MarketDataBundle.v2")
@@ -496,8 +563,7 @@ def validate_market_data_bundle_manifest(
     manifest_path: Path | None = None,
 ) -> None:
     payload = dict(manifest or {})
-    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
-    Draft202012Validator(schema).validate(payload)
+    _manifest_validator().validate(payload)
     expected_hash = market_data_bundle_content_hash(payload)
     if payload.get("content_hash") != expected_hash:
         raise ValueError("MarketDataBundle content_hash does not match canonical manifest")
@@ -507,6 +573,35 @@ def validate_market_data_bundle_manifest(
         raise ValueError("MarketDataBundle manifest filename must be manifest.json")
 
 
+@functools.lru_cache(maxsize=1)
+def _manifest_validator() -> Draft202012Validator:
+    schema = json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
+    return Draft202012Validator(schema)
+
+
+@functools.lru_cache(maxsize=256)
+def _validated_manifest(path: str, size: int, mtime_ns: int) -> Dict[str, Any]:
+    del size, mtime_ns
+    manifest_path = Path(path)
+    try:
+        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid MarketDataBundle manifest: {manifest_path}") from exc
+    validate_market_data_bundle_manifest(payload, manifest_path=manifest_path)
+    return payload
+
+
+def _read_sealed_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Validated manifest, parsed once per file size and mtime and shared by handles."""
+    try:
+        stat = manifest_path.stat()
+    except OSError as exc:
+        raise ValueError(f"Invalid MarketDataBundle manifest: {manifest_path}") from exc
+    return _validated_manifest(
+        str(manifest_path), int(stat.st_size), int(stat.st_mtime_ns)
+    )
+
+
 def market_data_bundle_content_hash(manifest: Mapping[str, Any]) -> str:
     payload = dict(manifest or {})
     tables = {
@@ -10,7 +10,7 @@ from __future__ import annotations
 import threading
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 import exchange_calendars as xcals  # type: ignore[import-untyped]
@@ -27,6 +27,12 @@ from dataloader.provider_bar_time import (
     resolve_xnys_session_bar_bounds,
     typed_intraday_duration,
 )
+from dataloader.provider_cache import (
+    ProviderBarCache,
+    ProviderBarCacheMiss,
+    provider_bar_cache_from_env,
+    provider_bar_variant,
+)
 from utils.path_resolver import resolve_input_path
 
 
@@ -116,6 +122,20 @@ _PROVIDER_BAR_CAPABILITIES = {
     },
 }
 
+# Spec fields, beyond the bar stream itself, that change the bars a provider
+# returns. Each distinct combination is cached as its own series variant.
+_PROVIDER_CACHE_VARIANT_FIELDS = (
+    "adjustment_policy",
+    "api_base",
+    "market",
+    "symbol_map",
+    "exchange",
+    "currency",
+    "use_rth",
+)
+
+_START_POLICY_PROVIDERS = {"yfinance", "binance", "coinbase"}
+
 _IBKR_SINGLE_REQUEST_HISTORY_DAYS = {
     (1, "minute"): 1,
     (5, "minute"): 7,
@@ -350,8 +370,14 @@ def market_data_spec_from_requirements(
 class MultiAssetMarketDataLoader:
     """Load normalized multi-asset market data frames from configured providers."""
 
-    def __init__(self, *, repo_root: Path):
+    def __init__(
+        self,
+        *,
+        repo_root: Path,
+        provider_cache: Optional[ProviderBarCache] = None,
+    ):
         self.repo_root = Path(repo_root)
+        self.provider_cache = provider_cache
 
     def load(
         self,
@@ -370,7 +396,11 @@ class MultiAssetMarketDataLoader:
             self._validate_provider_capability(spec)
         if provider in {"yfinance", "yf"}:
             self._validate_provider_price_basis(spec, provider="yfinance")
-            frames = self._download_yfinance(spec)
+            frames = self._fetch_provider_frames(
+                spec,
+                provider="yfinance",
+                download=self._download_yfinance,
+            )
             self._validate_provider_frames(frames, spec=spec)
             return self._with_external_features(
                 frames,
@@ -379,7 +409,11 @@ class MultiAssetMarketDataLoader:
             )
         if provider in {"binance", "binance_spot"}:
             self._validate_provider_price_basis(spec, provider="binance")
-            frames = self._download_binance(spec)
+            frames = self._fetch_provider_frames(
+                spec,
+                provider="binance",
+                download=self._download_binance,
+            )
             self._validate_provider_frames(frames, spec=spec)
             return self._with_external_features(
                 frames,
@@ -388,7 +422,11 @@ class MultiAssetMarketDataLoader:
             )
         if provider in {"coinbase", "coinbase_exchange"}:
             self._validate_provider_price_basis(spec, provider="coinbase")
-            frames = self._download_coinbase(spec)
+            frames = self._fetch_provider_frames(
+                spec,
+                provider="coinbase",
+                download=self._download_coinbase,
+            )
             self._validate_provider_frames(frames, spec=spec)
             return self._with_external_features(
                 frames,
@@ -398,7 +436,11 @@ class MultiAssetMarketDataLoader:
         if provider in {"futu", "futu_openapi"}:
             from dataloader.futu_loader import FutuMarketDataLoader
 
-            frames = FutuMarketDataLoader().load_multi_asset(spec)
+            frames = self._fetch_provider_frames(
+                spec,
+                provider="futu",
+                download=FutuMarketDataLoader().load_multi_asset,
+            )
             self._validate_provider_frames(frames, spec=spec)
             return self._with_external_features(
                 frames,
@@ -408,7 +450,11 @@ class MultiAssetMarketDataLoader:
         if provider in {"ibkr", "interactive_brokers", "interactivebrokers"}:
             from dataloader.ibkr_loader import IBKRMarketDataLoader
 
-            frames = IBKRMarketDataLoader().load_multi_asset(spec)
+            frames = self._fetch_provider_frames(
+                spec,
+                provider="ibkr",
+                download=IBKRMarketDataLoader().load_multi_asset,
+            )
             self._validate_provider_frames(frames, spec=spec)
             return self._with_external_features(
                 frames,
@@ -422,6 +468,119 @@ class MultiAssetMarketDataLoader:
             config_file_path=config_file_path,
         )
 
+    def _fetch_provider_frames(
+        self,
+        spec: Dict[str, Any],
+        *,
+        provider: str,
+        download: Callable[[Dict[str, Any]], Dict[str, pd.DataFrame]],
+    ) -> Dict[str, pd.DataFrame]:
+        """Serve provider bars from the local cache, downloading only uncovered windows."""
+
+        cache = (
+            self.provider_cache
+            if self.provider_cache is not None
+            else provider_bar_cache_from_env(self.repo_root)
+        )
+        execution_stream = spec.get("execution_stream")
+        raw_symbols = spec.get("symbols")
+        start_raw = spec.get("start") or spec.get("start_date")
+        if (
+            cache is None
+            or not isinstance(execution_stream, dict)
+            or not isinstance(execution_stream.get("bar_spec"), dict)
+            or not isinstance(raw_symbols, list)
+            or not start_raw
+            or "end_datetime" in spec
+        ):
+            return download(spec)
+        symbols = [str(item).strip().upper() for item in raw_symbols if str(item).strip()]
+        if provider == "binance":
+            symbols = [symbol.replace("/", "") for symbol in symbols]
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return download(spec)
+
+        bar_spec = execution_stream["bar_spec"]
+        row_key_kind = self._configured_row_key_kind(spec)
+        convention = self._timestamp_convention(spec)
+        start = pd.Timestamp(str(start_raw))
+        end_raw = spec.get("end") or spec.get("end_date")
+        end = pd.Timestamp(str(end_raw)) if end_raw else None
+        if start.tz is not None:
+            start = start.tz_convert("UTC").tz_localize(None)
+        if end is not None and end.tz is not None:
+            end = end.tz_convert("UTC").tz_localize(None)
+        if row_key_kind == "session_label":
+            bar_step = pd.Timedelta(days=1)
+            slice_offset = pd.Timedelta(0)
+            start = start.floor("D")
+            end = end.ceil("D") if end is not None else None
+        else:
+            bar_step = self._execution_bar_duration(bar_spec)
+            slice_offset = bar_step if convention == "bar_close" else pd.Timedelta(0)
+        # yfinance, FUTU and IBKR take calendar dates; the crypto REST APIs
+        # take exact timestamps.
+        day_bounds = row_key_kind == "session_label" or provider in {"futu", "ibkr"}
+
+        def fetch(
+            fetch_start: pd.Timestamp,
+            fetch_end: pd.Timestamp,
+            fetch_symbols: List[str],
+        ) -> Dict[str, pd.DataFrame]:
+            if day_bounds:
+                bounds = (
+                    fetch_start.floor("D").strftime("%Y-%m-%d"),
+                    fetch_end.ceil("D").strftime("%Y-%m-%d"),
+                )
+            else:
+                bounds = (fetch_start.isoformat(), fetch_end.isoformat())
+            window_spec = {
+                key: value
+                for key, value in spec.items()
+                if key not in {"start_date", "end_date", "start_policy", "dropna_policy"}
+            }
+            window_spec.update(
+                {"symbols": fetch_symbols, "start": bounds[0], "end": bounds[1]}
+            )
+            return download(window_spec)
+
+        session_model = spec.get("session_model")
+        variant = provider_bar_variant(
+            {
+                "row_key_kind": row_key_kind,
+                "timestamp_convention": convention,
+                "calendar_id": (
+                    session_model.get("calendar_id")
+                    if isinstance(session_model, dict)
+                    else None
+                ),
+                **{field: spec.get(field) for field in _PROVIDER_CACHE_VARIANT_FIELDS},
+            }
+        )
+        try:
+            frames = cache.load_bars(
+                provider=provider,
+                interval=f"{bar_spec.get('step')}_{bar_spec.get('unit')}",
+                variant=variant,
+                symbols=symbols,
+                start=start,
+                end=end,
+                bar_step=bar_step,
+                slice_offset=slice_offset,
+                fetch=fetch,
+            )
+        except ProviderBarCacheMiss as exc:
+            raise MarketDataContractError(
+                "provider_cache_miss",
+                str(exc),
+                provider=provider,
+                details={"missing_windows": exc.missing_windows()},
+            ) from exc
+        if provider not in _START_POLICY_PROVIDERS:
+            return frames
+        return self._apply_start_policy(frames, spec, provider=provider, symbols=symbols)
+
     @classmethod
     def _validate_provider_frames(
         cls,
@@ -1475,21 +1634,7 @@ class MultiAssetMarketDataLoader:
                     + ", ".join(missing_symbols)
                 )
         frames = {key: frame.reindex(columns=symbols) for key, frame in frames.items()}
-        start_policy = str(
-            spec.get("start_policy") or spec.get("dropna_policy") or ""
-        ).strip().lower()
-        if start_policy in {"common_available", "first_common", "all_symbols_available"}:
-            common_dates = frames["close"].dropna(how="any").index
-            if common_dates.empty:
-                raise ValueError(
-                    f"yfinance data has no common tradable date for symbols={symbols}"
-                )
-            first_common = pd.Timestamp(common_dates.to_series().iloc[0]).normalize()
-            frames = {
-                key: frame.loc[frame.index >= first_common].copy()
-                for key, frame in frames.items()
-            }
-        return frames
+        return self._apply_start_policy(frames, spec, provider="yfinance", symbols=symbols)
 
     @classmethod
     def _normalize_yfinance_row_keys(
@@ -1573,21 +1718,7 @@ class MultiAssetMarketDataLoader:
             for field, series_list in field_frames.items()
         }
         frames = {key: frame.reindex(columns=symbols) for key, frame in frames.items()}
-        start_policy = str(
-            spec.get("start_policy") or spec.get("dropna_policy") or ""
-        ).strip().lower()
-        if start_policy in {"common_available", "first_common", "all_symbols_available"}:
-            common_dates = frames["close"].dropna(how="any").index
-            if common_dates.empty:
-                raise ValueError(
-                    f"coinbase data has no common tradable date for symbols={symbols}"
-                )
-            first_common = pd.Timestamp(common_dates.to_series().iloc[0]).normalize()
-            frames = {
-                key: frame.loc[frame.index >= first_common].copy()
-                for key, frame in frames.items()
-            }
-        return frames
+        return self._apply_start_policy(frames, spec, provider="coinbase", symbols=symbols)
 
     @staticmethod
     def _download_coinbase_symbol(
@@ -1730,21 +1861,7 @@ class MultiAssetMarketDataLoader:
             for field, series_list in field_frames.items()
         }
         frames = {key: frame.reindex(columns=symbols) for key, frame in frames.items()}
-        start_policy = str(
-            spec.get("start_policy") or spec.get("dropna_policy") or ""
-        ).strip().lower()
-        if start_policy in {"common_available", "first_common", "all_symbols_available"}:
-            common_dates = frames["close"].dropna(how="any").index
-            if common_dates.empty:
-                raise ValueError(
-                    f"binance data has no common tradable date for symbols={symbols}"
-                )
-            first_common = pd.Timestamp(common_dates.to_series().iloc[0]).normalize()
-            frames = {
-                key: frame.loc[frame.index >= first_common].copy()
-                for key, frame in frames.items()
-            }
-        return frames
+        return self._apply_start_policy(frames, spec, provider="binance", symbols=symbols)
 
     @staticmethod
     def _download_binance_symbol(
@@ -1833,6 +1950,30 @@ class MultiAssetMarketDataLoader:
             frame[field] = pd.to_numeric(frame[field], errors="coerce")
         return frame.set_index("Time")[["open", "high", "low", "close", "volume"]].sort_index()
 
+    @staticmethod
+    def _apply_start_policy(
+        frames: Dict[str, pd.DataFrame],
+        spec: Dict[str, Any],
+        *,
+        provider: str,
+        symbols: List[str],
+    ) -> Dict[str, pd.DataFrame]:
+        start_policy = str(
+            spec.get("start_policy") or spec.get("dropna_policy") or ""
+        ).strip().lower()
+        if start_policy not in {"common_available", "first_common", "all_symbols_available"}:
+            return frames
+        common_dates = frames["close"].dropna(how="any").index
+        if common_dates.empty:
+            raise ValueError(
+                f"{provider} data has no common tradable date for symbols={symbols}"
+            )
+        first_common = pd.Timestamp(common_dates.to_series().iloc[0]).normalize()
+        return {
+            key: frame.loc[frame.index >= first_common].copy()
+            for key, frame in frames.items()
+        }
+
     @staticmethod
     def _provider_interval(spec: Dict[str, Any], *, provider: str) -> str:
         execution_stream = spec.get("execution_stream")
@@ -0,0 +1,402 @@
+"""On-disk cache of provider bars with per-series coverage metadata.
+
+Each ``(provider, interval, variant, symbol)`` series is one parquet file of
+normalized OHLCV rows plus a JSON sidecar listing the half-open request windows
+the provider has already answered.  ``MultiAssetMarketDataLoader`` asks the
+cache which parts of a request are uncovered, downloads only those windows, and
+serves everything else from disk.  Offline mode never calls the provider and
+fails closed when the cache does not cover the request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.path_resolver import outputs_root
+
+PROVIDER_BAR_CACHE_SCHEMA_VERSION = "provider_bar_cache.v1"
+PROVIDER_BAR_FIELDS = ("open", "high", "low", "close", "volume")
+_PRICE_FIELDS = ("open", "high", "low", "close")
+_DISABLED_MODES = {"0", "off", "false", "disabled"}
+
+Window = Tuple[pd.Timestamp, pd.Timestamp]
+FetchBars = Callable[[pd.Timestamp, pd.Timestamp, List[str]], Dict[str, pd.DataFrame]]
+
+_SERIES_LOCKS: Dict[Path, threading.Lock] = {}
+_SERIES_LOCKS_GUARD = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ProviderBarSeries:
+    """Identity of one cached bar series."""
+
+    provider: str
+    interval: str
+    variant: str
+    symbol: str
+
+
+class ProviderBarCacheMiss(LookupError):
+    """Offline request that the cache cannot answer without the provider."""
+
+    def __init__(self, provider: str, missing: Dict[str, List[Window]]) -> None:
+        symbols = ", ".join(sorted(missing))
+        super().__init__(
+            f"{provider} offline cache does not cover the requested history for: {symbols}"
+        )
+        self.provider = provider
+        self.missing = missing
+
+    def missing_windows(self) -> Dict[str, List[List[str]]]:
+        return {
+            symbol: [[start.isoformat(), end.isoformat()] for start, end in windows]
+            for symbol, windows in sorted(self.missing.items())
+        }
+
+
+def provider_bar_variant(fields: Dict[str, Any]) -> str:
+    """Short digest of every spec field that changes the bars a provider returns."""
+
+    payload = json.dumps(
+        {"schema_version": PROVIDER_BAR_CACHE_SCHEMA_VERSION, **fields},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ProviderBarCache:
+    """Parquet bar store that fetches only the windows its coverage lacks.
+
+    Coverage is kept in naive UTC request time: session labels as dates, and
+    event timestamps shifted back to the bar open so ``bar_close`` keys compare
+    against the same ``[start, end)`` bounds the providers are asked for.  Only
+    bars whose open is at least one bar old are persisted or marked covered, so
+    an in-progress bar is always refetched.  When a fetch overlaps cached rows
+    and their prices disagree (for example after a retroactive dividend
+    adjustment), the series is dropped and the whole request is refetched.
+    """
+
+    def __init__(self, root: Path, *, offline: bool = False) -> None:
+        self.root = Path(root)
+        self.offline = bool(offline)
+
+    def series_paths(self, series: ProviderBarSeries) -> Tuple[Path, Path]:
+        directory = self.root / _safe_name(series.provider) / _safe_name(series.interval) / series.variant
+        name = _safe_name(series.symbol)
+        return directory / f"{name}.parquet", directory / f"{name}.json"
+
+    def read(self, series: ProviderBarSeries) -> Tuple[pd.DataFrame, List[Window]]:
+        """Cached rows and coverage for ``series``; unreadable entries count as empty."""
+
+        frame_path, meta_path = self.series_paths(series)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("schema_version") != PROVIDER_BAR_CACHE_SCHEMA_VERSION:
+                return _empty_bars(), []
+            frame = pd.read_parquet(frame_path)
+            coverage = [
+                (pd.Timestamp(start), pd.Timestamp(end))
+                for start, end in meta.get("coverage", [])
+            ]
+        except (OSError, ValueError, TypeError):
+            return _empty_bars(), []
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            return _empty_bars(), []
+        return frame[list(PROVIDER_BAR_FIELDS)], _union_windows(coverage)
+
+    def write(
+        self,
+        series: ProviderBarSeries,
+        frame: pd.DataFrame,
+        coverage: List[Window],
+    ) -> None:
+        frame_path, meta_path = self.series_paths(series)
+        frame_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "schema_version": PROVIDER_BAR_CACHE_SCHEMA_VERSION,
+            "provider": series.provider,
+            "interval": series.interval,
+            "variant": series.variant,
+            "symbol": series.symbol,
+            "row_count": int(len(frame)),
+            "coverage": [
+                [start.isoformat(), end.isoformat()]
+                for start, end in _union_windows(coverage)
+            ],
+        }
+        # Rows land before coverage, so a torn write can only under-claim.
+        frame_tmp = frame_path.with_suffix(f".parquet.{os.getpid()}.tmp")
+        frame[list(PROVIDER_BAR_FIELDS)].to_parquet(frame_tmp)
+        os.replace(frame_tmp, frame_path)
+        meta_tmp = meta_path.with_suffix(f".json.{os.getpid()}.tmp")
+        meta_tmp.write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+        os.replace(meta_tmp, meta_path)
+
+    def invalidate(self, series: ProviderBarSeries) -> None:
+        frame_path, meta_path = self.series_paths(series)
+        for path in (meta_path, frame_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def load_bars(
+        self,
+        *,
+        provider: str,
+        interval: str,
+        variant: str,
+        symbols: List[str],
+        start: pd.Timestamp,
+        end: Optional[pd.Timestamp],
+        bar_step: pd.Timedelta,
+        slice_offset: pd.Timedelta,
+        fetch: FetchBars,
+        now: Optional[pd.Timestamp] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Wide OHLCV frames for ``[start, end)``, fetching only uncovered windows.
+
+        ``fetch(start, end, symbols)`` returns provider frames in the loader's
+        wide shape.  An open ``end`` means "up to now" online and "up to the
+        cached coverage" offline.
+        """
+
+        now = _naive_utc(now) if now is not None else _naive_utc(pd.Timestamp.now(tz="UTC"))
+        settled = now - bar_step
+        series_by_symbol = {
+            symbol: ProviderBarSeries(provider, interval, variant, symbol)
+            for symbol in symbols
+        }
+        with ExitStack() as stack:
+            for path in sorted(self.series_paths(series)[0] for series in series_by_symbol.values()):
+                stack.enter_context(_series_lock(path))
+            frames: Dict[str, pd.DataFrame] = {}
+            coverage: Dict[str, List[Window]] = {}
+            for symbol, series in series_by_symbol.items():
+                frames[symbol], coverage[symbol] = self.read(series)
+            if end is None:
+                end = now
+                if self.offline:
+                    covered_ends = [
+                        max(window_end for _, window_end in windows) if windows else start
+                        for windows in coverage.values()
+                    ]
+                    if covered_ends and min(covered_ends) > start:
+                        end = min(covered_ends)
+
+            plans: Dict[Window, List[Tuple[str, Window]]] = {}
+            for symbol in symbols:
+                for gap in _subtract_windows((start, end), coverage[symbol]):
+                    fetch_window = _fetch_window(
+                        gap,
+                        frames[symbol],
+                        coverage[symbol],
+                        bar_step=bar_step,
+                        slice_offset=slice_offset,
+                    )
+                    plans.setdefault(fetch_window, []).append((symbol, gap))
+            if plans and self.offline:
+                missing: Dict[str, List[Window]] = {}
+                for members in plans.values():
+                    for symbol, gap in members:
+                        missing.setdefault(symbol, []).append(gap)
+                raise ProviderBarCacheMiss(provider, missing)
+
+            touched: set[str] = set()
+            revised: set[str] = set()
+            for (fetch_start, fetch_end), members in plans.items():
+                fetched = fetch(fetch_start, fetch_end, [symbol for symbol, _ in members])
+                for symbol, gap in members:
+                    if symbol in revised:
+                        continue
+                    rows = _symbol_rows(fetched, symbol)
+                    if not _prices_agree(frames[symbol], rows):
+                        revised.add(symbol)
+                        continue
+                    frames[symbol] = _merge_rows(frames[symbol], rows)
+                    coverage[symbol] = _claim(coverage[symbol], gap, settled)
+                    touched.add(symbol)
+            if revised:
+                refetched = fetch(start, end, sorted(revised))
+                for symbol in revised:
+                    self.invalidate(series_by_symbol[symbol])
+                    frames[symbol] = _symbol_rows(refetched, symbol)
+                    coverage[symbol] = _claim([], (start, end), settled)
+                touched |= revised
+
+            for symbol in sorted(touched):
+                frame = frames[symbol]
+                keys = _slice_keys(frame.index, slice_offset)
+                self.write(series_by_symbol[symbol], frame.loc[keys < settled], coverage[symbol])
+
+        out: Dict[str, pd.DataFrame] = {}
+        for field in PROVIDER_BAR_FIELDS:
+            columns: List[pd.Series] = []
+            for symbol in symbols:
+                frame = frames[symbol]
+                if frame.empty:
+                    continue
+                keys = _slice_keys(frame.index, slice_offset)
+                columns.append(frame.loc[(keys >= start) & (keys < end), field].rename(symbol))
+            if columns:
+                out[field] = pd.concat(columns, axis=1).sort_index().reindex(columns=symbols)
+            else:
+                out[field] = pd.DataFrame(columns=symbols)
+        return out
+
+
+def provider_bar_cache_from_env(repo_root: Path) -> Optional[ProviderBarCache]:
+    """The cache configured by ``LO2CIN4BT_PROVIDER_CACHE*``, or ``None`` when off."""
+
+    mode = os.getenv("LO2CIN4BT_PROVIDER_CACHE", "").strip().lower()
+    if mode in _DISABLED_MODES:
+        return None
+    raw_dir = os.getenv("LO2CIN4BT_PROVIDER_CACHE_DIR", "").strip()
+    root = (
+        Path(raw_dir)
+        if raw_dir
+        else outputs_root(Path(repo_root)) / "cache" / "provider_bars"
+    )
+    return ProviderBarCache(root, offline=mode == "offline")
+
+
+def _series_lock(path: Path) -> threading.Lock:
+    with _SERIES_LOCKS_GUARD:
+        lock = _SERIES_LOCKS.get(path)
+        if lock is None:
+            lock = threading.Lock()
+            _SERIES_LOCKS[path] = lock
+        return lock
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._=-]+", "_", str(value)) or "_"
+
+
+def _naive_utc(value: Any) -> pd.Timestamp:
+    stamp = pd.Timestamp(value)
+    if stamp.tz is not None:
+        stamp = stamp.tz_convert("UTC").tz_localize(None)
+    return stamp
+
+
+def _empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(
+        columns=list(PROVIDER_BAR_FIELDS),
+        index=pd.DatetimeIndex([], name="Time"),
+        dtype=float,
+    )
+
+
+def _slice_keys(index: pd.Index, slice_offset: pd.Timedelta) -> pd.DatetimeIndex:
+    keys = pd.DatetimeIndex(index)
+    if keys.tz is not None:
+        keys = keys.tz_convert("UTC").tz_localize(None)
+    return keys - slice_offset
+
+
+def _union_windows(windows: List[Window]) -> List[Window]:
+    merged: List[Window] = []
+    for start, end in sorted(window for window in windows if window[0] < window[1]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract_windows(request: Window, coverage: List[Window]) -> List[Window]:
+    gaps: List[Window] = []
+    cursor, end = request
+    for covered_start, covered_end in coverage:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _claim(coverage: List[Window], gap: Window, settled: pd.Timestamp) -> List[Window]:
+    return _union_windows([*coverage, (gap[0], min(gap[1], settled))])
+
+
+def _fetch_window(
+    gap: Window,
+    frame: pd.DataFrame,
+    coverage: List[Window],
+    *,
+    bar_step: pd.Timedelta,
+    slice_offset: pd.Timedelta,
+) -> Window:
+    """Widen ``gap`` to the adjacent cached bars so the fetch overlaps known rows.
+
+    The overlap both proves the cached prices are still current and keeps a
+    short gap (a weekend, say) from reaching the provider as an empty request.
+    """
+
+    fetch_start, fetch_end = gap
+    if frame.empty:
+        return gap
+    keys = _slice_keys(frame.index, slice_offset)
+    for covered_start, covered_end in coverage:
+        if covered_end == gap[0]:
+            before = keys[(keys >= covered_start) & (keys < gap[0])]
+            if len(before):
+                fetch_start = before.max()
+        if covered_start == gap[1]:
+            after = keys[(keys >= gap[1]) & (keys < covered_end)]
+            if len(after):
+                fetch_end = after.min() + bar_step
+    return fetch_start, fetch_end
+
+
+def _symbol_rows(fetched: Dict[str, pd.DataFrame], symbol: str) -> pd.DataFrame:
+    columns = {}
+    for field in PROVIDER_BAR_FIELDS:
+        frame = fetched.get(field)
+        if not isinstance(frame, pd.DataFrame) or symbol not in frame.columns:
+            return _empty_bars()
+        columns[field] = frame[symbol]
+    rows = pd.DataFrame(columns).dropna(how="all")
+    if rows.empty:
+        return _empty_bars()
+    return rows.sort_index()
+
+
+def _prices_agree(cached: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    if cached.empty or fresh.empty:
+        return True
+    shared = cached.index.intersection(fresh.index)
+    if shared.empty:
+        return True
+    left = cached.loc[shared, list(_PRICE_FIELDS)].to_numpy(dtype=float)
+    right = fresh.loc[shared, list(_PRICE_FIELDS)].to_numpy(dtype=float)
+    return bool(np.allclose(left, right, rtol=1e-7, atol=0.0, equal_nan=True))
+
+
+def _merge_rows(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    if fresh.empty:
+        return cached
+    if cached.empty:
+        return fresh
+    kept = cached.loc[~cached.index.isin(fresh.index)]
+    return pd.concat([kept, fresh]).sort_index()
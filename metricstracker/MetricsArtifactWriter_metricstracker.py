@@ -6,10 +6,6 @@ import json
 from pathlib import Path
 from typing import Dict
 
-import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
-
 from backtester.RustCoreBridge_backtester import run_metrics_parquet_via_cli
 from utils.filename_utils import bounded_filename_stem
 
@@ -23,10 +19,16 @@ def export_metrics_artifacts(
     benchmark_symbol: str | None = None,
 ) -> Dict[str, str]:
     source = Path(source_path).resolve()
+    output_dir = source.parent.parent / "metricstracker"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = bounded_filename_stem(source.stem, max_length=96, fallback="metrics")
+    metadata_path = output_dir / f"{stem}_metadata.json"
+    parquet_path = output_dir / f"{stem}_metrics.parquet"
     request = {
         "parquet_path": str(source),
         "time_unit": int(time_unit),
         "risk_free_rate": float(risk_free_rate),
+        "output_parquet_path": str(parquet_path),
     }
     if benchmark_parquet_path:
         request["benchmark_parquet_path"] = str(Path(benchmark_parquet_path).resolve())
@@ -35,17 +37,16 @@ def export_metrics_artifacts(
         request,
         timeout=60,
     )
-    metrics, enriched_rows = summary.get("metrics"), summary.get("enriched_rows")
-    if not isinstance(metrics, list) or not isinstance(enriched_rows, list):
+    metrics, enriched = summary.get("metrics"), summary.get("enriched_parquet")
+    if not isinstance(metrics, list) or not isinstance(enriched, dict):
         raise RuntimeError("Rust metrics_parquet returned an invalid contract")
+    if Path(str(enriched.get("path") or "")) != parquet_path or not parquet_path.exists():
+        raise RuntimeError("Rust metrics_parquet did not write the enriched parquet")
+    if not isinstance(enriched.get("row_count"), int) or not enriched.get("content_hash"):
+        raise RuntimeError("Rust metrics_parquet returned an invalid enriched parquet contract")
     annualization = summary.get("annualization")
     if not isinstance(annualization, dict):
         raise RuntimeError("Rust metrics_parquet returned no annualization contract")
-    output_dir = source.parent.parent / "metricstracker"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    stem = bounded_filename_stem(source.stem, max_length=96, fallback="metrics")
-    metadata_path = output_dir / f"{stem}_metadata.json"
-    parquet_path = output_dir / f"{stem}_metrics.parquet"
     metadata_rows = [
         {
             **row,
@@ -58,20 +59,4 @@ def export_metrics_artifacts(
     metadata_path.write_text(
         json.dumps(metadata_rows, ensure_ascii=False, indent=2), encoding="utf-8"
     )
-    source_frame = pd.read_parquet(source)
-    columns = [
-        name
-        for name in ["Time", "Session_label", "Equity_value", "Backtest_id"]
-        if name in source_frame
-    ]
-    output = source_frame[columns].copy()
-    enriched = pd.DataFrame(enriched_rows).sort_values("row_index")
-    if len(enriched) != len(output):
-        raise RuntimeError("Rust metrics_parquet enrichment row count mismatch")
-    for name in ["BAH_Equity", "BAH_Return", "Drawdown", "BAH_Drawdown"]:
-        if name in enriched:
-            output[name] = pd.to_numeric(enriched[name], errors="coerce").to_numpy()
-    metadata = {key: value for key, value in (pq.read_schema(source).metadata or {}).items() if key != b"batch_metadata"}
-    table = pa.Table.from_pandas(output, preserve_index=False).replace_schema_metadata(metadata)
-    pq.write_table(table, parquet_path)
     return {"parquet_path": str(parquet_path), "metadata_path": str(metadata_path)}
@@ -58,8 +58,12 @@ export const api = {
     postJson<any>('/screenshots', payload),
   wfaRuns: () => getJson<any[]>('/wfa/runs'),
   statRuns: () => getJson<any[]>('/statanalyser/runs'),
-  metricsOverview: (runId: string) =>
-    getJson<MetricsOverviewPayloadV1>(`/metrics/${runId}/overview`),
+  metricsOverview: (runId: string, options: { maxPoints?: number } = {}) =>
+    getJson<MetricsOverviewPayloadV1>(
+      options.maxPoints
+        ? `/metrics/${runId}/overview?max_points=${options.maxPoints}`
+        : `/metrics/${runId}/overview`,
+    ),
   parameterMatrix: (runId: string) =>
     getJson<any>(`/metrics/${runId}/parameter-matrix`),
   parameterMatrixReviewPreview: (
@@ -89,5 +93,5 @@ export const api = {
     getJson<any>(`/statanalyser/${runId}`),
 }
 
-export const createBatchSocket = (batchId: string): WebSocket =>
-  new WebSocket(`${window.location.protocol === 'https:' ? 'wss' : 'ws'}://${window.location.host}${API_BASE}/batches/${batchId}/stream`)
+export const createBatchEventSource = (batchId: string): EventSource =>
+  new EventSource(`${API_BASE}/batches/${batchId}/events`)
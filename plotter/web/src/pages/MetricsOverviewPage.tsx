@@ -22,6 +22,9 @@ import {
 } from '../tradeMarkers'
 import { benchmarkDisplayLabel, dataHealthLabel } from '../uiVocabulary'
 
+// Points per curve in the overview chart; the API serves them from the LTTB pyramid.
+const OVERVIEW_CHART_MAX_POINTS = 2000
+
 const CORE_KPIS = [
   ['CAGR', 'cagr'],
   ['Total Return', 'total_return'],
@@ -518,6 +521,12 @@ export function MetricsOverviewPage() {
     enabled: hasResolvedRun,
     staleTime: 60000,
   })
+  const chartQuery = useQuery({
+    queryKey: ['metrics-overview', runId, 'chart', OVERVIEW_CHART_MAX_POINTS],
+    queryFn: () => api.metricsOverview(runId, { maxPoints: OVERVIEW_CHART_MAX_POINTS }),
+    enabled: hasResolvedRun && Boolean(overviewQuery.data) && overviewQuery.data?.result_type !== 'portfolio',
+    staleTime: 60000,
+  })
 
   useEffect(() => {
     if (!runsQuery.data?.length || requestedRunId) return
@@ -585,7 +594,8 @@ export function MetricsOverviewPage() {
 
   const plotData = useMemo(() => {
     const selectedSet = new Set(selectedIds)
-    const series: any[] = (overviewQuery.data?.series || [])
+    const chartPayload = chartQuery.data || overviewQuery.data
+    const series: any[] = (chartPayload?.series || [])
       .filter((item: any) => selectedSet.has(item.backtest_id))
       .map((item: any) => ({
         x: item.x,
@@ -595,18 +605,18 @@ export function MetricsOverviewPage() {
         name: item.label,
         customdata: item.backtest_id,
       }))
-    if (benchmarkVisible && overviewQuery.data?.benchmark_series) {
+    if (benchmarkVisible && chartPayload?.benchmark_series) {
       series.push({
-        x: overviewQuery.data.benchmark_series.x,
-        y: overviewQuery.data.benchmark_series.y,
+        x: chartPayload.benchmark_series.x,
+        y: chartPayload.benchmark_series.y,
         type: 'scatter',
         mode: 'lines',
-        name: overviewQuery.data.benchmark_series.label,
+        name: chartPayload.benchmark_series.label,
         line: { dash: 'dash', color: '#7e9bcc' },
       })
     }
     return series
-  }, [benchmarkVisible, overviewQuery.data, selectedIds])
+  }, [benchmarkVisible, chartQuery.data, overviewQuery.data, selectedIds])
 
   const formatCell = formatFixedCell
 
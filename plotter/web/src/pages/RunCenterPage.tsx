@@ -2,7 +2,7 @@ import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 import { Link } from '../routing'
 
-import { api, createBatchSocket, AppApiError } from '../api'
+import { api, createBatchEventSource, AppApiError } from '../api'
 import { useCopy } from '../i18n'
 import { SectionCard } from '../components/SectionCard'
 import { StatusBadge } from '../components/StatusBadge'
@@ -535,7 +535,7 @@ export function RunCenterPage() {
   const [runCenterFeedback, setRunCenterFeedback] = useState('')
   const [lastDebugError, setLastDebugError] = useState<Record<string, unknown> | null>(null)
   const [pendingStopBatchId, setPendingStopBatchId] = useState<string | null>(null)
-  const socketsRef = useRef<Record<string, WebSocket>>({})
+  const streamsRef = useRef<Record<string, EventSource>>({})
   const syncedCompletedRunIdsRef = useRef<Set<string>>(new Set())
 
   const configsQuery = useQuery({
@@ -700,14 +700,14 @@ export function RunCenterPage() {
         ),
       )
       replaceBatchIds(activeIds)
-      Object.values(socketsRef.current).forEach((socket) => {
+      Object.values(streamsRef.current).forEach((source) => {
         try {
-          socket.close()
+          source.close()
         } catch {
           // Ignore cleanup close failures.
         }
       })
-      socketsRef.current = {}
+      streamsRef.current = {}
       return
     }
     if (activeBatches.length > 0) {
@@ -735,14 +735,14 @@ export function RunCenterPage() {
 
   useEffect(() => {
     if (!commandCenterQuery.isError) return
-    Object.values(socketsRef.current).forEach((socket) => {
+    Object.values(streamsRef.current).forEach((source) => {
       try {
-        socket.close()
+        source.close()
       } catch {
         // Ignore cleanup close failures.
       }
     })
-    socketsRef.current = {}
+    streamsRef.current = {}
     setLiveBatches({})
     setServerSessionId('')
     replaceBatchIds([])
@@ -779,24 +779,24 @@ export function RunCenterPage() {
   useEffect(() => {
     const trackedSet = new Set(trackedBatchIds)
 
-    Object.entries(socketsRef.current).forEach(([batchId, socket]) => {
+    Object.entries(streamsRef.current).forEach(([batchId, source]) => {
       if (trackedSet.has(batchId)) {
         return
       }
       try {
-        socket.close()
+        source.close()
       } catch {
         // Ignore cleanup close failures.
       }
-      delete socketsRef.current[batchId]
+      delete streamsRef.current[batchId]
     })
 
     trackedBatchIds.forEach((batchId) => {
-      if (socketsRef.current[batchId]) {
+      if (streamsRef.current[batchId]) {
         return
       }
-      const socket = createBatchSocket(batchId)
-      socketsRef.current[batchId] = socket
+      const source = createBatchEventSource(batchId)
+      streamsRef.current[batchId] = source
 
       api.getBatch(batchId)
         .then((batch) => {
@@ -812,7 +812,7 @@ export function RunCenterPage() {
           })
         })
 
-      socket.onmessage = async () => {
+      source.onmessage = async () => {
         try {
           const batch = await api.getBatch(batchId)
           setLiveBatches((current) => ({ ...current, [batchId]: batch }))
@@ -827,23 +827,25 @@ export function RunCenterPage() {
         }
       }
 
-      socket.onclose = () => {
-        delete socketsRef.current[batchId]
-      }
+      // The server ends the stream once the batch finishes; closing here keeps
+      // EventSource from reconnecting and replaying it.
+      source.addEventListener('end', () => {
+        source.close()
+      })
     })
 
   }, [trackedBatchIds, removeBatchId, syncCompletedBatchResults])
 
   useEffect(
     () => () => {
-      Object.values(socketsRef.current).forEach((socket) => {
+      Object.values(streamsRef.current).forEach((source) => {
         try {
-          socket.close()
+          source.close()
         } catch {
           // Ignore cleanup close failures.
         }
       })
-      socketsRef.current = {}
+      streamsRef.current = {}
     },
     [],
   )
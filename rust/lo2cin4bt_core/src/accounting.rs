@@ -1,4 +1,5 @@
 use crate::artifact_tables::write_result_rows_parquet;
+use crate::cancellation::{self, CancellationReason};
 use crate::computed_fields::returns::simple_return;
 use crate::result_validator::{
     validate_result_tables, ResultTableView, ResultValidationError, ResultValidationReport,
@@ -58,6 +59,8 @@ pub enum AccountingError {
     Simulation(#[from] SimulationError),
     #[error(transparent)]
     ResultValidation(#[from] ResultValidationError),
+    #[error(transparent)]
+    Cancelled(#[from] CancellationReason),
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -267,6 +270,7 @@ pub fn run_accounting(input: AccountingInput) -> Result<AccountingSummary, Accou
         .collect::<Vec<_>>();
 
     for checkpoint in input.checkpoints {
+        cancellation::checkpoint()?;
         let session = session_progress
             .observe(&checkpoint.time, &input.config.session_label_by_event_time)
             .map_err(AccountingError::InvalidSessionProgress)?;
@@ -1,12 +1,14 @@
 use lo2cin4bt_core::{
-    handle_engine_service_request, EngineServiceCommand, EngineServiceError, EngineServiceRequest,
-    EngineServiceResponse, EngineServiceStatus, ENGINE_SERVICE_PROTOCOL_VERSION,
+    handle_engine_service_request, handle_engine_service_request_with_cancellation, read_frame,
+    write_frame, CancellationToken, EngineQueueRejection, EngineSchedulingReport,
+    EngineServiceCommand, EngineServiceError, EngineServiceRequest, EngineServiceResponse,
+    EngineServiceStatus, EngineTransportError, EngineWorkerPool, EngineWorkerPoolConfig,
+    ENGINE_SERVICE_PROTOCOL_VERSION, FRAMED_TRANSPORT,
 };
-use std::collections::HashSet;
+use std::collections::HashMap;
 use std::io::{self, BufRead, Stdout, Write};
 use std::panic::{catch_unwind, AssertUnwindSafe};
-use std::sync::{Arc, Mutex};
-use std::thread;
+use std::sync::{Arc, Mutex, MutexGuard};
 
 fn main() {
     if let Err(exc) = run_server() {
@@ -15,18 +17,48 @@ fn main() {
     }
 }
 
+/// Response sink shared by the reader loop and worker threads. `framed` flips
+/// once, under the lock, right after the `negotiate_transport` ack is written.
+struct ServiceOutput {
+    stdout: Stdout,
+    framed: bool,
+}
+
 fn run_server() -> Result<(), String> {
-    let stdin = io::stdin();
-    let stdout = Arc::new(Mutex::new(io::stdout()));
-    let active = Arc::new(Mutex::new(HashSet::<String>::new()));
-    let canceled = Arc::new(Mutex::new(HashSet::<String>::new()));
+    let mut stdin = io::stdin().lock();
+    let stdout = Arc::new(Mutex::new(ServiceOutput {
+        stdout: io::stdout(),
+        framed: false,
+    }));
+    let active = Arc::new(Mutex::new(HashMap::<String, CancellationToken>::new()));
+    let pool = EngineWorkerPool::new(EngineWorkerPoolConfig::from_env());
+    let mut framed = false;
 
-    for line in stdin.lock().lines() {
-        let input_text = line.map_err(|exc| format!("unable to read stdin line: {exc}"))?;
-        if input_text.trim().is_empty() {
-            continue;
-        }
-        let request = match serde_json::from_str::<EngineServiceRequest>(&input_text) {
+    loop {
+        let parsed = if framed {
+            match read_frame(&mut stdin) {
+                Ok(Some(value)) => serde_json::from_value::<EngineServiceRequest>(value)
+                    .map_err(|exc| exc.to_string()),
+                Ok(None) => break,
+                Err(EngineTransportError::Io(exc)) => {
+                    return Err(format!("unable to read stdin frame: {exc}"))
+                }
+                Err(exc) => Err(exc.to_string()),
+            }
+        } else {
+            let mut input_text = String::new();
+            let read = stdin
+                .read_line(&mut input_text)
+                .map_err(|exc| format!("unable to read stdin line: {exc}"))?;
+            if read == 0 {
+                break;
+            }
+            if input_text.trim().is_empty() {
+                continue;
+            }
+            serde_json::from_str::<EngineServiceRequest>(&input_text).map_err(|exc| exc.to_string())
+        };
+        let request = match parsed {
             Ok(request) => request,
             Err(exc) => {
                 write_response(
@@ -39,9 +71,10 @@ fn run_server() -> Result<(), String> {
                         result: None,
                         error: Some(EngineServiceError {
                             code: "invalid_envelope".to_string(),
-                            message: exc.to_string(),
+                            message: exc,
                             retryable: false,
                         }),
+                        scheduling: Some(pool.report(0, 0)),
                     },
                 )?;
                 continue;
@@ -52,50 +85,97 @@ fn run_server() -> Result<(), String> {
             EngineServiceCommand::Execute
             | EngineServiceCommand::ExecuteEngineRequest
             | EngineServiceCommand::ExecuteEngineRequestBatch => {
-                write_response(
-                    &stdout,
-                    &EngineServiceResponse::progress(
-                        &request,
-                        serde_json::json!({"stage": "accepted"}),
-                    ),
-                )?;
-                let worker_stdout = Arc::clone(&stdout);
-                let worker_active = Arc::clone(&active);
-                let worker_canceled = Arc::clone(&canceled);
+                let request_id = request.request_id.clone();
+                let priority = request.priority;
+                let token = CancellationToken::new();
                 active
                     .lock()
                     .map_err(|_| "active request registry lock poisoned".to_string())?
-                    .insert(request.request_id.clone());
-                thread::spawn(move || {
-                    let request_id = request.request_id.clone();
-                    let response = match catch_unwind(AssertUnwindSafe(|| {
-                        handle_engine_service_request(request.clone())
-                    })) {
-                        Ok(response) => response,
-                        Err(_) => EngineServiceResponse::failure(
-                            &request,
-                            "worker_panic",
-                            "Rust engine worker panicked".to_string(),
-                        ),
+                    .insert(request_id.clone(), token.clone());
+                let worker_request = request.clone();
+                let worker_stdout = Arc::clone(&stdout);
+                let worker_active = Arc::clone(&active);
+                let pool_config = pool.config();
+                // Hold stdout so the accepted frame is written before the worker's final frame.
+                let accepted_guard = stdout
+                    .lock()
+                    .map_err(|_| "engine stdout lock poisoned".to_string())?;
+                let admission = pool.submit(priority, move |start| {
+                    let request = worker_request;
+                    let response = if token.is_canceled() {
+                        None
+                    } else {
+                        Some(
+                            match catch_unwind(AssertUnwindSafe(|| {
+                                handle_engine_service_request_with_cancellation(
+                                    request.clone(),
+                                    &token,
+                                )
+                            })) {
+                                Ok(response) => response,
+                                Err(_) => EngineServiceResponse::failure(
+                                    &request,
+                                    "worker_panic",
+                                    "Rust engine worker panicked".to_string(),
+                                ),
+                            },
+                        )
                     };
-                    let was_canceled = worker_canceled
-                        .lock()
-                        .map(|mut rows| rows.remove(&request_id))
-                        .unwrap_or(false);
                     if let Ok(mut rows) = worker_active.lock() {
-                        rows.remove(&request_id);
+                        rows.remove(&request.request_id);
                     }
-                    let final_response = if was_canceled {
-                        EngineServiceResponse::failure(
+                    // Kernels stop at their next checkpoint and report partial progress;
+                    // a cancel that lands after the last checkpoint still wins.
+                    let final_response = match response {
+                        Some(response)
+                            if !token.is_canceled()
+                                || response
+                                    .error
+                                    .as_ref()
+                                    .is_some_and(|error| error.code == "canceled") =>
+                        {
+                            response
+                        }
+                        _ => EngineServiceResponse::failure(
                             &request,
                             "canceled",
                             "request canceled by control command".to_string(),
-                        )
-                    } else {
-                        response
+                        ),
+                    };
+                    let scheduling = EngineSchedulingReport {
+                        workers: pool_config.workers,
+                        running: start.running,
+                        queue_depth: start.queue_depth,
+                        queue_capacity: pool_config.queue_capacity,
+                        queue_wait_ms: start.queue_wait_ms,
+                        priority,
                     };
-                    let _ = write_response(&worker_stdout, &final_response);
+                    let _ =
+                        write_response(&worker_stdout, &final_response.with_scheduling(scheduling));
                 });
+                let response = match admission {
+                    Ok(report) => EngineServiceResponse::progress(
+                        &request,
+                        serde_json::json!({"stage": "accepted"}),
+                    )
+                    .with_scheduling(report),
+                    Err(rejection) => {
+                        if let Ok(mut rows) = active.lock() {
+                            rows.remove(&request_id);
+                        }
+                        let code = match rejection {
+                            EngineQueueRejection::QueueFull { .. } => "queue_full",
+                            EngineQueueRejection::ShuttingDown => "shutting_down",
+                        };
+                        EngineServiceResponse::retryable_failure(
+                            &request,
+                            code,
+                            rejection.to_string(),
+                        )
+                        .with_scheduling(pool.report(0, priority))
+                    }
+                };
+                write_locked_response(accepted_guard, &response)?;
             }
             EngineServiceCommand::Cancel => {
                 if let Some(target) = request
@@ -104,27 +184,44 @@ fn run_server() -> Result<(), String> {
                     .and_then(serde_json::Value::as_str)
                     .filter(|value| !value.trim().is_empty())
                 {
-                    let is_active = active
+                    if let Some(token) = active
                         .lock()
                         .map_err(|_| "active request registry lock poisoned".to_string())?
-                        .contains(target);
-                    if is_active {
-                        canceled
-                            .lock()
-                            .map_err(|_| "cancel registry lock poisoned".to_string())?
-                            .insert(target.to_string());
+                        .get(target)
+                    {
+                        token.cancel();
                     }
                 }
-                let response = handle_engine_service_request(request);
+                let scheduling = pool.report(0, request.priority);
+                let response = handle_engine_service_request(request).with_scheduling(scheduling);
                 write_response(&stdout, &response)?;
             }
+            EngineServiceCommand::NegotiateTransport => {
+                let scheduling = pool.report(0, request.priority);
+                let response = handle_engine_service_request(request).with_scheduling(scheduling);
+                let switch = response
+                    .result
+                    .as_ref()
+                    .and_then(|result| result.get("transport"))
+                    .and_then(serde_json::Value::as_str)
+                    == Some(FRAMED_TRANSPORT);
+                let mut output = stdout
+                    .lock()
+                    .map_err(|_| "engine stdout lock poisoned".to_string())?;
+                write_output(&mut output, &response)?;
+                output.framed |= switch;
+                framed |= switch;
+            }
             EngineServiceCommand::Shutdown => {
-                let response = handle_engine_service_request(request);
+                pool.shutdown();
+                let scheduling = pool.report(0, request.priority);
+                let response = handle_engine_service_request(request).with_scheduling(scheduling);
                 write_response(&stdout, &response)?;
                 break;
             }
             _ => {
-                let response = handle_engine_service_request(request);
+                let scheduling = pool.report(0, request.priority);
+                let response = handle_engine_service_request(request).with_scheduling(scheduling);
                 write_response(&stdout, &response)?;
             }
         }
@@ -133,15 +230,36 @@ fn run_server() -> Result<(), String> {
 }
 
 fn write_response(
-    stdout: &Arc<Mutex<Stdout>>,
+    stdout: &Arc<Mutex<ServiceOutput>>,
     response: &EngineServiceResponse,
 ) -> Result<(), String> {
-    let encoded = serde_json::to_string(response)
-        .map_err(|exc| format!("unable to serialize engine response: {exc}"))?;
-    let mut writer = stdout
+    let writer = stdout
         .lock()
         .map_err(|_| "engine stdout lock poisoned".to_string())?;
-    writeln!(writer, "{encoded}").map_err(|exc| format!("unable to write stdout: {exc}"))?;
+    write_locked_response(writer, response)
+}
+
+fn write_locked_response(
+    mut writer: MutexGuard<'_, ServiceOutput>,
+    response: &EngineServiceResponse,
+) -> Result<(), String> {
+    write_output(&mut writer, response)
+}
+
+fn write_output(
+    output: &mut ServiceOutput,
+    response: &EngineServiceResponse,
+) -> Result<(), String> {
+    let mut writer = output.stdout.lock();
+    if output.framed {
+        let value = serde_json::to_value(response)
+            .map_err(|exc| format!("unable to serialize engine response: {exc}"))?;
+        write_frame(&mut writer, value).map_err(|exc| format!("unable to write stdout: {exc}"))?;
+    } else {
+        let encoded = serde_json::to_string(response)
+            .map_err(|exc| format!("unable to serialize engine response: {exc}"))?;
+        writeln!(writer, "{encoded}").map_err(|exc| format!("unable to write stdout: {exc}"))?;
+    }
     writer
         .flush()
         .map_err(|exc| format!("unable to flush stdout: {exc}"))
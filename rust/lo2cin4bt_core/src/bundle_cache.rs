@@ -0,0 +1,226 @@
+//! Resident cache of decoded MarketDataBundle tables.
+//!
+//! Matrix chunks and WFA windows resend the same bundle manifest many times.
+//! Tables are keyed by the manifest `content_hash` plus the table role, so a
+//! repeated request reuses the decoded frame instead of reading parquet again.
+//! Frames are evicted least-recently-used once the memory budget is exceeded.
+
+use polars::prelude::DataFrame;
+use serde::Serialize;
+use std::collections::HashMap;
+use std::sync::{Mutex, MutexGuard, OnceLock};
+
+pub const BUNDLE_CACHE_BYTES_ENV: &str = "LO2CIN4BT_BUNDLE_CACHE_BYTES";
+const DEFAULT_BUNDLE_CACHE_BYTES: usize = 512 * 1024 * 1024;
+
+#[derive(Clone, Debug, Default, PartialEq, Eq, Serialize)]
+pub struct BundleCacheStats {
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+    pub entries: usize,
+    pub resident_bytes: usize,
+    pub budget_bytes: usize,
+}
+
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+struct BundleTableKey {
+    content_hash: String,
+    role: String,
+}
+
+struct CachedTable {
+    frame: DataFrame,
+    bytes: usize,
+    last_used: u64,
+}
+
+pub struct BundleTableCache {
+    budget_bytes: usize,
+    tables: HashMap<BundleTableKey, CachedTable>,
+    clock: u64,
+    stats: BundleCacheStats,
+}
+
+impl BundleTableCache {
+    pub fn new(budget_bytes: usize) -> Self {
+        Self {
+            budget_bytes,
+            tables: HashMap::new(),
+            clock: 0,
+            stats: BundleCacheStats {
+                budget_bytes,
+                ..BundleCacheStats::default()
+            },
+        }
+    }
+
+    pub fn from_env() -> Self {
+        let budget_bytes = std::env::var(BUNDLE_CACHE_BYTES_ENV)
+            .ok()
+            .and_then(|value| value.trim().parse::<usize>().ok())
+            .unwrap_or(DEFAULT_BUNDLE_CACHE_BYTES);
+        Self::new(budget_bytes)
+    }
+
+    /// Return the cached frame for `role` of the bundle `content_hash`, if resident.
+    pub fn get(&mut self, content_hash: &str, role: &str) -> Option<DataFrame> {
+        let key = BundleTableKey {
+            content_hash: content_hash.to_string(),
+            role: role.to_string(),
+        };
+        self.clock += 1;
+        match self.tables.get_mut(&key) {
+            Some(table) => {
+                table.last_used = self.clock;
+                self.stats.hits += 1;
+                Some(table.frame.clone())
+            }
+            None => {
+                self.stats.misses += 1;
+                None
+            }
+        }
+    }
+
+    /// Keep a decoded frame resident, evicting older tables to stay in budget.
+    pub fn insert(&mut self, content_hash: &str, role: &str, frame: DataFrame) {
+        let bytes = frame.estimated_size();
+        if bytes > self.budget_bytes {
+            return;
+        }
+        let key = BundleTableKey {
+            content_hash: content_hash.to_string(),
+            role: role.to_string(),
+        };
+        self.clock += 1;
+        if let Some(previous) = self.tables.remove(&key) {
+            self.stats.resident_bytes -= previous.bytes;
+        }
+        while self.stats.resident_bytes + bytes > self.budget_bytes {
+            if !self.evict_least_recently_used() {
+                break;
+            }
+        }
+        self.tables.insert(
+            key,
+            CachedTable {
+                frame,
+                bytes,
+                last_used: self.clock,
+            },
+        );
+        self.stats.resident_bytes += bytes;
+        self.stats.entries = self.tables.len();
+    }
+
+    pub fn stats(&self) -> BundleCacheStats {
+        self.stats.clone()
+    }
+
+    pub fn clear(&mut self) {
+        self.tables.clear();
+        self.stats.entries = 0;
+        self.stats.resident_bytes = 0;
+    }
+
+    fn evict_least_recently_used(&mut self) -> bool {
+        let Some(key) = self
+            .tables
+            .iter()
+            .min_by_key(|(_, table)| table.last_used)
+            .map(|(key, _)| key.clone())
+        else {
+            return false;
+        };
+        if let Some(table) = self.tables.remove(&key) {
+            self.stats.resident_bytes -= table.bytes;
+            self.stats.evictions += 1;
+        }
+        self.stats.entries = self.tables.len();
+        true
+    }
+}
+
+fn shared_cache() -> MutexGuard<'static, BundleTableCache> {
+    static CACHE: OnceLock<Mutex<BundleTableCache>> = OnceLock::new();
+    CACHE
+        .get_or_init(|| Mutex::new(BundleTableCache::from_env()))
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+/// Load a bundle table through the process-wide cache.
+///
+/// The lock is released while `load` decodes, so concurrent misses on different
+/// bundles do not serialize behind each other.
+pub fn cached_bundle_table<E>(
+    content_hash: &str,
+    role: &str,
+    load: impl FnOnce() -> Result<DataFrame, E>,
+) -> Result<DataFrame, E> {
+    if let Some(frame) = shared_cache().get(content_hash, role) {
+        return Ok(frame);
+    }
+    let frame = load()?;
+    shared_cache().insert(content_hash, role, frame.clone());
+    Ok(frame)
+}
+
+pub fn bundle_cache_stats() -> BundleCacheStats {
+    shared_cache().stats()
+}
+
+pub fn clear_bundle_cache() {
+    shared_cache().clear();
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use polars::prelude::*;
+
+    fn frame(rows: usize) -> DataFrame {
+        df!("close" => vec![1.0_f64; rows]).unwrap()
+    }
+
+    #[test]
+    fn repeated_content_hash_hits_without_reloading() {
+        let mut cache = BundleTableCache::new(1024 * 1024);
+        assert!(cache.get("hash-a", "close").is_none());
+        cache.insert("hash-a", "close", frame(4));
+
+        let cached = cache.get("hash-a", "close").unwrap();
+        assert_eq!(cached.height(), 4);
+        assert!(cache.get("hash-a", "open").is_none());
+        assert!(cache.get("hash-b", "close").is_none());
+
+        let stats = cache.stats();
+        assert_eq!((stats.hits, stats.misses, stats.entries), (1, 3, 1));
+    }
+
+    #[test]
+    fn budget_evicts_least_recently_used_tables() {
+        let one_table = frame(16).estimated_size();
+        let mut cache = BundleTableCache::new(one_table * 2);
+        cache.insert("hash-a", "close", frame(16));
+        cache.insert("hash-b", "close", frame(16));
+        cache.get("hash-a", "close").unwrap();
+        cache.insert("hash-c", "close", frame(16));
+
+        assert!(cache.get("hash-a", "close").is_some());
+        assert!(cache.get("hash-b", "close").is_none());
+        assert!(cache.get("hash-c", "close").is_some());
+        let stats = cache.stats();
+        assert_eq!(stats.evictions, 1);
+        assert!(stats.resident_bytes <= stats.budget_bytes);
+    }
+
+    #[test]
+    fn zero_budget_disables_residency() {
+        let mut cache = BundleTableCache::new(0);
+        cache.insert("hash-a", "close", frame(4));
+        assert!(cache.get("hash-a", "close").is_none());
+        assert_eq!(cache.stats().entries, 0);
+    }
+}
@@ -0,0 +1,255 @@
+//! Cooperative cancellation for long-running engine kernels.
+//!
+//! The engine service installs a [`CancellationToken`] around each request.
+//! Candidate and bar loops call [`checkpoint`] so a cancel command, an elapsed
+//! envelope deadline, or an exhausted `max_operation_ms` budget stops the
+//! kernel within [`CHECK_INTERVAL_BARS`] bars instead of after the whole run.
+//! Outside an installed scope every checkpoint is a no-op.
+
+use serde::Serialize;
+use std::cell::RefCell;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+use std::time::Instant;
+use thiserror::Error;
+
+/// Bars processed between clock reads; the cancel flag is read on every bar.
+pub const CHECK_INTERVAL_BARS: u64 = 256;
+
+#[derive(Clone, Copy, Debug, Error, PartialEq, Eq, Serialize)]
+#[serde(rename_all = "snake_case")]
+pub enum CancellationReason {
+    #[error("request canceled by control command")]
+    Canceled,
+    #[error("request deadline elapsed during execution")]
+    DeadlineExceeded,
+    #[error("operation exceeded its max_operation_ms budget")]
+    ResourceBudgetExceeded,
+}
+
+impl CancellationReason {
+    pub fn code(self) -> &'static str {
+        match self {
+            Self::Canceled => "canceled",
+            Self::DeadlineExceeded => "deadline_exceeded",
+            Self::ResourceBudgetExceeded => "resource_budget_exceeded",
+        }
+    }
+}
+
+#[derive(Clone, Debug, Default)]
+pub struct CancellationToken {
+    canceled: Arc<AtomicBool>,
+    deadline: Option<Instant>,
+    budget_deadline: Option<Instant>,
+}
+
+impl CancellationToken {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    pub fn with_deadline(mut self, deadline: Option<Instant>) -> Self {
+        self.deadline = deadline;
+        self
+    }
+
+    pub fn with_budget_deadline(mut self, budget_deadline: Option<Instant>) -> Self {
+        self.budget_deadline = budget_deadline;
+        self
+    }
+
+    pub fn cancel(&self) {
+        self.canceled.store(true, Ordering::Release);
+    }
+
+    pub fn is_canceled(&self) -> bool {
+        self.canceled.load(Ordering::Acquire)
+    }
+
+    pub fn check(&self) -> Result<(), CancellationReason> {
+        self.check_flag()?;
+        self.check_clock(Instant::now())
+    }
+
+    fn check_flag(&self) -> Result<(), CancellationReason> {
+        if self.is_canceled() {
+            Err(CancellationReason::Canceled)
+        } else {
+            Ok(())
+        }
+    }
+
+    fn check_clock(&self, now: Instant) -> Result<(), CancellationReason> {
+        if self.deadline.is_some_and(|deadline| now >= deadline) {
+            return Err(CancellationReason::DeadlineExceeded);
+        }
+        if self.budget_deadline.is_some_and(|deadline| now >= deadline) {
+            return Err(CancellationReason::ResourceBudgetExceeded);
+        }
+        Ok(())
+    }
+}
+
+/// Work completed before a kernel returned, reported with cancelled results.
+#[derive(Clone, Debug, Default, PartialEq, Eq, Serialize)]
+pub struct CancellationProgress {
+    pub completed_candidates: u64,
+    pub bars_processed: u64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub reason: Option<CancellationReason>,
+}
+
+struct CancellationScope {
+    token: CancellationToken,
+    bars_since_clock_check: u64,
+    progress: CancellationProgress,
+}
+
+thread_local! {
+    static ACTIVE_SCOPE: RefCell<Option<CancellationScope>> = const { RefCell::new(None) };
+}
+
+/// Run `work` with `token` installed for this thread and report its progress.
+pub fn run_with_cancellation<R>(
+    token: &CancellationToken,
+    work: impl FnOnce() -> R,
+) -> (R, CancellationProgress) {
+    let previous = ACTIVE_SCOPE.with(|scope| {
+        scope.borrow_mut().replace(CancellationScope {
+            token: token.clone(),
+            bars_since_clock_check: 0,
+            progress: CancellationProgress::default(),
+        })
+    });
+    let output = work();
+    let finished = ACTIVE_SCOPE.with(|scope| std::mem::replace(&mut *scope.borrow_mut(), previous));
+    let progress = finished.map(|scope| scope.progress).unwrap_or_default();
+    (output, progress)
+}
+
+/// The token installed on this thread, for propagating into helper threads.
+pub fn current_token() -> Option<CancellationToken> {
+    ACTIVE_SCOPE.with(|scope| scope.borrow().as_ref().map(|scope| scope.token.clone()))
+}
+
+/// Per-bar checkpoint. Reads the clock every [`CHECK_INTERVAL_BARS`] bars.
+pub fn checkpoint() -> Result<(), CancellationReason> {
+    with_scope(|scope| {
+        scope.progress.bars_processed += 1;
+        scope.bars_since_clock_check += 1;
+        scope.token.check_flag()?;
+        if scope.bars_since_clock_check >= CHECK_INTERVAL_BARS {
+            scope.bars_since_clock_check = 0;
+            scope.token.check_clock(Instant::now())?;
+        }
+        Ok(())
+    })
+}
+
+/// Candidate-boundary checkpoint; always reads the flag and the clock.
+pub fn candidate_checkpoint() -> Result<(), CancellationReason> {
+    with_scope(|scope| {
+        scope.bars_since_clock_check = 0;
+        scope.token.check()
+    })
+}
+
+/// Record one fully evaluated candidate for partial-result reporting.
+pub fn candidate_completed() {
+    let _ = with_scope(|scope| {
+        scope.progress.completed_candidates += 1;
+        Ok(())
+    });
+}
+
+/// Fold progress reported by a helper thread's scope into this thread's scope.
+pub fn absorb_progress(progress: &CancellationProgress) {
+    ACTIVE_SCOPE.with(|scope| {
+        if let Some(scope) = scope.borrow_mut().as_mut() {
+            scope.progress.completed_candidates += progress.completed_candidates;
+            scope.progress.bars_processed += progress.bars_processed;
+            scope.progress.reason = scope.progress.reason.or(progress.reason);
+        }
+    });
+}
+
+fn with_scope(
+    check: impl FnOnce(&mut CancellationScope) -> Result<(), CancellationReason>,
+) -> Result<(), CancellationReason> {
+    ACTIVE_SCOPE.with(|scope| {
+        let mut scope = scope.borrow_mut();
+        let Some(scope) = scope.as_mut() else {
+            return Ok(());
+        };
+        if let Some(reason) = scope.progress.reason {
+            return Err(reason);
+        }
+        let result = check(scope);
+        if let Err(reason) = result {
+            scope.progress.reason = Some(reason);
+        }
+        result
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::time::Duration;
+
+    #[test]
+    fn checkpoints_are_noops_without_an_installed_scope() {
+        for _ in 0..(CHECK_INTERVAL_BARS * 2) {
+            assert_eq!(checkpoint(), Ok(()));
+        }
+        assert_eq!(candidate_checkpoint(), Ok(()));
+    }
+
+    #[test]
+    fn cancel_flag_stops_the_next_bar_and_reports_progress() {
+        let token = CancellationToken::new();
+        let (result, progress) = run_with_cancellation(&token, || {
+            for bar in 0..10_000u64 {
+                if bar == 10 {
+                    token.cancel();
+                }
+                checkpoint()?;
+            }
+            Ok::<_, CancellationReason>(())
+        });
+
+        assert_eq!(result, Err(CancellationReason::Canceled));
+        assert_eq!(progress.bars_processed, 11);
+        assert_eq!(progress.reason, Some(CancellationReason::Canceled));
+        assert!(current_token().is_none());
+    }
+
+    #[test]
+    fn elapsed_budget_stops_within_one_check_interval() {
+        let token = CancellationToken::new().with_budget_deadline(Some(Instant::now()));
+        std::thread::sleep(Duration::from_millis(1));
+        let (result, progress) = run_with_cancellation(&token, || {
+            candidate_completed();
+            for _ in 0..10_000u64 {
+                checkpoint()?;
+            }
+            Ok::<_, CancellationReason>(())
+        });
+
+        assert_eq!(result, Err(CancellationReason::ResourceBudgetExceeded));
+        assert_eq!(progress.completed_candidates, 1);
+        assert_eq!(progress.bars_processed, CHECK_INTERVAL_BARS);
+    }
+
+    #[test]
+    fn tripped_scope_keeps_failing_after_inner_errors_are_swallowed() {
+        let token = CancellationToken::new();
+        token.cancel();
+        let (_, progress) = run_with_cancellation(&token, || {
+            let _ = candidate_checkpoint();
+            assert_eq!(checkpoint(), Err(CancellationReason::Canceled));
+        });
+        assert_eq!(progress.reason, Some(CancellationReason::Canceled));
+    }
+}
@@ -0,0 +1,246 @@
+//! Order-preserving parallel map over batch candidates.
+//!
+//! Batch kernels evaluate candidates independently against shared read-only
+//! market inputs. [`map_candidates`] spreads them over scoped threads that
+//! pull the next index from a shared counter, then returns results in input
+//! order so summaries, artifact rows and hashes match a serial run. The
+//! request's cancellation token is installed on every helper thread and their
+//! progress is folded back into the caller's scope.
+//!
+//! Helper threads are drawn from one process-wide budget
+//! (`LO2CIN4BT_CANDIDATE_THREADS`, default every available core). A request
+//! running alone may use all of it, while concurrent requests on the engine
+//! worker pool share it instead of each fanning out over every core; a loop
+//! granted fewer than two helpers runs serially on its own thread.
+
+use crate::cancellation::{absorb_progress, current_token, run_with_cancellation};
+use std::cell::Cell;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Mutex, OnceLock};
+use std::thread;
+
+pub const CANDIDATE_THREADS_ENV: &str = "LO2CIN4BT_CANDIDATE_THREADS";
+
+thread_local! {
+    static THREAD_BUDGET: Cell<Option<usize>> = const { Cell::new(None) };
+}
+
+static HELPERS: HelperBudget = HelperBudget::new();
+
+/// Helper threads in use across every candidate loop of the process.
+struct HelperBudget {
+    busy: AtomicUsize,
+}
+
+/// Helpers claimed from a [`HelperBudget`], returned when dropped.
+struct HelperGrant<'a> {
+    budget: &'a HelperBudget,
+    count: usize,
+}
+
+impl HelperBudget {
+    const fn new() -> Self {
+        Self {
+            busy: AtomicUsize::new(0),
+        }
+    }
+
+    /// Claim up to `wanted` of the `total` helpers not already in use.
+    fn claim(&self, total: usize, wanted: usize) -> HelperGrant<'_> {
+        let mut busy = self.busy.load(Ordering::Relaxed);
+        loop {
+            let count = wanted.min(total.saturating_sub(busy));
+            if count == 0 {
+                return HelperGrant {
+                    budget: self,
+                    count,
+                };
+            }
+            match self.busy.compare_exchange_weak(
+                busy,
+                busy + count,
+                Ordering::AcqRel,
+                Ordering::Relaxed,
+            ) {
+                Ok(_) => {
+                    return HelperGrant {
+                        budget: self,
+                        count,
+                    }
+                }
+                Err(actual) => busy = actual,
+            }
+        }
+    }
+}
+
+impl Drop for HelperGrant<'_> {
+    fn drop(&mut self) {
+        self.budget.busy.fetch_sub(self.count, Ordering::AcqRel);
+    }
+}
+
+/// Process-wide helper thread budget.
+fn process_threads() -> usize {
+    static THREADS: OnceLock<usize> = OnceLock::new();
+    *THREADS.get_or_init(|| {
+        std::env::var(CANDIDATE_THREADS_ENV)
+            .ok()
+            .and_then(|value| value.trim().parse::<usize>().ok())
+            .filter(|value| *value > 0)
+            .unwrap_or_else(|| thread::available_parallelism().map_or(1, usize::from))
+    })
+}
+
+/// Run `work` with candidate loops capped at `threads` (`None` keeps the
+/// default of the whole process budget).
+pub fn with_candidate_threads<R>(threads: Option<usize>, work: impl FnOnce() -> R) -> R {
+    let previous = THREAD_BUDGET.with(|budget| budget.replace(threads));
+    let output = work();
+    THREAD_BUDGET.with(|budget| budget.set(previous));
+    output
+}
+
+/// Threads a candidate loop on this thread may use when no other request
+/// holds helpers.
+pub fn candidate_threads() -> usize {
+    THREAD_BUDGET
+        .with(Cell::get)
+        .unwrap_or_else(process_threads)
+        .max(1)
+}
+
+/// Apply `work` to every item and return the results in input order.
+pub fn map_candidates<T, R, F>(items: Vec<T>, work: F) -> Vec<R>
+where
+    T: Send,
+    R: Send,
+    F: Fn(T) -> R + Sync,
+{
+    let wanted = candidate_threads().min(items.len());
+    if wanted <= 1 {
+        return items.into_iter().map(work).collect();
+    }
+    let grant = HELPERS.claim(process_threads(), wanted);
+    let threads = grant.count;
+    if threads <= 1 {
+        return items.into_iter().map(work).collect();
+    }
+    let items = items
+        .into_iter()
+        .map(|item| Mutex::new(Some(item)))
+        .collect::<Vec<_>>();
+    let token = current_token();
+    let next = AtomicUsize::new(0);
+    let slots: Mutex<Vec<Option<R>>> = Mutex::new((0..items.len()).map(|_| None).collect());
+    thread::scope(|scope| {
+        let handles = (0..threads)
+            .map(|_| {
+                scope.spawn(|| {
+                    // Nested candidate loops on a helper thread stay serial.
+                    let drain = || {
+                        with_candidate_threads(Some(1), || {
+                            let mut done = Vec::new();
+                            loop {
+                                let index = next.fetch_add(1, Ordering::Relaxed);
+                                let Some(slot) = items.get(index) else {
+                                    break;
+                                };
+                                let item = slot
+                                    .lock()
+                                    .expect("candidate slot poisoned")
+                                    .take()
+                                    .expect("every candidate index is claimed once");
+                                done.push((index, work(item)));
+                            }
+                            done
+                        })
+                    };
+                    let (done, progress) = match token.as_ref() {
+                        Some(token) => {
+                            let (done, progress) = run_with_cancellation(token, drain);
+                            (done, Some(progress))
+                        }
+                        None => (drain(), None),
+                    };
+                    let mut slots = slots.lock().expect("candidate result slots poisoned");
+                    for (index, output) in done {
+                        slots[index] = Some(output);
+                    }
+                    progress
+                })
+            })
+            .collect::<Vec<_>>();
+        for handle in handles {
+            match handle.join() {
+                Ok(Some(progress)) => absorb_progress(&progress),
+                Ok(None) => {}
+                Err(panic) => std::panic::resume_unwind(panic),
+            }
+        }
+    });
+    slots
+        .into_inner()
+        .expect("candidate result slots poisoned")
+        .into_iter()
+        .map(|slot| slot.expect("every candidate produces one result"))
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::cancellation::{
+        candidate_checkpoint, candidate_completed, CancellationReason, CancellationToken,
+    };
+
+    #[test]
+    fn helper_budget_is_shared_between_concurrent_loops() {
+        let budget = HelperBudget::new();
+        let first = budget.claim(8, 6);
+        let second = budget.claim(8, 6);
+        assert_eq!((first.count, second.count), (6, 2));
+        assert_eq!(budget.claim(8, 4).count, 0);
+        drop(first);
+        assert_eq!(budget.claim(8, 4).count, 4);
+        drop(second);
+        assert_eq!(budget.busy.load(Ordering::Relaxed), 0);
+    }
+
+    #[test]
+    fn results_keep_input_order_across_threads() {
+        let items = (0..200u64).collect::<Vec<_>>();
+        let serial =
+            with_candidate_threads(Some(1), || map_candidates(items.clone(), |item| item * 3));
+        let parallel =
+            with_candidate_threads(Some(8), || map_candidates(items.clone(), |item| item * 3));
+        assert_eq!(serial, parallel);
+        assert_eq!(parallel[199], 597);
+    }
+
+    #[test]
+    fn helper_threads_observe_the_request_token_and_report_progress() {
+        let token = CancellationToken::new();
+        let items = (0..64usize).collect::<Vec<_>>();
+        let (outputs, progress) = run_with_cancellation(&token, || {
+            with_candidate_threads(Some(4), || {
+                map_candidates(items, |item| {
+                    if item == 40 {
+                        token.cancel();
+                    }
+                    candidate_checkpoint()?;
+                    candidate_completed();
+                    Ok::<_, CancellationReason>(item)
+                })
+            })
+        });
+        assert!(outputs
+            .iter()
+            .any(|output| *output == Err(CancellationReason::Canceled)));
+        assert_eq!(progress.reason, Some(CancellationReason::Canceled));
+        assert_eq!(
+            progress.completed_candidates as usize,
+            outputs.iter().filter(|output| output.is_ok()).count()
+        );
+    }
+}
@@ -0,0 +1,231 @@
+//! Bounded top-K retention of full candidate results.
+//!
+//! A retained batch emits a compact row for every candidate but keeps full
+//! detail only for the best `limit` candidates seen so far. Candidates are
+//! offered as they finish, on whichever candidate thread ran them; the heap
+//! drops a result as soon as `limit` better ones are held, so resident detail
+//! is bounded by `limit` plus the candidates in flight rather than by the
+//! batch size. The ranking is the Portfolio Matrix order: sharpe, final
+//! equity, total return and CAGR descending (missing or non-finite values
+//! last), then `candidate_id` ascending, so the retained set does not depend
+//! on thread scheduling.
+
+use serde::{Deserialize, Serialize};
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+use std::sync::Mutex;
+
+pub const CANDIDATE_RETENTION_SCHEMA_VERSION: &str = "candidate_retention.v1";
+pub const CANDIDATE_RETENTION_RANKING: [&str; 5] = [
+    "sharpe",
+    "final_equity",
+    "total_return",
+    "cagr",
+    "candidate_id",
+];
+
+/// Ranking metrics of one candidate.
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct RetentionScore {
+    pub sharpe: Option<f64>,
+    pub final_equity: f64,
+    pub total_return: f64,
+    pub cagr: Option<f64>,
+}
+
+impl RetentionScore {
+    /// Ascending sort key: better candidates compare lower.
+    fn key(&self) -> [f64; 4] {
+        [
+            descending(self.sharpe),
+            descending(Some(self.final_equity)),
+            descending(Some(self.total_return)),
+            descending(self.cagr),
+        ]
+    }
+}
+
+fn descending(value: Option<f64>) -> f64 {
+    match value {
+        // `+ 0.0` folds -0.0 into 0.0 so equal metrics tie as they do in Python.
+        Some(value) if value.is_finite() => -value + 0.0,
+        _ => f64::INFINITY,
+    }
+}
+
+/// Which candidates kept full detail, reported next to the compact rows.
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+pub struct CandidateRetentionSummary {
+    pub schema_version: String,
+    pub limit: usize,
+    pub ranking: Vec<String>,
+    /// Retained ids, best first.
+    pub retained_candidate_ids: Vec<String>,
+}
+
+struct Retained<T> {
+    key: [f64; 4],
+    candidate_id: String,
+    index: usize,
+    value: T,
+}
+
+impl<T> Retained<T> {
+    fn rank_cmp(&self, other: &Self) -> Ordering {
+        self.key
+            .iter()
+            .zip(&other.key)
+            .map(|(left, right)| left.total_cmp(right))
+            .find(|ordering| ordering.is_ne())
+            .unwrap_or(Ordering::Equal)
+            .then_with(|| self.candidate_id.cmp(&other.candidate_id))
+    }
+}
+
+impl<T> PartialEq for Retained<T> {
+    fn eq(&self, other: &Self) -> bool {
+        self.rank_cmp(other).is_eq()
+    }
+}
+
+impl<T> Eq for Retained<T> {}
+
+impl<T> PartialOrd for Retained<T> {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl<T> Ord for Retained<T> {
+    // Worse candidates compare greater, so the heap top is the one to evict.
+    fn cmp(&self, other: &Self) -> Ordering {
+        self.rank_cmp(other)
+    }
+}
+
+/// The best `limit` candidates offered so far, safe to share across
+/// candidate threads.
+pub struct RetainedCandidates<T> {
+    limit: usize,
+    heap: Mutex<BinaryHeap<Retained<T>>>,
+}
+
+impl<T> RetainedCandidates<T> {
+    pub fn new(limit: usize) -> Self {
+        Self {
+            limit,
+            heap: Mutex::new(BinaryHeap::with_capacity(limit.saturating_add(1))),
+        }
+    }
+
+    /// Offer the full result of the candidate at `index`. It is kept only
+    /// while fewer than `limit` candidates outrank it.
+    pub fn offer(&self, index: usize, candidate_id: &str, score: RetentionScore, value: T) {
+        if self.limit == 0 {
+            return;
+        }
+        let entry = Retained {
+            key: score.key(),
+            candidate_id: candidate_id.to_string(),
+            index,
+            value,
+        };
+        let mut heap = self.heap.lock().expect("retained candidates poisoned");
+        if heap.len() < self.limit {
+            heap.push(entry);
+        } else if heap.peek().is_some_and(|worst| entry < *worst) {
+            heap.pop();
+            heap.push(entry);
+        }
+    }
+
+    /// The retention report and the retained values as `(index, value)`
+    /// pairs in candidate order.
+    pub fn finish(self) -> (CandidateRetentionSummary, Vec<(usize, T)>) {
+        let ranked = self
+            .heap
+            .into_inner()
+            .expect("retained candidates poisoned")
+            .into_sorted_vec();
+        let summary = CandidateRetentionSummary {
+            schema_version: CANDIDATE_RETENTION_SCHEMA_VERSION.to_string(),
+            limit: self.limit,
+            ranking: CANDIDATE_RETENTION_RANKING
+                .iter()
+                .map(|field| (*field).to_string())
+                .collect(),
+            retained_candidate_ids: ranked
+                .iter()
+                .map(|entry| entry.candidate_id.clone())
+                .collect(),
+        };
+        let mut retained = ranked
+            .into_iter()
+            .map(|entry| (entry.index, entry.value))
+            .collect::<Vec<_>>();
+        retained.sort_by_key(|(index, _)| *index);
+        (summary, retained)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::candidate_parallel::{map_candidates, with_candidate_threads};
+
+    fn score(sharpe: Option<f64>, final_equity: f64) -> RetentionScore {
+        RetentionScore {
+            sharpe,
+            final_equity,
+            total_return: final_equity / 100.0 - 1.0,
+            cagr: None,
+        }
+    }
+
+    #[test]
+    fn keeps_best_candidates_by_matrix_ranking() {
+        let retained = RetainedCandidates::new(2);
+        retained.offer(0, "c0", score(Some(0.5), 110.0), "c0");
+        retained.offer(1, "c1", score(None, 200.0), "c1");
+        retained.offer(2, "c2", score(Some(1.2), 105.0), "c2");
+        retained.offer(3, "c3", score(Some(0.5), 120.0), "c3");
+        retained.offer(4, "c4", score(Some(f64::NAN), 300.0), "c4");
+
+        let (summary, values) = retained.finish();
+        assert_eq!(summary.retained_candidate_ids, vec!["c2", "c3"]);
+        assert_eq!(summary.limit, 2);
+        assert_eq!(values, vec![(2, "c2"), (3, "c3")]);
+    }
+
+    #[test]
+    fn ties_fall_back_to_candidate_id_and_zero_limit_keeps_nothing() {
+        let retained = RetainedCandidates::new(1);
+        retained.offer(0, "b", score(Some(0.0), 100.0), ());
+        retained.offer(1, "a", score(Some(-0.0), 100.0), ());
+        assert_eq!(retained.finish().0.retained_candidate_ids, vec!["a"]);
+
+        let empty = RetainedCandidates::new(0);
+        empty.offer(0, "a", score(Some(1.0), 100.0), ());
+        assert!(empty.finish().1.is_empty());
+    }
+
+    #[test]
+    fn retained_set_does_not_depend_on_thread_count() {
+        let run = |threads| {
+            let retained = RetainedCandidates::new(5);
+            with_candidate_threads(Some(threads), || {
+                map_candidates((0..64usize).collect(), |index| {
+                    let sharpe = ((index * 37) % 11) as f64 / 10.0;
+                    retained.offer(
+                        index,
+                        &format!("c{index:02}"),
+                        score(Some(sharpe), 100.0),
+                        index,
+                    );
+                })
+            });
+            retained.finish()
+        };
+        assert_eq!(run(1), run(8));
+    }
+}
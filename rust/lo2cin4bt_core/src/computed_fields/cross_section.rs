@@ -1,10 +1,9 @@
-use super::{field, quantile, ComputedFieldError, ComputedFieldSpec};
-use std::collections::BTreeMap;
+use super::{field, quantile, ComputedFieldError, ComputedFieldSpec, FieldMap};
 
 pub(crate) fn compute(
     op: &str,
     spec: &ComputedFieldSpec,
-    fields: &BTreeMap<String, Vec<f64>>,
+    fields: &FieldMap,
     rows: usize,
     cols: usize,
 ) -> Result<Vec<f64>, ComputedFieldError> {
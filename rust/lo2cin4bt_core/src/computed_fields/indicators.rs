@@ -1,11 +1,14 @@
 use super::returns::simple_return;
-use super::{field, quantile, ComputedFieldError, ComputedFieldSpec};
-use std::collections::BTreeMap;
+use super::window::{
+    DriftGuard, MonotonicWindow, OrderStatisticWindow, RunningCoMoments, RunningMoments,
+    SpreadWindow,
+};
+use super::{field, ComputedFieldError, ComputedFieldSpec, FieldMap};
 
 pub(crate) fn compute(
     op: &str,
     spec: &ComputedFieldSpec,
-    fields: &BTreeMap<String, Vec<f64>>,
+    fields: &FieldMap,
     dates: &[String],
     rows: usize,
     cols: usize,
@@ -171,25 +174,108 @@ fn rolling_aggregate(
     period: usize,
     op: &str,
 ) -> Vec<f64> {
+    match op {
+        "rolling.min" => rolling_extreme(source, rows, cols, period, false),
+        "rolling.max" => rolling_extreme(source, rows, cols, period, true),
+        "rolling.median" => rolling_quantile(source, rows, cols, period, 0.5),
+        "rolling.sum" => rolling_sum(source, rows, cols, period, false),
+        _ => rolling_sum(source, rows, cols, period, true),
+    }
+}
+
+fn rolling_sum(source: &[f64], rows: usize, cols: usize, period: usize, mean: bool) -> Vec<f64> {
     let mut output = vec![f64::NAN; rows * cols];
-    for row in period.saturating_sub(1)..rows {
-        for col in 0..cols {
-            let mut values = (row + 1 - period..=row)
-                .map(|idx| source[idx * cols + col])
-                .collect::<Vec<_>>();
-            if values.iter().any(|value| !value.is_finite()) {
+    for col in 0..cols {
+        let value_at = |row: usize| source[row * cols + col];
+        let (mut sum, mut non_finite) = (0.0, 0usize);
+        let mut drift = DriftGuard::new(period);
+        for row in 0..rows {
+            let entering = value_at(row);
+            if entering.is_finite() {
+                sum += entering;
+            } else {
+                non_finite += 1;
+            }
+            if row >= period {
+                let leaving = value_at(row - period);
+                if leaving.is_finite() {
+                    sum -= leaving;
+                } else {
+                    non_finite -= 1;
+                }
+            }
+            drift.record();
+            if row + 1 < period || non_finite > 0 {
                 continue;
             }
-            output[row * cols + col] = match op {
-                "rolling.min" => values.into_iter().fold(f64::INFINITY, f64::min),
-                "rolling.max" => values.into_iter().fold(f64::NEG_INFINITY, f64::max),
-                "rolling.sum" => values.into_iter().sum(),
-                "rolling.median" => {
-                    values.sort_by(f64::total_cmp);
-                    quantile(&values, 0.5)
+            if drift.take_due() {
+                sum = (row + 1 - period..=row).map(value_at).sum();
+            }
+            output[row * cols + col] = if mean { sum / period as f64 } else { sum };
+        }
+    }
+    output
+}
+
+fn rolling_extreme(
+    source: &[f64],
+    rows: usize,
+    cols: usize,
+    period: usize,
+    keep_max: bool,
+) -> Vec<f64> {
+    let mut output = vec![f64::NAN; rows * cols];
+    let mut window = MonotonicWindow::new(keep_max);
+    for col in 0..cols {
+        window.clear();
+        let mut last_non_finite = None;
+        for row in 0..rows {
+            let value = source[row * cols + col];
+            if value.is_finite() {
+                window.push(row, value);
+            } else {
+                last_non_finite = Some(row);
+            }
+            if row + 1 < period {
+                continue;
+            }
+            let first = row + 1 - period;
+            window.expire(first);
+            if last_non_finite.is_some_and(|index| index >= first) {
+                continue;
+            }
+            if let Some(extreme) = window.front() {
+                output[row * cols + col] = extreme;
+            }
+        }
+    }
+    output
+}
+
+fn rolling_quantile(source: &[f64], rows: usize, cols: usize, period: usize, q: f64) -> Vec<f64> {
+    let mut output = vec![f64::NAN; rows * cols];
+    for col in 0..cols {
+        let value_at = |row: usize| source[row * cols + col];
+        let mut window = OrderStatisticWindow::new((0..rows).map(value_at));
+        let mut non_finite = 0usize;
+        for row in 0..rows {
+            let entering = value_at(row);
+            if entering.is_finite() {
+                window.insert(entering);
+            } else {
+                non_finite += 1;
+            }
+            if row >= period {
+                let leaving = value_at(row - period);
+                if leaving.is_finite() {
+                    window.remove(leaving);
+                } else {
+                    non_finite -= 1;
                 }
-                _ => values.into_iter().sum::<f64>() / period as f64,
-            };
+            }
+            if row + 1 >= period && non_finite == 0 {
+                output[row * cols + col] = window.quantile(period, q);
+            }
         }
     }
     output
@@ -281,16 +367,44 @@ fn rolling_stats(source: &[f64], rows: usize, cols: usize, period: usize) -> (Ve
     if period <= 1 {
         return (means, stds);
     }
-    for row in period - 1..rows {
-        for col in 0..cols {
+    for col in 0..cols {
+        let value_at = |row: usize| source[row * cols + col];
+        let mut moments = RunningMoments::default();
+        let mut spread = SpreadWindow::new();
+        let mut drift = DriftGuard::new(period);
+        for row in 0..rows {
+            let entering = value_at(row);
+            if entering.is_finite() {
+                moments.push(entering);
+                spread.push(row, entering);
+            }
+            if row >= period {
+                let leaving = value_at(row - period);
+                if leaving.is_finite() {
+                    moments.pop(leaving);
+                }
+            }
+            drift.record();
+            if row + 1 < period {
+                continue;
+            }
+            spread.expire(row + 1 - period);
             let mean = means[row * cols + col];
             if !mean.is_finite() {
                 continue;
             }
-            let values = (row + 1 - period..=row).map(|idx| source[idx * cols + col]);
-            stds[row * cols + col] = (values.map(|value| (value - mean).powi(2)).sum::<f64>()
-                / (period - 1) as f64)
-                .sqrt();
+            if spread.is_near_flat() {
+                // Running moments cancel badly here; rescan like the reference.
+                let values = (row + 1 - period..=row).map(value_at);
+                stds[row * cols + col] = (values.map(|value| (value - mean).powi(2)).sum::<f64>()
+                    / (period - 1) as f64)
+                    .sqrt();
+                continue;
+            }
+            if drift.take_due() {
+                moments.rebuild((row + 1 - period..=row).map(value_at));
+            }
+            stds[row * cols + col] = moments.sample_std();
         }
     }
     (means, stds)
@@ -318,21 +432,13 @@ fn rolling_percentile(
     period: usize,
     percentile: f64,
 ) -> Vec<f64> {
-    let mut output = vec![f64::NAN; rows * cols];
-    let q = percentile.clamp(0.0, 100.0) / 100.0;
-    for row in period.saturating_sub(1)..rows {
-        for col in 0..cols {
-            let mut values = (row + 1 - period..=row)
-                .map(|idx| source[idx * cols + col])
-                .collect::<Vec<_>>();
-            if values.iter().any(|value| !value.is_finite()) {
-                continue;
-            }
-            values.sort_by(f64::total_cmp);
-            output[row * cols + col] = quantile(&values, q);
-        }
-    }
-    output
+    rolling_quantile(
+        source,
+        rows,
+        cols,
+        period,
+        percentile.clamp(0.0, 100.0) / 100.0,
+    )
 }
 
 fn rolling_bollinger(
@@ -400,31 +506,55 @@ fn rolling_volatility(
 
 fn rolling_rsi(source: &[f64], rows: usize, cols: usize, period: usize) -> Vec<f64> {
     let mut output = vec![f64::NAN; rows * cols];
-    for row in period..rows {
-        for col in 0..cols {
-            let mut gain = 0.0;
-            let mut loss = 0.0;
-            let mut valid = true;
-            for idx in row + 1 - period..=row {
-                let current = source[idx * cols + col];
-                let previous = source[(idx - 1) * cols + col];
-                if !current.is_finite() || !previous.is_finite() {
-                    valid = false;
-                    break;
+    for col in 0..cols {
+        // Bar-to-bar change ending at `row`; None when either close is missing.
+        let delta_at = |row: usize| {
+            let current = source[row * cols + col];
+            let previous = source[(row - 1) * cols + col];
+            (current.is_finite() && previous.is_finite()).then(|| current - previous)
+        };
+        let (mut gain, mut loss) = (0.0, 0.0);
+        let (mut gain_bars, mut loss_bars, mut invalid) = (0usize, 0usize, 0usize);
+        let mut drift = DriftGuard::new(period);
+        for row in 1..rows {
+            match delta_at(row) {
+                Some(delta) => {
+                    gain += delta.max(0.0);
+                    loss += (-delta).max(0.0);
+                    gain_bars += usize::from(delta > 0.0);
+                    loss_bars += usize::from(delta < 0.0);
                 }
-                let delta = current - previous;
-                gain += delta.max(0.0);
-                loss += (-delta).max(0.0);
-            }
-            if valid {
-                let average_gain = gain / period as f64;
-                let average_loss = loss / period as f64;
-                output[row * cols + col] = if average_loss == 0.0 {
-                    100.0
-                } else {
-                    100.0 - 100.0 / (1.0 + average_gain / average_loss)
-                };
+                None => invalid += 1,
             }
+            if row > period {
+                match delta_at(row - period) {
+                    Some(delta) => {
+                        gain -= delta.max(0.0);
+                        loss -= (-delta).max(0.0);
+                        gain_bars -= usize::from(delta > 0.0);
+                        loss_bars -= usize::from(delta < 0.0);
+                    }
+                    None => invalid -= 1,
+                }
+            }
+            drift.record();
+            if row < period || invalid > 0 {
+                continue;
+            }
+            if drift.take_due() {
+                let deltas = (row + 1 - period..=row).filter_map(delta_at);
+                (gain, loss) = deltas.fold((0.0, 0.0), |(gain, loss), delta| {
+                    (gain + delta.max(0.0), loss + (-delta).max(0.0))
+                });
+            }
+            // Windows without any down (up) bar keep an exact zero sum.
+            let average_gain = if gain_bars == 0 { 0.0 } else { gain } / period as f64;
+            let average_loss = if loss_bars == 0 { 0.0 } else { loss } / period as f64;
+            output[row * cols + col] = if average_loss == 0.0 {
+                100.0
+            } else {
+                100.0 - 100.0 / (1.0 + average_gain / average_loss)
+            };
         }
     }
     output
@@ -552,27 +682,297 @@ fn rolling_correlation(
     period: usize,
 ) -> Vec<f64> {
     let mut output = vec![f64::NAN; rows * cols];
-    for row in period.saturating_sub(1)..rows {
-        for col in 0..cols {
-            let pairs = (row + 1 - period..=row)
-                .map(|idx| (left[idx * cols + col], right[idx * cols + col]))
-                .collect::<Vec<_>>();
-            if pairs.iter().any(|(x, y)| !x.is_finite() || !y.is_finite()) {
+    for col in 0..cols {
+        let pair_at = |row: usize| {
+            let (x, y) = (left[row * cols + col], right[row * cols + col]);
+            (x.is_finite() && y.is_finite()).then_some((x, y))
+        };
+        let mut moments = RunningCoMoments::default();
+        let (mut spread_x, mut spread_y) = (SpreadWindow::new(), SpreadWindow::new());
+        let mut non_finite = 0usize;
+        let mut drift = DriftGuard::new(period);
+        for row in 0..rows {
+            match pair_at(row) {
+                Some((x, y)) => {
+                    moments.push(x, y);
+                    spread_x.push(row, x);
+                    spread_y.push(row, y);
+                }
+                None => non_finite += 1,
+            }
+            if row >= period {
+                match pair_at(row - period) {
+                    Some((x, y)) => moments.pop(x, y),
+                    None => non_finite -= 1,
+                }
+            }
+            drift.record();
+            if row + 1 < period {
                 continue;
             }
-            let mean_x = pairs.iter().map(|(x, _)| x).sum::<f64>() / period as f64;
-            let mean_y = pairs.iter().map(|(_, y)| y).sum::<f64>() / period as f64;
-            let covariance = pairs
+            spread_x.expire(row + 1 - period);
+            spread_y.expire(row + 1 - period);
+            if non_finite > 0 {
+                continue;
+            }
+            if spread_x.is_near_flat() || spread_y.is_near_flat() {
+                let pairs = (row + 1 - period..=row)
+                    .filter_map(pair_at)
+                    .collect::<Vec<_>>();
+                output[row * cols + col] = exact_correlation(&pairs);
+                continue;
+            }
+            if drift.take_due() {
+                moments.rebuild((row + 1 - period..=row).filter_map(pair_at));
+            }
+            output[row * cols + col] = moments.correlation();
+        }
+    }
+    output
+}
+
+/// Two-pass correlation over one window, used where running moments cancel.
+fn exact_correlation(pairs: &[(f64, f64)]) -> f64 {
+    let count = pairs.len() as f64;
+    let mean_x = pairs.iter().map(|(x, _)| x).sum::<f64>() / count;
+    let mean_y = pairs.iter().map(|(_, y)| y).sum::<f64>() / count;
+    let covariance = pairs
+        .iter()
+        .map(|(x, y)| (x - mean_x) * (y - mean_y))
+        .sum::<f64>();
+    let variance_x = pairs.iter().map(|(x, _)| (x - mean_x).powi(2)).sum::<f64>();
+    let variance_y = pairs.iter().map(|(_, y)| (y - mean_y).powi(2)).sum::<f64>();
+    let denominator = (variance_x * variance_y).sqrt();
+    if denominator > 0.0 {
+        covariance / denominator
+    } else {
+        f64::NAN
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::computed_fields::quantile;
+
+    /// Deterministic price-like columns with gaps, flat runs and a sign flip.
+    fn sample(rows: usize, cols: usize) -> Vec<f64> {
+        let mut state = 0x9e37_79b9_7f4a_7c15_u64;
+        let mut values = vec![0.0; rows * cols];
+        for col in 0..cols {
+            let mut price = 100.0 + col as f64 * 25.0;
+            for row in 0..rows {
+                state ^= state << 13;
+                state ^= state >> 7;
+                state ^= state << 17;
+                let step = (state % 2001) as f64 / 1000.0 - 1.0;
+                if !(40..48).contains(&row) {
+                    price += step * if col == 2 { 30.0 } else { 1.5 };
+                }
+                values[row * cols + col] = match (row + col * 7) % 97 {
+                    0 => f64::NAN,
+                    1 if col == 1 => f64::INFINITY,
+                    _ => price,
+                };
+            }
+        }
+        values
+    }
+
+    fn windows(
+        source: &[f64],
+        rows: usize,
+        cols: usize,
+        period: usize,
+    ) -> impl Iterator<Item = (usize, Option<Vec<f64>>)> + '_ {
+        (period.saturating_sub(1)..rows).flat_map(move |row| {
+            (0..cols).map(move |col| {
+                let values = (row + 1 - period..=row)
+                    .map(|idx| source[idx * cols + col])
+                    .collect::<Vec<_>>();
+                let valid = values.iter().all(|value| value.is_finite());
+                (row * cols + col, valid.then_some(values))
+            })
+        })
+    }
+
+    fn reference_aggregate(
+        source: &[f64],
+        rows: usize,
+        cols: usize,
+        period: usize,
+        op: &str,
+    ) -> Vec<f64> {
+        let mut output = vec![f64::NAN; rows * cols];
+        for (idx, values) in windows(source, rows, cols, period) {
+            let Some(mut values) = values else { continue };
+            output[idx] = match op {
+                "rolling.min" => values.into_iter().fold(f64::INFINITY, f64::min),
+                "rolling.max" => values.into_iter().fold(f64::NEG_INFINITY, f64::max),
+                "rolling.sum" => values.into_iter().sum(),
+                "median" | "percentile" => {
+                    values.sort_by(f64::total_cmp);
+                    quantile(&values, if op == "median" { 0.5 } else { 0.37 })
+                }
+                _ => values.into_iter().sum::<f64>() / period as f64,
+            };
+        }
+        output
+    }
+
+    fn reference_std(source: &[f64], rows: usize, cols: usize, period: usize) -> Vec<f64> {
+        let mut output = vec![f64::NAN; rows * cols];
+        for (idx, values) in windows(source, rows, cols, period) {
+            let Some(values) = values else { continue };
+            let mean = values.iter().sum::<f64>() / period as f64;
+            output[idx] = (values
                 .iter()
+                .map(|value| (value - mean).powi(2))
+                .sum::<f64>()
+                / (period - 1) as f64)
+                .sqrt();
+        }
+        output
+    }
+
+    fn reference_correlation(
+        left: &[f64],
+        right: &[f64],
+        rows: usize,
+        cols: usize,
+        period: usize,
+    ) -> Vec<f64> {
+        let mut output = vec![f64::NAN; rows * cols];
+        let pairs = windows(left, rows, cols, period).zip(windows(right, rows, cols, period));
+        for ((idx, x), (_, y)) in pairs {
+            let (Some(x), Some(y)) = (x, y) else { continue };
+            let mean_x = x.iter().sum::<f64>() / period as f64;
+            let mean_y = y.iter().sum::<f64>() / period as f64;
+            let covariance = x
+                .iter()
+                .zip(&y)
                 .map(|(x, y)| (x - mean_x) * (y - mean_y))
                 .sum::<f64>();
-            let variance_x = pairs.iter().map(|(x, _)| (x - mean_x).powi(2)).sum::<f64>();
-            let variance_y = pairs.iter().map(|(_, y)| (y - mean_y).powi(2)).sum::<f64>();
+            let variance_x = x.iter().map(|x| (x - mean_x).powi(2)).sum::<f64>();
+            let variance_y = y.iter().map(|y| (y - mean_y).powi(2)).sum::<f64>();
             let denominator = (variance_x * variance_y).sqrt();
             if denominator > 0.0 {
-                output[row * cols + col] = covariance / denominator;
+                output[idx] = covariance / denominator;
             }
         }
+        output
+    }
+
+    fn reference_rsi(source: &[f64], rows: usize, cols: usize, period: usize) -> Vec<f64> {
+        let mut output = vec![f64::NAN; rows * cols];
+        for row in period..rows {
+            for col in 0..cols {
+                let deltas = (row + 1 - period..=row)
+                    .map(|idx| source[idx * cols + col] - source[(idx - 1) * cols + col])
+                    .collect::<Vec<_>>();
+                if deltas.iter().any(|delta| !delta.is_finite()) {
+                    continue;
+                }
+                let gain = deltas.iter().map(|delta| delta.max(0.0)).sum::<f64>();
+                let loss = deltas.iter().map(|delta| (-delta).max(0.0)).sum::<f64>();
+                output[row * cols + col] = if loss == 0.0 {
+                    100.0
+                } else {
+                    100.0 - 100.0 / (1.0 + gain / loss)
+                };
+            }
+        }
+        output
+    }
+
+    fn assert_same(actual: &[f64], expected: &[f64], tolerance: f64, label: &str) {
+        assert_eq!(actual.len(), expected.len(), "{label}");
+        for (idx, (actual, expected)) in actual.iter().zip(expected).enumerate() {
+            if expected.is_nan() {
+                assert!(actual.is_nan(), "{label}[{idx}]: {actual} != NaN");
+                continue;
+            }
+            let scale = expected.abs().max(1.0);
+            assert!(
+                (actual - expected).abs() <= tolerance * scale,
+                "{label}[{idx}]: {actual} != {expected}"
+            );
+        }
+    }
+
+    #[test]
+    fn order_statistic_windows_match_rescanning_exactly() {
+        let (rows, cols) = (600, 3);
+        let source = sample(rows, cols);
+        for period in [1, 2, 5, 20, 64] {
+            for op in ["rolling.min", "rolling.max"] {
+                assert_eq!(
+                    rolling_aggregate(&source, rows, cols, period, op)
+                        .iter()
+                        .map(|value| value.to_bits())
+                        .collect::<Vec<_>>(),
+                    reference_aggregate(&source, rows, cols, period, op)
+                        .iter()
+                        .map(|value| value.to_bits())
+                        .collect::<Vec<_>>(),
+                    "{op} period={period}"
+                );
+            }
+            let median = rolling_aggregate(&source, rows, cols, period, "rolling.median");
+            let percentile = rolling_percentile(&source, rows, cols, period, 37.0);
+            assert_same(
+                &median,
+                &reference_aggregate(&source, rows, cols, period, "median"),
+                0.0,
+                "median",
+            );
+            assert_same(
+                &percentile,
+                &reference_aggregate(&source, rows, cols, period, "percentile"),
+                0.0,
+                "percentile",
+            );
+        }
+    }
+
+    #[test]
+    fn running_moment_windows_match_rescanning() {
+        let (rows, cols) = (2_000, 3);
+        let source = sample(rows, cols);
+        let right = sample(rows + 5, cols)[5 * cols..].to_vec();
+        for period in [2, 3, 14, 50, 250] {
+            for op in ["rolling.sum", "rolling.mean"] {
+                assert_same(
+                    &rolling_aggregate(&source, rows, cols, period, op),
+                    &reference_aggregate(&source, rows, cols, period, op),
+                    1e-12,
+                    op,
+                );
+            }
+            assert_same(
+                &rolling_stats(&source, rows, cols, period).1,
+                &reference_std(&source, rows, cols, period),
+                1e-9,
+                "std",
+            );
+            assert_same(
+                &rolling_correlation(&source, &right, rows, cols, period),
+                &reference_correlation(&source, &right, rows, cols, period),
+                1e-9,
+                "correlation",
+            );
+            assert_same(
+                &rolling_rsi(&source, rows, cols, period),
+                &reference_rsi(&source, rows, cols, period),
+                1e-9,
+                "rsi",
+            );
+        }
+    }
+
+    #[test]
+    fn flat_windows_keep_exact_zero_rsi_loss() {
+        let source = [1.0, 2.0, 3.0, 3.0, 4.0, 5.0];
+        assert_eq!(rolling_rsi(&source, 6, 1, 3)[3..], [100.0, 100.0, 100.0]);
     }
-    output
 }
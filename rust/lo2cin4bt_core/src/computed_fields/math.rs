@@ -1,10 +1,9 @@
-use super::{field, scalar_or_field, ComputedFieldError, ComputedFieldSpec};
-use std::collections::BTreeMap;
+use super::{field, scalar_or_field, ComputedFieldError, ComputedFieldSpec, FieldMap};
 
 pub(crate) fn compute(
     op: &str,
     spec: &ComputedFieldSpec,
-    fields: &BTreeMap<String, Vec<f64>>,
+    fields: &FieldMap,
     len: usize,
 ) -> Result<Vec<f64>, ComputedFieldError> {
     let left = field(
@@ -3,12 +3,29 @@ mod indicators;
 mod math;
 pub mod returns;
 mod transforms;
+mod window;
 
-use serde::Deserialize;
-use std::collections::BTreeMap;
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
+use std::collections::{BTreeMap, HashMap};
+use std::sync::{Arc, Mutex};
 use thiserror::Error;
 
-#[derive(Debug, Clone, Default, Deserialize)]
+/// Named field columns; values are shared read-only between candidates.
+pub(crate) type FieldMap = BTreeMap<String, Arc<[f64]>>;
+
+/// Spec fields that name another field rather than carry a parameter.
+const SOURCE_KEYS: [&str; 7] = [
+    "source",
+    "right_source",
+    "high_source",
+    "low_source",
+    "close_source",
+    "true_source",
+    "false_source",
+];
+
+#[derive(Debug, Clone, Default, Deserialize, Serialize)]
 pub struct ComputedFieldSpec {
     pub name: String,
     pub op: String,
@@ -93,63 +110,163 @@ pub(crate) fn compute_fields(
     rows: usize,
     cols: usize,
     specs: &[ComputedFieldSpec],
-) -> Result<BTreeMap<String, Vec<f64>>, ComputedFieldError> {
-    let expected_len = rows * cols;
-    let mut fields = market_fields
-        .iter()
-        .map(|(name, values)| (name.trim().to_lowercase(), values.clone()))
-        .collect::<BTreeMap<_, _>>();
-    for (name, values) in &fields {
-        if values.len() != expected_len {
-            return Err(ComputedFieldError::InvalidParameter(format!(
-                "{name} length {} does not match {expected_len}",
-                values.len()
-            )));
+) -> Result<FieldMap, ComputedFieldError> {
+    ComputedFieldGraph::new(close, market_fields, dates, rows, cols)?.fields_for(specs)
+}
+
+/// Computed fields for a batch of candidates that share one market frame.
+///
+/// Each spec is canonicalized by (op, resolved sources, params), so candidates
+/// that define the same node under different names, e.g. `sma(close, 20)` with
+/// different exit parameters, compute it once per batch and share the column.
+pub(crate) struct ComputedFieldGraph<'a> {
+    dates: &'a [String],
+    rows: usize,
+    cols: usize,
+    base: FieldMap,
+    // Candidate threads resolve specs concurrently; a node computed twice by a
+    // race is identical, so the first insert is kept.
+    nodes: Mutex<HashMap<String, Arc<[f64]>>>,
+}
+
+impl<'a> ComputedFieldGraph<'a> {
+    pub(crate) fn new(
+        close: &[f64],
+        market_fields: &BTreeMap<String, Vec<f64>>,
+        dates: &'a [String],
+        rows: usize,
+        cols: usize,
+    ) -> Result<Self, ComputedFieldError> {
+        let expected_len = rows * cols;
+        let mut base = market_fields
+            .iter()
+            .map(|(name, values)| (name.trim().to_lowercase(), Arc::from(values.as_slice())))
+            .collect::<FieldMap>();
+        for (name, values) in &base {
+            if values.len() != expected_len {
+                return Err(ComputedFieldError::InvalidParameter(format!(
+                    "{name} length {} does not match {expected_len}",
+                    values.len()
+                )));
+            }
         }
+        base.insert("close".to_string(), Arc::from(close));
+        Ok(Self {
+            dates,
+            rows,
+            cols,
+            base,
+            nodes: Mutex::new(HashMap::new()),
+        })
     }
-    fields.insert("close".to_string(), close.to_vec());
-    for spec in specs {
-        let name = spec.name.trim().to_lowercase();
-        if name.is_empty() {
-            return Err(ComputedFieldError::InvalidParameter(
-                "computed field name is required".to_string(),
-            ));
-        }
-        if fields.contains_key(&name) {
-            return Err(ComputedFieldError::InvalidParameter(format!(
-                "computed field name already exists: {name}"
-            )));
+
+    /// Resolve one candidate's specs, reusing nodes computed for earlier ones.
+    pub(crate) fn fields_for(
+        &self,
+        specs: &[ComputedFieldSpec],
+    ) -> Result<FieldMap, ComputedFieldError> {
+        let mut fields = self.base.clone();
+        let mut node_keys = HashMap::<String, String>::new();
+        for spec in specs {
+            let name = spec.name.trim().to_lowercase();
+            if name.is_empty() {
+                return Err(ComputedFieldError::InvalidParameter(
+                    "computed field name is required".to_string(),
+                ));
+            }
+            if fields.contains_key(&name) {
+                return Err(ComputedFieldError::InvalidParameter(format!(
+                    "computed field name already exists: {name}"
+                )));
+            }
+            let op = spec.op.trim().to_lowercase();
+            let key = node_key(spec, &op, &node_keys)?;
+            let cached = self.cached_node(&key);
+            let values = match cached {
+                Some(values) => values,
+                None => {
+                    let values: Arc<[f64]> = self.compute(&op, spec, &fields)?.into();
+                    Arc::clone(
+                        self.nodes
+                            .lock()
+                            .expect("computed field nodes poisoned")
+                            .entry(key.clone())
+                            .or_insert(values),
+                    )
+                }
+            };
+            node_keys.insert(name.clone(), key);
+            fields.insert(name, values);
         }
-        let op = spec.op.trim().to_lowercase();
-        let values = if op.starts_with("indicator.") || op.starts_with("rolling.") {
-            indicators::compute(&op, spec, &fields, dates, rows, cols)?
+        Ok(fields)
+    }
+
+    fn cached_node(&self, key: &str) -> Option<Arc<[f64]>> {
+        self.nodes
+            .lock()
+            .expect("computed field nodes poisoned")
+            .get(key)
+            .cloned()
+    }
+
+    fn compute(
+        &self,
+        op: &str,
+        spec: &ComputedFieldSpec,
+        fields: &FieldMap,
+    ) -> Result<Vec<f64>, ComputedFieldError> {
+        let (rows, cols) = (self.rows, self.cols);
+        if op.starts_with("indicator.") || op.starts_with("rolling.") {
+            indicators::compute(op, spec, fields, self.dates, rows, cols)
         } else if op.starts_with("math.") {
-            math::compute(&op, spec, &fields, expected_len)?
+            math::compute(op, spec, fields, rows * cols)
         } else if op.starts_with("transform.") {
-            transforms::compute(&op, spec, &fields, rows, cols)?
+            transforms::compute(op, spec, fields, rows, cols)
         } else if op.starts_with("cross_section.") {
-            cross_section::compute(&op, spec, &fields, rows, cols)?
+            cross_section::compute(op, spec, fields, rows, cols)
         } else {
-            return Err(ComputedFieldError::UnsupportedOperation(op));
-        };
-        fields.insert(name, values);
+            Err(ComputedFieldError::UnsupportedOperation(op.to_string()))
+        }
+    }
+}
+
+/// Canonical identity of a spec: its op and parameters with the field name
+/// dropped and every source replaced by the identity of the node it names.
+fn node_key(
+    spec: &ComputedFieldSpec,
+    op: &str,
+    node_keys: &HashMap<String, String>,
+) -> Result<String, ComputedFieldError> {
+    let mut canonical = serde_json::to_value(spec)
+        .map_err(|error| ComputedFieldError::InvalidParameter(error.to_string()))?;
+    if let Some(object) = canonical.as_object_mut() {
+        object.remove("name");
+        object.insert("op".to_string(), op.into());
+        for source_key in SOURCE_KEYS {
+            if let Some(source) = object.get(source_key).and_then(|value| value.as_str()) {
+                let source = source.trim().to_lowercase();
+                let resolved = node_keys
+                    .get(&source)
+                    .cloned()
+                    .unwrap_or_else(|| format!("field:{source}"));
+                object.insert(source_key.to_string(), resolved.into());
+            }
+        }
     }
-    Ok(fields)
+    let digest = Sha256::digest(canonical.to_string().as_bytes());
+    Ok(digest.iter().map(|byte| format!("{byte:02x}")).collect())
 }
 
-pub(crate) fn field<'a>(
-    fields: &'a BTreeMap<String, Vec<f64>>,
-    name: &str,
-) -> Result<&'a [f64], ComputedFieldError> {
+pub(crate) fn field<'a>(fields: &'a FieldMap, name: &str) -> Result<&'a [f64], ComputedFieldError> {
     let key = name.trim().to_lowercase();
     fields
         .get(&key)
-        .map(Vec::as_slice)
+        .map(AsRef::as_ref)
         .ok_or(ComputedFieldError::UnknownField(key))
 }
 
 pub(crate) fn scalar_or_field(
-    fields: &BTreeMap<String, Vec<f64>>,
+    fields: &FieldMap,
     source: Option<&str>,
     value: Option<f64>,
     len: usize,
@@ -266,7 +383,7 @@ mod tests {
         )
         .expect("cross-sectional rank should succeed");
 
-        assert_eq!(fields["rank"], [1.0, 3.0, 2.0, 2.0, 1.0, 3.0]);
+        assert_eq!(fields["rank"][..], [1.0, 3.0, 2.0, 2.0, 1.0, 3.0]);
     }
 
     #[test]
@@ -291,4 +408,34 @@ mod tests {
                 if message == "indicator.macd requires fastperiod"
         ));
     }
+
+    #[test]
+    fn graph_computes_each_canonical_node_once_per_batch() {
+        let close = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0];
+        let dates = Vec::new();
+        let graph = ComputedFieldGraph::new(&close, &BTreeMap::new(), &dates, 6, 1).unwrap();
+        let mut fast = spec("fast", "indicator.sma", "close");
+        fast.period = Some(2);
+        let mut renamed = spec("FAST_MA", " Indicator.SMA ", "CLOSE");
+        renamed.period = Some(2);
+        let mut slow = spec("slow", "indicator.sma", "close");
+        slow.period = Some(3);
+        let mut spread = spec("spread", "math.subtract", "fast");
+        spread.right_source = Some("slow".to_string());
+        let mut renamed_spread = spec("gap", "math.subtract", "fast_ma");
+        renamed_spread.right_source = Some("slow".to_string());
+
+        let first = graph
+            .fields_for(&[fast, slow.clone(), spread])
+            .expect("first candidate should compute");
+        let second = graph
+            .fields_for(&[renamed, slow, renamed_spread])
+            .expect("second candidate should reuse nodes");
+
+        assert_eq!(graph.nodes.lock().unwrap().len(), 3);
+        assert!(Arc::ptr_eq(&first["fast"], &second["fast_ma"]));
+        assert!(Arc::ptr_eq(&first["spread"], &second["gap"]));
+        assert!(Arc::ptr_eq(&first["close"], &second["close"]));
+        assert_eq!(second["gap"][5], 0.5);
+    }
 }
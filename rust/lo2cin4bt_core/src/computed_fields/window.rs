@@ -0,0 +1,369 @@
+//! Incremental sliding-window state for rolling computed fields.
+//!
+//! Each structure is updated once when a bar enters or leaves the window, so a
+//! rolling kernel costs O(N) (O(N log N) for order statistics) instead of
+//! rescanning `period` bars per output cell. Only finite values are pushed;
+//! kernels track non-finite bars separately and emit NaN while one is inside
+//! the window, matching the rescanning implementation.
+
+use std::cmp::Ordering;
+use std::collections::VecDeque;
+
+/// Counts updates since running state was last rebuilt from the window.
+///
+/// Kernels rebuild their running sums once `period` updates have accumulated,
+/// which keeps floating-point drift bounded on long minute-bar series while
+/// staying O(1) amortized per bar.
+#[derive(Clone, Copy, Debug)]
+pub(super) struct DriftGuard {
+    period: usize,
+    updates: usize,
+}
+
+impl DriftGuard {
+    pub(super) fn new(period: usize) -> Self {
+        Self { period, updates: 0 }
+    }
+
+    pub(super) fn record(&mut self) {
+        self.updates += 1;
+    }
+
+    /// True (and reset) when the running state should be rebuilt now.
+    pub(super) fn take_due(&mut self) -> bool {
+        if self.updates >= self.period {
+            self.updates = 0;
+            true
+        } else {
+            false
+        }
+    }
+}
+
+/// Mean and sum of squared deviations (Welford) with removal support.
+///
+/// Values are shifted by an origin taken from the window at each rebuild, so
+/// deviations stay on the scale of the window spread rather than the price.
+#[derive(Clone, Copy, Debug, Default)]
+pub(super) struct RunningMoments {
+    origin: f64,
+    count: usize,
+    mean: f64,
+    m2: f64,
+}
+
+impl RunningMoments {
+    pub(super) fn push(&mut self, value: f64) {
+        let value = value - self.origin;
+        self.count += 1;
+        let delta = value - self.mean;
+        self.mean += delta / self.count as f64;
+        self.m2 += delta * (value - self.mean);
+    }
+
+    pub(super) fn pop(&mut self, value: f64) {
+        if self.count <= 1 {
+            *self = Self {
+                origin: self.origin,
+                ..Self::default()
+            };
+            return;
+        }
+        let value = value - self.origin;
+        let delta = value - self.mean;
+        self.count -= 1;
+        self.mean -= delta / self.count as f64;
+        self.m2 -= delta * (value - self.mean);
+    }
+
+    pub(super) fn rebuild(&mut self, values: impl Iterator<Item = f64>) {
+        let mut values = values.peekable();
+        *self = Self {
+            origin: values.peek().copied().unwrap_or_default(),
+            ..Self::default()
+        };
+        values.for_each(|value| self.push(value));
+    }
+
+    pub(super) fn sample_std(&self) -> f64 {
+        if self.count < 2 {
+            return f64::NAN;
+        }
+        (self.m2.max(0.0) / (self.count - 1) as f64).sqrt()
+    }
+}
+
+/// Paired Welford moments for rolling covariance and correlation.
+#[derive(Clone, Copy, Debug, Default)]
+pub(super) struct RunningCoMoments {
+    origin: (f64, f64),
+    count: usize,
+    mean_x: f64,
+    mean_y: f64,
+    m2_x: f64,
+    m2_y: f64,
+    co_moment: f64,
+}
+
+impl RunningCoMoments {
+    pub(super) fn push(&mut self, x: f64, y: f64) {
+        let (x, y) = (x - self.origin.0, y - self.origin.1);
+        self.count += 1;
+        let n = self.count as f64;
+        let delta_x = x - self.mean_x;
+        let delta_y = y - self.mean_y;
+        self.mean_x += delta_x / n;
+        self.mean_y += delta_y / n;
+        self.m2_x += delta_x * (x - self.mean_x);
+        self.m2_y += delta_y * (y - self.mean_y);
+        self.co_moment += delta_x * (y - self.mean_y);
+    }
+
+    pub(super) fn pop(&mut self, x: f64, y: f64) {
+        if self.count <= 1 {
+            *self = Self {
+                origin: self.origin,
+                ..Self::default()
+            };
+            return;
+        }
+        let (x, y) = (x - self.origin.0, y - self.origin.1);
+        self.count -= 1;
+        let n = self.count as f64;
+        let delta_x = x - self.mean_x;
+        let delta_y = y - self.mean_y;
+        self.mean_x -= delta_x / n;
+        self.mean_y -= delta_y / n;
+        self.m2_x -= delta_x * (x - self.mean_x);
+        self.m2_y -= delta_y * (y - self.mean_y);
+        self.co_moment -= delta_x * (y - self.mean_y);
+    }
+
+    pub(super) fn rebuild(&mut self, pairs: impl Iterator<Item = (f64, f64)>) {
+        let mut pairs = pairs.peekable();
+        *self = Self {
+            origin: pairs.peek().copied().unwrap_or_default(),
+            ..Self::default()
+        };
+        pairs.for_each(|(x, y)| self.push(x, y));
+    }
+
+    pub(super) fn correlation(&self) -> f64 {
+        let denominator = (self.m2_x.max(0.0) * self.m2_y.max(0.0)).sqrt();
+        if denominator > 0.0 {
+            self.co_moment / denominator
+        } else {
+            f64::NAN
+        }
+    }
+}
+
+/// Monotonic deque holding the window minimum or maximum at its front.
+#[derive(Debug)]
+pub(super) struct MonotonicWindow {
+    keep_max: bool,
+    entries: VecDeque<(usize, f64)>,
+}
+
+impl MonotonicWindow {
+    pub(super) fn new(keep_max: bool) -> Self {
+        Self {
+            keep_max,
+            entries: VecDeque::new(),
+        }
+    }
+
+    pub(super) fn push(&mut self, index: usize, value: f64) {
+        while let Some(&(_, back)) = self.entries.back() {
+            let dominated = if self.keep_max {
+                back <= value
+            } else {
+                back >= value
+            };
+            if !dominated {
+                break;
+            }
+            self.entries.pop_back();
+        }
+        self.entries.push_back((index, value));
+    }
+
+    /// Drop entries whose index fell out of a window starting at `first_index`.
+    pub(super) fn expire(&mut self, first_index: usize) {
+        while self
+            .entries
+            .front()
+            .is_some_and(|(index, _)| *index < first_index)
+        {
+            self.entries.pop_front();
+        }
+    }
+
+    pub(super) fn front(&self) -> Option<f64> {
+        self.entries.front().map(|(_, value)| *value)
+    }
+
+    pub(super) fn clear(&mut self) {
+        self.entries.clear();
+    }
+}
+
+/// Relative spread below which running moments lose too many digits to
+/// cancellation; such windows are recomputed exactly by the kernels.
+const NEAR_FLAT_RELATIVE_SPREAD: f64 = 1e-6;
+
+/// Window minimum and maximum, used to spot near-flat windows.
+#[derive(Debug)]
+pub(super) struct SpreadWindow {
+    min: MonotonicWindow,
+    max: MonotonicWindow,
+}
+
+impl SpreadWindow {
+    pub(super) fn new() -> Self {
+        Self {
+            min: MonotonicWindow::new(false),
+            max: MonotonicWindow::new(true),
+        }
+    }
+
+    pub(super) fn push(&mut self, index: usize, value: f64) {
+        self.min.push(index, value);
+        self.max.push(index, value);
+    }
+
+    pub(super) fn expire(&mut self, first_index: usize) {
+        self.min.expire(first_index);
+        self.max.expire(first_index);
+    }
+
+    /// True when the window is flat or nearly so relative to its magnitude.
+    pub(super) fn is_near_flat(&self) -> bool {
+        match (self.min.front(), self.max.front()) {
+            (Some(min), Some(max)) => {
+                max - min <= NEAR_FLAT_RELATIVE_SPREAD * min.abs().max(max.abs())
+            }
+            _ => true,
+        }
+    }
+}
+
+/// Multiset of window values over a fixed value universe (one column), backed
+/// by a Fenwick tree of counts so insert, remove and k-th smallest are O(log U).
+#[derive(Debug)]
+pub(super) struct OrderStatisticWindow {
+    universe: Vec<f64>,
+    tree: Vec<usize>,
+    top_bit: usize,
+}
+
+impl OrderStatisticWindow {
+    pub(super) fn new(values: impl Iterator<Item = f64>) -> Self {
+        let mut universe = values.filter(|value| value.is_finite()).collect::<Vec<_>>();
+        universe.sort_by(f64::total_cmp);
+        universe.dedup_by(|left, right| left.total_cmp(right) == Ordering::Equal);
+        let top_bit = if universe.is_empty() {
+            0
+        } else {
+            1 << (usize::BITS - 1 - universe.len().leading_zeros())
+        };
+        Self {
+            tree: vec![0; universe.len() + 1],
+            universe,
+            top_bit,
+        }
+    }
+
+    pub(super) fn insert(&mut self, value: f64) {
+        self.update(value, true);
+    }
+
+    pub(super) fn remove(&mut self, value: f64) {
+        self.update(value, false);
+    }
+
+    /// The `k`-th smallest value (0-based) currently in the window.
+    pub(super) fn kth(&self, k: usize) -> f64 {
+        let mut position = 0usize;
+        let mut remaining = k + 1;
+        let mut step = self.top_bit;
+        while step > 0 {
+            let next = position + step;
+            if next < self.tree.len() && self.tree[next] < remaining {
+                position = next;
+                remaining -= self.tree[next];
+            }
+            step >>= 1;
+        }
+        self.universe[position]
+    }
+
+    /// Linear-interpolated quantile over a window of `len` values, matching
+    /// `computed_fields::quantile` on the sorted window.
+    pub(super) fn quantile(&self, len: usize, q: f64) -> f64 {
+        let position = q.clamp(0.0, 1.0) * (len - 1) as f64;
+        let lower = position.floor() as usize;
+        let upper = position.ceil() as usize;
+        let lower_value = self.kth(lower);
+        let upper_value = if upper == lower {
+            lower_value
+        } else {
+            self.kth(upper)
+        };
+        lower_value + (upper_value - lower_value) * (position - lower as f64)
+    }
+
+    fn update(&mut self, value: f64, insert: bool) {
+        let Ok(rank) = self
+            .universe
+            .binary_search_by(|probe| probe.total_cmp(&value))
+        else {
+            return;
+        };
+        let mut index = rank + 1;
+        while index < self.tree.len() {
+            if insert {
+                self.tree[index] += 1;
+            } else {
+                self.tree[index] -= 1;
+            }
+            index += index & index.wrapping_neg();
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn order_statistics_track_inserts_and_removals() {
+        let values = [5.0, 1.0, 3.0, 3.0, 9.0, -2.0];
+        let mut window = OrderStatisticWindow::new(values.iter().copied());
+        for value in &values[..4] {
+            window.insert(*value);
+        }
+        assert_eq!(
+            (0..4).map(|k| window.kth(k)).collect::<Vec<_>>(),
+            [1.0, 3.0, 3.0, 5.0]
+        );
+        window.remove(3.0);
+        window.insert(-2.0);
+        assert_eq!(
+            (0..4).map(|k| window.kth(k)).collect::<Vec<_>>(),
+            [-2.0, 1.0, 3.0, 5.0]
+        );
+        assert_eq!(window.quantile(4, 0.5), 2.0);
+    }
+
+    #[test]
+    fn monotonic_window_expires_old_extremes() {
+        let mut window = MonotonicWindow::new(true);
+        for (index, value) in [4.0, 2.0, 3.0, 1.0].into_iter().enumerate() {
+            window.push(index, value);
+        }
+        assert_eq!(window.front(), Some(4.0));
+        window.expire(1);
+        assert_eq!(window.front(), Some(3.0));
+    }
+}
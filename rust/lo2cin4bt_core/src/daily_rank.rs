@@ -2,9 +2,14 @@ use crate::accounting::{
     apply_risk_gates, AccountingConfig, AccountingError, AccountingRiskGateEvent,
 };
 use crate::artifact_tables::write_result_rows_parquet;
+use crate::cancellation::{self, CancellationReason};
 use crate::candidate_identity::parse_candidate_id;
+use crate::candidate_parallel::map_candidates;
+use crate::candidate_retention::{CandidateRetentionSummary, RetainedCandidates, RetentionScore};
 use crate::computed_fields::returns::simple_return;
-use crate::computed_fields::{compute_fields, ComputedFieldError, ComputedFieldSpec};
+use crate::computed_fields::{
+    compute_fields, ComputedFieldError, ComputedFieldGraph, ComputedFieldSpec, FieldMap,
+};
 use crate::result_validator::{
     validate_result_tables, ResultTableView, ResultValidationError, ResultValidationReport,
 };
@@ -23,6 +28,7 @@ use serde_json::{json, Value};
 use std::collections::{BTreeMap, BTreeSet};
 use std::fs;
 use std::path::PathBuf;
+use std::sync::Arc;
 use thiserror::Error;
 
 #[derive(Debug, Clone, Deserialize)]
@@ -114,9 +120,45 @@ pub struct DailyRankBatchInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Keep full results only for the best `retain_top` candidates.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
     pub candidates: Vec<DailyRankBatchCandidateInput>,
 }
 
+/// Market inputs every candidate of a run reads. A batch builds them once and
+/// each candidate borrows them, so memory per candidate is only its own
+/// eligibility, score and rebalance arrays.
+#[derive(Debug)]
+struct DailyRankMarket {
+    config: Arc<AccountingConfig>,
+    dates: Arc<[String]>,
+    symbols: Arc<[String]>,
+    close: Arc<[f64]>,
+    open: Arc<[f64]>,
+    market_fields: Arc<BTreeMap<String, Vec<f64>>>,
+}
+
+impl DailyRankMarket {
+    fn new(
+        config: AccountingConfig,
+        dates: Vec<String>,
+        symbols: Vec<String>,
+        close: Vec<f64>,
+        open: Vec<f64>,
+        market_fields: BTreeMap<String, Vec<f64>>,
+    ) -> Self {
+        Self {
+            config: Arc::new(config),
+            dates: dates.into(),
+            symbols: symbols.into(),
+            close: close.into(),
+            open: open.into(),
+            market_fields: Arc::new(market_fields),
+        }
+    }
+}
+
 pub type DailyRankFeatureSpec = ComputedFieldSpec;
 
 #[derive(Debug, Clone, Default, Deserialize)]
@@ -199,12 +241,25 @@ pub struct DailyRankCompactResult {
     pub summary: Option<DailyRankAccountingSummary>,
 }
 
+impl DailyRankCompactResult {
+    fn retention_score(&self) -> RetentionScore {
+        RetentionScore {
+            sharpe: None,
+            final_equity: self.final_equity,
+            total_return: self.total_return,
+            cagr: None,
+        }
+    }
+}
+
 #[derive(Debug, Clone, Serialize)]
 pub struct DailyRankBatchSummary {
     pub candidate_count: usize,
     pub results: Vec<DailyRankCompactResult>,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub artifact_bundle: Option<DailyRankRustArtifactBundle>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub retention: Option<CandidateRetentionSummary>,
 }
 
 #[derive(Debug, Clone, Serialize)]
@@ -271,9 +326,11 @@ pub enum DailyRankAccountingError {
     InvalidCandidateId(String),
     #[error("duplicate canonical candidate_id: {0}")]
     DuplicateCandidateId(String),
+    #[error(transparent)]
+    Cancelled(#[from] CancellationReason),
 }
 
-fn map_computed_field_error(error: ComputedFieldError) -> DailyRankAccountingError {
+pub(crate) fn map_computed_field_error(error: ComputedFieldError) -> DailyRankAccountingError {
     match error {
         ComputedFieldError::UnsupportedOperation(operation) => {
             DailyRankAccountingError::UnsupportedFeature(operation)
@@ -294,43 +351,80 @@ fn default_long_gross_exposure() -> f64 {
 }
 
 pub fn run_daily_rank_accounting(
-    mut input: DailyRankAccountingInput,
+    input: DailyRankAccountingInput,
 ) -> Result<DailyRankAccountingSummary, DailyRankAccountingError> {
-    materialize_rust_producer_fields(&mut input)?;
-    validate_input(&input)?;
-    validate_accounting_config(&input.config)?;
-    let rows = input.dates.len();
-    let cols = input.symbols.len();
-    let selection = run_rank_selection(RankSelectionInput {
-        rows,
-        cols,
-        eligible: input.eligible.clone(),
-        score: input.score.clone(),
+    let market = DailyRankMarket::new(
+        input.config,
+        input.dates,
+        input.symbols,
+        input.close,
+        input.open,
+        input.market_fields,
+    );
+    let candidate = DailyRankBatchCandidateInput {
+        candidate_id: String::new(),
+        resolved_params: BTreeMap::new(),
+        eligible: input.eligible,
+        score: input.score,
+        rebalance: input.rebalance,
         ascending: input.ascending,
         top_n: input.top_n,
         short_bottom_n: input.short_bottom_n,
         long_gross_exposure: input.long_gross_exposure,
         short_gross_exposure: input.short_gross_exposure,
         position_limit: input.position_limit,
+        feature_specs: input.feature_specs,
+        eligible_rule: input.eligible_rule,
+        rank_by: input.rank_by,
+        target_change: input.target_change,
+        execute_next_open: input.execute_next_open,
+    };
+    run_daily_rank_candidate(&market, candidate, None)
+}
+
+/// Run one candidate against shared market inputs, resolving its computed
+/// fields through a batch graph when one is supplied so nodes shared with
+/// other candidates are reused.
+fn run_daily_rank_candidate(
+    market: &DailyRankMarket,
+    mut candidate: DailyRankBatchCandidateInput,
+    graph: Option<&ComputedFieldGraph<'_>>,
+) -> Result<DailyRankAccountingSummary, DailyRankAccountingError> {
+    materialize_rust_producer_fields(market, &mut candidate, graph)?;
+    validate_input(market, &candidate)?;
+    validate_accounting_config(&market.config)?;
+    let rows = market.dates.len();
+    let cols = market.symbols.len();
+    let selection = run_rank_selection(RankSelectionInput {
+        rows,
+        cols,
+        eligible: candidate.eligible.clone(),
+        score: candidate.score.clone(),
+        ascending: candidate.ascending,
+        top_n: candidate.top_n,
+        short_bottom_n: candidate.short_bottom_n,
+        long_gross_exposure: candidate.long_gross_exposure,
+        short_gross_exposure: candidate.short_gross_exposure,
+        position_limit: candidate.position_limit,
     })?;
 
     let mut pre_trade_returns = vec![0.0; rows * cols];
     let mut post_trade_returns = vec![0.0; rows * cols];
     for row in 1..rows {
         for col in 0..cols {
-            let previous_close = input.close[(row - 1) * cols + col];
-            let current_open = if input.execute_next_open {
-                input.open[row * cols + col]
+            let previous_close = market.close[(row - 1) * cols + col];
+            let current_open = if candidate.execute_next_open {
+                market.open[row * cols + col]
             } else {
-                input.close[row * cols + col]
+                market.close[row * cols + col]
             };
             let pre_trade_return = simple_return(current_open, previous_close);
             if !pre_trade_return.is_finite() {
                 return Err(DailyRankAccountingError::NonFiniteDerivedReturn { row, col });
             }
             pre_trade_returns[row * cols + col] = pre_trade_return;
-            if input.execute_next_open {
-                let post_trade_return = simple_return(input.close[row * cols + col], current_open);
+            if candidate.execute_next_open {
+                let post_trade_return = simple_return(market.close[row * cols + col], current_open);
                 if !post_trade_return.is_finite() {
                     return Err(DailyRankAccountingError::NonFiniteDerivedReturn { row, col });
                 }
@@ -339,7 +433,7 @@ pub fn run_daily_rank_accounting(
         }
     }
 
-    let start_equity = input.config.starting_equity;
+    let start_equity = market.config.starting_equity;
     let mut equity = start_equity;
     let mut previous_weights = vec![0.0; cols];
     let mut events = Vec::with_capacity(rows);
@@ -348,7 +442,7 @@ pub fn run_daily_rank_accounting(
     let mut active_rebalances = 0usize;
     let mut equity_peak = equity;
     let mut risk_gate_events = Vec::new();
-    let symbol_set = input.symbols.iter().cloned().collect::<BTreeSet<_>>();
+    let symbol_set = market.symbols.iter().cloned().collect::<BTreeSet<_>>();
     let mut risk_control = RiskControlState::default();
     let mut shadow_equity = 0.0;
     let mut shadow_weights = vec![0.0; cols];
@@ -356,8 +450,12 @@ pub fn run_daily_rank_accounting(
     let mut session_progress = SessionProgress::default();
 
     for row in 0..rows {
+        cancellation::checkpoint()?;
         let session = session_progress
-            .observe(&input.dates[row], &input.config.session_label_by_event_time)
+            .observe(
+                &market.dates[row],
+                &market.config.session_label_by_event_time,
+            )
             .map_err(DailyRankAccountingError::InvalidSessionProgress)?;
         if session.advanced {
             settlement_ledger.advance_session();
@@ -393,33 +491,33 @@ pub fn run_daily_rank_accounting(
         }
 
         let before_weights = previous_weights.clone();
-        let decision_row = if input.execute_next_open {
+        let decision_row = if candidate.execute_next_open {
             row.saturating_sub(1)
         } else {
             row
         };
-        let has_executable_decision = !input.execute_next_open || row > 0;
+        let has_executable_decision = !candidate.execute_next_open || row > 0;
         let decision_start = decision_row * cols;
-        let is_rebalance = has_executable_decision && input.rebalance[decision_row];
+        let is_rebalance = has_executable_decision && candidate.rebalance[decision_row];
         let mut selected_target_weights = if is_rebalance {
             selection.target_weights[decision_start..decision_start + cols].to_vec()
         } else {
             before_weights.clone()
         };
-        let before_map = vector_weights_to_map(&input.symbols, &before_weights);
+        let before_map = vector_weights_to_map(&market.symbols, &before_weights);
         let maintenance_liquidation =
-            maintenance_margin_breached(&before_map, &input.config.simulated_account);
+            maintenance_margin_breached(&before_map, &market.config.simulated_account);
         let execute_rebalance = is_rebalance || maintenance_liquidation;
         if maintenance_liquidation {
             selected_target_weights.fill(0.0);
             risk_gate_events.push(AccountingRiskGateEvent {
-                time: input.dates[row].clone(),
+                time: market.dates[row].clone(),
                 gate: "maintenance_margin".to_string(),
                 threshold: 1.0,
                 observed: before_weights.iter().map(|value| value.abs()).sum::<f64>()
-                    * input.config.simulated_account.maintenance_margin_ratio,
+                    * market.config.simulated_account.maintenance_margin_ratio,
                 action: "margin_liquidation".to_string(),
-                affected_assets: input.symbols.clone(),
+                affected_assets: market.symbols.to_vec(),
                 resulting_target_weights: BTreeMap::new(),
             });
         }
@@ -445,10 +543,10 @@ pub fn run_daily_rank_accounting(
                     .zip(shadow_weights.iter())
                     .map(|(target, before)| (target - before).abs())
                     .sum::<f64>();
-                shadow_equity *= (1.0 - shadow_turnover * input.config.cost_rate).max(0.0);
+                shadow_equity *= (1.0 - shadow_turnover * market.config.cost_rate).max(0.0);
                 shadow_weights = selected_target_weights.clone();
             }
-            if input.execute_next_open && row > 0 {
+            if candidate.execute_next_open && row > 0 {
                 let shadow_post_return = shadow_weights
                     .iter()
                     .zip(post_returns_row.iter())
@@ -469,61 +567,61 @@ pub fn run_daily_rank_accounting(
                         .map(|weight| weight.abs())
                         .sum::<f64>();
                     shadow_equity *= (1.0
-                        - shadow_short_gross * input.config.short_borrow_rate_annual
-                            / input.config.borrow_day_count as f64)
+                        - shadow_short_gross * market.config.short_borrow_rate_annual
+                            / market.config.borrow_day_count as f64)
                         .max(0.0);
                 }
             }
             if risk_control.observe_shadow_equity(shadow_equity) {
                 risk_gate_events.push(AccountingRiskGateEvent {
-                    time: input.dates[row].clone(),
+                    time: market.dates[row].clone(),
                     gate: "max_drawdown".to_string(),
                     threshold: risk_control.recovery_target(),
                     observed: shadow_equity,
                     action: SHADOW_RECOVERY_ARMED_ACTION.to_string(),
-                    affected_assets: input.symbols.clone(),
+                    affected_assets: market.symbols.to_vec(),
                     resulting_target_weights: vector_weights_to_map(
-                        &input.symbols,
+                        &market.symbols,
                         &shadow_weights,
                     ),
                 });
             }
         }
-        let target_map = vector_weights_to_map(&input.symbols, &selected_target_weights);
+        let target_map = vector_weights_to_map(&market.symbols, &selected_target_weights);
         let (adjusted_map, mut row_risk_events) =
             if risk_control.is_shadow() && risk_control.recovery_armed() && is_rebalance {
                 let recovery_target = risk_control.recovery_target();
                 risk_control.resume_on_next_action();
                 equity_peak = equity;
                 risk_gate_events.push(AccountingRiskGateEvent {
-                    time: input.dates[row].clone(),
+                    time: market.dates[row].clone(),
                     gate: "max_drawdown".to_string(),
                     threshold: recovery_target,
                     observed: equity,
                     action: SHADOW_RECOVERY_RESUMED_ACTION.to_string(),
-                    affected_assets: input.symbols.clone(),
+                    affected_assets: market.symbols.to_vec(),
                     resulting_target_weights: target_map.clone(),
                 });
                 apply_risk_gates(
-                    &input.config.risk_gates,
+                    &market.config.risk_gates,
                     &symbol_set,
                     &before_map,
                     &target_map,
                     equity,
                     equity_peak,
                     daily_return,
-                    &input.dates[row],
+                    &market.dates[row],
                 )
             } else if risk_control.live_orders_allowed() {
                 apply_risk_gates(
-                    &input.config.risk_gates,
+                    &market.config.risk_gates,
                     &symbol_set,
                     &before_map,
                     &target_map,
                     equity,
                     equity_peak,
                     daily_return,
-                    &input.dates[row],
+                    &market.dates[row],
                 )
             } else {
                 (BTreeMap::new(), Vec::new())
@@ -539,7 +637,7 @@ pub fn run_daily_rank_accounting(
                     .zip(before_weights.iter())
                     .map(|(target, before)| (target - before).abs())
                     .sum::<f64>();
-                shadow_equity = equity * (1.0 - shadow_turnover * input.config.cost_rate).max(0.0);
+                shadow_equity = equity * (1.0 - shadow_turnover * market.config.cost_rate).max(0.0);
                 shadow_weights = selected_target_weights.clone();
                 risk_control.observe_shadow_equity(shadow_equity);
             } else {
@@ -549,17 +647,17 @@ pub fn run_daily_rank_accounting(
         risk_gate_events.append(&mut row_risk_events);
         let (target_weights, turnover, orders, settlements) = if execute_rebalance {
             let execution = execute_target_weight_orders(
-                &format!("{}:rank", input.dates[row]),
+                &format!("{}:rank", market.dates[row]),
                 &before_map,
                 &adjusted_map,
-                &input.config.simulated_venue,
-                &input.config.simulated_account,
+                &market.config.simulated_venue,
+                &market.config.simulated_account,
             )?;
             for settlement in &execution.settlements {
                 settlement_ledger.submit(settlement.clone());
             }
             (
-                map_weights_to_vector(&input.symbols, &execution.resulting_weights),
+                map_weights_to_vector(&market.symbols, &execution.resulting_weights),
                 execution.turnover,
                 execution.orders,
                 execution.settlements,
@@ -567,16 +665,16 @@ pub fn run_daily_rank_accounting(
         } else {
             (before_weights.clone(), 0.0, Vec::new(), Vec::new())
         };
-        let trade_cost = if turnover > 0.0 && input.config.cost_rate > 0.0 {
-            let cost = equity * turnover * input.config.cost_rate;
-            equity *= (1.0 - turnover * input.config.cost_rate).max(0.0);
+        let trade_cost = if turnover > 0.0 && market.config.cost_rate > 0.0 {
+            let cost = equity * turnover * market.config.cost_rate;
+            equity *= (1.0 - turnover * market.config.cost_rate).max(0.0);
             cost
         } else {
             0.0
         };
         let executed_weights = target_weights.clone();
         let mut final_weights = executed_weights.clone();
-        let post_return = if input.execute_next_open && row > 0 {
+        let post_return = if candidate.execute_next_open && row > 0 {
             let value = executed_weights
                 .iter()
                 .zip(post_returns_row.iter())
@@ -603,7 +701,7 @@ pub fn run_daily_rank_accounting(
             0.0
         };
         daily_return = (1.0 + daily_return) * (1.0 + post_return) - 1.0;
-        let borrow_basis = if input.execute_next_open {
+        let borrow_basis = if candidate.execute_next_open {
             &executed_weights
         } else {
             &pre_return_weights
@@ -613,16 +711,17 @@ pub fn run_daily_rank_accounting(
             .filter(|weight| **weight < 0.0)
             .map(|weight| weight.abs())
             .sum::<f64>();
-        let borrow_cost =
-            if session.advanced && short_gross > 0.0 && input.config.short_borrow_rate_annual > 0.0
-            {
-                let cost = equity * short_gross * input.config.short_borrow_rate_annual
-                    / input.config.borrow_day_count as f64;
-                equity = (equity - cost).max(0.0);
-                cost
-            } else {
-                0.0
-            };
+        let borrow_cost = if session.advanced
+            && short_gross > 0.0
+            && market.config.short_borrow_rate_annual > 0.0
+        {
+            let cost = equity * short_gross * market.config.short_borrow_rate_annual
+                / market.config.borrow_day_count as f64;
+            equity = (equity - cost).max(0.0);
+            cost
+        } else {
+            0.0
+        };
         previous_weights = final_weights.clone();
         equity_peak = equity_peak.max(equity);
         let gross_exposure = previous_weights
@@ -653,7 +752,7 @@ pub fn run_daily_rank_accounting(
             )
             .collect();
         events.push(DailyRankAccountingEvent {
-            date: input.dates[row].clone(),
+            date: market.dates[row].clone(),
             session_label: session.label,
             rebalance: execute_rebalance,
             equity_after_trade: equity,
@@ -681,7 +780,13 @@ pub fn run_daily_rank_accounting(
     }
 
     let settlement_events = settlement_ledger.events().to_vec();
-    let result_tables = build_result_tables(&input, &events, &risk_gate_events, &settlement_events);
+    let result_tables = build_result_tables(
+        market,
+        &candidate,
+        &events,
+        &risk_gate_events,
+        &settlement_events,
+    );
     let result_validation = validate_result_tables(ResultTableView {
         result_schema_version: &result_tables.schema_version,
         equity_curve: &result_tables.equity_curve,
@@ -717,61 +822,108 @@ pub fn run_daily_rank_accounting_batch(
         .as_ref()
         .map(|value| !value.trim().is_empty())
         .unwrap_or(false);
-    let mut results = Vec::with_capacity(input.candidates.len());
-    let mut full_summaries: Vec<(String, DailyRankAccountingSummary)> = Vec::new();
+    let market = DailyRankMarket::new(
+        input.config,
+        input.dates,
+        input.symbols,
+        input.close,
+        input.open,
+        input.market_fields,
+    );
     let mut seen_ids = BTreeSet::new();
+    // Candidates share computed-field nodes; a frame the graph rejects falls
+    // back to per-candidate computation, which reports the same error.
+    let graph = ComputedFieldGraph::new(
+        &market.close,
+        &market.market_fields,
+        &market.dates,
+        market.dates.len(),
+        market.symbols.len(),
+    )
+    .ok();
 
+    // Identity checks stay serial so the first bad candidate_id is reported
+    // exactly as before; the validated prefix then runs across threads.
+    let mut prepared = Vec::with_capacity(input.candidates.len());
+    let mut rejected = None;
     for candidate in input.candidates {
-        parse_candidate_id(&candidate.candidate_id)
-            .map_err(DailyRankAccountingError::InvalidCandidateId)?;
+        if let Err(exc) = parse_candidate_id(&candidate.candidate_id) {
+            rejected = Some(DailyRankAccountingError::InvalidCandidateId(exc));
+            break;
+        }
         if !seen_ids.insert(candidate.candidate_id.clone()) {
-            return Err(DailyRankAccountingError::DuplicateCandidateId(
+            rejected = Some(DailyRankAccountingError::DuplicateCandidateId(
                 candidate.candidate_id,
             ));
+            break;
         }
-        let candidate_id = candidate.candidate_id;
-        let summary = run_daily_rank_accounting(DailyRankAccountingInput {
-            config: input.config.clone(),
-            dates: input.dates.clone(),
-            symbols: input.symbols.clone(),
-            close: input.close.clone(),
-            open: input.open.clone(),
-            execute_next_open: candidate.execute_next_open,
-            market_fields: input.market_fields.clone(),
-            rebalance: candidate.rebalance,
-            eligible: candidate.eligible,
-            score: candidate.score,
-            ascending: candidate.ascending,
-            top_n: candidate.top_n,
-            short_bottom_n: candidate.short_bottom_n,
-            long_gross_exposure: candidate.long_gross_exposure,
-            short_gross_exposure: candidate.short_gross_exposure,
-            position_limit: candidate.position_limit,
-            feature_specs: candidate.feature_specs,
-            eligible_rule: candidate.eligible_rule,
-            rank_by: candidate.rank_by,
-            target_change: candidate.target_change,
-        })?;
-        if export_artifacts {
-            full_summaries.push((candidate_id.clone(), summary.clone()));
+        prepared.push(candidate);
+    }
+    // With `retain_top`, full summaries go to a bounded top-K heap as
+    // candidates finish; only the survivors are exported or attached.
+    let retained = input.retain_top.map(RetainedCandidates::new);
+    let evaluated = map_candidates(
+        prepared.into_iter().enumerate().collect(),
+        |(index, candidate)| -> Result<_, DailyRankAccountingError> {
+            cancellation::candidate_checkpoint()?;
+            let candidate_id = candidate.candidate_id.clone();
+            let resolved_params = candidate.resolved_params.clone();
+            let summary = run_daily_rank_candidate(&market, candidate, graph.as_ref())?;
+            cancellation::candidate_completed();
+            let result = DailyRankCompactResult {
+                candidate_id,
+                resolved_params,
+                final_equity: summary.final_equity,
+                total_return: summary.total_return,
+                days: summary.days,
+                active_rebalances: summary.active_rebalances,
+                average_turnover: summary.average_turnover,
+                average_gross_exposure: summary.average_gross_exposure,
+                result_validation: summary.result_validation.clone(),
+                summary: None,
+            };
+            match retained.as_ref() {
+                Some(retained) => {
+                    retained.offer(
+                        index,
+                        &result.candidate_id,
+                        result.retention_score(),
+                        summary,
+                    );
+                    Ok((result, None))
+                }
+                None => Ok((result, Some(summary))),
+            }
+        },
+    );
+
+    let mut results = Vec::with_capacity(evaluated.len());
+    let mut full_summaries: Vec<(String, DailyRankAccountingSummary)> = Vec::new();
+    for outcome in evaluated {
+        let (mut result, summary) = outcome?;
+        if let Some(summary) = summary {
+            if export_artifacts {
+                full_summaries.push((result.candidate_id.clone(), summary));
+            } else if input.include_full_results {
+                result.summary = Some(summary);
+            }
         }
-        results.push(DailyRankCompactResult {
-            candidate_id,
-            resolved_params: candidate.resolved_params,
-            final_equity: summary.final_equity,
-            total_return: summary.total_return,
-            days: summary.days,
-            active_rebalances: summary.active_rebalances,
-            average_turnover: summary.average_turnover,
-            average_gross_exposure: summary.average_gross_exposure,
-            result_validation: summary.result_validation.clone(),
-            summary: if input.include_full_results && !export_artifacts {
-                Some(summary)
-            } else {
-                None
-            },
-        });
+        results.push(result);
+    }
+    if let Some(exc) = rejected {
+        return Err(exc);
     }
+    let retention = retained.map(|retained| {
+        let (retention, kept) = retained.finish();
+        for (index, summary) in kept {
+            if export_artifacts {
+                full_summaries.push((results[index].candidate_id.clone(), summary));
+            } else if input.include_full_results {
+                results[index].summary = Some(summary);
+            }
+        }
+        retention
+    });
     let artifact_bundle = if export_artifacts {
         Some(export_daily_rank_bundle(
             input.artifact_output_dir.as_deref().unwrap_or_default(),
@@ -788,6 +940,7 @@ pub fn run_daily_rank_accounting_batch(
         candidate_count: results.len(),
         results,
         artifact_bundle,
+        retention,
     })
 }
 
@@ -874,42 +1027,49 @@ fn slugify(value: &str) -> String {
 }
 
 fn materialize_rust_producer_fields(
-    input: &mut DailyRankAccountingInput,
+    market: &DailyRankMarket,
+    candidate: &mut DailyRankBatchCandidateInput,
+    graph: Option<&ComputedFieldGraph<'_>>,
 ) -> Result<(), DailyRankAccountingError> {
-    let rows = input.dates.len();
-    let cols = input.symbols.len();
+    let rows = market.dates.len();
+    let cols = market.symbols.len();
     if rows == 0 || cols == 0 {
         return Ok(());
     }
     let expected_len = rows * cols;
-    if input.rebalance.is_empty() && !input.target_change {
-        input.rebalance = vec![true; rows];
+    if candidate.rebalance.is_empty() && !candidate.target_change {
+        candidate.rebalance = vec![true; rows];
     }
-    if input.close.len() != expected_len {
+    if market.close.len() != expected_len {
         return Ok(());
     }
-    if input.eligible.len() == expected_len && input.score.len() == expected_len {
+    if candidate.eligible.len() == expected_len && candidate.score.len() == expected_len {
         return Ok(());
     }
 
-    let fields = compute_feature_fields_with_dates_and_market_fields(
-        &input.close,
-        &input.market_fields,
-        &input.dates,
-        rows,
-        cols,
-        &input.feature_specs,
-    )?;
+    let fields = match graph {
+        Some(graph) => graph
+            .fields_for(&candidate.feature_specs)
+            .map_err(map_computed_field_error)?,
+        None => compute_feature_fields_with_dates_and_market_fields(
+            &market.close,
+            &market.market_fields,
+            &market.dates,
+            rows,
+            cols,
+            &candidate.feature_specs,
+        )?,
+    };
 
-    if input.eligible.len() != expected_len {
-        input.eligible = if let Some(rule) = &input.eligible_rule {
+    if candidate.eligible.len() != expected_len {
+        candidate.eligible = if let Some(rule) = &candidate.eligible_rule {
             evaluate_condition(rule, &fields, rows, cols)?
         } else {
             vec![true; expected_len]
         };
     }
-    if input.score.len() != expected_len {
-        let rank_by = input
+    if candidate.score.len() != expected_len {
+        let rank_by = candidate
             .rank_by
             .as_deref()
             .ok_or_else(|| {
@@ -919,23 +1079,23 @@ fn materialize_rust_producer_fields(
             })?
             .trim()
             .to_lowercase();
-        input.score = fields
+        candidate.score = fields
             .get(&rank_by)
             .ok_or_else(|| DailyRankAccountingError::UnknownField(rank_by.clone()))?
-            .clone();
+            .to_vec();
     }
-    if input.target_change {
-        input.rebalance = target_change_flags(RankSelectionInput {
+    if candidate.target_change {
+        candidate.rebalance = target_change_flags(RankSelectionInput {
             rows,
             cols,
-            eligible: input.eligible.clone(),
-            score: input.score.clone(),
-            ascending: input.ascending,
-            top_n: input.top_n,
-            short_bottom_n: input.short_bottom_n,
-            long_gross_exposure: input.long_gross_exposure,
-            short_gross_exposure: input.short_gross_exposure,
-            position_limit: input.position_limit,
+            eligible: candidate.eligible.clone(),
+            score: candidate.score.clone(),
+            ascending: candidate.ascending,
+            top_n: candidate.top_n,
+            short_bottom_n: candidate.short_bottom_n,
+            long_gross_exposure: candidate.long_gross_exposure,
+            short_gross_exposure: candidate.short_gross_exposure,
+            position_limit: candidate.position_limit,
         })?;
     }
     Ok(())
@@ -968,17 +1128,18 @@ pub(crate) fn compute_feature_fields(
     rows: usize,
     cols: usize,
     feature_specs: &[DailyRankFeatureSpec],
-) -> Result<BTreeMap<String, Vec<f64>>, DailyRankAccountingError> {
+) -> Result<FieldMap, DailyRankAccountingError> {
     compute_feature_fields_with_market_fields(close, &BTreeMap::new(), rows, cols, feature_specs)
 }
 
+#[cfg(test)]
 pub(crate) fn compute_feature_fields_with_market_fields(
     close: &[f64],
     market_fields: &BTreeMap<String, Vec<f64>>,
     rows: usize,
     cols: usize,
     feature_specs: &[DailyRankFeatureSpec],
-) -> Result<BTreeMap<String, Vec<f64>>, DailyRankAccountingError> {
+) -> Result<FieldMap, DailyRankAccountingError> {
     compute_feature_fields_with_dates_and_market_fields(
         close,
         market_fields,
@@ -996,14 +1157,14 @@ pub(crate) fn compute_feature_fields_with_dates_and_market_fields(
     rows: usize,
     cols: usize,
     feature_specs: &[DailyRankFeatureSpec],
-) -> Result<BTreeMap<String, Vec<f64>>, DailyRankAccountingError> {
+) -> Result<FieldMap, DailyRankAccountingError> {
     compute_fields(close, market_fields, dates, rows, cols, feature_specs)
         .map_err(map_computed_field_error)
 }
 
-pub(crate) fn evaluate_condition(
+pub(crate) fn evaluate_condition<V: AsRef<[f64]>>(
     rule: &DailyRankConditionInput,
-    fields: &BTreeMap<String, Vec<f64>>,
+    fields: &BTreeMap<String, V>,
     rows: usize,
     cols: usize,
 ) -> Result<Vec<bool>, DailyRankAccountingError> {
@@ -1047,7 +1208,8 @@ pub(crate) fn evaluate_condition(
         .to_lowercase();
     let left = fields
         .get(&left_name)
-        .ok_or_else(|| DailyRankAccountingError::UnknownField(left_name.clone()))?;
+        .ok_or_else(|| DailyRankAccountingError::UnknownField(left_name.clone()))?
+        .as_ref();
     let right_field = rule
         .right_field
         .as_deref()
@@ -1056,7 +1218,8 @@ pub(crate) fn evaluate_condition(
         Some(
             fields
                 .get(&name)
-                .ok_or_else(|| DailyRankAccountingError::UnknownField(name.clone()))?,
+                .ok_or_else(|| DailyRankAccountingError::UnknownField(name.clone()))?
+                .as_ref(),
         )
     } else {
         None
@@ -1129,17 +1292,18 @@ pub(crate) fn evaluate_condition(
 }
 
 fn build_result_tables(
-    input: &DailyRankAccountingInput,
+    market: &DailyRankMarket,
+    candidate: &DailyRankBatchCandidateInput,
     events: &[DailyRankAccountingEvent],
     risk_gate_events: &[AccountingRiskGateEvent],
     settlement_events: &[SettlementEvent],
 ) -> DailyRankResultTables {
     DailyRankResultTables {
         schema_version: "rust_daily_rank_result_tables.v1".to_string(),
-        equity_curve: build_equity_rows(input, events),
-        holdings: build_holding_rows(input, events),
-        rebalance_audit: build_rebalance_rows(input, events),
-        rebalance_trades: build_trade_rows(input, events),
+        equity_curve: build_equity_rows(market, events),
+        holdings: build_holding_rows(market, candidate, events),
+        rebalance_audit: build_rebalance_rows(market, events),
+        rebalance_trades: build_trade_rows(market, candidate, events),
         risk_gate_events: build_risk_gate_rows(risk_gate_events),
         settlements: build_settlement_rows(settlement_events),
     }
@@ -1170,7 +1334,7 @@ fn build_settlement_rows(events: &[SettlementEvent]) -> Vec<BTreeMap<String, Val
 }
 
 fn build_equity_rows(
-    input: &DailyRankAccountingInput,
+    market: &DailyRankMarket,
     events: &[DailyRankAccountingEvent],
 ) -> Vec<BTreeMap<String, Value>> {
     events
@@ -1200,7 +1364,7 @@ fn build_equity_rows(
                 "Cash_weight".to_string(),
                 json_f64(event.cash_weight.max(0.0)),
             );
-            for (idx, symbol) in input.symbols.iter().enumerate() {
+            for (idx, symbol) in market.symbols.iter().enumerate() {
                 row.insert(
                     format!("Weight_{symbol}"),
                     json_f64(*event.target_weights.get(idx).unwrap_or(&0.0)),
@@ -1216,17 +1380,18 @@ fn build_equity_rows(
 }
 
 fn build_holding_rows(
-    input: &DailyRankAccountingInput,
+    market: &DailyRankMarket,
+    candidate: &DailyRankBatchCandidateInput,
     events: &[DailyRankAccountingEvent],
 ) -> Vec<BTreeMap<String, Value>> {
-    let cols = input.symbols.len();
+    let cols = market.symbols.len();
     let mut rows = Vec::new();
     for event in events {
         for (rank, asset_idx) in event.ranked_indices.iter().enumerate() {
             if *asset_idx >= cols {
                 continue;
             }
-            let symbol = &input.symbols[*asset_idx];
+            let symbol = &market.symbols[*asset_idx];
             let flat_idx = event.decision_row * cols + *asset_idx;
             let selected = event.selected_indices.contains(asset_idx);
             let mut row = BTreeMap::new();
@@ -1236,11 +1401,11 @@ fn build_holding_rows(
             row.insert("Selected".to_string(), json!(selected));
             row.insert(
                 "Eligible".to_string(),
-                json!(*input.eligible.get(flat_idx).unwrap_or(&false)),
+                json!(*candidate.eligible.get(flat_idx).unwrap_or(&false)),
             );
             row.insert(
                 "Score".to_string(),
-                json_f64(*input.score.get(flat_idx).unwrap_or(&f64::NAN)),
+                json_f64(*candidate.score.get(flat_idx).unwrap_or(&f64::NAN)),
             );
             row.insert(
                 "Target_weight".to_string(),
@@ -1253,7 +1418,7 @@ fn build_holding_rows(
 }
 
 fn build_rebalance_rows(
-    input: &DailyRankAccountingInput,
+    market: &DailyRankMarket,
     events: &[DailyRankAccountingEvent],
 ) -> Vec<BTreeMap<String, Value>> {
     events
@@ -1263,12 +1428,12 @@ fn build_rebalance_rows(
             let selected_assets = event
                 .selected_indices
                 .iter()
-                .filter_map(|idx| input.symbols.get(*idx).cloned())
+                .filter_map(|idx| market.symbols.get(*idx).cloned())
                 .collect::<Vec<_>>();
             let ranked_assets = event
                 .ranked_indices
                 .iter()
-                .filter_map(|idx| input.symbols.get(*idx).cloned())
+                .filter_map(|idx| market.symbols.get(*idx).cloned())
                 .collect::<Vec<_>>();
             let mut row = BTreeMap::new();
             row.insert("Time".to_string(), json!(event.date));
@@ -1280,7 +1445,7 @@ fn build_rebalance_rows(
             );
             row.insert("Ranked_candidates".to_string(), json!(ranked_assets));
             row.insert("Turnover".to_string(), json_f64(event.turnover));
-            row.insert("Cost_rate".to_string(), json_f64(input.config.cost_rate));
+            row.insert("Cost_rate".to_string(), json_f64(market.config.cost_rate));
             row.insert("Trade_cost".to_string(), json_f64(event.trade_cost));
             row.insert("Borrow_cost".to_string(), json_f64(event.borrow_cost));
             row.insert(
@@ -1293,10 +1458,11 @@ fn build_rebalance_rows(
 }
 
 fn build_trade_rows(
-    input: &DailyRankAccountingInput,
+    market: &DailyRankMarket,
+    candidate: &DailyRankBatchCandidateInput,
     events: &[DailyRankAccountingEvent],
 ) -> Vec<BTreeMap<String, Value>> {
-    let cols = input.symbols.len();
+    let cols = market.symbols.len();
     let mut rows = Vec::new();
     for event in events {
         let ranked_lookup = event
@@ -1333,7 +1499,7 @@ fn build_trade_rows(
             };
             let flat_idx = event.decision_row * cols + asset_idx;
             let rank = ranked_lookup.get(&asset_idx).copied();
-            let eligible = *input.eligible.get(flat_idx).unwrap_or(&false);
+            let eligible = *candidate.eligible.get(flat_idx).unwrap_or(&false);
             let selected = event.selected_indices.contains(&asset_idx);
             let mut reason_parts = Vec::new();
             if let Some(rank) = rank {
@@ -1348,7 +1514,7 @@ fn build_trade_rows(
             }
             let mut row = BTreeMap::new();
             row.insert("Time".to_string(), json!(event.date));
-            row.insert("Asset".to_string(), json!(input.symbols[asset_idx]));
+            row.insert("Asset".to_string(), json!(market.symbols[asset_idx]));
             row.insert("Before_weight".to_string(), json_f64(before));
             row.insert("Target_weight".to_string(), json_f64(target));
             row.insert("Trade_delta".to_string(), json_f64(delta));
@@ -1363,7 +1529,7 @@ fn build_trade_rows(
             );
             row.insert(
                 "Score".to_string(),
-                json_f64(*input.score.get(flat_idx).unwrap_or(&f64::NAN)),
+                json_f64(*candidate.score.get(flat_idx).unwrap_or(&f64::NAN)),
             );
             row.insert(
                 "Reason".to_string(),
@@ -1430,35 +1596,38 @@ fn map_weights_to_vector(symbols: &[String], weights: &BTreeMap<String, f64>) ->
         .collect()
 }
 
-fn validate_input(input: &DailyRankAccountingInput) -> Result<(), DailyRankAccountingError> {
-    let rows = input.dates.len();
-    let cols = input.symbols.len();
+fn validate_input(
+    market: &DailyRankMarket,
+    candidate: &DailyRankBatchCandidateInput,
+) -> Result<(), DailyRankAccountingError> {
+    let rows = market.dates.len();
+    let cols = market.symbols.len();
     if rows == 0 || cols == 0 {
         return Err(DailyRankAccountingError::InvalidShape);
     }
     let expected_len = rows * cols;
-    if input.close.len() != expected_len
-        || input.eligible.len() != expected_len
-        || input.score.len() != expected_len
-        || input.rebalance.len() != rows
+    if market.close.len() != expected_len
+        || candidate.eligible.len() != expected_len
+        || candidate.score.len() != expected_len
+        || candidate.rebalance.len() != rows
     {
         return Err(DailyRankAccountingError::InvalidArrayLength);
     }
-    if input.execute_next_open && input.open.len() != expected_len {
+    if candidate.execute_next_open && market.open.len() != expected_len {
         return Err(DailyRankAccountingError::InvalidArrayLength);
     }
     for row in 0..rows {
         for col in 0..cols {
-            if !input.close[row * cols + col].is_finite() {
+            if !market.close[row * cols + col].is_finite() {
                 return Err(DailyRankAccountingError::NonFiniteClose { row, col });
             }
-            if input.close[row * cols + col] <= 0.0 {
+            if market.close[row * cols + col] <= 0.0 {
                 return Err(DailyRankAccountingError::NonPositivePrice { row, col });
             }
-            if input.execute_next_open && !input.open[row * cols + col].is_finite() {
+            if candidate.execute_next_open && !market.open[row * cols + col].is_finite() {
                 return Err(DailyRankAccountingError::NonFiniteClose { row, col });
             }
-            if input.execute_next_open && input.open[row * cols + col] <= 0.0 {
+            if candidate.execute_next_open && market.open[row * cols + col] <= 0.0 {
                 return Err(DailyRankAccountingError::NonPositivePrice { row, col });
             }
         }
@@ -1593,6 +1762,114 @@ mod tests {
         assert!(!summary.result_tables.rebalance_trades.is_empty());
     }
 
+    #[test]
+    fn batch_candidates_share_market_inputs_and_match_single_runs() {
+        let candidate = |candidate_id: &str, top_n: usize| DailyRankBatchCandidateInput {
+            candidate_id: candidate_id.to_string(),
+            resolved_params: BTreeMap::from([("top_n".to_string(), top_n.to_string())]),
+            eligible: vec![true; 6],
+            score: vec![100.0, 90.0, 80.0, 110.0, 95.0, 70.0],
+            rebalance: Vec::new(),
+            ascending: false,
+            top_n,
+            short_bottom_n: 0,
+            long_gross_exposure: 1.0,
+            short_gross_exposure: 0.0,
+            position_limit: 1.0,
+            feature_specs: Vec::new(),
+            eligible_rule: None,
+            rank_by: None,
+            target_change: false,
+            execute_next_open: false,
+        };
+        let dates = vec!["2024-01-01".to_string(), "2024-01-02".to_string()];
+        let symbols = vec!["AAA".to_string(), "BBB".to_string(), "CCC".to_string()];
+        let close = vec![100.0, 90.0, 80.0, 110.0, 95.0, 70.0];
+        let batch = run_daily_rank_accounting_batch(DailyRankBatchInput {
+            config: AccountingConfig::default(),
+            dates: dates.clone(),
+            symbols: symbols.clone(),
+            close: close.clone(),
+            open: Vec::new(),
+            market_fields: BTreeMap::new(),
+            include_full_results: false,
+            artifact_output_dir: None,
+            artifact_run_id: None,
+            retain_top: None,
+            candidates: vec![
+                candidate("rank_probe:parameter_matrix:top_1", 1),
+                candidate("rank_probe:parameter_matrix:top_2", 2),
+            ],
+        })
+        .expect("daily rank batch should run");
+
+        for (result, top_n) in batch.results.iter().zip([1, 2]) {
+            let single = candidate("", top_n);
+            let summary = run_daily_rank_accounting(DailyRankAccountingInput {
+                config: AccountingConfig::default(),
+                dates: dates.clone(),
+                symbols: symbols.clone(),
+                close: close.clone(),
+                open: Vec::new(),
+                execute_next_open: false,
+                market_fields: BTreeMap::new(),
+                target_change: false,
+                rebalance: Vec::new(),
+                eligible: single.eligible,
+                score: single.score,
+                ascending: false,
+                top_n,
+                short_bottom_n: 0,
+                long_gross_exposure: 1.0,
+                short_gross_exposure: 0.0,
+                position_limit: 1.0,
+                feature_specs: Vec::new(),
+                eligible_rule: None,
+                rank_by: None,
+            })
+            .expect("daily rank should run");
+            assert_eq!(result.final_equity, summary.final_equity);
+            assert_eq!(result.resolved_params["top_n"], top_n.to_string());
+        }
+        assert_ne!(batch.results[0].final_equity, batch.results[1].final_equity);
+
+        let retained = run_daily_rank_accounting_batch(DailyRankBatchInput {
+            config: AccountingConfig::default(),
+            dates,
+            symbols,
+            close,
+            open: Vec::new(),
+            market_fields: BTreeMap::new(),
+            include_full_results: true,
+            artifact_output_dir: None,
+            artifact_run_id: None,
+            retain_top: Some(1),
+            candidates: vec![
+                candidate("rank_probe:parameter_matrix:top_1", 1),
+                candidate("rank_probe:parameter_matrix:top_2", 2),
+            ],
+        })
+        .expect("retained daily rank batch should run");
+        let best = if batch.results[0].final_equity > batch.results[1].final_equity {
+            0
+        } else {
+            1
+        };
+        assert_eq!(
+            retained
+                .retention
+                .expect("retention report")
+                .retained_candidate_ids,
+            vec![batch.results[best].candidate_id.clone()]
+        );
+        assert!(retained.results[best].summary.is_some());
+        assert!(retained.results[1 - best].summary.is_none());
+        assert_eq!(
+            retained.results[1 - best].final_equity,
+            batch.results[1 - best].final_equity
+        );
+    }
+
     #[test]
     fn daily_rank_keeps_positions_between_scheduled_rebalances() {
         let summary = run_daily_rank_accounting(DailyRankAccountingInput {
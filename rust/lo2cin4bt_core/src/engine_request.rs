@@ -1069,9 +1069,78 @@ pub struct MarketDataBundleV2 {
     pub quality: MarketDataQualityV2,
     pub tables: BTreeMap<String, MarketDataTableV2>,
     pub lineage: MarketDataLineageV2,
+    /// Set only on in-process window views derived by [`Self::row_window_view`].
+    #[serde(skip)]
+    row_view: Option<MarketDataRowView>,
+}
+
+/// Half-open `[start_row, end_row)` row range of a parent MarketDataBundle.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(deny_unknown_fields)]
+pub struct MarketDataRowWindowV1 {
+    pub start_row: usize,
+    pub end_row: usize,
+}
+
+impl MarketDataRowWindowV1 {
+    pub fn len(&self) -> usize {
+        self.end_row.saturating_sub(self.start_row)
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+}
+
+/// Where a window view sits inside the parent bundle's physical tables.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct MarketDataRowView {
+    pub parent_row_count: usize,
+    pub window: MarketDataRowWindowV1,
 }
 
 impl MarketDataBundleV2 {
+    /// The parent row range when this manifest is a window view.
+    pub fn row_view(&self) -> Option<MarketDataRowView> {
+        self.row_view
+    }
+
+    /// Narrow a verified parent manifest to `window` without copying tables.
+    ///
+    /// The view keeps the parent `content_hash`, so table reads resolve through
+    /// the parent's resident frames and are sliced to the window. Row counts,
+    /// session windows and the time range describe the window; the caller
+    /// derives `session_windows` and `time_range` from the sliced timeline.
+    pub fn row_window_view(
+        &self,
+        window: MarketDataRowWindowV1,
+        session_windows: Vec<MarketDataSessionWindowV2>,
+        time_range: RequestWindowV1,
+    ) -> Result<Self, ConfigError> {
+        ensure(
+            self.row_view.is_none(),
+            "market_data_window cannot narrow an existing window view",
+        )?;
+        ensure(
+            !window.is_empty() && window.end_row <= self.row_count,
+            "market_data_window must be a non-empty range inside the bundle rows",
+        )?;
+        let mut view = self.clone();
+        for table in view.tables.values_mut() {
+            if table.row_count == self.row_count {
+                table.row_count = window.len();
+            }
+        }
+        view.row_count = window.len();
+        view.session_windows = session_windows;
+        view.time_range = time_range;
+        view.row_view = Some(MarketDataRowView {
+            parent_row_count: self.row_count,
+            window,
+        });
+        Ok(view)
+    }
+
     pub fn validate(&self) -> Result<(), ConfigError> {
         ensure(
             self.schema_version == MARKET_DATA_BUNDLE_SCHEMA_VERSION,
@@ -1197,6 +1266,10 @@ impl MarketDataBundleV2 {
                 .all(|warning| !warning.trim().is_empty()),
             "quality warnings must not contain empty values",
         )?;
+        if self.row_view.is_some() {
+            // The parent manifest was hash-verified before the view narrowed it.
+            return Ok(());
+        }
         let computed_hash = self.computed_content_hash()?;
         ensure(
             self.content_hash == computed_hash,
@@ -1,6 +1,10 @@
 use crate::bar_aggregation::parse_utc_nanos;
+use crate::bundle_cache::cached_bundle_table;
+use crate::cancellation::{self, CancellationReason};
+use crate::candidate_parallel::map_candidates;
 use crate::computed_fields::returns::simple_return;
-use crate::daily_rank::{compute_feature_fields_with_market_fields, evaluate_condition};
+use crate::computed_fields::{ComputedFieldError, ComputedFieldGraph};
+use crate::daily_rank::{evaluate_condition, map_computed_field_error};
 use crate::{
     aggregate_time_bars, run_accounting, run_calendar_overlay_batch,
     run_daily_rank_accounting_batch, run_single_asset_calendar_same_session_batch,
@@ -13,9 +17,9 @@ use crate::{
     ContractBarAlignmentV1, ContractBarSpecV1, ContractBarUnitV1, DailyRankBatchCandidateInput,
     DailyRankBatchInput, DailyRankConditionInput, DailyRankFeatureSpec, DecisionPlanV1, DerivedBar,
     EmptyBarPolicyV1, EngineRequestV2, ExecutionBarIndex, FinalPartialBarPolicyV1,
-    MarketDataBundleV2, MarketDataIndexKind, OperationId,
-    PartialBarPolicy as RuntimePartialBarPolicy, PartialBarPolicyV1, ResetTimerBatchInput,
-    ResetTimerCandidateInput, SessionWindow, SingleAssetSignalBatchInput,
+    MarketDataBundleV2, MarketDataIndexKind, MarketDataRowWindowV1, OperationId,
+    PartialBarPolicy as RuntimePartialBarPolicy, PartialBarPolicyV1, RequestWindowV1,
+    ResetTimerBatchInput, ResetTimerCandidateInput, SessionWindow, SingleAssetSignalBatchInput,
     SingleAssetSignalCandidateInput, SourceBar, TimelineAccountingConfig, TimelinePositionPolicy,
 };
 use polars::io::parquet::read::ParquetReader;
@@ -37,6 +41,9 @@ pub struct EngineRequestExecutionInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Run against `[start_row, end_row)` of `market_data_bundle` as a view.
+    #[serde(default)]
+    pub market_data_window: Option<MarketDataRowWindowV1>,
 }
 
 #[derive(Debug, Clone, Deserialize, Serialize)]
@@ -48,6 +55,13 @@ pub struct EngineRequestBatchExecutionInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Run against `[start_row, end_row)` of `market_data_bundle` as a view.
+    #[serde(default)]
+    pub market_data_window: Option<MarketDataRowWindowV1>,
+    /// Grouped batches keep full results only for the best `retain_top`
+    /// candidates; every candidate still gets its compact row.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
 }
 
 #[derive(Debug, Clone)]
@@ -212,6 +226,8 @@ pub enum EngineRuntimeError {
     MarketData(String),
     #[error("accounting failed: {0}")]
     Accounting(String),
+    #[error(transparent)]
+    Cancelled(#[from] CancellationReason),
 }
 
 impl PreparedRuntimeStreams {
@@ -1052,8 +1068,11 @@ fn prepare_runtime_streams_from_frames(
 }
 
 pub fn execute_engine_request(
-    input: EngineRequestExecutionInput,
+    mut input: EngineRequestExecutionInput,
 ) -> Result<Value, EngineRuntimeError> {
+    if let Some(window) = input.market_data_window.take() {
+        input.market_data_bundle = market_data_window_view(&input.market_data_bundle, window)?;
+    }
     input
         .engine_request
         .validate()
@@ -1101,8 +1120,11 @@ pub fn execute_engine_request(
 }
 
 pub fn execute_engine_request_batch(
-    input: EngineRequestBatchExecutionInput,
+    mut input: EngineRequestBatchExecutionInput,
 ) -> Result<Value, EngineRuntimeError> {
+    if let Some(window) = input.market_data_window.take() {
+        input.market_data_bundle = market_data_window_view(&input.market_data_bundle, window)?;
+    }
     if input.engine_requests.is_empty() {
         return Err(EngineRuntimeError::InvalidRequest(
             "engine_requests must not be empty".to_string(),
@@ -1157,12 +1179,14 @@ pub fn execute_engine_request_batch(
         .unwrap_or("engine_request_batch");
     let mut results = Vec::with_capacity(input.engine_requests.len());
     for (index, engine_request) in input.engine_requests.into_iter().enumerate() {
+        cancellation::candidate_checkpoint()?;
         let request_id = engine_request.request_id.clone();
         let strategy_id = engine_request.strategy.strategy_id.clone();
         let result = execute_engine_request(EngineRequestExecutionInput {
             engine_request,
             market_data_bundle: input.market_data_bundle.clone(),
             artifact_output_dir: input.artifact_output_dir.clone(),
+            market_data_window: None,
             artifact_run_id: input
                 .artifact_output_dir
                 .as_ref()
@@ -1264,22 +1288,32 @@ fn execute_signal_request_batch(
             decision_bars.iter().map(|bar| bar.volume).collect(),
         ),
     ]);
-    let mut decision_candidates = Vec::with_capacity(input.engine_requests.len());
-    let mut execution_candidates = Vec::with_capacity(input.engine_requests.len());
-    for request in &input.engine_requests {
-        let mut decision_candidate = single_signal_candidate(
-            request,
-            &decision_close,
-            &decision_market_fields,
-            request.strategy.strategy_id.clone(),
-        )?;
+    let graph = ComputedFieldGraph::new(
+        &decision_close,
+        &decision_market_fields,
+        &[],
+        decision_close.len(),
+        1,
+    )
+    .map_err(computed_field_profile_error)?;
+    let evaluated = map_candidates(input.engine_requests.iter().collect(), |request| {
+        cancellation::candidate_checkpoint()?;
+        let mut decision_candidate =
+            single_signal_candidate(request, &graph, request.strategy.strategy_id.clone())?;
         mask_signal_candidate_to_workflow_window(request, decision_bars, &mut decision_candidate)?;
-        execution_candidates.push(remap_signal_candidate_to_execution(
+        let execution_candidate = remap_signal_candidate_to_execution(
             decision_candidate.clone(),
             decision_bars,
             execution_bars.len(),
-        )?);
+        )?;
+        Ok::<_, EngineRuntimeError>((decision_candidate, execution_candidate))
+    });
+    let mut decision_candidates = Vec::with_capacity(evaluated.len());
+    let mut execution_candidates = Vec::with_capacity(evaluated.len());
+    for candidates in evaluated {
+        let (decision_candidate, execution_candidate) = candidates?;
         decision_candidates.push(decision_candidate);
+        execution_candidates.push(execution_candidate);
     }
     let mut config = identical_timeline_config(&input.engine_requests)?;
     config.session_label_by_event_time = execution_bars
@@ -1298,6 +1332,7 @@ fn execute_signal_request_batch(
         include_full_results: true,
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: input.retain_top,
         candidates: execution_candidates,
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -1430,6 +1465,7 @@ fn execute_calendar_same_session_request_batch(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: input.retain_top,
         candidates,
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -1497,6 +1533,7 @@ fn execute_calendar_overlay_request_batch(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: input.retain_top,
         candidates,
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -1597,6 +1634,7 @@ fn execute_reset_timer_request_batch(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: input.retain_top,
         candidates,
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -1614,7 +1652,9 @@ fn execute_reset_timer(input: EngineRequestExecutionInput) -> Result<Value, Engi
         engine_requests: vec![input.engine_request],
         market_data_bundle: input.market_data_bundle,
         artifact_output_dir: input.artifact_output_dir,
+        market_data_window: None,
         artifact_run_id: input.artifact_run_id,
+        retain_top: None,
     })?;
     grouped
         .get("result")
@@ -1964,6 +2004,7 @@ fn execute_daily_rank_request_batch(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: input.retain_top,
         candidates,
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -2023,12 +2064,16 @@ fn execute_single_asset_signal(
             decision_bars.iter().map(|bar| bar.volume).collect(),
         ),
     ]);
-    let mut decision_candidate = single_signal_candidate(
-        request,
+    let graph = ComputedFieldGraph::new(
         &decision_close,
         &decision_market_fields,
-        request.strategy.strategy_id.clone(),
-    )?;
+        &[],
+        decision_close.len(),
+        1,
+    )
+    .map_err(computed_field_profile_error)?;
+    let mut decision_candidate =
+        single_signal_candidate(request, &graph, request.strategy.strategy_id.clone())?;
     mask_signal_candidate_to_workflow_window(request, decision_bars, &mut decision_candidate)?;
     let candidate = remap_signal_candidate_to_execution(
         decision_candidate.clone(),
@@ -2052,6 +2097,7 @@ fn execute_single_asset_signal(
         include_full_results: true,
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: None,
         candidates: vec![candidate],
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -2141,6 +2187,7 @@ fn execute_calendar_same_session(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: None,
         candidates: vec![candidate],
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -2180,6 +2227,7 @@ fn execute_calendar_overlay(
         include_full_results: input.artifact_output_dir.is_none(),
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: None,
         candidates: vec![candidate],
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -2204,19 +2252,7 @@ fn execute_fixed_allocation(
         .ok_or_else(|| {
             EngineRuntimeError::InvalidAllocation("rebalance.trigger.op is required".to_string())
         })?;
-    let close_table = bundle
-        .tables
-        .get("close")
-        .ok_or_else(|| EngineRuntimeError::InvalidBundle("close table is missing".to_string()))?;
-    let close_path = close_table.path.as_deref().ok_or_else(|| {
-        EngineRuntimeError::InvalidBundle("close table requires parquet path".to_string())
-    })?;
-    let frame = read_parquet(close_path)?;
-    if frame.height() != close_table.row_count || frame.height() != bundle.row_count {
-        return Err(EngineRuntimeError::MarketData(
-            "close parquet row_count does not match bundle manifest".to_string(),
-        ));
-    }
+    let frame = read_bundle_table(bundle, "close")?;
     let dates = bundle_time_strings(bundle, &frame)?;
     let prices = close_prices(&frame, &bundle.symbols)?;
     let rebalance = rebalance_flags(&dates, trigger)?;
@@ -2292,14 +2328,7 @@ fn execute_daily_rank(input: EngineRequestExecutionInput) -> Result<Value, Engin
     let request = &input.engine_request;
     let bundle = &input.market_data_bundle;
     validate_daily_rank_trigger(request)?;
-    let close_table = bundle
-        .tables
-        .get("close")
-        .ok_or_else(|| EngineRuntimeError::InvalidBundle("close table is missing".to_string()))?;
-    let close_path = close_table.path.as_deref().ok_or_else(|| {
-        EngineRuntimeError::InvalidBundle("close table requires parquet path".to_string())
-    })?;
-    let frame = read_parquet(close_path)?;
+    let frame = read_cached_bundle_parquet(bundle, "close")?;
     let (dates, open) = if daily_rank_executes_next_open(request) {
         let open_frame = read_bundle_table(bundle, "open")?;
         let dates = aligned_dates(bundle, &frame, &open_frame)?;
@@ -2333,6 +2362,7 @@ fn execute_daily_rank(input: EngineRequestExecutionInput) -> Result<Value, Engin
         include_full_results: true,
         artifact_output_dir: input.artifact_output_dir,
         artifact_run_id: input.artifact_run_id,
+        retain_top: None,
         candidates: vec![candidate],
     })
     .map_err(|error| EngineRuntimeError::Accounting(error.to_string()))?;
@@ -2506,17 +2536,21 @@ fn daily_rank_candidate(
     })
 }
 
+fn computed_field_profile_error(error: ComputedFieldError) -> EngineRuntimeError {
+    EngineRuntimeError::UnsupportedProfile(map_computed_field_error(error).to_string())
+}
+
 fn single_signal_candidate(
     request: &EngineRequestV2,
-    close: &[f64],
-    market_fields: &BTreeMap<String, Vec<f64>>,
+    graph: &ComputedFieldGraph<'_>,
     candidate_id: String,
 ) -> Result<SingleAssetSignalCandidateInput, EngineRuntimeError> {
     validate_next_open_signal_actions(request)?;
     let specs = feature_specs(request)?;
-    let fields =
-        compute_feature_fields_with_market_fields(close, market_fields, close.len(), 1, &specs)
-            .map_err(|error| EngineRuntimeError::UnsupportedProfile(error.to_string()))?;
+    let fields = graph
+        .fields_for(&specs)
+        .map_err(computed_field_profile_error)?;
+    let rows = fields["close"].len();
     let signals = &request.strategy.decision_plan.signals;
     let entry_rule = condition_from_value(signals.get("entry").ok_or_else(|| {
         EngineRuntimeError::UnsupportedProfile("entry signal is required".to_string())
@@ -2524,9 +2558,9 @@ fn single_signal_candidate(
     let exit_rule = condition_from_value(signals.get("exit").ok_or_else(|| {
         EngineRuntimeError::UnsupportedProfile("exit signal is required".to_string())
     })?);
-    let entry_signal = evaluate_condition(&entry_rule, &fields, close.len(), 1)
+    let entry_signal = evaluate_condition(&entry_rule, &fields, rows, 1)
         .map_err(|error| EngineRuntimeError::UnsupportedProfile(error.to_string()))?;
-    let exit_signal = evaluate_condition(&exit_rule, &fields, close.len(), 1)
+    let exit_signal = evaluate_condition(&exit_rule, &fields, rows, 1)
         .map_err(|error| EngineRuntimeError::UnsupportedProfile(error.to_string()))?;
     let target_weight = signals
         .get("target_weight")
@@ -3314,10 +3348,7 @@ fn read_bundle_table(
         .tables
         .get(role)
         .ok_or_else(|| EngineRuntimeError::InvalidBundle(format!("{role} table is missing")))?;
-    let path = table.path.as_deref().ok_or_else(|| {
-        EngineRuntimeError::InvalidBundle(format!("{role} table requires parquet path"))
-    })?;
-    let frame = read_parquet(path)?;
+    let frame = read_cached_bundle_parquet(bundle, role)?;
     if frame.height() != table.row_count || frame.height() != bundle.row_count {
         return Err(EngineRuntimeError::MarketData(format!(
             "{role} parquet row_count does not match bundle manifest"
@@ -3898,6 +3929,84 @@ fn timeline_accounting_config(
     })
 }
 
+/// Decode a bundle table once per `content_hash`; later requests reuse the frame.
+fn read_cached_bundle_parquet(
+    bundle: &MarketDataBundleV2,
+    role: &str,
+) -> Result<DataFrame, EngineRuntimeError> {
+    let path = bundle
+        .tables
+        .get(role)
+        .ok_or_else(|| EngineRuntimeError::InvalidBundle(format!("{role} table is missing")))?
+        .path
+        .as_deref()
+        .ok_or_else(|| {
+            EngineRuntimeError::InvalidBundle(format!("{role} table requires parquet path"))
+        })?;
+    let frame = cached_bundle_table(&bundle.content_hash, role, || read_parquet(path))?;
+    match bundle.row_view() {
+        // Window views share the parent's resident frame; slicing is zero-copy.
+        Some(view) if frame.height() == view.parent_row_count => {
+            Ok(frame.slice(view.window.start_row as i64, view.window.len()))
+        }
+        _ => Ok(frame),
+    }
+}
+
+/// Narrow a parent bundle to a row window made of whole execution sessions.
+///
+/// WFA windows reference the parent bundle instead of writing a sliced copy, so
+/// each window reuses the parent's resident tables and costs no parquet I/O.
+fn market_data_window_view(
+    bundle: &MarketDataBundleV2,
+    window: MarketDataRowWindowV1,
+) -> Result<MarketDataBundleV2, EngineRuntimeError> {
+    bundle
+        .validate()
+        .map_err(|error| EngineRuntimeError::InvalidBundle(error.to_string()))?;
+    if window.is_empty() || window.end_row > bundle.row_count {
+        return Err(EngineRuntimeError::InvalidRequest(
+            "market_data_window must be a non-empty range inside the bundle rows".to_string(),
+        ));
+    }
+    let execution = &bundle.execution_stream;
+    // Include one neighbouring row on each side to check session boundaries.
+    let first = window.start_row.saturating_sub(1);
+    let last = (window.end_row + 1).min(bundle.row_count);
+    let timeline =
+        read_bundle_table(bundle, &execution.timeline_table)?.slice(first as i64, last - first);
+    let labels = table_string_column(
+        &timeline,
+        &execution.timestamp_semantics.session_label_column,
+    )?;
+    let row_keys = table_string_column(&timeline, &bundle.time_column)?;
+    let inside = window.start_row - first..window.end_row - first;
+    let splits_session = (inside.start > 0 && labels[inside.start - 1] == labels[inside.start])
+        || (inside.end < labels.len() && labels[inside.end] == labels[inside.end - 1]);
+    if splits_session {
+        return Err(EngineRuntimeError::InvalidRequest(
+            "market_data_window must cover whole execution sessions".to_string(),
+        ));
+    }
+    let covered = labels[inside.clone()]
+        .iter()
+        .map(String::as_str)
+        .collect::<BTreeSet<_>>();
+    let session_windows = bundle
+        .session_windows
+        .iter()
+        .filter(|session| covered.contains(session.session_label.as_str()))
+        .cloned()
+        .collect();
+    let time_range = RequestWindowV1 {
+        start: row_keys[inside.start].clone(),
+        end: row_keys[inside.end - 1].clone(),
+    };
+    bundle
+        .row_window_view(window, session_windows, time_range)
+        .map_err(|error| EngineRuntimeError::InvalidBundle(error.to_string()))
+}
+
 fn read_parquet(path: &str) -> Result<DataFrame, EngineRuntimeError> {
     let file = File::open(Path::new(path))
         .map_err(|error| EngineRuntimeError::MarketData(error.to_string()))?;
@@ -4957,6 +5066,7 @@ mod timestamp_tests {
                 engine_request: request,
                 market_data_bundle: bundle,
                 artifact_output_dir: None,
+                market_data_window: None,
                 artifact_run_id: None,
             },
             &prepared,
@@ -5025,7 +5135,9 @@ mod timestamp_tests {
             engine_requests: vec![first, second],
             market_data_bundle: bundle,
             artifact_output_dir: None,
+            market_data_window: None,
             artifact_run_id: None,
+            retain_top: None,
         })
         .unwrap();
         assert_eq!(result["execution_mode"], "grouped");
@@ -5211,6 +5323,7 @@ mod timestamp_tests {
                 engine_request: request,
                 market_data_bundle: bundle,
                 artifact_output_dir: None,
+                market_data_window: None,
                 artifact_run_id: None,
             },
             &prepared,
@@ -5435,6 +5548,7 @@ mod timestamp_tests {
             engine_request: request.clone(),
             market_data_bundle: bundle.clone(),
             artifact_output_dir: None,
+            market_data_window: None,
             artifact_run_id: None,
         })
         .unwrap();
@@ -5540,6 +5654,7 @@ mod timestamp_tests {
             engine_request: request,
             market_data_bundle: bundle,
             artifact_output_dir: Some(artifact_dir.to_string_lossy().to_string()),
+            market_data_window: None,
             artifact_run_id: Some("multilevel".to_string()),
         })
         .unwrap();
@@ -5698,6 +5813,7 @@ mod timestamp_tests {
             engine_request: request,
             market_data_bundle: bundle,
             artifact_output_dir: None,
+            market_data_window: None,
             artifact_run_id: None,
         })
         .unwrap();
@@ -5844,4 +5960,78 @@ mod timestamp_tests {
         )
         .is_err());
     }
+
+    #[test]
+    fn market_data_window_view_slices_parent_tables_without_rewriting_the_bundle() {
+        let frames = xnys_calendar_month_daily_frames();
+        let mut bundle = direct_daily_bundle();
+        let dates = ["2024-01-31", "2024-02-01", "2024-02-02", "2024-03-01"];
+        bundle.row_count = dates.len();
+        bundle.time_range.start = dates[0].to_string();
+        bundle.time_range.end = dates[dates.len() - 1].to_string();
+        bundle.session_windows = dates
+            .iter()
+            .map(|session_label| crate::MarketDataSessionWindowV2 {
+                session_label: (*session_label).to_string(),
+                open_timestamp: format!("{session_label}T14:30:00Z"),
+                close_timestamp: format!("{session_label}T21:00:00Z"),
+            })
+            .collect();
+        let temp =
+            std::env::temp_dir().join(format!("lo2cin4bt-row-window-{}", std::process::id()));
+        std::fs::create_dir_all(&temp).unwrap();
+        for (name, frame) in &frames {
+            let path = temp.join(format!("{name}.parquet"));
+            let mut frame = frame.clone();
+            ParquetWriter::new(File::create(&path).unwrap())
+                .finish(&mut frame)
+                .unwrap();
+            let table = bundle.tables.get_mut(name).unwrap();
+            table.path = Some(path.to_string_lossy().to_string());
+            table.row_count = dates.len();
+        }
+        bundle.content_hash = bundle.computed_content_hash().unwrap();
+        bundle.bundle_id = format!("mdb-{}", &bundle.content_hash[..16]);
+
+        let window = MarketDataRowWindowV1 {
+            start_row: 1,
+            end_row: 3,
+        };
+        let view = market_data_window_view(&bundle, window).unwrap();
+
+        view.validate().unwrap();
+        assert_eq!(view.content_hash, bundle.content_hash);
+        assert_eq!(view.row_count, 2);
+        assert_eq!(view.time_range.start, "2024-02-01");
+        assert_eq!(view.time_range.end, "2024-02-02");
+        assert_eq!(
+            view.session_windows
+                .iter()
+                .map(|session| session.session_label.as_str())
+                .collect::<Vec<_>>(),
+            ["2024-02-01", "2024-02-02"]
+        );
+        let close = read_bundle_table(&view, "close").unwrap();
+        assert_eq!(
+            close
+                .column("QQQ")
+                .unwrap()
+                .f64()
+                .unwrap()
+                .iter()
+                .collect::<Vec<_>>(),
+            [Some(102.0), Some(103.0)]
+        );
+        assert_eq!(read_bundle_table(&bundle, "close").unwrap().height(), 4);
+        assert!(market_data_window_view(&view, window).is_err());
+        assert!(market_data_window_view(
+            &bundle,
+            MarketDataRowWindowV1 {
+                start_row: 2,
+                end_row: 5,
+            },
+        )
+        .is_err());
+        let _ = std::fs::remove_dir_all(temp);
+    }
 }
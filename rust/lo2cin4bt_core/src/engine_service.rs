@@ -1,19 +1,24 @@
+use crate::bundle_cache::bundle_cache_stats;
+use crate::cancellation::{run_with_cancellation, CancellationProgress, CancellationToken};
+use crate::candidate_parallel::with_candidate_threads;
+use crate::engine_transport::{BINARY_ARRAY_MIN_LEN, JSON_LINES_TRANSPORT, SUPPORTED_TRANSPORTS};
+use crate::engine_worker_pool::EngineSchedulingReport;
 use crate::{
     execute_engine_request, execute_engine_request_batch, project_backtest_detail_bundle,
-    project_plot_bundle, run_accounting, run_calendar_overlay_batch, run_daily_rank_accounting,
-    run_daily_rank_accounting_batch, run_metrics_batch, run_metrics_parquet, run_rank_selection,
-    run_reset_timer_batch, run_single_asset_calendar_same_session_batch,
-    run_single_asset_next_open_signal_batch, run_single_asset_next_open_signal_timeline,
-    run_timeline_accounting, AccountingInput, BacktestDetailProjectionInput,
-    CalendarOverlayBatchInput, CalendarSameSessionBatchInput, DailyRankAccountingInput,
-    DailyRankBatchInput, EngineRequestBatchExecutionInput, EngineRequestExecutionInput,
-    EngineRequestV2, MetricsBatchInput, MetricsParquetInput, PlotProjectionInput,
-    RankSelectionInput, ResetTimerBatchInput, SingleAssetNextOpenSignalInput,
-    SingleAssetSignalBatchInput, TimelineAccountingInput,
+    project_plot_bundle, project_plot_lod, run_accounting, run_calendar_overlay_batch,
+    run_daily_rank_accounting, run_daily_rank_accounting_batch, run_metrics_batch,
+    run_metrics_parquet, run_rank_selection, run_reset_timer_batch,
+    run_single_asset_calendar_same_session_batch, run_single_asset_next_open_signal_batch,
+    run_single_asset_next_open_signal_timeline, run_timeline_accounting, AccountingInput,
+    BacktestDetailProjectionInput, CalendarOverlayBatchInput, CalendarSameSessionBatchInput,
+    DailyRankAccountingInput, DailyRankBatchInput, EngineRequestBatchExecutionInput,
+    EngineRequestExecutionInput, EngineRequestV2, MetricsBatchInput, MetricsParquetInput,
+    PlotLodInput, PlotProjectionInput, RankSelectionInput, ResetTimerBatchInput,
+    SingleAssetNextOpenSignalInput, SingleAssetSignalBatchInput, TimelineAccountingInput,
 };
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
-use std::time::{Instant, SystemTime, UNIX_EPOCH};
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 
 pub const ENGINE_SERVICE_PROTOCOL_VERSION: &str = "engine_service.v1";
 
@@ -28,6 +33,7 @@ pub enum EngineServiceCommand {
     ExecuteEngineRequestBatch,
     Cancel,
     Shutdown,
+    NegotiateTransport,
 }
 
 #[derive(Clone, Copy, Debug, Deserialize, Serialize, PartialEq, Eq)]
@@ -46,6 +52,7 @@ pub enum EngineOperation {
     DailyRankAccounting,
     DailyRankBatch,
     PlotBundle,
+    PlotLod,
     BacktestDetailBundle,
 }
 
@@ -56,6 +63,9 @@ pub struct EngineResourceBudget {
     pub max_payload_bytes: Option<usize>,
     #[serde(default)]
     pub max_operation_ms: Option<u64>,
+    /// Threads a batch kernel may spread candidates over; defaults to every core.
+    #[serde(default)]
+    pub max_threads: Option<usize>,
 }
 
 #[derive(Clone, Debug, Deserialize, Serialize)]
@@ -72,6 +82,8 @@ pub struct EngineServiceRequest {
     pub deadline_unix_ms: Option<u64>,
     #[serde(default)]
     pub resource_budget: EngineResourceBudget,
+    #[serde(default)]
+    pub priority: i32,
 }
 
 #[derive(Clone, Debug, Deserialize, Serialize, PartialEq, Eq)]
@@ -103,6 +115,8 @@ pub struct EngineServiceResponse {
     pub result: Option<Value>,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub error: Option<EngineServiceError>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub scheduling: Option<EngineSchedulingReport>,
 }
 
 impl EngineServiceResponse {
@@ -114,6 +128,7 @@ impl EngineServiceResponse {
             operation: request.operation,
             result: Some(result),
             error: None,
+            scheduling: None,
         }
     }
 
@@ -125,6 +140,7 @@ impl EngineServiceResponse {
             operation: request.operation,
             result: Some(result),
             error: None,
+            scheduling: None,
         }
     }
 
@@ -140,11 +156,34 @@ impl EngineServiceResponse {
                 message,
                 retryable: false,
             }),
+            scheduling: None,
+        }
+    }
+
+    /// Failure the caller may retry later, e.g. when the work queue is full.
+    pub fn retryable_failure(request: &EngineServiceRequest, code: &str, message: String) -> Self {
+        let mut response = Self::failure(request, code, message);
+        if let Some(error) = response.error.as_mut() {
+            error.retryable = true;
         }
+        response
+    }
+
+    pub fn with_scheduling(mut self, scheduling: EngineSchedulingReport) -> Self {
+        self.scheduling = Some(scheduling);
+        self
     }
 }
 
 pub fn handle_engine_service_request(request: EngineServiceRequest) -> EngineServiceResponse {
+    handle_engine_service_request_with_cancellation(request, &CancellationToken::new())
+}
+
+/// Handle a request whose execute commands stop early once `token` is canceled.
+pub fn handle_engine_service_request_with_cancellation(
+    request: EngineServiceRequest,
+    token: &CancellationToken,
+) -> EngineServiceResponse {
     if request.protocol_version != ENGINE_SERVICE_PROTOCOL_VERSION {
         return EngineServiceResponse::failure(
             &request,
@@ -183,7 +222,11 @@ pub fn handle_engine_service_request(request: EngineServiceRequest) -> EngineSer
     match request.command {
         EngineServiceCommand::Health => EngineServiceResponse::success(
             &request,
-            serde_json::json!({"ready": true, "protocol_version": ENGINE_SERVICE_PROTOCOL_VERSION}),
+            serde_json::json!({
+                "ready": true,
+                "protocol_version": ENGINE_SERVICE_PROTOCOL_VERSION,
+                "bundle_cache": bundle_cache_stats(),
+            }),
         ),
         EngineServiceCommand::Capabilities => EngineServiceResponse::success(
             &request,
@@ -195,12 +238,33 @@ pub fn handle_engine_service_request(request: EngineServiceRequest) -> EngineSer
                     "signal_timeline_batch", "calendar_same_session_batch",
                     "calendar_overlay_batch", "reset_timer_batch", "metrics_batch",
                     "metrics_parquet", "rank_selection", "daily_rank_accounting",
-                    "daily_rank_batch", "plot_bundle"
+                    "daily_rank_batch", "plot_bundle", "plot_lod"
                     , "backtest_detail_bundle"
                 ],
-                "commands": ["health", "capabilities", "validate_engine_request", "execute", "execute_engine_request", "execute_engine_request_batch", "cancel", "shutdown"]
+                "commands": ["health", "capabilities", "validate_engine_request", "execute", "execute_engine_request", "execute_engine_request_batch", "cancel", "shutdown", "negotiate_transport"],
+                "transports": SUPPORTED_TRANSPORTS,
             }),
         ),
+        EngineServiceCommand::NegotiateTransport => {
+            // The first offered transport this build speaks wins; the ack itself
+            // is always a JSON line so older clients can read it.
+            let transport = request
+                .payload
+                .get("transports")
+                .and_then(Value::as_array)
+                .into_iter()
+                .flatten()
+                .filter_map(Value::as_str)
+                .find(|name| SUPPORTED_TRANSPORTS.contains(name))
+                .unwrap_or(JSON_LINES_TRANSPORT);
+            EngineServiceResponse::success(
+                &request,
+                serde_json::json!({
+                    "transport": transport,
+                    "binary_array_min_len": BINARY_ARRAY_MIN_LEN,
+                }),
+            )
+        }
         EngineServiceCommand::ValidateEngineRequest => {
             let result = serde_json::from_value::<EngineRequestV2>(request.payload.clone())
                 .map_err(|exc| exc.to_string())
@@ -214,100 +278,28 @@ pub fn handle_engine_service_request(request: EngineServiceRequest) -> EngineSer
                 });
             result_or_failure(&request, result)
         }
-        EngineServiceCommand::Execute => {
-            let started = Instant::now();
-            let response = match request.operation {
-                Some(operation) => result_or_failure(
-                    &request,
-                    execute_operation(operation, request.payload.clone()),
-                ),
-                None => EngineServiceResponse::failure(
-                    &request,
-                    "invalid_request",
-                    "execute command requires operation".to_string(),
-                ),
-            };
-            if let Some(max_operation_ms) = request.resource_budget.max_operation_ms {
-                if started.elapsed().as_millis() > u128::from(max_operation_ms) {
-                    return EngineServiceResponse::failure(
-                        &request,
-                        "resource_budget_exceeded",
-                        format!("operation exceeded {max_operation_ms}ms budget"),
-                    );
-                }
-            }
-            if request
-                .deadline_unix_ms
-                .is_some_and(|deadline| now_unix_ms() > deadline)
-            {
-                return EngineServiceResponse::failure(
-                    &request,
-                    "deadline_exceeded",
-                    "request deadline elapsed during execution".to_string(),
-                );
-            }
-            response
-        }
-        EngineServiceCommand::ExecuteEngineRequest => {
-            let started = Instant::now();
-            let result =
-                serde_json::from_value::<EngineRequestExecutionInput>(request.payload.clone())
-                    .map_err(|error| error.to_string())
-                    .and_then(|input| {
-                        execute_engine_request(input).map_err(|error| error.to_string())
-                    });
-            let response = result_or_failure(&request, result);
-            if let Some(max_operation_ms) = request.resource_budget.max_operation_ms {
-                if started.elapsed().as_millis() > u128::from(max_operation_ms) {
-                    return EngineServiceResponse::failure(
-                        &request,
-                        "resource_budget_exceeded",
-                        format!("operation exceeded {max_operation_ms}ms budget"),
-                    );
-                }
-            }
-            if request
-                .deadline_unix_ms
-                .is_some_and(|deadline| now_unix_ms() > deadline)
-            {
-                return EngineServiceResponse::failure(
-                    &request,
-                    "deadline_exceeded",
-                    "request deadline elapsed during execution".to_string(),
-                );
-            }
-            response
-        }
-        EngineServiceCommand::ExecuteEngineRequestBatch => {
-            let started = Instant::now();
-            let result =
-                serde_json::from_value::<EngineRequestBatchExecutionInput>(request.payload.clone())
-                    .map_err(|error| error.to_string())
-                    .and_then(|input| {
-                        execute_engine_request_batch(input).map_err(|error| error.to_string())
-                    });
-            let response = result_or_failure(&request, result);
-            if let Some(max_operation_ms) = request.resource_budget.max_operation_ms {
-                if started.elapsed().as_millis() > u128::from(max_operation_ms) {
-                    return EngineServiceResponse::failure(
-                        &request,
-                        "resource_budget_exceeded",
-                        format!("operation exceeded {max_operation_ms}ms budget"),
-                    );
-                }
-            }
-            if request
-                .deadline_unix_ms
-                .is_some_and(|deadline| now_unix_ms() > deadline)
-            {
-                return EngineServiceResponse::failure(
-                    &request,
-                    "deadline_exceeded",
-                    "request deadline elapsed during execution".to_string(),
-                );
-            }
-            response
-        }
+        EngineServiceCommand::Execute => match request.operation {
+            Some(operation) => run_cancellable(&request, token, || {
+                execute_operation(operation, request.payload.clone())
+            }),
+            None => EngineServiceResponse::failure(
+                &request,
+                "invalid_request",
+                "execute command requires operation".to_string(),
+            ),
+        },
+        EngineServiceCommand::ExecuteEngineRequest => run_cancellable(&request, token, || {
+            serde_json::from_value::<EngineRequestExecutionInput>(request.payload.clone())
+                .map_err(|error| error.to_string())
+                .and_then(|input| execute_engine_request(input).map_err(|error| error.to_string()))
+        }),
+        EngineServiceCommand::ExecuteEngineRequestBatch => run_cancellable(&request, token, || {
+            serde_json::from_value::<EngineRequestBatchExecutionInput>(request.payload.clone())
+                .map_err(|error| error.to_string())
+                .and_then(|input| {
+                    execute_engine_request_batch(input).map_err(|error| error.to_string())
+                })
+        }),
         EngineServiceCommand::Cancel => {
             let target = request
                 .payload
@@ -334,10 +326,85 @@ pub fn handle_engine_service_request(request: EngineServiceRequest) -> EngineSer
             operation: None,
             result: Some(serde_json::json!({"accepted": true})),
             error: None,
+            scheduling: None,
         },
     }
 }
 
+/// Run an execute command under `token`, with the envelope deadline and
+/// `max_operation_ms` budget enforced at kernel checkpoints.
+fn run_cancellable(
+    request: &EngineServiceRequest,
+    token: &CancellationToken,
+    work: impl FnOnce() -> Result<Value, String>,
+) -> EngineServiceResponse {
+    let started = Instant::now();
+    let deadline = request
+        .deadline_unix_ms
+        .map(|deadline| started + Duration::from_millis(deadline.saturating_sub(now_unix_ms())));
+    let budget_deadline = request
+        .resource_budget
+        .max_operation_ms
+        .map(|max_operation_ms| started + Duration::from_millis(max_operation_ms));
+    let scoped = token
+        .clone()
+        .with_deadline(deadline)
+        .with_budget_deadline(budget_deadline);
+    let threads = request.resource_budget.max_threads;
+    let (result, progress) =
+        run_with_cancellation(&scoped, || with_candidate_threads(threads, work));
+    if let Some(reason) = progress.reason {
+        return cancelled_failure(request, reason.code(), reason.to_string(), &progress);
+    }
+    if token.is_canceled() {
+        return cancelled_failure(
+            request,
+            "canceled",
+            "request canceled by control command".to_string(),
+            &progress,
+        );
+    }
+    if let Some(max_operation_ms) = request.resource_budget.max_operation_ms {
+        if started.elapsed().as_millis() > u128::from(max_operation_ms) {
+            return cancelled_failure(
+                request,
+                "resource_budget_exceeded",
+                format!("operation exceeded {max_operation_ms}ms budget"),
+                &progress,
+            );
+        }
+    }
+    if request
+        .deadline_unix_ms
+        .is_some_and(|deadline| now_unix_ms() > deadline)
+    {
+        return cancelled_failure(
+            request,
+            "deadline_exceeded",
+            "request deadline elapsed during execution".to_string(),
+            &progress,
+        );
+    }
+    result_or_failure(request, result)
+}
+
+/// Failure carrying how much work finished before the kernel stopped.
+fn cancelled_failure(
+    request: &EngineServiceRequest,
+    code: &str,
+    message: String,
+    progress: &CancellationProgress,
+) -> EngineServiceResponse {
+    let mut response = EngineServiceResponse::failure(request, code, message);
+    response.result = Some(serde_json::json!({
+        "canceled": true,
+        "reason": code,
+        "completed_candidates": progress.completed_candidates,
+        "bars_processed": progress.bars_processed,
+    }));
+    response
+}
+
 fn result_or_failure(
     request: &EngineServiceRequest,
     result: Result<Value, String>,
@@ -424,6 +491,9 @@ fn execute_operation(operation: EngineOperation, payload: Value) -> Result<Value
                 project_plot_bundle(input).map_err(|exc| exc.to_string())
             })
         }
+        EngineOperation::PlotLod => parse_and_run::<PlotLodInput, _, _>(payload, |input| {
+            project_plot_lod(input).map_err(|exc| exc.to_string())
+        }),
         EngineOperation::BacktestDetailBundle => {
             parse_and_run::<BacktestDetailProjectionInput, _, _>(payload, |input| {
                 project_backtest_detail_bundle(input).map_err(|exc| exc.to_string())
@@ -455,6 +525,7 @@ mod tests {
             payload,
             deadline_unix_ms: None,
             resource_budget: EngineResourceBudget::default(),
+            priority: 0,
         }
     }
 
@@ -545,4 +616,45 @@ mod tests {
             "request-running"
         );
     }
+
+    #[test]
+    fn canceled_execution_reports_partial_progress() {
+        let input = request(
+            EngineServiceCommand::Execute,
+            Some(EngineOperation::RankSelection),
+            Value::Null,
+        );
+        let token = CancellationToken::new();
+        let response = run_cancellable(&input, &token, || {
+            crate::cancellation::candidate_completed();
+            token.cancel();
+            for _ in 0..1_000 {
+                crate::cancellation::checkpoint().map_err(|error| error.to_string())?;
+            }
+            Ok(Value::Null)
+        });
+
+        assert_eq!(response.status, EngineServiceStatus::Error);
+        assert_eq!(response.error.unwrap().code, "canceled");
+        let partial = response.result.unwrap();
+        assert_eq!(partial["completed_candidates"], 1);
+        assert_eq!(partial["bars_processed"], 1);
+    }
+
+    #[test]
+    fn exhausted_operation_budget_stops_at_the_next_checkpoint() {
+        let mut input = request(
+            EngineServiceCommand::Execute,
+            Some(EngineOperation::RankSelection),
+            Value::Null,
+        );
+        input.resource_budget.max_operation_ms = Some(0);
+        let response = run_cancellable(&input, &CancellationToken::new(), || {
+            crate::cancellation::candidate_checkpoint().map_err(|error| error.to_string())?;
+            Ok(Value::Null)
+        });
+
+        assert_eq!(response.error.unwrap().code, "resource_budget_exceeded");
+        assert_eq!(response.result.unwrap()["completed_candidates"], 0);
+    }
 }
@@ -0,0 +1,260 @@
+//! Length-prefixed binary framing for the engine service.
+//!
+//! JSON lines stay the default transport. After a `negotiate_transport`
+//! exchange both sides switch to frames laid out as
+//!
+//! ```text
+//! u32 LE header_len | u64 LE body_len | header (UTF-8 JSON envelope) | body
+//! ```
+//!
+//! Numeric arrays of at least [`BINARY_ARRAY_MIN_LEN`] items are lifted out of
+//! the envelope into the body as little-endian `f64` or `i64` buffers and
+//! replaced by `{"$binary": {"dtype", "offset", "count"}}` placeholders, so
+//! equity series and weight vectors skip decimal text encoding in both
+//! directions.
+
+use serde_json::{Map, Number, Value};
+use std::io::{self, Read, Write};
+use thiserror::Error;
+
+pub const JSON_LINES_TRANSPORT: &str = "json_lines";
+pub const FRAMED_TRANSPORT: &str = "framed.v1";
+pub const SUPPORTED_TRANSPORTS: [&str; 2] = [FRAMED_TRANSPORT, JSON_LINES_TRANSPORT];
+/// Shorter arrays stay inline; the placeholder would cost more than the text.
+pub const BINARY_ARRAY_MIN_LEN: usize = 32;
+
+const BINARY_PLACEHOLDER_KEY: &str = "$binary";
+const FRAME_PREFIX_BYTES: usize = 12;
+
+#[derive(Debug, Error)]
+pub enum EngineTransportError {
+    #[error("frame I/O failed: {0}")]
+    Io(#[from] io::Error),
+    #[error("frame header is not valid JSON: {0}")]
+    Header(String),
+    #[error("invalid binary buffer reference: {0}")]
+    Buffer(String),
+}
+
+#[derive(Clone, Copy)]
+enum BinaryDtype {
+    F64,
+    I64,
+}
+
+impl BinaryDtype {
+    fn name(self) -> &'static str {
+        match self {
+            Self::F64 => "f64",
+            Self::I64 => "i64",
+        }
+    }
+
+    fn parse(name: &str) -> Option<Self> {
+        match name {
+            "f64" => Some(Self::F64),
+            "i64" => Some(Self::I64),
+            _ => None,
+        }
+    }
+}
+
+/// Read one frame and resolve its binary placeholders. Returns `None` on a
+/// clean end of stream between frames.
+pub fn read_frame<R: Read>(reader: &mut R) -> Result<Option<Value>, EngineTransportError> {
+    let mut prefix = [0u8; FRAME_PREFIX_BYTES];
+    let mut filled = 0;
+    while filled < prefix.len() {
+        match reader.read(&mut prefix[filled..]) {
+            Ok(0) if filled == 0 => return Ok(None),
+            Ok(0) => return Err(io::Error::from(io::ErrorKind::UnexpectedEof).into()),
+            Ok(read) => filled += read,
+            Err(exc) if exc.kind() == io::ErrorKind::Interrupted => {}
+            Err(exc) => return Err(exc.into()),
+        }
+    }
+    let header_len = u32::from_le_bytes(prefix[..4].try_into().expect("4-byte prefix")) as usize;
+    let body_len = u64::from_le_bytes(prefix[4..].try_into().expect("8-byte prefix")) as usize;
+    let mut header = vec![0u8; header_len];
+    reader.read_exact(&mut header)?;
+    let mut body = vec![0u8; body_len];
+    reader.read_exact(&mut body)?;
+    let header = serde_json::from_slice::<Value>(&header)
+        .map_err(|exc| EngineTransportError::Header(exc.to_string()))?;
+    restore_binary_arrays(header, &body).map(Some)
+}
+
+/// Write `value` as one frame, lifting long numeric arrays into the body.
+pub fn write_frame<W: Write>(writer: &mut W, value: Value) -> Result<(), EngineTransportError> {
+    let mut body = Vec::new();
+    let header = lift_binary_arrays(value, &mut body);
+    let header =
+        serde_json::to_vec(&header).map_err(|exc| EngineTransportError::Header(exc.to_string()))?;
+    let header_len = u32::try_from(header.len())
+        .map_err(|_| EngineTransportError::Header("frame header exceeds 4 GiB".to_string()))?;
+    writer.write_all(&header_len.to_le_bytes())?;
+    writer.write_all(&(body.len() as u64).to_le_bytes())?;
+    writer.write_all(&header)?;
+    writer.write_all(&body)?;
+    Ok(())
+}
+
+fn lift_binary_arrays(value: Value, body: &mut Vec<u8>) -> Value {
+    match value {
+        Value::Array(items) => {
+            if items.len() >= BINARY_ARRAY_MIN_LEN {
+                if let Some(dtype) = numeric_dtype(&items) {
+                    let offset = body.len();
+                    body.reserve(items.len() * 8);
+                    for item in &items {
+                        match dtype {
+                            BinaryDtype::F64 => body.extend_from_slice(
+                                &item.as_f64().unwrap_or(f64::NAN).to_le_bytes(),
+                            ),
+                            BinaryDtype::I64 => body.extend_from_slice(
+                                &item.as_i64().unwrap_or_default().to_le_bytes(),
+                            ),
+                        }
+                    }
+                    return serde_json::json!({
+                        BINARY_PLACEHOLDER_KEY: {
+                            "dtype": dtype.name(),
+                            "offset": offset,
+                            "count": items.len(),
+                        }
+                    });
+                }
+            }
+            Value::Array(
+                items
+                    .into_iter()
+                    .map(|item| lift_binary_arrays(item, body))
+                    .collect(),
+            )
+        }
+        Value::Object(map) => Value::Object(
+            map.into_iter()
+                .map(|(key, item)| (key, lift_binary_arrays(item, body)))
+                .collect(),
+        ),
+        other => other,
+    }
+}
+
+/// Arrays qualify only when every item keeps its JSON type through the
+/// buffer: all floats, or all integers that fit in `i64`.
+fn numeric_dtype(items: &[Value]) -> Option<BinaryDtype> {
+    let numbers = || items.iter().map(Value::as_number);
+    if numbers().all(|number| number.is_some_and(Number::is_f64)) {
+        Some(BinaryDtype::F64)
+    } else if numbers().all(|number| number.is_some_and(Number::is_i64)) {
+        Some(BinaryDtype::I64)
+    } else {
+        None
+    }
+}
+
+fn restore_binary_arrays(value: Value, body: &[u8]) -> Result<Value, EngineTransportError> {
+    match value {
+        Value::Object(map) if map.len() == 1 && map.contains_key(BINARY_PLACEHOLDER_KEY) => {
+            decode_binary_array(&map[BINARY_PLACEHOLDER_KEY], body)
+        }
+        Value::Object(map) => map
+            .into_iter()
+            .map(|(key, item)| restore_binary_arrays(item, body).map(|item| (key, item)))
+            .collect::<Result<Map<_, _>, _>>()
+            .map(Value::Object),
+        Value::Array(items) => items
+            .into_iter()
+            .map(|item| restore_binary_arrays(item, body))
+            .collect::<Result<Vec<_>, _>>()
+            .map(Value::Array),
+        other => Ok(other),
+    }
+}
+
+fn decode_binary_array(spec: &Value, body: &[u8]) -> Result<Value, EngineTransportError> {
+    let field = |name: &str| {
+        spec.get(name)
+            .and_then(Value::as_u64)
+            .map(|item| item as usize)
+    };
+    let dtype = spec
+        .get("dtype")
+        .and_then(Value::as_str)
+        .and_then(BinaryDtype::parse)
+        .ok_or_else(|| EngineTransportError::Buffer("dtype must be f64 or i64".to_string()))?;
+    let (Some(offset), Some(count)) = (field("offset"), field("count")) else {
+        return Err(EngineTransportError::Buffer(
+            "offset and count are required".to_string(),
+        ));
+    };
+    let bytes = count
+        .checked_mul(8)
+        .and_then(|len| offset.checked_add(len).map(|end| (offset, end)))
+        .and_then(|(start, end)| body.get(start..end))
+        .ok_or_else(|| {
+            EngineTransportError::Buffer(format!(
+                "{count} items at offset {offset} exceed the {} byte body",
+                body.len()
+            ))
+        })?;
+    let items = bytes.chunks_exact(8).map(|chunk| {
+        let raw: [u8; 8] = chunk.try_into().expect("8-byte chunk");
+        match dtype {
+            BinaryDtype::F64 => Number::from_f64(f64::from_le_bytes(raw))
+                .map(Value::Number)
+                .unwrap_or(Value::Null),
+            BinaryDtype::I64 => Value::from(i64::from_le_bytes(raw)),
+        }
+    });
+    Ok(Value::Array(items.collect()))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn frames_round_trip_long_numeric_arrays_through_the_body() {
+        let floats = (0..40).map(|index| index as f64 * 0.1).collect::<Vec<_>>();
+        let ints = (0..40).map(|index| index - 20).collect::<Vec<i64>>();
+        let value = serde_json::json!({
+            "request_id": "r1",
+            "payload": {
+                "equity": floats,
+                "indices": ints,
+                "short": [1.5, 2.5],
+                "mixed": (0..40).map(|index| if index == 0 { Value::Null } else { Value::from(1.0) }).collect::<Vec<_>>(),
+                "rows": [floats.clone()],
+            }
+        });
+        let mut encoded = Vec::new();
+        write_frame(&mut encoded, value.clone()).unwrap();
+        let header_len = u32::from_le_bytes(encoded[..4].try_into().unwrap()) as usize;
+        let header: Value =
+            serde_json::from_slice(&encoded[FRAME_PREFIX_BYTES..FRAME_PREFIX_BYTES + header_len])
+                .unwrap();
+        assert!(header["payload"]["equity"]
+            .get(BINARY_PLACEHOLDER_KEY)
+            .is_some());
+        assert!(header["payload"]["indices"][BINARY_PLACEHOLDER_KEY]["dtype"] == "i64");
+        assert!(header["payload"]["short"].is_array());
+        assert!(header["payload"]["mixed"].is_array());
+
+        let mut reader = encoded.as_slice();
+        assert_eq!(read_frame(&mut reader).unwrap(), Some(value));
+        assert!(read_frame(&mut reader).unwrap().is_none());
+    }
+
+    #[test]
+    fn out_of_range_buffer_reference_is_rejected() {
+        let header = serde_json::json!({
+            "payload": {BINARY_PLACEHOLDER_KEY: {"dtype": "f64", "offset": 0, "count": 4}}
+        });
+        assert!(matches!(
+            restore_binary_arrays(header, &[0u8; 8]),
+            Err(EngineTransportError::Buffer(_))
+        ));
+    }
+}
@@ -0,0 +1,359 @@
+//! Fixed-size worker pool with a bounded priority queue for the engine service.
+//!
+//! The service admits execute requests into this pool instead of spawning one
+//! thread per request. A full queue rejects new work so callers can back off,
+//! which keeps a saturated service from oversubscribing cores or memory.
+
+use serde::{Deserialize, Serialize};
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+use std::panic::{catch_unwind, AssertUnwindSafe};
+use std::sync::{Arc, Condvar, Mutex};
+use std::thread::{self, JoinHandle};
+use std::time::Instant;
+use thiserror::Error;
+
+pub const ENGINE_WORKERS_ENV: &str = "LO2CIN4BT_ENGINE_WORKERS";
+pub const ENGINE_QUEUE_CAPACITY_ENV: &str = "LO2CIN4BT_ENGINE_QUEUE_CAPACITY";
+const MIN_QUEUE_CAPACITY: usize = 16;
+const QUEUE_SLOTS_PER_WORKER: usize = 4;
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct EngineWorkerPoolConfig {
+    pub workers: usize,
+    pub queue_capacity: usize,
+}
+
+impl EngineWorkerPoolConfig {
+    pub fn new(workers: usize, queue_capacity: usize) -> Self {
+        Self {
+            workers: workers.max(1),
+            queue_capacity,
+        }
+    }
+
+    pub fn from_env() -> Self {
+        let workers = env_usize(ENGINE_WORKERS_ENV)
+            .filter(|value| *value > 0)
+            .unwrap_or_else(|| {
+                thread::available_parallelism()
+                    .map(usize::from)
+                    .unwrap_or(1)
+            });
+        let queue_capacity = env_usize(ENGINE_QUEUE_CAPACITY_ENV)
+            .unwrap_or_else(|| (workers * QUEUE_SLOTS_PER_WORKER).max(MIN_QUEUE_CAPACITY));
+        Self::new(workers, queue_capacity)
+    }
+}
+
+/// Queue state attached to every engine service response.
+#[derive(Clone, Debug, Default, Deserialize, Serialize, PartialEq, Eq)]
+#[serde(deny_unknown_fields)]
+pub struct EngineSchedulingReport {
+    pub workers: usize,
+    pub running: usize,
+    pub queue_depth: usize,
+    pub queue_capacity: usize,
+    pub queue_wait_ms: u64,
+    pub priority: i32,
+}
+
+#[derive(Clone, Debug, Error, PartialEq, Eq)]
+pub enum EngineQueueRejection {
+    #[error("engine queue is full ({queue_depth}/{queue_capacity} waiting)")]
+    QueueFull {
+        queue_depth: usize,
+        queue_capacity: usize,
+    },
+    #[error("engine worker pool is shutting down")]
+    ShuttingDown,
+}
+
+/// Passed to a job when a worker dequeues it.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct EngineJobStart {
+    pub queue_wait_ms: u64,
+    pub queue_depth: usize,
+    pub running: usize,
+}
+
+type EngineJob = Box<dyn FnOnce(EngineJobStart) + Send + 'static>;
+
+struct QueuedJob {
+    priority: i32,
+    sequence: u64,
+    enqueued_at: Instant,
+    job: EngineJob,
+}
+
+impl PartialEq for QueuedJob {
+    fn eq(&self, other: &Self) -> bool {
+        self.cmp(other) == Ordering::Equal
+    }
+}
+
+impl Eq for QueuedJob {}
+
+impl PartialOrd for QueuedJob {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl Ord for QueuedJob {
+    // Higher priority first; FIFO within the same priority.
+    fn cmp(&self, other: &Self) -> Ordering {
+        self.priority
+            .cmp(&other.priority)
+            .then_with(|| other.sequence.cmp(&self.sequence))
+    }
+}
+
+#[derive(Default)]
+struct PoolState {
+    queue: BinaryHeap<QueuedJob>,
+    running: usize,
+    next_sequence: u64,
+    shutdown: bool,
+}
+
+struct PoolShared {
+    state: Mutex<PoolState>,
+    available: Condvar,
+}
+
+pub struct EngineWorkerPool {
+    config: EngineWorkerPoolConfig,
+    shared: Arc<PoolShared>,
+    workers: Vec<JoinHandle<()>>,
+}
+
+impl EngineWorkerPool {
+    pub fn new(config: EngineWorkerPoolConfig) -> Self {
+        let shared = Arc::new(PoolShared {
+            state: Mutex::new(PoolState::default()),
+            available: Condvar::new(),
+        });
+        let workers = (0..config.workers)
+            .map(|index| {
+                let worker_shared = Arc::clone(&shared);
+                thread::Builder::new()
+                    .name(format!("lo2cin4bt-engine-worker-{index}"))
+                    .spawn(move || worker_loop(&worker_shared))
+                    .expect("unable to spawn engine worker thread")
+            })
+            .collect();
+        Self {
+            config,
+            shared,
+            workers,
+        }
+    }
+
+    pub fn config(&self) -> EngineWorkerPoolConfig {
+        self.config
+    }
+
+    /// Queue a job, or reject it when the queue is already at capacity.
+    pub fn submit<F>(
+        &self,
+        priority: i32,
+        job: F,
+    ) -> Result<EngineSchedulingReport, EngineQueueRejection>
+    where
+        F: FnOnce(EngineJobStart) + Send + 'static,
+    {
+        let mut state = lock_state(&self.shared);
+        if state.shutdown {
+            return Err(EngineQueueRejection::ShuttingDown);
+        }
+        let idle_workers = self.config.workers.saturating_sub(state.running);
+        if state.queue.len() >= self.config.queue_capacity + idle_workers {
+            return Err(EngineQueueRejection::QueueFull {
+                queue_depth: state.queue.len(),
+                queue_capacity: self.config.queue_capacity,
+            });
+        }
+        let sequence = state.next_sequence;
+        state.next_sequence += 1;
+        state.queue.push(QueuedJob {
+            priority,
+            sequence,
+            enqueued_at: Instant::now(),
+            job: Box::new(job),
+        });
+        let report = self.report_locked(&state, 0, priority);
+        drop(state);
+        self.shared.available.notify_one();
+        Ok(report)
+    }
+
+    /// Current queue state for responses that did not pass through the queue.
+    pub fn report(&self, queue_wait_ms: u64, priority: i32) -> EngineSchedulingReport {
+        let state = lock_state(&self.shared);
+        self.report_locked(&state, queue_wait_ms, priority)
+    }
+
+    /// Stop accepting work and wake idle workers so they can exit.
+    pub fn shutdown(&self) {
+        lock_state(&self.shared).shutdown = true;
+        self.shared.available.notify_all();
+    }
+
+    /// Shut down and wait for queued and running jobs to finish.
+    pub fn join(mut self) {
+        self.shutdown();
+        for handle in self.workers.drain(..) {
+            let _ = handle.join();
+        }
+    }
+
+    fn report_locked(
+        &self,
+        state: &PoolState,
+        queue_wait_ms: u64,
+        priority: i32,
+    ) -> EngineSchedulingReport {
+        EngineSchedulingReport {
+            workers: self.config.workers,
+            running: state.running,
+            queue_depth: state.queue.len(),
+            queue_capacity: self.config.queue_capacity,
+            queue_wait_ms,
+            priority,
+        }
+    }
+}
+
+fn worker_loop(shared: &PoolShared) {
+    loop {
+        let (queued, start) = {
+            let mut state = lock_state(shared);
+            loop {
+                if let Some(queued) = state.queue.pop() {
+                    state.running += 1;
+                    let start = EngineJobStart {
+                        queue_wait_ms: elapsed_ms(queued.enqueued_at),
+                        queue_depth: state.queue.len(),
+                        running: state.running,
+                    };
+                    break (queued, start);
+                }
+                if state.shutdown {
+                    return;
+                }
+                state = shared
+                    .available
+                    .wait(state)
+                    .unwrap_or_else(|poisoned| poisoned.into_inner());
+            }
+        };
+        // A panicking job must not take the worker down with it.
+        let _ = catch_unwind(AssertUnwindSafe(|| (queued.job)(start)));
+        lock_state(shared).running -= 1;
+    }
+}
+
+fn lock_state(shared: &PoolShared) -> std::sync::MutexGuard<'_, PoolState> {
+    shared
+        .state
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+fn elapsed_ms(started: Instant) -> u64 {
+    u64::try_from(started.elapsed().as_millis()).unwrap_or(u64::MAX)
+}
+
+fn env_usize(name: &str) -> Option<usize> {
+    std::env::var(name)
+        .ok()
+        .and_then(|value| value.trim().parse::<usize>().ok())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::mpsc;
+    use std::time::Duration;
+
+    #[test]
+    fn full_queue_rejects_instead_of_spawning_more_work() {
+        let pool = EngineWorkerPool::new(EngineWorkerPoolConfig::new(1, 1));
+        let (release_tx, release_rx) = mpsc::channel::<()>();
+        let (started_tx, started_rx) = mpsc::channel::<()>();
+        pool.submit(0, move |_| {
+            started_tx.send(()).unwrap();
+            release_rx.recv().unwrap();
+        })
+        .unwrap();
+        started_rx.recv_timeout(Duration::from_secs(5)).unwrap();
+
+        let queued = pool.submit(0, |_| {}).unwrap();
+        let rejected = pool.submit(0, |_| {}).unwrap_err();
+
+        assert_eq!(queued.queue_depth, 1);
+        assert_eq!(queued.running, 1);
+        assert_eq!(
+            rejected,
+            EngineQueueRejection::QueueFull {
+                queue_depth: 1,
+                queue_capacity: 1
+            }
+        );
+        release_tx.send(()).unwrap();
+        pool.join();
+    }
+
+    #[test]
+    fn higher_priority_jobs_run_first_and_ties_stay_fifo() {
+        let pool = EngineWorkerPool::new(EngineWorkerPoolConfig::new(1, 8));
+        let (release_tx, release_rx) = mpsc::channel::<()>();
+        let (started_tx, started_rx) = mpsc::channel::<()>();
+        let order = Arc::new(Mutex::new(Vec::new()));
+        pool.submit(0, move |_| {
+            started_tx.send(()).unwrap();
+            release_rx.recv().unwrap();
+        })
+        .unwrap();
+        started_rx.recv_timeout(Duration::from_secs(5)).unwrap();
+        for (label, priority) in [("low-a", 0), ("high", 5), ("low-b", 0), ("urgent", 9)] {
+            let order = Arc::clone(&order);
+            pool.submit(priority, move |_| order.lock().unwrap().push(label))
+                .unwrap();
+        }
+
+        release_tx.send(()).unwrap();
+        pool.join();
+
+        assert_eq!(
+            *order.lock().unwrap(),
+            vec!["urgent", "high", "low-a", "low-b"]
+        );
+    }
+
+    #[test]
+    fn dequeued_jobs_report_wait_time_and_survive_panics() {
+        let pool = EngineWorkerPool::new(EngineWorkerPoolConfig::new(1, 4));
+        pool.submit(0, |_| panic!("kernel panic")).unwrap();
+        let (tx, rx) = mpsc::channel();
+        pool.submit(0, move |start| tx.send(start).unwrap())
+            .unwrap();
+
+        let start = rx.recv_timeout(Duration::from_secs(5)).unwrap();
+        assert_eq!(start.queue_depth, 0);
+        assert_eq!(start.running, 1);
+        pool.join();
+    }
+
+    #[test]
+    fn shutdown_rejects_new_work() {
+        let pool = EngineWorkerPool::new(EngineWorkerPoolConfig::new(2, 4));
+        pool.shutdown();
+        assert_eq!(
+            pool.submit(0, |_| {}).unwrap_err(),
+            EngineQueueRejection::ShuttingDown
+        );
+        pool.join();
+    }
+}
@@ -9,7 +9,11 @@
 pub mod accounting;
 mod artifact_tables;
 pub mod bar_aggregation;
+pub mod bundle_cache;
+pub mod cancellation;
 pub mod candidate_identity;
+pub mod candidate_parallel;
+pub mod candidate_retention;
 pub mod computed_fields;
 pub mod config;
 pub mod daily_rank;
@@ -17,6 +21,8 @@ pub mod detail;
 pub mod engine_request;
 pub mod engine_runtime;
 pub mod engine_service;
+pub mod engine_transport;
+pub mod engine_worker_pool;
 pub mod metrics;
 pub mod metrics_parquet;
 pub mod plot;
@@ -37,10 +43,22 @@ pub use bar_aggregation::{
     BarAlignment, BarSpec, BarUnit, DerivedBar, DerivedBarLineage, EventOrderingKey,
     ExecutionBarIndex, LifecycleStage, PartialBarPolicy, SessionWindow, SourceBar,
 };
+pub use bundle_cache::{
+    bundle_cache_stats, clear_bundle_cache, BundleCacheStats, BundleTableCache,
+    BUNDLE_CACHE_BYTES_ENV,
+};
+pub use cancellation::{
+    run_with_cancellation, CancellationProgress, CancellationReason, CancellationToken,
+};
 pub use candidate_identity::{
     canonical_parameter_suffix, parse_candidate_id, validate_base_strategy_id,
     FIXED_PARAMETER_SUFFIX,
 };
+pub use candidate_parallel::{candidate_threads, map_candidates, with_candidate_threads};
+pub use candidate_retention::{
+    CandidateRetentionSummary, RetainedCandidates, RetentionScore, CANDIDATE_RETENTION_RANKING,
+    CANDIDATE_RETENTION_SCHEMA_VERSION,
+};
 pub use computed_fields::returns::{
     period_return_series, session_return_series, PeriodReturnSeries, ReturnSeriesError,
     SessionReturnSeries,
@@ -70,27 +88,38 @@ pub use engine_request::{
     MarketDataBundleV2, MarketDataExecutionRoleV2, MarketDataExecutionStreamV2,
     MarketDataExternalSourceKindV2, MarketDataExternalSourceV2, MarketDataIndexKind,
     MarketDataLineageV2, MarketDataMissingValuePolicyV2, MarketDataOhlcvBindingsV2,
-    MarketDataOutOfOrderPolicyV2, MarketDataQualityV2, MarketDataRoleV2, MarketDataSessionWindowV2,
-    MarketDataTableV2, MarketDataTimestampSemanticsV2, MarketDataTransportV2,
-    NonSessionBarPolicyV1, OperationId, OutputRequestV1, PartialBarPolicyV1, PositionMode,
-    RequestLineageV1, RequestWindowV1, RoutingMode, RunScopeId, SessionLabelPolicy,
-    SimulationRequestV2, StaleValuePolicy, StrategyRequestV2, StrategyStreamBindingV1,
-    TimelineActionId, VenueRequestV1, WorkflowRequestV1,
+    MarketDataOutOfOrderPolicyV2, MarketDataQualityV2, MarketDataRoleV2, MarketDataRowView,
+    MarketDataRowWindowV1, MarketDataSessionWindowV2, MarketDataTableV2,
+    MarketDataTimestampSemanticsV2, MarketDataTransportV2, NonSessionBarPolicyV1, OperationId,
+    OutputRequestV1, PartialBarPolicyV1, PositionMode, RequestLineageV1, RequestWindowV1,
+    RoutingMode, RunScopeId, SessionLabelPolicy, SimulationRequestV2, StaleValuePolicy,
+    StrategyRequestV2, StrategyStreamBindingV1, TimelineActionId, VenueRequestV1,
+    WorkflowRequestV1,
 };
 pub use engine_runtime::{
     execute_engine_request, execute_engine_request_batch, EngineRequestBatchExecutionInput,
     EngineRequestExecutionInput, EngineRuntimeError,
 };
 pub use engine_service::{
-    handle_engine_service_request, EngineOperation, EngineResourceBudget, EngineServiceCommand,
-    EngineServiceError, EngineServiceRequest, EngineServiceResponse, EngineServiceStatus,
+    handle_engine_service_request, handle_engine_service_request_with_cancellation,
+    EngineOperation, EngineResourceBudget, EngineServiceCommand, EngineServiceError,
+    EngineServiceRequest, EngineServiceResponse, EngineServiceStatus,
     ENGINE_SERVICE_PROTOCOL_VERSION,
 };
+pub use engine_transport::{
+    read_frame, write_frame, EngineTransportError, FRAMED_TRANSPORT, JSON_LINES_TRANSPORT,
+};
+pub use engine_worker_pool::{
+    EngineJobStart, EngineQueueRejection, EngineSchedulingReport, EngineWorkerPool,
+    EngineWorkerPoolConfig,
+};
 pub use metrics::{run_metrics_batch, EquityMetricRow, MetricsBatchInput, MetricsBatchSummary};
 pub use metrics_parquet::{run_metrics_parquet, MetricsParquetInput};
 pub use plot::{
-    project_plot_bundle, PlotAxes, PlotBundle, PlotInputSeries, PlotProjectionError,
-    PlotProjectionInput, PlotSeries, PLOT_BUNDLE_SCHEMA_VERSION,
+    lttb_indices, lttb_pyramid, project_plot_bundle, project_plot_lod, PlotAxes, PlotBundle,
+    PlotInputSeries, PlotLod, PlotLodInput, PlotLodInputSeries, PlotProjectionError,
+    PlotProjectionInput, PlotSeries, PlotSeriesLevel, PlotSeriesLod, PLOT_BUNDLE_SCHEMA_VERSION,
+    PLOT_LOD_LEVEL_FACTOR, PLOT_LOD_SCHEMA_VERSION,
 };
 pub use result_validator::{
     validate_bar_time_audit, validate_result_tables, BarTimeExpectedAggregationLineage,
@@ -1,13 +1,21 @@
-use std::fs::File;
-use std::path::Path;
+use std::fs::{self, File};
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
 
 use polars::io::parquet::read::ParquetReader;
 use polars::prelude::*;
-use serde::Deserialize;
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
 use std::collections::HashMap;
 use thiserror::Error;
 
-use crate::metrics::{run_metrics_batch, MetricsBatchInput, MetricsBatchSummary};
+use crate::metrics::{
+    run_metrics_batch, EquityMetricRow, MetricEnrichedRow, MetricsAnnualizationMetadata,
+    MetricsBatchInput,
+};
+
+/// Source columns carried into the enriched metrics parquet, in output order.
+const PASSTHROUGH_COLUMNS: [&str; 4] = ["Time", "Session_label", "Equity_value", "Backtest_id"];
 
 #[derive(Debug, Clone, Deserialize)]
 pub struct MetricsParquetInput {
@@ -18,6 +26,29 @@ pub struct MetricsParquetInput {
     pub benchmark_symbol: Option<String>,
     pub time_unit: usize,
     pub risk_free_rate: f64,
+    /// When set, the enriched metrics parquet is written here and the response
+    /// carries only its path, row count and content hash instead of
+    /// `enriched_rows`.
+    #[serde(default)]
+    pub output_parquet_path: Option<String>,
+}
+
+#[derive(Debug, Clone, Serialize)]
+pub struct MetricsParquetSummary {
+    pub row_count: usize,
+    pub annualization: MetricsAnnualizationMetadata,
+    pub metrics: Vec<EquityMetricRow>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub enriched_rows: Option<Vec<MetricEnrichedRow>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub enriched_parquet: Option<MetricsParquetArtifact>,
+}
+
+#[derive(Debug, Clone, Serialize)]
+pub struct MetricsParquetArtifact {
+    pub path: String,
+    pub row_count: usize,
+    pub content_hash: String,
 }
 
 #[derive(Debug, Error)]
@@ -38,11 +69,13 @@ pub enum MetricsParquetError {
     Metrics(String),
     #[error("benchmark parquet is invalid: {0}")]
     InvalidBenchmark(String),
+    #[error("failed to write enriched metrics parquet: {0}")]
+    Write(String),
 }
 
 pub fn run_metrics_parquet(
     input: MetricsParquetInput,
-) -> Result<MetricsBatchSummary, MetricsParquetError> {
+) -> Result<MetricsParquetSummary, MetricsParquetError> {
     let df = read_metrics_parquet(&input.parquet_path)?;
     let benchmark = match input.benchmark_parquet_path.as_deref() {
         Some(path) => Some(read_metrics_parquet(path)?),
@@ -56,7 +89,114 @@ pub fn run_metrics_parquet(
         input.time_unit,
         input.risk_free_rate,
     )?;
-    run_metrics_batch(batch).map_err(|exc| MetricsParquetError::Metrics(exc.to_string()))
+    let summary =
+        run_metrics_batch(batch).map_err(|exc| MetricsParquetError::Metrics(exc.to_string()))?;
+    let (enriched_rows, enriched_parquet) = match input.output_parquet_path.as_deref() {
+        Some(path) => (
+            None,
+            Some(write_enriched_parquet(
+                &df,
+                &summary.enriched_rows,
+                Path::new(path),
+            )?),
+        ),
+        None => (Some(summary.enriched_rows), None),
+    };
+    Ok(MetricsParquetSummary {
+        row_count: summary.row_count,
+        annualization: summary.annualization,
+        metrics: summary.metrics,
+        enriched_rows,
+        enriched_parquet,
+    })
+}
+
+/// Write the source passthrough columns plus the enrichment columns, hashing
+/// the bytes as they are written. The file is renamed into place once complete
+/// so readers never observe a partial parquet.
+fn write_enriched_parquet(
+    source: &DataFrame,
+    enriched_rows: &[MetricEnrichedRow],
+    path: &Path,
+) -> Result<MetricsParquetArtifact, MetricsParquetError> {
+    let write_error = |exc: &dyn std::fmt::Display| MetricsParquetError::Write(exc.to_string());
+    let row_count = source.height();
+    if enriched_rows.len() != row_count {
+        return Err(MetricsParquetError::Write(format!(
+            "enrichment covers {} of {row_count} rows",
+            enriched_rows.len()
+        )));
+    }
+    let mut ordered: Vec<Option<&MetricEnrichedRow>> = vec![None; row_count];
+    for row in enriched_rows {
+        if let Some(slot) = ordered.get_mut(row.row_index) {
+            *slot = Some(row);
+        }
+    }
+    let enrichment = |value: fn(&MetricEnrichedRow) -> Option<f64>| -> Vec<Option<f64>> {
+        ordered
+            .iter()
+            .map(|row| row.and_then(value).filter(|item| item.is_finite()))
+            .collect()
+    };
+
+    let mut columns: Vec<Column> = PASSTHROUGH_COLUMNS
+        .iter()
+        .filter_map(|name| source.column(name).ok().cloned())
+        .collect();
+    for (name, values) in [
+        ("BAH_Equity", enrichment(|row| row.bah_equity)),
+        ("BAH_Return", enrichment(|row| row.bah_return)),
+        ("Drawdown", enrichment(|row| Some(row.drawdown))),
+        ("BAH_Drawdown", enrichment(|row| row.bah_drawdown)),
+    ] {
+        columns.push(Series::new(name.into(), values).into());
+    }
+    let mut frame = DataFrame::new(row_count, columns).map_err(|exc| write_error(&exc))?;
+
+    if let Some(parent) = path.parent().filter(|dir| !dir.as_os_str().is_empty()) {
+        fs::create_dir_all(parent).map_err(|exc| write_error(&exc))?;
+    }
+    let mut staging = path.as_os_str().to_owned();
+    staging.push(".tmp");
+    let staging = PathBuf::from(staging);
+    let file = File::create(&staging).map_err(|exc| write_error(&exc))?;
+    let mut writer = HashingWriter {
+        inner: file,
+        digest: Sha256::new(),
+    };
+    let written = ParquetWriter::new(&mut writer)
+        .with_compression(ParquetCompression::Zstd(None))
+        .finish(&mut frame)
+        .map_err(|exc| write_error(&exc))
+        .and_then(|_| writer.inner.sync_all().map_err(|exc| write_error(&exc)))
+        .and_then(|_| fs::rename(&staging, path).map_err(|exc| write_error(&exc)));
+    if let Err(exc) = written {
+        let _ = fs::remove_file(&staging);
+        return Err(exc);
+    }
+    Ok(MetricsParquetArtifact {
+        path: path.to_string_lossy().into_owned(),
+        row_count,
+        content_hash: format!("{:x}", writer.digest.finalize()),
+    })
+}
+
+struct HashingWriter<W> {
+    inner: W,
+    digest: Sha256,
+}
+
+impl<W: Write> Write for HashingWriter<W> {
+    fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
+        let written = self.inner.write(buf)?;
+        self.digest.update(&buf[..written]);
+        Ok(written)
+    }
+
+    fn flush(&mut self) -> io::Result<()> {
+        self.inner.flush()
+    }
 }
 
 fn read_metrics_parquet(path: &str) -> Result<DataFrame, MetricsParquetError> {
@@ -327,3 +467,73 @@ fn build_bah_equity(equity: &[f64], close: &[f64], starts: &[usize], ends: &[usi
     }
     out
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn output_path_writes_enriched_parquet_instead_of_rows() {
+        let dir =
+            std::env::temp_dir().join(format!("lo2cin4bt-metrics-parquet-{}", std::process::id()));
+        fs::create_dir_all(&dir).unwrap();
+        let source_path = dir.join("source.parquet");
+        let output_path = dir.join("out").join("source_metrics.parquet");
+        let sessions = ["2024-01-01", "2024-01-02", "2024-01-03"];
+        let mut source = DataFrame::new(
+            3,
+            vec![
+                Series::new("Time".into(), sessions.to_vec()).into(),
+                Series::new("Session_label".into(), sessions.to_vec()).into(),
+                Series::new("Backtest_id".into(), vec!["a1:parameter_matrix:fixed"; 3]).into(),
+                Series::new("Equity_value".into(), vec![100.0, 110.0, 99.0]).into(),
+                Series::new("Close".into(), vec![10.0, 12.0, 9.0]).into(),
+            ],
+        )
+        .unwrap();
+        ParquetWriter::new(File::create(&source_path).unwrap())
+            .finish(&mut source)
+            .unwrap();
+
+        let summary = run_metrics_parquet(MetricsParquetInput {
+            parquet_path: source_path.to_string_lossy().into_owned(),
+            benchmark_parquet_path: None,
+            benchmark_symbol: None,
+            time_unit: 252,
+            risk_free_rate: 0.0,
+            output_parquet_path: Some(output_path.to_string_lossy().into_owned()),
+        })
+        .unwrap();
+
+        assert!(summary.enriched_rows.is_none());
+        let artifact = summary.enriched_parquet.unwrap();
+        assert_eq!(artifact.row_count, 3);
+        let bytes = fs::read(&output_path).unwrap();
+        assert_eq!(
+            artifact.content_hash,
+            format!("{:x}", Sha256::digest(&bytes))
+        );
+        let frame = ParquetReader::new(File::open(&output_path).unwrap())
+            .finish()
+            .unwrap();
+        assert_eq!(frame.height(), 3);
+        assert_eq!(
+            frame
+                .get_column_names()
+                .iter()
+                .map(|name| name.as_str())
+                .collect::<Vec<_>>(),
+            [
+                "Time",
+                "Session_label",
+                "Equity_value",
+                "Backtest_id",
+                "BAH_Equity",
+                "BAH_Return",
+                "Drawdown",
+                "BAH_Drawdown"
+            ]
+        );
+        fs::remove_dir_all(dir).unwrap();
+    }
+}
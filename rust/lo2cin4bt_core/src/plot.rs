@@ -2,6 +2,9 @@ use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
 pub const PLOT_BUNDLE_SCHEMA_VERSION: &str = "plot_bundle.v1";
+pub const PLOT_LOD_SCHEMA_VERSION: &str = "plot_lod.v1";
+/// Each pyramid level keeps this many times the points of the level below it.
+pub const PLOT_LOD_LEVEL_FACTOR: usize = 4;
 
 #[derive(Debug, Clone, Deserialize, Serialize)]
 #[serde(deny_unknown_fields)]
@@ -35,6 +38,42 @@ pub struct PlotSeries {
     pub annotations: Vec<String>,
 }
 
+/// Series whose LTTB pyramid is requested; the pyramid is kept out of
+/// `PlotBundle` so `plot_bundle.v1` payloads stay unchanged.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+#[serde(deny_unknown_fields)]
+pub struct PlotLodInput {
+    pub series: Vec<PlotLodInputSeries>,
+    /// Smallest level of each pyramid.
+    pub min_points: usize,
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+#[serde(deny_unknown_fields)]
+pub struct PlotLodInputSeries {
+    pub series_id: String,
+    pub y: Vec<f64>,
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct PlotLod {
+    pub schema_version: String,
+    pub series: Vec<PlotSeriesLod>,
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize, PartialEq)]
+pub struct PlotSeriesLod {
+    pub series_id: String,
+    pub levels: Vec<PlotSeriesLevel>,
+}
+
+/// One downsampled view of a series: positions into its full `x`/`y` arrays.
+#[derive(Debug, Clone, Deserialize, Serialize, PartialEq)]
+pub struct PlotSeriesLevel {
+    pub max_points: usize,
+    pub indices: Vec<usize>,
+}
+
 #[derive(Debug, Clone, Deserialize, Serialize)]
 pub struct PlotBundle {
     pub schema_version: String,
@@ -66,6 +105,8 @@ pub enum PlotProjectionError {
     NonFiniteValue,
     #[error("plot projection requires valid source hashes and artifact source refs")]
     InvalidSource,
+    #[error("plot lod min_points must be at least 3")]
+    InvalidLevelOfDetail,
 }
 
 pub fn project_plot_bundle(input: PlotProjectionInput) -> Result<PlotBundle, PlotProjectionError> {
@@ -144,6 +185,103 @@ pub fn project_plot_bundle(input: PlotProjectionInput) -> Result<PlotBundle, Plo
     })
 }
 
+/// LTTB pyramid of every requested series.
+pub fn project_plot_lod(input: PlotLodInput) -> Result<PlotLod, PlotProjectionError> {
+    if input.min_points < 3 {
+        return Err(PlotProjectionError::InvalidLevelOfDetail);
+    }
+    if input
+        .series
+        .iter()
+        .any(|series| series.series_id.trim().is_empty() || series.y.is_empty())
+    {
+        return Err(PlotProjectionError::MissingInput);
+    }
+    if input
+        .series
+        .iter()
+        .flat_map(|series| series.y.iter())
+        .any(|value| !value.is_finite())
+    {
+        return Err(PlotProjectionError::NonFiniteValue);
+    }
+    let series = input
+        .series
+        .into_iter()
+        .map(|series| PlotSeriesLod {
+            levels: lttb_pyramid(&series.y, input.min_points),
+            series_id: series.series_id,
+        })
+        .collect();
+    Ok(PlotLod {
+        schema_version: PLOT_LOD_SCHEMA_VERSION.to_string(),
+        series,
+    })
+}
+
+/// LTTB levels of `min_points`, `min_points * PLOT_LOD_LEVEL_FACTOR`, ...
+/// below the full series length, coarsest first.
+pub fn lttb_pyramid(y: &[f64], min_points: usize) -> Vec<PlotSeriesLevel> {
+    let mut levels = Vec::new();
+    let mut max_points = min_points.max(3);
+    while max_points < y.len() {
+        levels.push(PlotSeriesLevel {
+            max_points,
+            indices: lttb_indices(y, max_points),
+        });
+        max_points = max_points.saturating_mul(PLOT_LOD_LEVEL_FACTOR);
+    }
+    levels
+}
+
+/// Largest-Triangle-Three-Buckets: the positions of `threshold` points that
+/// keep the visual shape of `y`, always including the first and last point.
+///
+/// Points are spaced by position, so each bucket covers the same number of
+/// bars. Within a bucket the point forming the largest triangle with the
+/// previously kept point and the next bucket's mean is kept, which preserves
+/// single-bar spikes such as drawdown troughs that a stride would skip.
+pub fn lttb_indices(y: &[f64], threshold: usize) -> Vec<usize> {
+    let len = y.len();
+    if threshold >= len || threshold < 3 {
+        return (0..len).collect();
+    }
+    let bucket_width = (len - 2) as f64 / (threshold - 2) as f64;
+    let bucket_start = |bucket: usize| 1 + (bucket as f64 * bucket_width) as usize;
+    let mut indices = Vec::with_capacity(threshold);
+    indices.push(0);
+    let mut anchor = 0usize;
+    for bucket in 0..threshold - 2 {
+        let start = bucket_start(bucket);
+        let end = bucket_start(bucket + 1).min(len - 1);
+        let (next_start, next_end) = if bucket + 2 < threshold - 1 {
+            (end, bucket_start(bucket + 2).min(len - 1))
+        } else {
+            (len - 1, len)
+        };
+        let next_count = (next_end - next_start) as f64;
+        let mean_x = (next_start + next_end - 1) as f64 / 2.0;
+        let mean_y = y[next_start..next_end].iter().sum::<f64>() / next_count;
+        let anchor_x = anchor as f64;
+        let anchor_y = y[anchor];
+        let mut best = start;
+        let mut best_area = -1.0;
+        for (position, value) in y.iter().enumerate().take(end).skip(start) {
+            let area = ((anchor_x - mean_x) * (value - anchor_y)
+                - (anchor_x - position as f64) * (mean_y - anchor_y))
+                .abs();
+            if area > best_area {
+                best_area = area;
+                best = position;
+            }
+        }
+        indices.push(best);
+        anchor = best;
+    }
+    indices.push(len - 1);
+    indices
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -180,4 +318,55 @@ mod tests {
         assert_eq!(bundle.series[0].y, vec![100.0, 101.0]);
         assert_eq!(bundle.series[1].y, vec![100.0, 100.5]);
     }
+
+    #[test]
+    fn lttb_keeps_endpoints_and_a_single_bar_drawdown() {
+        let mut y: Vec<f64> = (0..10_000)
+            .map(|index| 100.0 + index as f64 * 0.01)
+            .collect();
+        y[4_321] = 20.0;
+
+        let indices = lttb_indices(&y, 100);
+
+        assert_eq!(indices.len(), 100);
+        assert_eq!(indices.first(), Some(&0));
+        assert_eq!(indices.last(), Some(&9_999));
+        assert!(indices.windows(2).all(|pair| pair[0] < pair[1]));
+        assert!(indices.contains(&4_321));
+        assert_eq!(lttb_indices(&y[..50], 100), (0..50).collect::<Vec<_>>());
+    }
+
+    #[test]
+    fn lod_projection_emits_geometric_lttb_pyramid() {
+        let len = 5_000;
+        let lod = project_plot_lod(PlotLodInput {
+            series: vec![PlotLodInputSeries {
+                series_id: "strategy".to_string(),
+                y: (0..len).map(|index| (index as f64 / 37.0).sin()).collect(),
+            }],
+            min_points: 64,
+        })
+        .unwrap();
+
+        assert_eq!(lod.schema_version, PLOT_LOD_SCHEMA_VERSION);
+        let levels = &lod.series[0].levels;
+        assert_eq!(
+            levels
+                .iter()
+                .map(|level| level.max_points)
+                .collect::<Vec<_>>(),
+            vec![64, 256, 1_024, 4_096]
+        );
+        assert!(levels
+            .iter()
+            .all(|level| level.indices.len() == level.max_points));
+        assert_eq!(
+            project_plot_lod(PlotLodInput {
+                series: Vec::new(),
+                min_points: 2,
+            })
+            .unwrap_err(),
+            PlotProjectionError::InvalidLevelOfDetail
+        );
+    }
 }
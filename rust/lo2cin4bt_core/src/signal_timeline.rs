@@ -1,12 +1,15 @@
 use crate::artifact_tables::write_result_rows_parquet;
+use crate::cancellation::{self, CancellationReason};
 use crate::candidate_identity::parse_candidate_id;
+use crate::candidate_parallel::map_candidates;
+use crate::candidate_retention::{CandidateRetentionSummary, RetainedCandidates, RetentionScore};
 use crate::computed_fields::returns::{
     annualized_return, session_return_series, simple_return, ReturnSeriesError, SessionReturnSeries,
 };
 use crate::result_validator::ResultValidationReport;
 use crate::timeline::{
     run_timeline_accounting, TimelineAccountingConfig, TimelineAccountingError,
-    TimelineAccountingSummary, TimelineActionInput, TimelineCheckpointInput,
+    TimelineAccountingSummary, TimelineActionInput, TimelineCheckpointInput, TimelineResultTables,
 };
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
@@ -35,6 +38,8 @@ pub enum SignalTimelineError {
     InvalidCandidateId(String),
     #[error("duplicate canonical candidate_id: {0}")]
     DuplicateCandidateId(String),
+    #[error(transparent)]
+    Cancelled(#[from] CancellationReason),
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -74,6 +79,9 @@ pub struct SingleAssetSignalBatchInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Keep full results only for the best `retain_top` candidates.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
     pub candidates: Vec<SingleAssetSignalCandidateInput>,
 }
 
@@ -96,6 +104,17 @@ pub struct SingleAssetSignalCompactResult {
     pub timeline: Option<TimelineAccountingSummary>,
 }
 
+impl SingleAssetSignalCompactResult {
+    fn retention_score(&self) -> RetentionScore {
+        RetentionScore {
+            sharpe: Some(self.sharpe),
+            final_equity: self.final_equity,
+            total_return: self.total_return,
+            cagr: Some(self.cagr),
+        }
+    }
+}
+
 fn register_candidate_id(
     candidate_id: String,
     seen_ids: &mut HashSet<String>,
@@ -113,6 +132,8 @@ pub struct SingleAssetSignalBatchSummary {
     pub results: Vec<SingleAssetSignalCompactResult>,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub artifact_bundle: Option<RustArtifactBundle>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub retention: Option<CandidateRetentionSummary>,
     #[serde(skip)]
     pub(crate) trusted_timelines: Vec<TimelineAccountingSummary>,
 }
@@ -152,6 +173,9 @@ pub struct CalendarSameSessionBatchInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Keep full results only for the best `retain_top` candidates.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
     pub candidates: Vec<CalendarSameSessionCandidateInput>,
 }
 
@@ -170,6 +194,9 @@ pub struct CalendarOverlayBatchInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Keep full results only for the best `retain_top` candidates.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
     pub candidates: Vec<CalendarSameSessionCandidateInput>,
 }
 
@@ -204,6 +231,9 @@ pub struct ResetTimerBatchInput {
     pub artifact_output_dir: Option<String>,
     #[serde(default)]
     pub artifact_run_id: Option<String>,
+    /// Keep full results only for the best `retain_top` candidates.
+    #[serde(default)]
+    pub retain_top: Option<usize>,
     pub candidates: Vec<ResetTimerCandidateInput>,
 }
 
@@ -220,6 +250,7 @@ pub fn run_single_asset_next_open_signal_timeline(
     let returns = session_return_series(&input.open, &input.close)?;
 
     for row_idx in 0..input.dates.len() {
+        cancellation::checkpoint()?;
         let mut open_actions = Vec::new();
         if row_idx > 0 {
             if input.entry_signal[row_idx - 1] {
@@ -266,74 +297,239 @@ pub fn run_single_asset_next_open_signal_batch(
     let row_count = input.dates.len();
     validate_common_series(&input.asset, &input.dates, &input.open, &input.close)?;
     let mut seen_ids = HashSet::new();
-    let mut results = Vec::with_capacity(input.candidates.len());
-    let mut full_summaries: Vec<(String, TimelineAccountingSummary)> = Vec::new();
-    let mut trusted_timelines = Vec::with_capacity(input.candidates.len());
     let export_artifacts = input
         .artifact_output_dir
         .as_ref()
         .map(|value| !value.trim().is_empty())
         .unwrap_or(false);
 
-    for candidate in input.candidates {
-        if candidate.entry_signal.len() != row_count || candidate.exit_signal.len() != row_count {
-            return Err(SignalTimelineError::InvalidLength);
-        }
-        let candidate_id = register_candidate_id(candidate.candidate_id, &mut seen_ids)?;
-
-        let summary = run_single_asset_next_open_signal_timeline(SingleAssetNextOpenSignalInput {
-            config: input.config.clone(),
-            asset: input.asset.clone(),
-            dates: input.dates.clone(),
-            open: input.open.clone(),
-            close: input.close.clone(),
-            entry_signal: candidate.entry_signal,
-            exit_signal: candidate.exit_signal,
-            target_weight: candidate.target_weight,
-        })?;
-        if export_artifacts {
-            full_summaries.push((candidate_id.clone(), summary.clone()));
-        }
-        trusted_timelines.push(summary.clone());
-        results.push(SingleAssetSignalCompactResult {
-            candidate_id,
-            resolved_params: candidate.resolved_params,
-            final_equity: summary.final_equity,
-            total_return: summary.total_return,
-            cagr: summary_cagr(&summary),
-            sharpe: summary_sharpe(&summary),
-            max_drawdown: summary_max_drawdown(&summary),
-            intraday_max_drawdown: summary.intraday_max_drawdown,
-            days: summary.days,
-            active_rebalances: summary.active_rebalances,
-            average_turnover: summary.average_turnover,
-            average_gross_exposure: summary.average_gross_exposure,
-            result_validation: summary.result_validation.clone(),
-            timeline: if input.include_full_results && !export_artifacts {
-                Some(summary)
-            } else {
-                None
-            },
-        });
-    }
+    let outputs = run_signal_candidates(
+        input.candidates,
+        |candidate| {
+            if candidate.entry_signal.len() != row_count || candidate.exit_signal.len() != row_count
+            {
+                return Err(SignalTimelineError::InvalidLength);
+            }
+            Ok(PreparedSignalCandidate {
+                candidate_id: register_candidate_id(candidate.candidate_id, &mut seen_ids)?,
+                resolved_params: candidate.resolved_params,
+                spec: (
+                    candidate.entry_signal,
+                    candidate.exit_signal,
+                    candidate.target_weight,
+                ),
+            })
+        },
+        |(entry_signal, exit_signal, target_weight)| {
+            run_single_asset_next_open_signal_timeline(SingleAssetNextOpenSignalInput {
+                config: input.config.clone(),
+                asset: input.asset.clone(),
+                dates: input.dates.clone(),
+                open: input.open.clone(),
+                close: input.close.clone(),
+                entry_signal: entry_signal.clone(),
+                exit_signal: exit_signal.clone(),
+                target_weight: *target_weight,
+            })
+        },
+        SignalBatchOutputOptions {
+            include_full_results: input.include_full_results,
+            export_artifacts,
+            keep_trusted_timelines: true,
+            retain_top: input.retain_top,
+        },
+    )?;
     let artifact_bundle = if export_artifacts {
         Some(export_single_asset_signal_bundle(
             input.artifact_output_dir.as_deref().unwrap_or_default(),
             input.artifact_run_id.as_deref().unwrap_or("signal_matrix"),
-            &full_summaries,
+            &outputs.full_summaries,
         )?)
     } else {
         None
     };
 
     Ok(SingleAssetSignalBatchSummary {
-        candidate_count: results.len(),
-        results,
+        candidate_count: outputs.results.len(),
+        results: outputs.results,
         artifact_bundle,
-        trusted_timelines,
+        retention: outputs.retention,
+        trusted_timelines: outputs.trusted_timelines,
     })
 }
 
+/// A candidate that passed validation and only awaits its timeline run.
+struct PreparedSignalCandidate<P> {
+    candidate_id: String,
+    resolved_params: BTreeMap<String, String>,
+    spec: P,
+}
+
+#[derive(Clone, Copy)]
+struct SignalBatchOutputOptions {
+    include_full_results: bool,
+    export_artifacts: bool,
+    keep_trusted_timelines: bool,
+    retain_top: Option<usize>,
+}
+
+struct SignalBatchOutputs {
+    results: Vec<SingleAssetSignalCompactResult>,
+    full_summaries: Vec<(String, TimelineAccountingSummary)>,
+    trusted_timelines: Vec<TimelineAccountingSummary>,
+    retention: Option<CandidateRetentionSummary>,
+}
+
+/// Validate candidates in order, run the validated prefix across candidate
+/// threads, and assemble results in input order. The first failing candidate
+/// decides the error, as in a serial loop, whether it failed validation or
+/// its timeline run.
+///
+/// With `retain_top`, full timelines go to a bounded top-K heap as candidates
+/// finish and only the survivors are exported or attached; trusted timelines
+/// shrink to the bar-time evidence the engine audit reads.
+fn run_signal_candidates<C, P: Send>(
+    candidates: Vec<C>,
+    mut prepare: impl FnMut(C) -> Result<PreparedSignalCandidate<P>, SignalTimelineError>,
+    run: impl Fn(&P) -> Result<TimelineAccountingSummary, SignalTimelineError> + Sync,
+    options: SignalBatchOutputOptions,
+) -> Result<SignalBatchOutputs, SignalTimelineError> {
+    let mut prepared = Vec::with_capacity(candidates.len());
+    let mut rejected = None;
+    for candidate in candidates {
+        match prepare(candidate) {
+            Ok(candidate) => prepared.push(candidate),
+            Err(exc) => {
+                rejected = Some(exc);
+                break;
+            }
+        }
+    }
+    let retained = options.retain_top.map(RetainedCandidates::new);
+    let evaluated = map_candidates(
+        prepared.into_iter().enumerate().collect(),
+        |(index, candidate)| -> Result<_, SignalTimelineError> {
+            let summary = cancellation::candidate_checkpoint()
+                .map_err(SignalTimelineError::from)
+                .and_then(|_| run(&candidate.spec))?;
+            cancellation::candidate_completed();
+            let compact = compact_signal_result(candidate, &summary);
+            let Some(retained) = retained.as_ref() else {
+                return Ok((compact, Some(summary)));
+            };
+            let evidence = options
+                .keep_trusted_timelines
+                .then(|| bar_time_evidence(&summary));
+            retained.offer(
+                index,
+                &compact.candidate_id,
+                compact.retention_score(),
+                summary,
+            );
+            Ok((compact, evidence))
+        },
+    );
+
+    let mut outputs = SignalBatchOutputs {
+        results: Vec::with_capacity(evaluated.len()),
+        full_summaries: Vec::new(),
+        trusted_timelines: Vec::new(),
+        retention: None,
+    };
+    for outcome in evaluated {
+        let (mut result, summary) = outcome?;
+        if let Some(summary) = summary {
+            if retained.is_some() {
+                outputs.trusted_timelines.push(summary);
+            } else {
+                if options.export_artifacts {
+                    outputs
+                        .full_summaries
+                        .push((result.candidate_id.clone(), summary.clone()));
+                }
+                if options.keep_trusted_timelines {
+                    outputs.trusted_timelines.push(summary.clone());
+                }
+                if options.include_full_results && !options.export_artifacts {
+                    result.timeline = Some(summary);
+                }
+            }
+        }
+        outputs.results.push(result);
+    }
+    if let Some(exc) = rejected {
+        return Err(exc);
+    }
+    if let Some(retained) = retained {
+        let (retention, kept) = retained.finish();
+        for (index, summary) in kept {
+            if options.export_artifacts {
+                outputs
+                    .full_summaries
+                    .push((outputs.results[index].candidate_id.clone(), summary));
+            } else if options.include_full_results {
+                outputs.results[index].timeline = Some(summary);
+            }
+        }
+        outputs.retention = Some(retention);
+    }
+    Ok(outputs)
+}
+
+fn compact_signal_result<P>(
+    candidate: PreparedSignalCandidate<P>,
+    summary: &TimelineAccountingSummary,
+) -> SingleAssetSignalCompactResult {
+    SingleAssetSignalCompactResult {
+        candidate_id: candidate.candidate_id,
+        resolved_params: candidate.resolved_params,
+        final_equity: summary.final_equity,
+        total_return: summary.total_return,
+        cagr: summary_cagr(summary),
+        sharpe: summary_sharpe(summary),
+        max_drawdown: summary_max_drawdown(summary),
+        intraday_max_drawdown: summary.intraday_max_drawdown,
+        days: summary.days,
+        active_rebalances: summary.active_rebalances,
+        average_turnover: summary.average_turnover,
+        average_gross_exposure: summary.average_gross_exposure,
+        result_validation: summary.result_validation.clone(),
+        timeline: None,
+    }
+}
+
+/// The part of a timeline the engine's bar-time audit reads: checkpoints that
+/// carried actions and the rebalance tables.
+fn bar_time_evidence(summary: &TimelineAccountingSummary) -> TimelineAccountingSummary {
+    TimelineAccountingSummary {
+        start_equity: summary.start_equity,
+        final_equity: summary.final_equity,
+        total_return: summary.total_return,
+        checkpoints: summary.checkpoints,
+        days: summary.days,
+        active_rebalances: summary.active_rebalances,
+        average_turnover: summary.average_turnover,
+        average_gross_exposure: summary.average_gross_exposure,
+        intraday_max_drawdown: summary.intraday_max_drawdown,
+        events: summary
+            .events
+            .iter()
+            .filter(|event| !event.actions.is_empty())
+            .cloned()
+            .collect(),
+        daily_events: Vec::new(),
+        risk_gate_events: Vec::new(),
+        settlement_events: Vec::new(),
+        result_tables: TimelineResultTables {
+            schema_version: summary.result_tables.schema_version.clone(),
+            rebalance_audit: summary.result_tables.rebalance_audit.clone(),
+            rebalance_trades: summary.result_tables.rebalance_trades.clone(),
+            ..TimelineResultTables::default()
+        },
+        result_validation: summary.result_validation.clone(),
+    }
+}
+
 fn export_single_asset_signal_bundle(
     output_dir: &str,
     run_id: &str,
@@ -427,58 +623,52 @@ pub fn run_single_asset_calendar_same_session_batch(
         .map(|date| parse_ymd(date))
         .collect::<Result<Vec<_>, _>>()?;
     let mut seen_ids = HashSet::new();
-    let mut results = Vec::with_capacity(input.candidates.len());
-    let mut full_summaries: Vec<(String, TimelineAccountingSummary)> = Vec::new();
     let export_artifacts = input
         .artifact_output_dir
         .as_ref()
         .map(|value| !value.trim().is_empty())
         .unwrap_or(false);
 
-    for candidate in input.candidates {
-        if !candidate.target_weight.is_finite() || candidate.target_weight < 0.0 {
-            return Err(SignalTimelineError::InvalidTargetWeight);
-        }
-        let weekday =
-            parse_weekday(&candidate.weekday).ok_or(SignalTimelineError::InvalidLength)?;
-        let candidate_id = register_candidate_id(candidate.candidate_id, &mut seen_ids)?;
-
-        let summary = run_calendar_same_session_candidate(
-            &input.config,
-            &input.asset,
-            &input.dates,
-            &parsed_dates,
-            &input.open,
-            &input.close,
-            candidate.ordinal,
-            weekday,
-            &candidate.months,
-            candidate.target_weight,
-        )?;
-        if export_artifacts {
-            full_summaries.push((candidate_id.clone(), summary.clone()));
-        }
-        results.push(SingleAssetSignalCompactResult {
-            candidate_id,
-            resolved_params: candidate.resolved_params,
-            final_equity: summary.final_equity,
-            total_return: summary.total_return,
-            cagr: summary_cagr(&summary),
-            sharpe: summary_sharpe(&summary),
-            max_drawdown: summary_max_drawdown(&summary),
-            intraday_max_drawdown: summary.intraday_max_drawdown,
-            days: summary.days,
-            active_rebalances: summary.active_rebalances,
-            average_turnover: summary.average_turnover,
-            average_gross_exposure: summary.average_gross_exposure,
-            result_validation: summary.result_validation.clone(),
-            timeline: if input.include_full_results && !export_artifacts {
-                Some(summary)
-            } else {
-                None
-            },
-        });
-    }
+    let outputs = run_signal_candidates(
+        input.candidates,
+        |candidate| {
+            if !candidate.target_weight.is_finite() || candidate.target_weight < 0.0 {
+                return Err(SignalTimelineError::InvalidTargetWeight);
+            }
+            let weekday =
+                parse_weekday(&candidate.weekday).ok_or(SignalTimelineError::InvalidLength)?;
+            Ok(PreparedSignalCandidate {
+                candidate_id: register_candidate_id(candidate.candidate_id, &mut seen_ids)?,
+                resolved_params: candidate.resolved_params,
+                spec: (
+                    candidate.ordinal,
+                    weekday,
+                    candidate.months,
+                    candidate.target_weight,
+                ),
+            })
+        },
+        |(ordinal, weekday, months, target_weight)| {
+            run_calendar_same_session_candidate(
+                &input.config,
+                &input.asset,
+                &input.dates,
+                &parsed_dates,
+                &input.open,
+                &input.close,
+                *ordinal,
+                *weekday,
+                months,
+                *target_weight,
+            )
+        },
+        SignalBatchOutputOptions {
+            include_full_results: input.include_full_results,
+            export_artifacts,
+            keep_trusted_timelines: false,
+            retain_top: input.retain_top,
+        },
+    )?;
     let artifact_bundle = if export_artifacts {
         Some(export_single_asset_signal_bundle(
             input.artifact_output_dir.as_deref().unwrap_or_default(),
@@ -486,17 +676,18 @@ pub fn run_single_asset_calendar_same_session_batch(
                 .artifact_run_id
                 .as_deref()
                 .unwrap_or("calendar_same_session_matrix"),
-            &full_summaries,
+            &outputs.full_summaries,
         )?)
     } else {
         None
     };
 
     Ok(SingleAssetSignalBatchSummary {
-        candidate_count: results.len(),
-        results,
+        candidate_count: outputs.results.len(),
+        results: outputs.results,
         artifact_bundle,
-        trusted_timelines: Vec::new(),
+        retention: outputs.retention,
+        trusted_timelines: outputs.trusted_timelines,
     })
 }
 
@@ -510,56 +701,45 @@ pub fn run_calendar_overlay_batch(
         .map(|date| parse_ymd(date))
         .collect::<Result<Vec<_>, _>>()?;
     let mut seen_ids = HashSet::new();
-    let mut results = Vec::with_capacity(input.candidates.len());
-    let mut full_summaries: Vec<(String, TimelineAccountingSummary)> = Vec::new();
     let export_artifacts = input
         .artifact_output_dir
         .as_ref()
         .map(|value| !value.trim().is_empty())
         .unwrap_or(false);
 
-    for candidate in input.candidates {
-        let weekday =
-            parse_weekday(&candidate.weekday).ok_or(SignalTimelineError::InvalidLength)?;
-        let candidate_id = register_candidate_id(candidate.candidate_id, &mut seen_ids)?;
-
-        let summary = run_calendar_overlay_candidate(
-            &input.config,
-            &input.assets,
-            &input.dates,
-            &parsed_dates,
-            &input.open,
-            &input.close,
-            &input.baseline_weights,
-            &input.event_weights,
-            candidate.ordinal,
-            weekday,
-            &candidate.months,
-        )?;
-        if export_artifacts {
-            full_summaries.push((candidate_id.clone(), summary.clone()));
-        }
-        results.push(SingleAssetSignalCompactResult {
-            candidate_id,
-            resolved_params: candidate.resolved_params,
-            final_equity: summary.final_equity,
-            total_return: summary.total_return,
-            cagr: summary_cagr(&summary),
-            sharpe: summary_sharpe(&summary),
-            max_drawdown: summary_max_drawdown(&summary),
-            intraday_max_drawdown: summary.intraday_max_drawdown,
-            days: summary.days,
-            active_rebalances: summary.active_rebalances,
-            average_turnover: summary.average_turnover,
-            average_gross_exposure: summary.average_gross_exposure,
-            result_validation: summary.result_validation.clone(),
-            timeline: if input.include_full_results && !export_artifacts {
-                Some(summary)
-            } else {
-                None
-            },
-        });
-    }
+    let outputs = run_signal_candidates(
+        input.candidates,
+        |candidate| {
+            let weekday =
+                parse_weekday(&candidate.weekday).ok_or(SignalTimelineError::InvalidLength)?;
+            Ok(PreparedSignalCandidate {
+                candidate_id: register_candidate_id(candidate.candidate_id, &mut seen_ids)?,
+                resolved_params: candidate.resolved_params,
+                spec: (candidate.ordinal, weekday, candidate.months),
+            })
+        },
+        |(ordinal, weekday, months)| {
+            run_calendar_overlay_candidate(
+                &input.config,
+                &input.assets,
+                &input.dates,
+                &parsed_dates,
+                &input.open,
+                &input.close,
+                &input.baseline_weights,
+                &input.event_weights,
+                *ordinal,
+                *weekday,
+                months,
+            )
+        },
+        SignalBatchOutputOptions {
+            include_full_results: input.include_full_results,
+            export_artifacts,
+            keep_trusted_timelines: false,
+            retain_top: input.retain_top,
+        },
+    )?;
     let artifact_bundle = if export_artifacts {
         Some(export_single_asset_signal_bundle(
             input.artifact_output_dir.as_deref().unwrap_or_default(),
@@ -567,17 +747,18 @@ pub fn run_calendar_overlay_batch(
                 .artifact_run_id
                 .as_deref()
                 .unwrap_or("calendar_overlay_matrix"),
-            &full_summaries,
+            &outputs.full_summaries,
         )?)
     } else {
         None
     };
 
     Ok(SingleAssetSignalBatchSummary {
-        candidate_count: results.len(),
-        results,
+        candidate_count: outputs.results.len(),
+        results: outputs.results,
         artifact_bundle,
-        trusted_timelines: Vec::new(),
+        retention: outputs.retention,
+        trusted_timelines: outputs.trusted_timelines,
     })
 }
 
@@ -586,8 +767,6 @@ pub fn run_reset_timer_batch(
 ) -> Result<SingleAssetSignalBatchSummary, SignalTimelineError> {
     validate_reset_timer_input(&input)?;
     let mut seen_ids = HashSet::new();
-    let mut results = Vec::with_capacity(input.candidates.len());
-    let mut full_summaries: Vec<(String, TimelineAccountingSummary)> = Vec::new();
     let export_artifacts = input
         .artifact_output_dir
         .as_ref()
@@ -597,51 +776,42 @@ pub fn run_reset_timer_batch(
     let restore_phase = normalize_reset_phase(&input.restore_phase, "close")?;
     let row_count = input.dates.len();
 
-    for candidate in input.candidates {
-        if candidate.entry_signal.len() != row_count {
-            return Err(SignalTimelineError::InvalidLength);
-        }
-        let candidate_id = register_candidate_id(candidate.candidate_id, &mut seen_ids)?;
-
-        let summary = run_reset_timer_candidate(
-            &input.config,
-            &input.assets,
-            &input.dates,
-            &input.open,
-            &input.close,
-            &input.baseline_weights,
-            &input.event_weights,
-            &input.restore_weights,
-            &candidate.entry_signal,
-            input.entry_offset_bars,
-            &entry_phase,
-            candidate.hold_bars,
-            &restore_phase,
-        )?;
-        if export_artifacts {
-            full_summaries.push((candidate_id.clone(), summary.clone()));
-        }
-        results.push(SingleAssetSignalCompactResult {
-            candidate_id,
-            resolved_params: candidate.resolved_params,
-            final_equity: summary.final_equity,
-            total_return: summary.total_return,
-            cagr: summary_cagr(&summary),
-            sharpe: summary_sharpe(&summary),
-            max_drawdown: summary_max_drawdown(&summary),
-            intraday_max_drawdown: summary.intraday_max_drawdown,
-            days: summary.days,
-            active_rebalances: summary.active_rebalances,
-            average_turnover: summary.average_turnover,
-            average_gross_exposure: summary.average_gross_exposure,
-            result_validation: summary.result_validation.clone(),
-            timeline: if input.include_full_results && !export_artifacts {
-                Some(summary)
-            } else {
-                None
-            },
-        });
-    }
+    let outputs = run_signal_candidates(
+        input.candidates,
+        |candidate| {
+            if candidate.entry_signal.len() != row_count {
+                return Err(SignalTimelineError::InvalidLength);
+            }
+            Ok(PreparedSignalCandidate {
+                candidate_id: register_candidate_id(candidate.candidate_id, &mut seen_ids)?,
+                resolved_params: candidate.resolved_params,
+                spec: (candidate.entry_signal, candidate.hold_bars),
+            })
+        },
+        |(entry_signal, hold_bars)| {
+            run_reset_timer_candidate(
+                &input.config,
+                &input.assets,
+                &input.dates,
+                &input.open,
+                &input.close,
+                &input.baseline_weights,
+                &input.event_weights,
+                &input.restore_weights,
+                entry_signal,
+                input.entry_offset_bars,
+                &entry_phase,
+                *hold_bars,
+                &restore_phase,
+            )
+        },
+        SignalBatchOutputOptions {
+            include_full_results: input.include_full_results,
+            export_artifacts,
+            keep_trusted_timelines: false,
+            retain_top: input.retain_top,
+        },
+    )?;
     let artifact_bundle = if export_artifacts {
         Some(export_single_asset_signal_bundle(
             input.artifact_output_dir.as_deref().unwrap_or_default(),
@@ -649,17 +819,18 @@ pub fn run_reset_timer_batch(
                 .artifact_run_id
                 .as_deref()
                 .unwrap_or("reset_timer_matrix"),
-            &full_summaries,
+            &outputs.full_summaries,
         )?)
     } else {
         None
     };
 
     Ok(SingleAssetSignalBatchSummary {
-        candidate_count: results.len(),
-        results,
+        candidate_count: outputs.results.len(),
+        results: outputs.results,
         artifact_bundle,
-        trusted_timelines: Vec::new(),
+        retention: outputs.retention,
+        trusted_timelines: outputs.trusted_timelines,
     })
 }
 
@@ -1271,6 +1442,31 @@ mod tests {
         assert_eq!(summary.events[4].actions[0].action, "exit");
     }
 
+    #[test]
+    fn single_asset_next_open_signal_stops_at_a_bar_checkpoint_when_cancelled() {
+        let token = crate::cancellation::CancellationToken::new();
+        token.cancel();
+        let (result, progress) = crate::cancellation::run_with_cancellation(&token, || {
+            run_single_asset_next_open_signal_timeline(SingleAssetNextOpenSignalInput {
+                config: TimelineAccountingConfig::default(),
+                asset: "AAA".to_string(),
+                dates: vec!["2024-01-02".to_string(), "2024-01-03".to_string()],
+                open: vec![100.0, 110.0],
+                close: vec![100.0, 115.0],
+                entry_signal: vec![true, false],
+                exit_signal: vec![false, false],
+                target_weight: 1.0,
+            })
+        });
+
+        assert!(matches!(
+            result,
+            Err(SignalTimelineError::Cancelled(CancellationReason::Canceled))
+        ));
+        assert_eq!(progress.bars_processed, 1);
+        assert_eq!(progress.reason, Some(CancellationReason::Canceled));
+    }
+
     #[test]
     fn single_asset_next_open_signal_batch_returns_summary_results() {
         let input = SingleAssetSignalBatchInput {
@@ -1286,6 +1482,7 @@ mod tests {
             include_full_results: false,
             artifact_output_dir: None,
             artifact_run_id: None,
+            retain_top: None,
             candidates: vec![
                 SingleAssetSignalCandidateInput {
                     candidate_id: "signal_probe:parameter_matrix:a".to_string(),
@@ -1315,6 +1512,96 @@ mod tests {
         assert_eq!(summary.results[1].final_equity, 100.0);
     }
 
+    fn probe_signal_batch() -> SingleAssetSignalBatchInput {
+        SingleAssetSignalBatchInput {
+            config: TimelineAccountingConfig::default(),
+            asset: "AAA".to_string(),
+            dates: (0..12)
+                .map(|day| format!("2024-01-{:02}", day + 2))
+                .collect(),
+            open: (0..12).map(|day| 100.0 + day as f64).collect(),
+            close: (0..12).map(|day| 101.0 + (day % 5) as f64).collect(),
+            include_full_results: true,
+            artifact_output_dir: None,
+            artifact_run_id: None,
+            retain_top: None,
+            candidates: (0..24)
+                .map(|index| SingleAssetSignalCandidateInput {
+                    candidate_id: format!("signal_probe:parameter_matrix:c{index}"),
+                    resolved_params: BTreeMap::new(),
+                    entry_signal: (0..12).map(|day| day % (index % 4 + 2) == 0).collect(),
+                    exit_signal: (0..12).map(|day| day % (index % 3 + 3) == 1).collect(),
+                    target_weight: 1.0,
+                })
+                .collect(),
+        }
+    }
+
+    #[test]
+    fn signal_batch_results_do_not_depend_on_thread_count() {
+        let input = probe_signal_batch();
+        let run = |threads| {
+            let summary = crate::with_candidate_threads(Some(threads), || {
+                run_single_asset_next_open_signal_batch(input.clone())
+            })
+            .expect("batch should run");
+            serde_json::to_value(summary).expect("summary should serialize")
+        };
+
+        assert_eq!(run(1), run(6));
+    }
+
+    #[test]
+    fn retained_signal_batch_keeps_full_timelines_for_top_candidates_only() {
+        let mut input = probe_signal_batch();
+        let full =
+            run_single_asset_next_open_signal_batch(input.clone()).expect("batch should run");
+        input.retain_top = Some(3);
+        let retained = crate::with_candidate_threads(Some(4), || {
+            run_single_asset_next_open_signal_batch(input)
+        })
+        .expect("retained batch should run");
+
+        let retention = retained.retention.expect("retention report");
+        assert_eq!(retention.limit, 3);
+        assert_eq!(retention.retained_candidate_ids.len(), 3);
+        assert_eq!(retained.results.len(), full.results.len());
+        let worst_retained_sharpe = retained
+            .results
+            .iter()
+            .filter(|result| {
+                retention
+                    .retained_candidate_ids
+                    .contains(&result.candidate_id)
+            })
+            .map(|result| result.sharpe)
+            .fold(f64::INFINITY, f64::min);
+        for (kept, reference) in retained.results.iter().zip(&full.results) {
+            assert_eq!(kept.candidate_id, reference.candidate_id);
+            assert_eq!(kept.final_equity, reference.final_equity);
+            if retention
+                .retained_candidate_ids
+                .contains(&kept.candidate_id)
+            {
+                assert_eq!(
+                    serde_json::to_value(&kept.timeline).unwrap(),
+                    serde_json::to_value(&reference.timeline).unwrap()
+                );
+            } else {
+                assert!(kept.timeline.is_none());
+                assert!(!(kept.sharpe > worst_retained_sharpe));
+            }
+        }
+        assert!(retained
+            .trusted_timelines
+            .iter()
+            .all(|timeline| timeline.daily_events.is_empty()
+                && timeline
+                    .events
+                    .iter()
+                    .all(|event| !event.actions.is_empty())));
+    }
+
     #[test]
     fn single_asset_next_open_signal_batch_exports_parquet_bundle() {
         let output_dir =
@@ -1333,6 +1620,7 @@ mod tests {
             include_full_results: true,
             artifact_output_dir: Some(output_dir.to_string_lossy().to_string()),
             artifact_run_id: Some("bundle test".to_string()),
+            retain_top: None,
             candidates: vec![SingleAssetSignalCandidateInput {
                 candidate_id: "signal_probe:single_backtest:fixed".to_string(),
                 resolved_params: BTreeMap::new(),
@@ -1373,6 +1661,7 @@ mod tests {
             include_full_results: false,
             artifact_output_dir: None,
             artifact_run_id: None,
+            retain_top: None,
             candidates,
         };
 
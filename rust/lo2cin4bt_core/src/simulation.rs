@@ -307,11 +307,14 @@ pub fn maintenance_margin_breached(
     weights: &BTreeMap<String, f64>,
     account: &SimulatedAccountConfig,
 ) -> bool {
-    if account.account_type != SimulatedAccountType::Margin {
-        return false;
-    }
     let gross = weights.values().map(|value| value.abs()).sum::<f64>();
-    gross * account.maintenance_margin_ratio > 1.0 + 1e-12
+    maintenance_margin_breached_at(gross, account)
+}
+
+/// Margin check for a gross exposure the caller has already summed.
+pub fn maintenance_margin_breached_at(gross: f64, account: &SimulatedAccountConfig) -> bool {
+    account.account_type == SimulatedAccountType::Margin
+        && gross * account.maintenance_margin_ratio > 1.0 + 1e-12
 }
 
 fn preflight_rejection(
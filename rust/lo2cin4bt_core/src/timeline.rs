@@ -1,3 +1,4 @@
+use crate::cancellation::{self, CancellationReason};
 use crate::computed_fields::returns::simple_return;
 use crate::result_validator::{
     validate_result_tables, ResultTableView, ResultValidationError, ResultValidationReport,
@@ -8,7 +9,7 @@ use crate::risk::{
 };
 use crate::session_progress::SessionProgress;
 use crate::simulation::{
-    execute_target_weight_orders, maintenance_margin_breached, SettlementEvent,
+    execute_target_weight_orders, maintenance_margin_breached_at, SettlementEvent,
     SettlementInstruction, SettlementLedger, SimulatedAccountConfig, SimulatedOrderEvent,
     SimulatedVenueConfig, SimulationError,
 };
@@ -41,6 +42,8 @@ pub enum TimelineAccountingError {
     NonFiniteValue { field: &'static str, asset: String },
     #[error("missing return for held asset {0}")]
     MissingHeldAssetReturn(String),
+    #[error("asset {0} is not in the timeline asset index")]
+    UnknownTimelineAsset(String),
     #[error("negative target weight for {0} is not allowed in long-only timeline accounting")]
     NegativeWeightLongOnly(String),
     #[error("target gross exposure {actual:.6} exceeds configured max {limit:.6}")]
@@ -59,6 +62,8 @@ pub enum TimelineAccountingError {
     RiskControl(#[from] RiskControlError),
     #[error(transparent)]
     ResultValidation(#[from] ResultValidationError),
+    #[error(transparent)]
+    Cancelled(#[from] CancellationReason),
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -247,6 +252,9 @@ pub struct TimelineAccountingSummary {
     pub result_validation: ResultValidationReport,
 }
 
+/// Result tables as row maps, the shape the result validator, table hashes
+/// and the parquet/JSON exports read. They are built once after the
+/// accounting loop; only the loop's per-asset state is dense.
 #[derive(Debug, Clone, Default, Serialize, Deserialize)]
 pub struct TimelineResultTables {
     pub schema_version: String,
@@ -286,9 +294,19 @@ pub fn run_timeline_accounting(
         )
     });
 
+    let assets = AssetIndex::from_checkpoints(&checkpoints);
+    let asset_count = assets.len();
     let mut equity = input.config.starting_equity;
     let start_equity = equity;
-    let mut previous_weights: BTreeMap<String, f64> = BTreeMap::new();
+    // Dense per-asset state, reused across checkpoints. Held weights stay
+    // trimmed, so a non-zero entry is exactly a key of the former weight map.
+    let mut previous_weights = vec![0.0; asset_count];
+    let mut returns = vec![0.0; asset_count];
+    let mut has_return = vec![false; asset_count];
+    let mut assets_in_play = vec![false; asset_count];
+    let mut asset_values = vec![0.0; asset_count];
+    let mut contribution = vec![0.0; asset_count];
+    let mut drift_weights = vec![0.0; asset_count];
     let mut previous_cash_weight = 1.0;
     let mut events = Vec::with_capacity(checkpoints.len());
     let mut daily_events = Vec::new();
@@ -303,24 +321,42 @@ pub fn run_timeline_accounting(
     let mut session_progress = SessionProgress::default();
 
     for mut checkpoint in checkpoints {
+        cancellation::checkpoint()?;
         let session = session_progress
             .observe(&checkpoint.date, &input.config.session_label_by_event_time)
             .map_err(TimelineAccountingError::InvalidSessionProgress)?;
         if session.advanced {
             settlement_ledger.advance_session();
             if let Some(daily) = current_daily.take() {
-                daily_events.push(daily.finish(&previous_weights, previous_cash_weight, equity));
+                daily_events.push(daily.finish(
+                    &assets,
+                    &previous_weights,
+                    previous_cash_weight,
+                    equity,
+                ));
             }
         }
         let charge_borrow = current_daily.is_none();
         if current_daily.is_none() {
-            current_daily = Some(DailyAccumulator::new(session.label));
+            current_daily = Some(DailyAccumulator::new(session.label, asset_count));
+        }
+        returns.fill(0.0);
+        has_return.fill(false);
+        assets.for_each_index(&checkpoint.returns, |index, value| {
+            returns[index] = *value;
+            has_return[index] = true;
+        })?;
+        if let Some(index) = (0..asset_count)
+            .find(|index| previous_weights[*index].abs() > 1e-12 && !has_return[*index])
+        {
+            return Err(TimelineAccountingError::MissingHeldAssetReturn(
+                assets.names[index].clone(),
+            ));
         }
-        validate_held_asset_returns(&checkpoint.returns, &previous_weights)?;
 
         let equity_before_borrow = equity;
         let short_gross = previous_weights
-            .values()
+            .iter()
             .filter(|weight| **weight < 0.0)
             .map(|weight| weight.abs())
             .sum::<f64>();
@@ -333,17 +369,28 @@ pub fn run_timeline_accounting(
             };
         equity = (equity - borrow_cost).max(0.0);
         let equity_before_return = equity;
-        let assets = asset_union(&previous_weights, &checkpoint.returns, &checkpoint.actions);
-        let mut asset_values: BTreeMap<String, f64> = BTreeMap::new();
-        let mut contribution = BTreeMap::new();
+        // Assets held, priced or targeted at this checkpoint.
+        for index in 0..asset_count {
+            assets_in_play[index] = has_return[index] || previous_weights[index] != 0.0;
+        }
+        for action in &checkpoint.actions {
+            assets.for_each_index(&action.target_weights, |index, _| {
+                assets_in_play[index] = true
+            })?;
+        }
         let mut pre_trade_equity = equity_before_return * previous_cash_weight;
-        for asset in &assets {
-            let previous_weight = *previous_weights.get(asset).unwrap_or(&0.0);
-            let asset_return = *checkpoint.returns.get(asset).unwrap_or(&0.0);
+        for index in 0..asset_count {
+            if !assets_in_play[index] {
+                asset_values[index] = 0.0;
+                contribution[index] = 0.0;
+                continue;
+            }
+            let previous_weight = previous_weights[index];
+            let asset_return = returns[index];
             let value_before = equity_before_return * previous_weight;
             let value_after = value_before * (1.0 + asset_return);
-            asset_values.insert(asset.clone(), value_after);
-            contribution.insert(asset.clone(), previous_weight * asset_return);
+            asset_values[index] = value_after;
+            contribution[index] = previous_weight * asset_return;
             pre_trade_equity += value_after;
         }
 
@@ -352,30 +399,23 @@ pub fn run_timeline_accounting(
         } else {
             0.0
         };
-        let drift_weights = if pre_trade_equity > 0.0 {
-            asset_values
-                .iter()
-                .filter_map(|(asset, value)| {
-                    if value.abs() > 1e-12 {
-                        Some((asset.clone(), value / pre_trade_equity))
-                    } else {
-                        None
-                    }
-                })
-                .collect::<BTreeMap<_, _>>()
-        } else {
-            BTreeMap::new()
-        };
+        for index in 0..asset_count {
+            let value = asset_values[index];
+            drift_weights[index] = if pre_trade_equity > 0.0 && value.abs() > 1e-12 {
+                value / pre_trade_equity
+            } else {
+                0.0
+            };
+        }
 
-        let mut current_weights = drift_weights.clone();
         let mut checkpoint_turnover = 0.0;
         let mut checkpoint_trade_cost = 0.0;
         let mut action_events = Vec::with_capacity(checkpoint.actions.len());
         equity = pre_trade_equity;
         equity_peak = equity_peak.max(equity);
-        if maintenance_margin_breached(&current_weights, &input.config.simulated_account) {
-            let observed = gross_exposure(&current_weights)
-                * input.config.simulated_account.maintenance_margin_ratio;
+        let drift_gross = gross_exposure(&drift_weights);
+        if maintenance_margin_breached_at(drift_gross, &input.config.simulated_account) {
+            let observed = drift_gross * input.config.simulated_account.maintenance_margin_ratio;
             risk_gate_events.push(risk_gate_event(
                 &checkpoint.date,
                 &checkpoint.phase,
@@ -383,7 +423,10 @@ pub fn run_timeline_accounting(
                 1.0,
                 observed,
                 "margin_liquidation".to_string(),
-                current_weights.keys().cloned().collect(),
+                assets
+                    .to_map(&drift_weights, |index| drift_weights[index] != 0.0)
+                    .into_keys()
+                    .collect(),
                 &BTreeMap::new(),
             ));
             checkpoint.actions.insert(
@@ -416,6 +459,22 @@ pub fn run_timeline_accounting(
             }
         }
 
+        // Actions run on weight maps; checkpoints without actions never build them.
+        let acted = !checkpoint.actions.is_empty();
+        let (mut current_weights, traded_assets) = if acted {
+            (
+                assets.to_map(&drift_weights, |index| drift_weights[index] != 0.0),
+                assets
+                    .names
+                    .iter()
+                    .zip(&assets_in_play)
+                    .filter(|(_, in_play)| **in_play)
+                    .map(|(name, _)| name.clone())
+                    .collect::<BTreeSet<_>>(),
+            )
+        } else {
+            (BTreeMap::new(), BTreeSet::new())
+        };
         for (action_index, action) in checkpoint.actions.into_iter().enumerate() {
             let action_name = normalize_action(&action.action)?;
             let before_weights = current_weights.clone();
@@ -473,7 +532,7 @@ pub fn run_timeline_accounting(
                 + portfolio_return;
             let (target_weights, action_risk_events) = apply_risk_gates(
                 &input.config.risk_gates,
-                &assets,
+                &traded_assets,
                 &before_weights,
                 &policy_target_weights,
                 equity,
@@ -539,7 +598,12 @@ pub fn run_timeline_accounting(
             risk_gate_events.extend(action_risk_events);
         }
 
-        previous_weights = trim_weights(&current_weights);
+        if acted {
+            assets.fill(&current_weights, &mut previous_weights)?;
+        } else {
+            previous_weights.copy_from_slice(&drift_weights);
+        }
+        trim_dense_weights(&mut previous_weights);
         previous_cash_weight = cash_weight_for(&previous_weights);
         let gross_exposure = gross_exposure(&previous_weights);
         let cost_drag = if equity_before_borrow > 0.0 {
@@ -555,7 +619,7 @@ pub fn run_timeline_accounting(
             daily.trade_cost += checkpoint_trade_cost;
             daily.borrow_cost += borrow_cost;
             daily.cost_drag += cost_drag;
-            add_contribution(&mut daily.contribution, &contribution);
+            daily.add_contribution(&contribution, &assets_in_play);
         }
 
         events.push(TimelineCheckpointEvent {
@@ -572,15 +636,15 @@ pub fn run_timeline_accounting(
             cash_weight: previous_cash_weight,
             gross_exposure,
             active_positions: active_positions(&previous_weights),
-            target_weights: previous_weights.clone(),
-            drift_weights: trim_weights(&drift_weights),
-            contribution,
+            target_weights: assets.trimmed_map(&previous_weights),
+            drift_weights: assets.trimmed_map(&drift_weights),
+            contribution: assets.to_map(&contribution, |index| assets_in_play[index]),
             actions: action_events,
         });
     }
 
     if let Some(daily) = current_daily.take() {
-        daily_events.push(daily.finish(&previous_weights, previous_cash_weight, equity));
+        daily_events.push(daily.finish(&assets, &previous_weights, previous_cash_weight, equity));
     }
 
     let checkpoints = events.len();
@@ -936,11 +1000,12 @@ struct DailyAccumulator {
     trade_cost: f64,
     borrow_cost: f64,
     cost_drag: f64,
-    contribution: BTreeMap<String, f64>,
+    contribution: Vec<f64>,
+    contributed: Vec<bool>,
 }
 
 impl DailyAccumulator {
-    fn new(date: String) -> Self {
+    fn new(date: String, asset_count: usize) -> Self {
         Self {
             date,
             portfolio_return: 0.0,
@@ -948,16 +1013,28 @@ impl DailyAccumulator {
             trade_cost: 0.0,
             borrow_cost: 0.0,
             cost_drag: 0.0,
-            contribution: BTreeMap::new(),
+            contribution: vec![0.0; asset_count],
+            contributed: vec![false; asset_count],
+        }
+    }
+
+    fn add_contribution(&mut self, contribution: &[f64], assets_in_play: &[bool]) {
+        for (index, value) in contribution.iter().enumerate() {
+            if assets_in_play[index] {
+                self.contribution[index] += value;
+                self.contributed[index] = true;
+            }
         }
     }
 
     fn finish(
         self,
-        weights: &BTreeMap<String, f64>,
+        assets: &AssetIndex,
+        weights: &[f64],
         cash_weight: f64,
         equity: f64,
     ) -> TimelineDailyEvent {
+        let contributed = self.contributed;
         TimelineDailyEvent {
             date: self.date,
             equity_after_trade: equity,
@@ -969,8 +1046,8 @@ impl DailyAccumulator {
             cash_weight,
             gross_exposure: gross_exposure(weights),
             active_positions: active_positions(weights),
-            target_weights: weights.clone(),
-            contribution: self.contribution,
+            target_weights: assets.trimmed_map(weights),
+            contribution: assets.to_map(&self.contribution, |index| contributed[index]),
         }
     }
 }
@@ -1062,7 +1139,7 @@ fn initialize_timeline_shadow_recovery_state(
         control,
         shadow_equity,
         shadow_weights: trim_weights(requested_target_weights),
-        shadow_cash_weight: cash_weight_for(requested_target_weights),
+        shadow_cash_weight: cash_weight_for(requested_target_weights.values()),
     })
 }
 
@@ -1124,7 +1201,7 @@ fn update_timeline_shadow_recovery_state(
     }
     state.shadow_equity = equity;
     state.shadow_weights = current_weights;
-    state.shadow_cash_weight = cash_weight_for(&state.shadow_weights);
+    state.shadow_cash_weight = cash_weight_for(state.shadow_weights.values());
     state.control.observe_shadow_equity(state.shadow_equity);
     Ok(!was_armed && state.control.recovery_armed())
 }
@@ -1242,7 +1319,7 @@ fn apply_action_policy(
         }
         if policy == "add_position" {
             let combined = add_weights(current_weights, &requested);
-            let gross = gross_exposure(&combined);
+            let gross = gross_exposure(combined.values());
             if gross > config.max_gross_exposure + 1e-10 {
                 return Ok((
                     current_weights.clone(),
@@ -1262,7 +1339,7 @@ fn normalized_target_weights(
     config: &TimelineAccountingConfig,
 ) -> Result<BTreeMap<String, f64>, TimelineAccountingError> {
     let out = trim_weights(target_weights);
-    let gross = gross_exposure(&out);
+    let gross = gross_exposure(out.values());
     if gross > config.max_gross_exposure + 1e-10 {
         return Err(TimelineAccountingError::GrossExposureExceeded {
             actual: gross,
@@ -1561,16 +1638,19 @@ fn overlaps(
     })
 }
 
-fn cash_weight_for(weights: &BTreeMap<String, f64>) -> f64 {
-    1.0 - weights.values().sum::<f64>()
+fn cash_weight_for<'a>(weights: impl IntoIterator<Item = &'a f64>) -> f64 {
+    1.0 - weights.into_iter().sum::<f64>()
 }
 
-fn gross_exposure(weights: &BTreeMap<String, f64>) -> f64 {
-    weights.values().map(|value| value.abs()).sum()
+fn gross_exposure<'a>(weights: impl IntoIterator<Item = &'a f64>) -> f64 {
+    weights.into_iter().map(|value| value.abs()).sum()
 }
 
-fn active_positions(weights: &BTreeMap<String, f64>) -> usize {
-    weights.values().filter(|value| value.abs() > 1e-12).count()
+fn active_positions<'a>(weights: impl IntoIterator<Item = &'a f64>) -> usize {
+    weights
+        .into_iter()
+        .filter(|value| value.abs() > 1e-12)
+        .count()
 }
 
 fn trim_weights(weights: &BTreeMap<String, f64>) -> BTreeMap<String, f64> {
@@ -1586,9 +1666,87 @@ fn trim_weights(weights: &BTreeMap<String, f64>) -> BTreeMap<String, f64> {
         .collect()
 }
 
-fn add_contribution(lhs: &mut BTreeMap<String, f64>, rhs: &BTreeMap<String, f64>) {
-    for (asset, value) in rhs {
-        *lhs.entry(asset.clone()).or_insert(0.0) += value;
+/// Symbols of one timeline interned into dense indices, in name order, so the
+/// per-checkpoint accounting runs on `Vec<f64>` weights. Because index order is
+/// `BTreeMap` key order, sums over a dense vector add the same terms in the same
+/// order as sums over the equivalent map.
+#[derive(Debug)]
+struct AssetIndex {
+    names: Vec<String>,
+}
+
+impl AssetIndex {
+    fn from_checkpoints(checkpoints: &[TimelineCheckpointInput]) -> Self {
+        let mut names = BTreeSet::new();
+        for checkpoint in checkpoints {
+            names.extend(checkpoint.returns.keys());
+            for action in &checkpoint.actions {
+                names.extend(action.target_weights.keys());
+            }
+        }
+        Self {
+            names: names.into_iter().cloned().collect(),
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.names.len()
+    }
+
+    /// Visit the dense index of every key of `values`, walking both sorted
+    /// sequences together instead of looking each key up. A key the index
+    /// does not hold fails before it is visited.
+    fn for_each_index<V>(
+        &self,
+        values: &BTreeMap<String, V>,
+        mut visit: impl FnMut(usize, &V),
+    ) -> Result<(), TimelineAccountingError> {
+        let mut index = 0;
+        for (name, value) in values {
+            while index < self.names.len() && self.names[index] < *name {
+                index += 1;
+            }
+            if self.names.get(index) != Some(name) {
+                return Err(TimelineAccountingError::UnknownTimelineAsset(name.clone()));
+            }
+            visit(index, value);
+        }
+        Ok(())
+    }
+
+    /// Dense weights from a map; assets it does not hold are zero.
+    fn fill(
+        &self,
+        weights: &BTreeMap<String, f64>,
+        dense: &mut [f64],
+    ) -> Result<(), TimelineAccountingError> {
+        dense.fill(0.0);
+        self.for_each_index(weights, |index, weight| dense[index] = *weight)
+    }
+
+    /// Map of the entries where `keep` holds.
+    fn to_map(&self, dense: &[f64], keep: impl Fn(usize) -> bool) -> BTreeMap<String, f64> {
+        self.names
+            .iter()
+            .zip(dense)
+            .enumerate()
+            .filter(|(index, _)| keep(*index))
+            .map(|(_, (name, value))| (name.clone(), *value))
+            .collect()
+    }
+
+    /// Map of the dense weights above the trim threshold.
+    fn trimmed_map(&self, dense: &[f64]) -> BTreeMap<String, f64> {
+        self.to_map(dense, |index| dense[index].abs() > 1e-12)
+    }
+}
+
+/// Zero the weights at or below the trim threshold, as `trim_weights` drops them.
+fn trim_dense_weights(weights: &mut [f64]) {
+    for weight in weights {
+        if weight.abs() <= 1e-12 {
+            *weight = 0.0;
+        }
     }
 }
 
@@ -1638,6 +1796,87 @@ mod tests {
         );
     }
 
+    #[test]
+    fn asset_index_rejects_unknown_keys() {
+        let assets = AssetIndex {
+            names: vec!["AAA".to_string(), "CCC".to_string()],
+        };
+        let mut dense = vec![0.0; assets.len()];
+
+        assets
+            .fill(&weights(&[("AAA", 0.25), ("CCC", 0.75)]), &mut dense)
+            .expect("known assets fill");
+        assert_eq!(dense, vec![0.25, 0.75]);
+
+        for unknown in ["BBB", "ZZZ"] {
+            let error = assets
+                .fill(&weights(&[("AAA", 0.5), (unknown, 0.5)]), &mut dense)
+                .expect_err("unknown assets must fail");
+            assert_eq!(
+                error,
+                TimelineAccountingError::UnknownTimelineAsset(unknown.to_string())
+            );
+        }
+    }
+
+    #[test]
+    fn late_assets_keep_in_play_contribution_keys_and_trimmed_weights() {
+        let summary = run_timeline_accounting(TimelineAccountingInput {
+            config: TimelineAccountingConfig::default(),
+            checkpoints: vec![
+                TimelineCheckpointInput {
+                    date: "2024-01-02".to_string(),
+                    phase: "open".to_string(),
+                    returns: BTreeMap::new(),
+                    actions: vec![action("enter", &[("BBB", 0.5)])],
+                },
+                TimelineCheckpointInput {
+                    date: "2024-01-02".to_string(),
+                    phase: "close".to_string(),
+                    returns: weights(&[("BBB", 0.10), ("CCC", 0.05)]),
+                    actions: Vec::new(),
+                },
+                TimelineCheckpointInput {
+                    date: "2024-01-03".to_string(),
+                    phase: "close".to_string(),
+                    returns: weights(&[("BBB", 0.0), ("CCC", 0.02)]),
+                    actions: vec![action("set_target_weights", &[("AAA", 0.4)])],
+                },
+            ],
+        })
+        .unwrap();
+
+        let priced = &summary.events[1];
+        assert_eq!(
+            priced.contribution.keys().collect::<Vec<_>>(),
+            vec!["BBB", "CCC"]
+        );
+        assert_abs_diff_eq!(priced.contribution["BBB"], 0.05, epsilon = 1e-12);
+        assert_eq!(priced.contribution["CCC"], 0.0);
+        assert_eq!(priced.drift_weights.keys().collect::<Vec<_>>(), vec!["BBB"]);
+
+        let rotated = &summary.events[2];
+        assert_eq!(
+            rotated.contribution.keys().collect::<Vec<_>>(),
+            vec!["AAA", "BBB", "CCC"]
+        );
+        assert_eq!(rotated.target_weights, weights(&[("AAA", 0.4)]));
+        assert_eq!(
+            summary.daily_events[0]
+                .contribution
+                .keys()
+                .collect::<Vec<_>>(),
+            vec!["BBB", "CCC"]
+        );
+        assert_eq!(
+            summary.daily_events[1]
+                .contribution
+                .keys()
+                .collect::<Vec<_>>(),
+            vec!["AAA", "BBB", "CCC"]
+        );
+    }
+
     #[test]
     fn same_day_open_to_close_timeline_accounts_two_phases() {
         let summary = run_timeline_accounting(TimelineAccountingInput {
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_candidate_result_cache(monkeypatch):
+    # The cache is opt-in; keep a developer's shell setting from enabling it here.
+    monkeypatch.delenv("LO2CIN4BT_RESULT_CACHE_BYTES", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _ignore_host_cpu_load(monkeypatch):
+    # Scheduler admission must not depend on whatever else the host is running.
+    monkeypatch.setenv("LO2CIN4BT_APP_CPU_ADMIT_PERCENT", "0")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_provider_bar_cache(monkeypatch):
+    # Provider bars cached on disk would otherwise replace each test's fake download.
+    monkeypatch.setenv("LO2CIN4BT_PROVIDER_CACHE", "off")
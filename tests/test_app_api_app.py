@@ -10,8 +10,10 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api import create_app
+from app.api.admission import HostHeadroom
 from app.api.scheduler import JOB_WEIGHTS
 from app.api.service import AppAPIService
+from app.runtime.runtime import AppRuntimeService
 from tests.support.app_api_contract_fixtures import (
     build_portfolio_contract_run,
     build_wfa_contract_run,
@@ -342,6 +344,94 @@ def test_registry_parallel_writes_rebuild_complete_latest_runs_cache(
     }
 
 
+def test_registry_index_upserts_and_pages_filtered_runs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    service = AppAPIService(tmp_path)
+    registry = service.registry
+    monkeypatch.setattr(
+        type(registry.run_index),
+        "reconcile",
+        lambda *_args, **_kwargs: pytest.fail("registry writes must not rescan"),
+    )
+    for index in range(12):
+        registry.write_registry_entry(
+            {
+                "run_id": f"indexed-run-{index:02d}",
+                "module": "wfa" if index % 3 == 0 else "autorunner",
+                "status": "failed" if index % 4 == 0 else "completed",
+                "created_at": f"2026-07-{index + 1:02d}T09:00:00+08:00",
+            }
+        )
+    registry.write_registry_entry(
+        {
+            "run_id": "indexed-run-05",
+            "module": "autorunner",
+            "status": "running",
+            "created_at": "2026-07-06T09:00:00+08:00",
+        }
+    )
+
+    page = registry.query_runs(module="autorunner", status="completed", limit=3)
+    assert page["total"] == 5
+    assert [row["run_id"] for row in page["runs"]] == [
+        "indexed-run-11",
+        "indexed-run-10",
+        "indexed-run-07",
+    ]
+    second = registry.query_runs(
+        module="autorunner", status="completed", limit=3, offset=3
+    )
+    assert [row["run_id"] for row in second["runs"]] == [
+        "indexed-run-02",
+        "indexed-run-01",
+    ]
+    assert {row["module"] for row in registry.list_runs(module="wfa")} == {
+        "validation_workflow"
+    }
+    window = registry.list_runs(
+        created_after="2026-07-03", created_before="2026-07-05T23:59:59"
+    )
+    assert [row["run_id"] for row in window] == [
+        "indexed-run-04",
+        "indexed-run-03",
+        "indexed-run-02",
+    ]
+    assert registry.list_runs(status="running")[0]["run_id"] == "indexed-run-05"
+    response = TestClient(create_app(tmp_path)).get(
+        "/api/app/runs", params={"status": "failed", "limit": 2}
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
+    assert [row["run_id"] for row in response.json()["runs"]] == [
+        "indexed-run-08",
+        "indexed-run-04",
+    ]
+
+
+def test_registry_index_reconciles_files_changed_outside_the_registry(
+    tmp_path: Path,
+) -> None:
+    registry = AppAPIService(tmp_path).registry
+    registry.write_registry_entry(
+        {"run_id": "kept", "module": "autorunner", "status": "completed", "created_at": "2026-07-01"}
+    )
+    registry.write_registry_entry(
+        {"run_id": "removed", "module": "autorunner", "status": "completed", "created_at": "2026-07-02"}
+    )
+    registry.resolve_run_paths("removed")["run_registry"].unlink()
+    registry.resolve_run_paths("added")["run_registry"].write_text(
+        json.dumps(
+            {"run_id": "added", "module": "statanalyser", "status": "completed", "created_at": "2026-07-03"}
+        ),
+        encoding="utf-8",
+    )
+
+    registry.reconcile_run_index()
+
+    assert [row["run_id"] for row in registry.list_runs()] == ["added", "kept"]
+
+
 def test_parameter_matrix_cannot_submit_shortlist_to_wfa() -> None:
     client = TestClient(create_app(REPO_ROOT))
 
@@ -809,6 +899,207 @@ def test_stale_cancel_requested_job_is_force_finalized(
     assert not run_paths["snapshot_dir"].exists()
 
 
+def test_scheduler_journal_requeues_queued_jobs_after_restart(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        AppAPIService, "_prewarm_rust_batch_services", lambda self: None
+    )
+    repo = tmp_path / "repo"
+    config = repo / "workspace" / "runs" / "case.json"
+    config.parent.mkdir(parents=True)
+    config.write_text("{}", encoding="utf-8")
+    first_service = AppAPIService(repo)
+    with first_service.scheduler._lock:  # noqa: SLF001 - keep the job queued in the first process.
+        first_service.scheduler.capacity = 0
+    batch = first_service.scheduler.submit_batch("autorunner", [str(config)])
+    batch_id = batch["batch_id"]
+    assert batch["status"] == "queued"
+
+    monkeypatch.setattr(
+        AppRuntimeService,
+        "run_autorunner_config",
+        lambda self, config_path, emit: {"run_id": None, "status": "completed"},
+    )
+    restarted = AppAPIService(repo)
+    for _ in range(40):
+        resumed = restarted.scheduler.get_batch(batch_id)
+        if resumed["status"] == "completed":
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("journaled batch did not resume after restart")
+
+    events = restarted.scheduler.get_events_since(batch_id, 0)
+    assert [event["seq"] for event in events] == list(range(len(events)))
+    assert [event["type"] for event in events][:3] == [
+        "batch_submitted",
+        "batch_resumed",
+        "job_started",
+    ]
+    assert resumed["jobs"][0]["status"] == "completed"
+
+
+def test_scheduler_journal_coalesces_job_logs_and_caps_events(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        AppAPIService, "_prewarm_rust_batch_services", lambda self: None
+    )
+    monkeypatch.setattr("app.api.scheduler._JOURNAL_EVENT_LIMIT", 4)
+    monkeypatch.setattr("app.api.scheduler._LOG_FLUSH_SECONDS", 3600.0)
+    repo = tmp_path / "repo"
+    config = repo / "workspace" / "runs" / "case.json"
+    config.parent.mkdir(parents=True)
+    config.write_text("{}", encoding="utf-8")
+    service = AppAPIService(repo)
+    saves: list[tuple[list[str], list[dict]]] = []
+    original_save = service.scheduler.journal.save
+
+    def recording_save(state, jobs=(), events=()):
+        jobs = list(jobs)
+        events = list(events)
+        saves.append(([job["job_id"] for _, job in jobs], events))
+        original_save(state, jobs, events)
+
+    monkeypatch.setattr(service.scheduler.journal, "save", recording_save)
+
+    def chatty_run(_config_path: str, emit: Callable[[str, str], None]) -> dict:
+        for index in range(20):
+            emit("backtester", f"step {index}")
+        return {"run_id": None, "status": "completed"}
+
+    monkeypatch.setattr(service.runtime, "run_autorunner_config", chatty_run)
+    batch = service.scheduler.submit_batch(
+        "autorunner", [str(config), str(config)]
+    )
+    batch_id = batch["batch_id"]
+    for _ in range(40):
+        if service.scheduler.get_batch(batch_id)["status"] == "completed":
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("batch did not finish")
+
+    types_per_save = [[event["type"] for event in events] for _, events in saves]
+    log_writes = [types for types in types_per_save if "job_log" in types]
+    assert sum(types.count("job_log") for types in log_writes) == 40
+    assert len(log_writes) < 40
+    # A finishing job's row is written with its event; a job still running
+    # alongside it may ride along with its pending log updates.
+    finished = [
+        (job_ids, events[-1]["job_id"])
+        for job_ids, events in saves
+        if events and events[-1]["type"] == "job_finished"
+    ]
+    assert len(finished) == 2
+    assert all(job_id in job_ids for job_ids, job_id in finished)
+    assert {job_id for _, job_id in finished} == {
+        job["job_id"] for job in service.scheduler.get_batch(batch_id)["jobs"]
+    }
+
+    journaled = service.scheduler.journal.events_since(batch_id, 0, limit=1000)
+    assert len(journaled) == 4
+    assert journaled[-1]["type"] == "batch_status"
+    restarted = AppAPIService(repo)
+    assert [job["status"] for job in restarted.scheduler.get_batch(batch_id)["jobs"]] == [
+        "completed",
+        "completed",
+    ]
+
+
+def test_scheduler_spill_replay_skips_events_still_in_the_ring(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        AppAPIService, "_prewarm_rust_batch_services", lambda self: None
+    )
+    monkeypatch.setattr("app.api.scheduler._EVENT_RING_SIZE", 3)
+    monkeypatch.setattr("app.api.scheduler._JOURNAL_EVENT_LIMIT", 5)
+    repo = tmp_path / "repo"
+    config = repo / "workspace" / "runs" / "case.json"
+    config.parent.mkdir(parents=True)
+    config.write_text("{}", encoding="utf-8")
+    service = AppAPIService(repo)
+
+    def chatty_run(_config_path: str, emit: Callable[[str, str], None]) -> dict:
+        for index in range(12):
+            emit("backtester", f"step {index}")
+        return {"run_id": None, "status": "completed"}
+
+    monkeypatch.setattr(service.runtime, "run_autorunner_config", chatty_run)
+    batch_id = service.scheduler.submit_batch("autorunner", [str(config)])["batch_id"]
+    for _ in range(40):
+        if service.scheduler.get_batch(batch_id)["status"] == "completed":
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("batch did not finish")
+
+    ring = service.scheduler.get_batch(batch_id)["events"]
+    journaled = service.scheduler.journal.events_since(batch_id, 0, limit=1000)
+    assert journaled[0]["seq"] > 0
+    assert journaled[-1]["seq"] == ring[-1]["seq"]
+
+    seqs = [event["seq"] for event in service.scheduler.get_events_since(batch_id, 0)]
+    assert seqs == sorted(set(seqs))
+    assert seqs[0] == journaled[0]["seq"]
+    assert seqs[-1] == ring[-1]["seq"]
+
+
+def test_batch_events_stream_replays_spilled_events_over_sse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        AppAPIService, "_prewarm_rust_batch_services", lambda self: None
+    )
+    monkeypatch.setattr("app.api.scheduler._EVENT_RING_SIZE", 3)
+    repo = tmp_path / "repo"
+    config = repo / "workspace" / "runs" / "case.json"
+    config.parent.mkdir(parents=True)
+    config.write_text("{}", encoding="utf-8")
+    app = create_app(repo)
+    service: AppAPIService = app.state.app_service
+
+    def chatty_run(_config_path: str, emit: Callable[[str, str], None]) -> dict:
+        for index in range(6):
+            emit("backtester", f"step {index}")
+        return {"run_id": None, "status": "completed"}
+
+    monkeypatch.setattr(service.runtime, "run_autorunner_config", chatty_run)
+    client = TestClient(app)
+    batch_id = client.post(
+        "/api/app/batches",
+        json={"module": "autorunner", "config_paths": [str(config)]},
+    ).json()["batch_id"]
+
+    def read_stream(headers: dict[str, str] | None = None) -> list[str]:
+        with client.stream(
+            "GET", f"/api/app/batches/{batch_id}/events", headers=headers
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = "".join(response.iter_text())
+        return [frame for frame in body.split("\n\n") if frame.strip()]
+
+    frames = read_stream()
+    assert frames[-1].startswith("event: end")
+    ids = [int(frame.split("\n")[0].removeprefix("id: ")) for frame in frames[:-1]]
+    types = [json.loads(frame.split("\n")[1].removeprefix("data: "))["type"] for frame in frames[:-1]]
+    assert ids == list(range(len(ids)))
+    assert types.count("job_log") == 6
+    assert types[0] == "batch_submitted"
+    assert types[-1] == "batch_status"
+    assert len(service.scheduler.get_batch(batch_id)["events"]) == 3
+
+    resumed = read_stream({"Last-Event-ID": str(ids[-3])})
+    assert [frame.split("\n")[0] for frame in resumed[:-1]] == [
+        f"id: {ids[-2]}",
+        f"id: {ids[-1]}",
+    ]
+    assert client.get("/api/app/batches/missing/events").status_code == 404
+
+
 def test_existing_metrics_overview_payload_contract_smoke(tmp_path: Path) -> None:
     metrics_service, _payloads, _registry, selected_run_id = (
         build_portfolio_contract_run(tmp_path)
@@ -1119,6 +1410,166 @@ def test_scheduler_reserves_capacity_for_aged_heavy_job(tmp_path: Path) -> None:
     assert next_ref["job_id"] == "heavy"
 
 
+def test_scheduler_estimates_jobs_from_prior_bundle_manifest(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    config = repo / "workspace" / "runs" / "matrix.json"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        json.dumps(
+            {
+                "platform": {"workflow_id": "parameter_matrix"},
+                "data": {"start_date": "2020-01-01", "end_date": "2021-01-01"},
+                "universe": {"symbols": ["SPY"]},
+                "parameter_domains": {"fast": {"values": [1, 2, 3]}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    service = AppAPIService(repo)
+
+    from_config = service.scheduler._job_estimate("autorunner", config)  # noqa: SLF001
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps({"row_count": 5000, "symbols": ["SPY", "TLT"]}),
+        encoding="utf-8",
+    )
+    service.registry.write_registry_entry(
+        {
+            "run_id": "prior-run",
+            "module": "autorunner",
+            "status": "completed",
+            "created_at": "2026-07-13T23:00:00+08:00",
+            "config_filename": "matrix.json",
+            "market_data_bundle_manifest": str(manifest),
+        }
+    )
+    from_manifest = service.scheduler._job_estimate("autorunner", config)  # noqa: SLF001
+
+    assert from_config.source == "config"
+    assert (from_config.assets, from_config.candidates) == (1, 3)
+    assert 240 <= from_config.bars <= 260
+    assert from_manifest.source == "bundle_manifest"
+    assert (from_manifest.bars, from_manifest.assets) == (5000, 2)
+    assert from_manifest.work_units == 5000 * 2 * 3
+    assert from_manifest.peak_memory_bytes > from_config.peak_memory_bytes
+
+
+def test_scheduler_holds_jobs_that_exceed_memory_headroom(tmp_path: Path) -> None:
+    class _Probe:
+        memory_budget_bytes = 4 << 30
+
+        def sample(self) -> HostHeadroom:
+            return HostHeadroom(cpu_percent=10.0, available_bytes=8 << 30, rss_bytes=1 << 30)
+
+        def cpu_saturated(self, sample: HostHeadroom) -> bool:
+            return False
+
+    service = AppAPIService(tmp_path / "repo")
+    scheduler = service.scheduler
+    with scheduler._lock:  # noqa: SLF001 - scheduler policy regression guard.
+        batch_id = "memory-test"
+        jobs = [
+            {
+                "job_id": "huge",
+                "module": "autorunner",
+                "status": "queued",
+                "weight": 1,
+                "estimate": {"work_units": 10, "peak_memory_bytes": 6 << 30},
+                "created_at": "2026-07-11T00:00:00+08:00",
+                "queued_monotonic": time.monotonic(),
+            },
+            {
+                "job_id": "small",
+                "module": "autorunner",
+                "status": "queued",
+                "weight": 1,
+                "estimate": {"work_units": 20, "peak_memory_bytes": 512 << 20},
+                "created_at": "2026-07-11T00:00:01+08:00",
+                "queued_monotonic": time.monotonic(),
+            },
+        ]
+        scheduler.host_probe = _Probe()
+        scheduler.capacity = 4
+        scheduler._batches = {  # noqa: SLF001
+            batch_id: {"batch_id": batch_id, "created_at": "", "status": "queued", "jobs": jobs}
+        }
+        scheduler._pending = [  # noqa: SLF001
+            {"batch_id": batch_id, "job_id": "huge"},
+            {"batch_id": batch_id, "job_id": "small"},
+        ]
+        scheduler._active_weight = 1  # noqa: SLF001
+        scheduler._reserved_memory_bytes = 2 << 30  # noqa: SLF001
+        while_busy = scheduler._next_schedulable_job_ref()  # noqa: SLF001
+        scheduler._active_weight = 0  # noqa: SLF001
+        scheduler._reserved_memory_bytes = 0  # noqa: SLF001
+        when_idle = scheduler._next_schedulable_job_ref()  # noqa: SLF001
+        scheduler._pending = []  # noqa: SLF001
+
+    assert while_busy is not None and while_busy["job_id"] == "small"
+    assert "memory headroom" in str(jobs[0]["stage_message"])
+    assert when_idle is not None and when_idle["job_id"] == "huge"
+
+
+def test_scheduler_reserves_aged_job_refused_for_memory(tmp_path: Path) -> None:
+    class _Probe:
+        memory_budget_bytes = 4 << 30
+
+        def sample(self) -> HostHeadroom:
+            return HostHeadroom(cpu_percent=10.0, available_bytes=8 << 30, rss_bytes=1 << 30)
+
+        def cpu_saturated(self, sample: HostHeadroom) -> bool:
+            return False
+
+    service = AppAPIService(tmp_path / "repo")
+    scheduler = service.scheduler
+    with scheduler._lock:  # noqa: SLF001 - scheduler policy regression guard.
+        batch_id = "memory-aging-test"
+        jobs = [
+            {
+                "job_id": "huge",
+                "module": "autorunner",
+                "status": "queued",
+                "weight": 1,
+                "estimate": {"work_units": 10, "peak_memory_bytes": 6 << 30},
+                "created_at": "2026-07-11T00:00:00+08:00",
+                "queued_monotonic": 0.0,
+            },
+            {
+                "job_id": "small",
+                "module": "autorunner",
+                "status": "queued",
+                "weight": 1,
+                "estimate": {"work_units": 20, "peak_memory_bytes": 512 << 20},
+                "created_at": "2026-07-11T00:00:01+08:00",
+                "queued_monotonic": time.monotonic(),
+            },
+        ]
+        scheduler.host_probe = _Probe()
+        scheduler.capacity = 4
+        scheduler._batches = {  # noqa: SLF001
+            batch_id: {"batch_id": batch_id, "created_at": "", "status": "queued", "jobs": jobs}
+        }
+        scheduler._pending = [  # noqa: SLF001
+            {"batch_id": batch_id, "job_id": "huge"},
+            {"batch_id": batch_id, "job_id": "small"},
+        ]
+        scheduler._active_weight = 1  # noqa: SLF001
+        scheduler._reserved_memory_bytes = 2 << 30  # noqa: SLF001
+        first = scheduler._next_schedulable_job_ref()  # noqa: SLF001
+        after_refusal = scheduler._next_schedulable_job_ref()  # noqa: SLF001
+        scheduler._active_weight = 0  # noqa: SLF001
+        scheduler._reserved_memory_bytes = 0  # noqa: SLF001
+        when_idle = scheduler._next_schedulable_job_ref()  # noqa: SLF001
+        scheduler._pending = []  # noqa: SLF001
+
+    # A default-weight job is not heavy, but once refused it ages into the
+    # reservation and holds smaller jobs back until it fits.
+    assert first is not None and first["job_id"] == "small"
+    assert after_refusal is None
+    assert when_idle is not None and when_idle["job_id"] == "huge"
+
+
 def test_existing_wfa_dashboard_payload_contract_smoke(tmp_path: Path) -> None:
     service, run_id = build_wfa_contract_run(tmp_path)
     payload = service.wfa_dashboard(run_id)
@@ -1441,10 +1441,23 @@ def test_app_export_accepts_empty_optional_benchmark_series(
         ]
         return {"schema_version": "PlotBundle.v1", **request}
 
+    def fake_plot_lod(request: dict, **_kwargs: object) -> dict:
+        return {
+            "schema_version": "plot_lod.v1",
+            "series": [
+                {"series_id": item["series_id"], "levels": []}
+                for item in request["series"]
+            ],
+        }
+
     monkeypatch.setattr(
         "backtester.RustCoreBridge_backtester.run_plot_bundle_via_cli",
         fake_plot_bundle,
     )
+    monkeypatch.setattr(
+        "backtester.RustCoreBridge_backtester.run_plot_lod_via_cli",
+        fake_plot_lod,
+    )
 
     artifacts = runtime._write_backtest_chart_payloads(  # noqa: SLF001
         "optional_benchmark",
@@ -1525,10 +1538,23 @@ def test_intraday_chart_uses_execution_equity_instead_of_session_close_curve(
         assert str(execution_path) in request["artifact_source_refs"]
         return {"schema_version": "PlotBundle.v1", **request}
 
+    def fake_plot_lod(request: dict, **_kwargs: object) -> dict:
+        return {
+            "schema_version": "plot_lod.v1",
+            "series": [
+                {"series_id": item["series_id"], "levels": []}
+                for item in request["series"]
+            ],
+        }
+
     monkeypatch.setattr(
         "backtester.RustCoreBridge_backtester.run_plot_bundle_via_cli",
         fake_plot_bundle,
     )
+    monkeypatch.setattr(
+        "backtester.RustCoreBridge_backtester.run_plot_lod_via_cli",
+        fake_plot_lod,
+    )
 
     artifacts = runtime._write_backtest_chart_payloads(  # noqa: SLF001
         run_id,
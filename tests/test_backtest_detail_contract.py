@@ -2,12 +2,15 @@ import json
 from pathlib import Path
 from types import SimpleNamespace
 
+import pandas as pd
 import pytest
 
 from app.api.backtest_detail_contract import BacktestDetailContractService
+from app.api.payloads import AppPayloadService
 from app.api.service import AppAPIService
 from app.api.shared_chart_series import SharedChartSeriesStore
 from app.runtime.registry import AppRegistry
+from app.runtime.runtime import AppRuntimeService
 
 
 def _write(path: Path, payload: object) -> None:
@@ -135,3 +138,48 @@ def test_backtest_detail_api_projects_canonical_time_and_annualization() -> None
     assert payload["annualization"]["basis"] == "session_close_projection"
     assert payload["projected_session_count"] == 2
     assert payload["projected_return_interval_count"] == 1
+
+
+def test_detail_ohlc_projection_aligns_wide_tables_to_close_timeline() -> None:
+    index = pd.date_range("2026-03-06 09:30", periods=3, freq="1D", tz="America/New_York")
+    close = pd.DataFrame({"QQQ": [10.0, float("nan"), 12.0], "SPY": [1.0, 2.0, 3.0]}, index=index)
+    frames = {
+        "close": close,
+        "open": pd.DataFrame({"QQQ": [9.5, 10.5, float("inf")]}, index=index),
+        "high": pd.DataFrame({"QQQ": [10.5]}, index=index[:1]),
+    }
+    trades = pd.DataFrame({"Asset": ["QQQ", "QQQ", "MISSING", None]})
+    runtime = AppRuntimeService.__new__(AppRuntimeService)
+
+    projected = runtime._detail_ohlc_by_asset(trades, frames)  # noqa: SLF001 - projection guard.
+
+    assert list(projected) == ["QQQ"]
+    assert projected["QQQ"] == [
+        {"time": str(index[0]), "open": 9.5, "high": 10.5, "low": 10.0, "close": 10.0},
+        {"time": str(index[2]), "open": 12.0, "high": 12.0, "low": 12.0, "close": 12.0},
+    ]
+    assert projected["QQQ"][1]["time"] == "2026-03-08 09:30:00-04:00"
+
+
+def test_portfolio_ohlc_projection_aggregates_intraday_bars_per_date(tmp_path: Path) -> None:
+    index = pd.DatetimeIndex(
+        ["2026-03-06 10:00", "2026-03-06 15:00", "2026-03-09 10:00", "2026-03-09 15:00"]
+    )
+    frames = {
+        "close": pd.DataFrame({"QQQ": [10.0, 11.0, 12.0, 13.0]}, index=index),
+        "open": pd.DataFrame({"QQQ": [9.0, 10.0, 11.0, 12.0]}, index=index),
+        "high": pd.DataFrame({"QQQ": [14.0, 12.0, 13.0, 15.0]}, index=index),
+    }
+    trades = pd.DataFrame({"Asset": ["QQQ"]})
+    payloads = AppPayloadService(tmp_path, AppRegistry(tmp_path))
+
+    projected = payloads._portfolio_ohlc_by_asset(  # noqa: SLF001 - projection guard.
+        trades, market_frames=frames
+    )
+
+    assert [row["close"] for row in projected["QQQ"]] == [11.0, 13.0]
+    assert [row["open"] for row in projected["QQQ"]] == [9.0, 11.0]
+    assert [row["high"] for row in projected["QQQ"]] == [14.0, 15.0]
+    # Without a low table the daily low is the day's lowest close.
+    assert [row["low"] for row in projected["QQQ"]] == [10.0, 12.0]
+    assert len({row["time"] for row in projected["QQQ"]}) == 2
@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from backtester.CandidateResultCache_backtester import (  # noqa: E402
+    CANDIDATE_RESULT_TABLES,
+    CandidateResultCache,
+    candidate_result_cache_from_env,
+)
+
+
+def _tables(rows: int) -> dict:
+    tables = {name: pd.DataFrame() for name in CANDIDATE_RESULT_TABLES}
+    tables["equity_curve"] = pd.DataFrame(
+        {"equity": [100.0 + idx for idx in range(rows)]},
+        index=pd.RangeIndex(3, 3 + rows),
+    )
+    return tables
+
+
+def test_candidate_result_cache_round_trips_summary_and_tables(tmp_path):
+    cache = CandidateResultCache(tmp_path / "cache.sqlite3")
+    key = cache.cache_key("request", "bundle", "engine")
+    assert key != cache.cache_key("request", "bundle", "engine-next")
+
+    cache.put(
+        key=key,
+        request_hash="request",
+        bundle_key="bundle",
+        engine_version="engine",
+        summary={"row": {"strategy_id": "probe"}},
+    )
+    summary_only = cache.get_many([key, "missing"])
+    assert list(summary_only) == [key]
+    assert summary_only[key].has_tables is False
+    assert cache.load_tables(key) is None
+
+    cache.put(
+        key=key,
+        request_hash="request",
+        bundle_key="bundle",
+        engine_version="engine",
+        summary={"row": {"strategy_id": "probe"}, "feature_cache": {"computed": 2}},
+        tables=_tables(4),
+    )
+    cache.put(
+        key=key,
+        request_hash="request",
+        bundle_key="bundle",
+        engine_version="engine",
+        summary={"row": {"strategy_id": "probe"}},
+    )
+    entry = cache.get_many([key])[key]
+    assert entry.has_tables is True
+    assert entry.summary["feature_cache"] == {"computed": 2}
+    tables = cache.load_tables(key)
+    pd.testing.assert_frame_equal(tables["equity_curve"], _tables(4)["equity_curve"])
+    assert tables["holdings"].empty
+
+
+def test_candidate_result_cache_evicts_least_recently_used_entries(tmp_path):
+    probe = CandidateResultCache(tmp_path / "probe.sqlite3")
+    probe.put(
+        key="probe",
+        request_hash="probe",
+        bundle_key="bundle",
+        engine_version="engine",
+        summary={"row": {}},
+        tables=_tables(50),
+    )
+    entry_bytes = probe.stats()["resident_bytes"]
+
+    cache = CandidateResultCache(tmp_path / "cache.sqlite3", max_bytes=entry_bytes * 2 + 10)
+    for name in ("a", "b"):
+        cache.put(
+            key=name,
+            request_hash=name,
+            bundle_key="bundle",
+            engine_version="engine",
+            summary={"row": {}},
+            tables=_tables(50),
+        )
+    cache.get_many(["a"])
+    cache.put(
+        key="c",
+        request_hash="c",
+        bundle_key="bundle",
+        engine_version="engine",
+        summary={"row": {}},
+        tables=_tables(50),
+    )
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["resident_bytes"] <= cache.max_bytes
+
+
+def test_candidate_result_cache_is_opt_in_through_env_budget(tmp_path, monkeypatch):
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_PATH", str(tmp_path / "env.sqlite3"))
+    assert candidate_result_cache_from_env() is None
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_BYTES", "0")
+    assert candidate_result_cache_from_env() is None
+
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_BYTES", "4096")
+    cache = candidate_result_cache_from_env()
+    assert cache is candidate_result_cache_from_env()
+    assert cache.db_path == tmp_path / "env.sqlite3"
+    assert cache.stats()["budget_bytes"] == 4096
@@ -1033,6 +1033,42 @@ def test_shared_rust_matrix_bundle_is_filtered_per_candidate(tmp_path: Path) ->
     ]
 
 
+def test_rust_artifact_tables_read_each_combined_table_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from backtester.UnifiedBacktestRunner_backtester import RustArtifactTables
+
+    candidate_ids = [f"candidate_a:parameter_matrix:short_{index}" for index in range(4)]
+    path = tmp_path / "equity.parquet"
+    pd.DataFrame(
+        {
+            "Backtest_id": [candidate for candidate in candidate_ids for _ in range(3)],
+            "Equity_value": [float(index) for index in range(12)],
+        }
+    ).to_parquet(path, index=False)
+    reads: list[Path] = []
+    read_parquet = pd.read_parquet
+
+    def counting_read_parquet(target, *args, **kwargs):
+        reads.append(Path(target))
+        return read_parquet(target, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_parquet", counting_read_parquet)
+    tables = RustArtifactTables({"bundle_paths": {"equity_curve": str(path)}})
+
+    frames = [tables.frame("equity_curve", candidate_id=candidate) for candidate in candidate_ids]
+    missing = tables.frame(
+        "equity_curve", candidate_id="candidate_a:parameter_matrix:short_99"
+    )
+
+    assert reads == [path]
+    assert [frame["Equity_value"].tolist() for frame in frames][1] == [3.0, 4.0, 5.0]
+    assert all(frame["Backtest_id"].nunique() == 1 for frame in frames)
+    assert missing.empty
+    assert list(missing.columns) == ["Backtest_id", "Equity_value"]
+
+
 def test_rust_artifact_bundle_reader_fails_when_table_is_missing() -> None:
     from backtester.UnifiedBacktestRunner_backtester import (
         UnifiedBacktestRunnerBacktester,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import random
 
 import pytest
 
@@ -202,6 +203,85 @@ def test_heatmap_matrix_builder_rejects_missing_parameter_coordinates() -> None:
         )
 
 
+def test_heatmap_plateau_scores_use_neighbors_within_grid_distance() -> None:
+    builder = HeatmapMatrixBuilder()
+    cell_scores = {(x, y): 1.0 for x in (10, 20, 30) for y in (5, 10)}
+    cell_scores[(20, 10)] = 2.0
+    cell_scores[(90, 5)] = 1.0
+    cell_scores[("fast", 5)] = 1.0
+
+    scores = builder._cell_plateau_scores(cell_scores)
+
+    # (10, 5) sees the other five grid cells; (30, 5) is within 20 of it.
+    neighbors = [1.0, 1.0, 1.0, 1.0, 2.0]
+    mean = sum(neighbors) / len(neighbors)
+    std = math.sqrt(sum((value - mean) ** 2 for value in neighbors) / len(neighbors))
+    assert scores[(10, 5)] == round(0.6 + 0.4 * (1.0 - std), 4)
+    assert scores[(20, 10)] == round(0.0 + 0.4 * (1.0 - 0.0 / 2.0), 4)
+    assert scores[(90, 5)] == 0.0
+    assert scores[("fast", 5)] == 0.0
+
+
+def test_heatmap_plateau_scores_scale_to_dense_grids() -> None:
+    builder = HeatmapMatrixBuilder()
+    cell_scores = {
+        (x, y): 1.0 + ((x * 7 + y * 3) % 11) / 100.0
+        for x in range(120)
+        for y in range(120)
+    }
+
+    scores = builder._cell_plateau_scores(cell_scores)
+
+    assert len(scores) == len(cell_scores)
+    assert all(0.0 < score <= 1.0 for score in scores.values())
+
+
+def _brute_force_plateau_score(
+    key: tuple, cell_scores: dict, distance: float
+) -> float:
+    neighbors = []
+    for other, score in cell_scores.items():
+        x_distance = abs(float(other[0]) - float(key[0]))
+        y_distance = abs(float(other[1]) - float(key[1]))
+        if x_distance <= 1e-9 and y_distance <= 1e-9:
+            continue
+        if x_distance <= distance and y_distance <= distance:
+            neighbors.append(score)
+    if not neighbors:
+        return 0.0
+    center = cell_scores[key]
+    mean = sum(neighbors) / len(neighbors)
+    std = (
+        math.sqrt(sum((value - mean) ** 2 for value in neighbors) / len(neighbors))
+        if len(neighbors) > 1
+        else 0.0
+    )
+    threshold = center * 0.9 if center >= 0 else center
+    support = sum(value >= threshold for value in neighbors) / len(neighbors)
+    stability = max(0.0, 1.0 - std / max(abs(center), 1.0))
+    return round(support * 0.6 + stability * 0.4, 4)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_heatmap_plateau_scores_match_brute_force_neighbor_scan(seed: int) -> None:
+    rng = random.Random(seed)
+    builder = HeatmapMatrixBuilder()
+    distance = builder.PLATEAU_NEIGHBOR_DISTANCE
+    # Integer steps land neighbors exactly on the distance boundary.
+    cell_scores = {}
+    for _ in range(300):
+        x = rng.randrange(-60, 120, 5)
+        y = rng.randrange(0, 90, 10) if rng.random() < 0.5 else rng.uniform(0, 90)
+        cell_scores[(x, y)] = rng.uniform(-2.0, 3.0)
+
+    scores = builder._cell_plateau_scores(cell_scores)
+
+    for key in cell_scores:
+        assert scores[key] == pytest.approx(
+            _brute_force_plateau_score(key, cell_scores, distance), abs=1e-4
+        )
+
+
 def test_heatmap_shortlist_preserves_portfolio_snapshot_metrics() -> None:
     builder = HeatmapMatrixBuilder()
     payload = builder.build_payload(
@@ -367,3 +447,90 @@ def test_optuna_search_engine_runs_tpe_study(tmp_path) -> None:
     )
     assert payload["completed_trials"] >= 1
     assert "best_params" in payload
+
+
+def test_optuna_batched_executor_asks_and_tells_whole_batches(tmp_path) -> None:
+    optuna = pytest.importorskip("optuna")
+    engine = OptunaSearchEngine(
+        {
+            "sampler": "tpe",
+            "n_trials": 10,
+            "n_startup_trials": 4,
+            "random_seed": 7,
+            "pruner": "none",
+            "batch_size": 4,
+        },
+        storage_dir=tmp_path,
+    )
+    batches = []
+
+    def batch_objective(params_list):
+        batches.append([dict(params) for params in params_list])
+        return [-abs(params["fast_ma"] - 11) for params in params_list]
+
+    payload = engine.optimize_batched(
+        study_name="batched",
+        search_space=[{"name": "fast_ma", "type": "int", "low": 5, "high": 20}],
+        batch_objective_fn=batch_objective,
+    )
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert payload["batches"] == 3
+    assert payload["constant_liar"] is True
+    assert payload["completed_trials"] == 10
+    stored = optuna.load_study(
+        study_name="batched",
+        storage=f"sqlite:///{(tmp_path / 'batched.sqlite3').as_posix()}",
+    )
+    assert [trial.params for trial in stored.trials] == [
+        params for batch in batches for params in batch
+    ]
+    assert all(trial.state.name == "COMPLETE" for trial in stored.trials)
+
+
+def test_optuna_batched_executor_fails_asked_trials_when_batch_raises(tmp_path) -> None:
+    engine = OptunaSearchEngine(
+        {"sampler": "tpe", "n_trials": 6, "pruner": "none", "batch_size": 3},
+        storage_dir=tmp_path,
+    )
+    space = [{"name": "risk_pct", "type": "float", "low": 0.5, "high": 2.0}]
+
+    def broken_batch(params_list):
+        raise RuntimeError("engine batch failed")
+
+    with pytest.raises(RuntimeError, match="engine batch failed"):
+        engine.optimize_batched(
+            study_name="resumable",
+            search_space=space,
+            batch_objective_fn=broken_batch,
+        )
+    payload = engine.optimize_batched(
+        study_name="resumable",
+        search_space=space,
+        batch_objective_fn=lambda params_list: [
+            None if index == 0 else params["risk_pct"]
+            for index, params in enumerate(params_list)
+        ],
+    )
+
+    states = [trial["state"] for trial in payload["trials"]]
+    assert states.count("RUNNING") == 0
+    assert states[:3] == ["FAIL", "FAIL", "FAIL"]
+    assert payload["failed_trials"] == 5
+    assert payload["completed_trials"] == 4
+
+
+def test_optuna_batched_executor_reports_constant_liar_only_for_tpe(tmp_path) -> None:
+    engine = OptunaSearchEngine(
+        {"sampler": "nsga2", "n_trials": 4, "pruner": "none", "batch_size": 2, "constant_liar": True},
+        storage_dir=tmp_path,
+    )
+
+    payload = engine.optimize_batched(
+        study_name="nsga2_batched",
+        search_space=[{"name": "fast_ma", "type": "int", "low": 5, "high": 20}],
+        batch_objective_fn=lambda params_list: [float(params["fast_ma"]) for params in params_list],
+    )
+
+    assert payload["batches"] == 2
+    assert "constant_liar" not in payload
@@ -266,6 +266,81 @@ def test_bundle_detects_table_tampering(tmp_path: Path) -> None:
         bundle.load_frames()
 
 
+def test_sealed_bundle_parses_manifest_once_and_trusts_verified_tables(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import dataloader.market_data_bundle as bundle_module
+
+    bundle = build_market_data_bundle(_data(), spec=_spec(), output_root=tmp_path)
+    bundle.load_frames()
+    bundle.load_execution_timeline()
+    reopened = bundle_module.MarketDataBundle.open(bundle.manifest_path)
+    hash_calls = []
+    original_hash = bundle_module._frame_content_hash
+    monkeypatch.setattr(
+        bundle_module,
+        "_frame_content_hash",
+        lambda frame: hash_calls.append(frame.shape) or original_hash(frame),
+    )
+    manifest_parses = bundle_module._validated_manifest.cache_info().misses
+    validator = bundle_module._manifest_validator()
+
+    for _ in range(3):
+        assert reopened.bundle_id == bundle.bundle_id
+        assert reopened.content_hash == bundle.content_hash
+    reopened.read_manifest()["symbols"].append("ZZZ")
+    assert reopened.read_manifest()["symbols"] == ["AAA", "BBB"]
+    pd.testing.assert_frame_equal(
+        reopened.load_frames()["close"], _frames()["close"], check_freq=False
+    )
+    reopened.load_execution_timeline()
+    assert hash_calls == []
+    assert bundle_module._validated_manifest.cache_info().misses == manifest_parses
+    assert bundle_module._manifest_validator() is validator
+
+
+def test_verified_table_memo_keeps_one_entry_per_path_within_capacity(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import dataloader.market_data_bundle as bundle_module
+
+    monkeypatch.setattr(bundle_module, "_VERIFIED_TABLE_HASHES", bundle_module.OrderedDict())
+    monkeypatch.setattr(bundle_module, "_VERIFIED_TABLE_HASHES_CAPACITY", 3)
+    bundle = build_market_data_bundle(_data(), spec=_spec(), output_root=tmp_path)
+    bundle.load_frames()
+    bundle.load_frames()
+    bundle.load_execution_timeline()
+
+    memo = bundle_module._VERIFIED_TABLE_HASHES
+    assert len(memo) == 3
+    timeline_path = str(Path(bundle.read_manifest()["tables"]["execution_timeline"]["path"]).resolve())
+    assert next(reversed(memo)) == timeline_path
+
+
+def test_row_window_view_shares_parent_manifest_and_slices_frames(
+    tmp_path: Path,
+) -> None:
+    bundle = build_market_data_bundle(_data(), spec=_spec(), output_root=tmp_path)
+    view = bundle.with_row_window(1, 2)
+
+    assert bundle.market_data_window() is None
+    assert view.market_data_window() == {"start_row": 1, "end_row": 2}
+    assert view.read_manifest() == bundle.read_manifest()
+    assert view.content_hash == bundle.content_hash
+    pd.testing.assert_frame_equal(
+        view.load_frames()["close"], _frames()["close"].iloc[1:2], check_freq=False
+    )
+    assert view.load_execution_timeline()["session_label"].tolist() == (
+        bundle.load_execution_timeline()["session_label"].tolist()[1:2]
+    )
+    assert view.with_row_window(0, 1).market_data_window() == {
+        "start_row": 1,
+        "end_row": 2,
+    }
+    with pytest.raises(ValueError, match="row window"):
+        view.with_row_window(0, 2)
+
+
 def test_bundle_rejects_engine_request_symbol_mismatch(tmp_path: Path) -> None:
     request_mod = __import__("backtester.EngineRequest_backtester", fromlist=["dummy"])
     config = json.loads(
@@ -1,4 +1,5 @@
 from pathlib import Path
+import hashlib
 import json
 import sys
 
@@ -75,6 +76,47 @@ def test_rust_metrics_parquet_service_matches_existing_rust_batch_path(tmp_path:
     assert len(parquet_summary["enriched_rows"]) == len(source)
 
 
+def test_rust_metrics_parquet_writes_enriched_parquet_when_output_path_is_given(
+    tmp_path: Path,
+) -> None:
+    bridge = pytest.importorskip("backtester.RustCoreBridge_backtester")
+    if not bridge.rust_core_available():
+        pytest.skip("Rust core is unavailable")
+
+    source = _sample_metric_frame()
+    parquet_path = tmp_path / "metrics_source.parquet"
+    output_path = tmp_path / "metrics_enriched.parquet"
+    source.to_parquet(parquet_path, index=False)
+
+    summary = bridge.run_metrics_parquet_via_cli(
+        {
+            "parquet_path": str(parquet_path),
+            "time_unit": 252,
+            "risk_free_rate": 0.02,
+            "output_parquet_path": str(output_path),
+        },
+        timeout=120,
+    )
+
+    assert "enriched_rows" not in summary
+    artifact = summary["enriched_parquet"]
+    assert artifact["path"] == str(output_path)
+    assert artifact["row_count"] == len(source)
+    assert artifact["content_hash"] == hashlib.sha256(output_path.read_bytes()).hexdigest()
+    enriched = pd.read_parquet(output_path)
+    assert list(enriched.columns) == [
+        "Time",
+        "Session_label",
+        "Equity_value",
+        "Backtest_id",
+        "BAH_Equity",
+        "BAH_Return",
+        "Drawdown",
+        "BAH_Drawdown",
+    ]
+    assert enriched["Equity_value"].tolist() == source["Equity_value"].tolist()
+
+
 def test_metrics_exporter_can_export_directly_from_parquet(tmp_path: Path) -> None:
     bridge = pytest.importorskip("backtester.RustCoreBridge_backtester")
     if not bridge.rust_core_available():
@@ -0,0 +1,181 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from dataloader.market_data_loader import (
+    MarketDataContractError,
+    MultiAssetMarketDataLoader,
+)
+from dataloader.provider_cache import ProviderBarCache
+
+
+def _binance_daily_spec(start: str, end: str) -> dict:
+    return {
+        "provider": "binance",
+        "symbols": ["BTCUSDT", "ETHUSDT"],
+        "start": start,
+        "end": end,
+        "adjustment_policy": "raw",
+        "session_model": {
+            "calendar_id": "CRYPTO_24_7",
+            "timezone": "UTC",
+            "session_scope": "24x7",
+        },
+        "execution_stream": {
+            "stream_id": "execution_day",
+            "role": "execution",
+            "source": {"kind": "external", "provider_id": "binance"},
+            "session_scope": "24x7",
+            "row_key_kind": "session_label",
+            "bar_spec": {
+                "aggregation": "time",
+                "step": 1,
+                "unit": "day",
+                "price_type": "last",
+                "alignment": "session_open",
+            },
+            "timestamp_semantics": {
+                "timestamp_convention": "bar_close",
+                "availability_policy": "bar_close",
+            },
+        },
+    }
+
+
+class FakeBinance:
+    """Deterministic daily bars for whatever window the loader asks for."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, list[str]]] = []
+        self.bump = 0.0
+
+    def __call__(self, _loader, spec: dict) -> dict[str, pd.DataFrame]:
+        self.calls.append((spec["start"], spec["end"], list(spec["symbols"])))
+        index = pd.date_range(
+            spec["start"], spec["end"], freq="D", inclusive="left", name="Time"
+        )
+        close = pd.DataFrame(
+            {
+                symbol: [
+                    float(rank * 1000 + day.dayofyear) + self.bump for day in index
+                ]
+                for rank, symbol in enumerate(spec["symbols"], start=1)
+            },
+            index=index,
+        )
+        return {
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": pd.DataFrame(10.0, index=index, columns=close.columns),
+        }
+
+
+@pytest.fixture
+def fake_binance(monkeypatch: pytest.MonkeyPatch) -> FakeBinance:
+    fake = FakeBinance()
+    # A plain function binds as a method; the callable instance would not.
+    monkeypatch.setattr(
+        MultiAssetMarketDataLoader,
+        "_download_binance",
+        lambda loader, spec: fake(loader, spec),
+    )
+    return fake
+
+
+def _loader(root: Path, *, offline: bool = False) -> MultiAssetMarketDataLoader:
+    return MultiAssetMarketDataLoader(
+        repo_root=Path.cwd(),
+        provider_cache=ProviderBarCache(root, offline=offline),
+    )
+
+
+def test_repeated_load_is_served_from_cache(fake_binance, tmp_path):
+    spec = _binance_daily_spec("2024-01-01", "2024-01-11")
+
+    first = _loader(tmp_path).load(spec)
+    second = _loader(tmp_path).load(spec)
+
+    assert len(fake_binance.calls) == 1
+    assert len(first["close"]) == 10
+    for field in ("open", "high", "low", "close", "volume"):
+        pd.testing.assert_frame_equal(first[field], second[field], check_freq=False)
+
+
+def test_extended_request_fetches_only_the_missing_tail(fake_binance, tmp_path):
+    _loader(tmp_path).load(_binance_daily_spec("2024-01-01", "2024-01-11"))
+    frames = _loader(tmp_path).load(_binance_daily_spec("2024-01-01", "2024-01-16"))
+
+    # The tail fetch reaches back one cached bar to confirm prices still agree.
+    assert fake_binance.calls[-1] == ("2024-01-10", "2024-01-16", ["BTCUSDT", "ETHUSDT"])
+    assert frames["close"].index.strftime("%Y-%m-%d").tolist()[-1] == "2024-01-15"
+    assert frames["close"].loc[pd.Timestamp("2024-01-15"), "ETHUSDT"] == pytest.approx(2015.0)
+
+    sub_window = _loader(tmp_path).load(_binance_daily_spec("2024-01-05", "2024-01-08"))
+    assert len(fake_binance.calls) == 2
+    assert sub_window["close"].index.strftime("%Y-%m-%d").tolist() == [
+        "2024-01-05",
+        "2024-01-06",
+        "2024-01-07",
+    ]
+
+
+def test_offline_mode_serves_cache_and_fails_closed_on_miss(fake_binance, tmp_path):
+    _loader(tmp_path).load(_binance_daily_spec("2024-01-01", "2024-01-11"))
+
+    frames = _loader(tmp_path, offline=True).load(
+        _binance_daily_spec("2024-01-03", "2024-01-09")
+    )
+    assert len(fake_binance.calls) == 1
+    assert len(frames["close"]) == 6
+
+    with pytest.raises(MarketDataContractError) as raised:
+        _loader(tmp_path, offline=True).load(
+            _binance_daily_spec("2024-01-01", "2024-01-20")
+        )
+    assert raised.value.error_code == "provider_cache_miss"
+    assert raised.value.details["missing_windows"]["BTCUSDT"] == [
+        ["2024-01-11T00:00:00", "2024-01-20T00:00:00"]
+    ]
+    assert len(fake_binance.calls) == 1
+
+
+def test_revised_overlap_refetches_the_whole_request(fake_binance, tmp_path):
+    _loader(tmp_path).load(_binance_daily_spec("2024-01-01", "2024-01-11"))
+    fake_binance.bump = 0.25
+
+    frames = _loader(tmp_path).load(_binance_daily_spec("2024-01-01", "2024-01-16"))
+
+    assert fake_binance.calls[-1] == ("2024-01-01", "2024-01-16", ["BTCUSDT", "ETHUSDT"])
+    assert frames["close"].loc[pd.Timestamp("2024-01-02"), "BTCUSDT"] == pytest.approx(1002.25)
+
+
+def test_unsettled_bars_are_served_but_not_persisted(tmp_path):
+    cache = ProviderBarCache(tmp_path)
+    calls: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+
+    def fetch(start, end, symbols):
+        calls.append((start, end))
+        index = pd.date_range(start, end, freq="h", inclusive="left", tz="UTC")
+        close = pd.DataFrame({symbols[0]: 100.0}, index=index)
+        return {field: close for field in ("open", "high", "low", "close", "volume")}
+
+    def load():
+        return cache.load_bars(
+            provider="binance",
+            interval="1_hour",
+            variant="test",
+            symbols=["BTCUSDT"],
+            start=pd.Timestamp("2024-01-01"),
+            end=None,
+            bar_step=pd.Timedelta(hours=1),
+            slice_offset=pd.Timedelta(0),
+            fetch=fetch,
+            now=pd.Timestamp("2024-01-01T05:30:00Z"),
+        )
+
+    assert len(load()["close"]) == 6
+    assert len(load()["close"]) == 6
+    assert calls[-1] == (pd.Timestamp("2024-01-01T04:00:00"), pd.Timestamp("2024-01-01T05:30:00"))
@@ -382,6 +382,88 @@ def test_engine_service_client_enforces_request_timeout():
     client.close()
 
 
+def test_engine_service_client_backs_off_when_worker_queue_is_full():
+    import json
+    import queue
+
+    from backtester.EngineServiceClient_backtester import EngineServiceClient
+
+    envelopes: list[dict] = []
+    frames: queue.Queue = queue.Queue()
+
+    class _Input:
+        def write(self, value):
+            envelope = json.loads(value)
+            envelopes.append(envelope)
+            base = {
+                "protocol_version": "engine_service.v1",
+                "request_id": envelope["request_id"],
+            }
+            if len(envelopes) == 1:
+                frames.put(
+                    {
+                        **base,
+                        "status": "error",
+                        "error": {"code": "queue_full", "message": "full", "retryable": True},
+                        "scheduling": {"queue_depth": 4, "queue_capacity": 4, "queue_wait_ms": 0},
+                    }
+                )
+            else:
+                frames.put(
+                    {
+                        **base,
+                        "status": "ok",
+                        "result": {"rows": 1},
+                        "scheduling": {"queue_depth": 0, "queue_capacity": 4, "queue_wait_ms": 7},
+                    }
+                )
+            return len(value)
+
+        def flush(self):
+            return None
+
+    class _Output:
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            frame = frames.get()
+            if frame is None:
+                raise StopIteration
+            return json.dumps(frame) + "\n"
+
+    class _Process:
+        stdin = _Input()
+        stdout = _Output()
+        returncode = None
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            self.returncode = 0
+            frames.put(None)
+
+        def wait(self, timeout):
+            return self.returncode
+
+        def kill(self):
+            self.terminate()
+
+    client = EngineServiceClient(lambda: _Process(), availability_check=lambda: True)
+    client.queue_full_initial_backoff_seconds = 0.01
+
+    result = client.execute("rank_selection", {}, timeout=5, priority=3, max_threads=2)
+    client.close()
+
+    assert result == {"rows": 1}
+    assert len(envelopes) == 2
+    assert envelopes[0]["request_id"] == envelopes[1]["request_id"]
+    assert envelopes[1]["priority"] == 3
+    assert envelopes[1]["resource_budget"] == {"max_operation_ms": 5000, "max_threads": 2}
+    assert client.last_scheduling["queue_wait_ms"] == 7
+
+
 def test_engine_service_emits_progress_and_recovers_after_process_exit():
     bridge = importlib.import_module("backtester.RustCoreBridge_backtester")
     if not bridge.rust_core_available():
@@ -453,6 +535,328 @@ def test_engine_service_multiplexes_concurrent_requests_by_request_id():
     assert client.process is not None
 
 
+def test_engine_service_frames_lift_long_numeric_arrays_into_the_body():
+    import io
+
+    from backtester.EngineServiceFraming_backtester import encode_frame, read_frame
+
+    envelope = {
+        "request_id": "r1",
+        "payload": {
+            "equity": [100.0 + index * 0.25 for index in range(40)],
+            "indices": list(range(40)),
+            "short": [1.5, 2.5],
+            "flags": [True] * 40,
+        },
+    }
+
+    frame = encode_frame(envelope)
+
+    assert b"100.25" not in frame
+    assert b'"short":[1.5,2.5]' in frame
+    stream = io.BytesIO(frame + frame)
+    assert read_frame(stream) == envelope
+    assert read_frame(stream) == envelope
+    assert read_frame(stream) is None
+
+
+def test_engine_service_negotiates_frames_and_matches_json_lines():
+    from backtester.EngineServiceClient_backtester import EngineServiceClient
+
+    bridge = importlib.import_module("backtester.RustCoreBridge_backtester")
+    if not bridge.rust_core_available():
+        pytest.skip("Rust core is unavailable")
+    command = bridge._rust_bin_command(bridge._ENGINE_SERVICE_BIN, "engine_service_cli")
+
+    def _spawn(text: bool):
+        return subprocess.Popen(
+            command,
+            cwd=bridge._CRATE_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=text,
+        )
+
+    cols = 48
+    payload = {
+        "rows": 2,
+        "cols": cols,
+        "eligible": [True] * (2 * cols),
+        "score": [((index * 7) % 11) / 3.0 for index in range(2 * cols)],
+        "ascending": False,
+        "top_n": 5,
+        "position_limit": 0.3,
+    }
+    framed = EngineServiceClient(
+        lambda: _spawn(False), availability_check=lambda: True, transport="framed.v1"
+    )
+    lines = EngineServiceClient(lambda: _spawn(True), availability_check=lambda: True)
+    try:
+        framed_result = framed.execute("rank_selection", payload, timeout=30)
+        lines_result = lines.execute("rank_selection", payload, timeout=30)
+        assert framed.transport == "framed.v1"
+        assert lines.transport == "json_lines"
+    finally:
+        framed.close(graceful=True)
+        lines.close(graceful=True)
+
+    assert framed_result == lines_result
+
+
+def test_engine_service_client_falls_back_to_json_lines_when_frames_are_declined():
+    import json
+    import queue
+
+    from backtester.EngineServiceClient_backtester import EngineServiceClient
+
+    lines: queue.Queue = queue.Queue()
+
+    class _Input:
+        def write(self, value):
+            envelope = json.loads(value)
+            if envelope["command"] == "negotiate_transport":
+                response = {
+                    "protocol_version": "engine_service.v1",
+                    "request_id": "",
+                    "status": "error",
+                    "error": {"code": "invalid_envelope", "message": "unknown variant"},
+                }
+            else:
+                response = {
+                    "protocol_version": "engine_service.v1",
+                    "request_id": envelope["request_id"],
+                    "status": "ok",
+                    "result": {"rows": 1},
+                }
+            lines.put(json.dumps(response).encode("utf-8") + b"\n")
+            return len(value)
+
+        def flush(self):
+            return None
+
+    class _Output:
+        def readline(self):
+            return lines.get()
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            line = lines.get()
+            if line is None:
+                raise StopIteration
+            return line
+
+    class _Process:
+        stdin = _Input()
+        stdout = _Output()
+        returncode = None
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            self.returncode = 0
+            lines.put(None)
+
+        def wait(self, timeout):
+            return self.returncode
+
+        def kill(self):
+            self.terminate()
+
+    client = EngineServiceClient(
+        lambda: _Process(), availability_check=lambda: True, transport="framed.v1"
+    )
+
+    assert client.execute("rank_selection", {}, timeout=5) == {"rows": 1}
+    assert client.transport == "json_lines"
+    client.close()
+
+
+def test_engine_service_client_stops_a_service_that_never_acks_negotiation():
+    import subprocess
+    import threading
+
+    from backtester.EngineServiceClient_backtester import EngineServiceClient
+
+    closed = threading.Event()
+
+    class _Input:
+        def write(self, value):
+            return len(value)
+
+        def flush(self):
+            return None
+
+    class _Output:
+        def readline(self):
+            closed.wait(5)
+            return b""
+
+    class _Process:
+        stdin = _Input()
+        stdout = _Output()
+        returncode = None
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            self.returncode = -15
+            closed.set()
+
+        def wait(self, timeout):
+            return self.returncode
+
+        def kill(self):
+            self.terminate()
+
+    process = _Process()
+    client = EngineServiceClient(
+        lambda: process, availability_check=lambda: True, transport="framed.v1"
+    )
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        client.start(timeout=0.1)
+    assert closed.is_set()
+    assert client.process is None
+
+
+def test_engine_service_pool_routes_least_outstanding_with_bundle_affinity():
+    from backtester.EngineServicePool_backtester import EngineServicePool
+
+    def _never_spawn():
+        raise AssertionError("routing must not start processes")
+
+    pool = EngineServicePool(_never_spawn, availability_check=lambda: True, size=3)
+
+    assert [pool._acquire(None) for _ in range(3)] == [0, 1, 2]
+    assert pool._acquire("bundle-a") == 0
+    assert pool.outstanding() == [2, 1, 1]
+    # The bound member stays preferred while it is at most two requests busier.
+    assert pool._acquire("bundle-a") == 0
+    assert pool._acquire("bundle-a") == 0
+    assert pool.outstanding() == [4, 1, 1]
+    assert pool._acquire("bundle-a") == 1
+    assert pool._acquire("bundle-b") == 2
+    assert pool.outstanding() == [4, 2, 2]
+
+
+def test_engine_service_pool_resubmits_after_member_process_exits():
+    import json
+    import queue
+
+    from backtester.EngineServicePool_backtester import EngineServicePool
+
+    spawned: list = []
+
+    class _Process:
+        def __init__(self, crash: bool):
+            self.crash = crash
+            self.returncode = None
+            self.lines: queue.Queue = queue.Queue()
+            self.stdin = self
+            self.stdout = self
+
+        def write(self, value):
+            envelope = json.loads(value)
+            if self.crash:
+                self.terminate()
+            else:
+                self.lines.put(
+                    json.dumps(
+                        {
+                            "protocol_version": "engine_service.v1",
+                            "request_id": envelope["request_id"],
+                            "status": "ok",
+                            "result": {"process": len(spawned)},
+                        }
+                    )
+                    + "\n"
+                )
+            return len(value)
+
+        def flush(self):
+            return None
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            line = self.lines.get()
+            if line is None:
+                raise StopIteration
+            return line
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            if self.returncode is None:
+                self.returncode = 1
+                self.lines.put(None)
+
+        def wait(self, timeout):
+            return self.returncode
+
+        def kill(self):
+            self.terminate()
+
+    def _spawn():
+        process = _Process(crash=not spawned)
+        spawned.append(process)
+        return process
+
+    pool = EngineServicePool(_spawn, availability_check=lambda: True, size=2)
+
+    assert pool.execute("rank_selection", {}, timeout=5) == {"process": 2}
+    assert len(spawned) == 2
+    assert pool.outstanding() == [0, 0]
+    pool.close()
+
+
+def test_engine_service_pool_spreads_concurrent_requests_across_processes():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from backtester.EngineServicePool_backtester import EngineServicePool
+
+    bridge = importlib.import_module("backtester.RustCoreBridge_backtester")
+    if not bridge.rust_core_available():
+        pytest.skip("Rust core is unavailable")
+    pool = EngineServicePool(
+        bridge._spawn_engine_service_process,
+        availability_check=bridge.rust_core_available,
+        size=2,
+        transport=bridge._ENGINE_TRANSPORT,
+    )
+    payload = {
+        "rows": 1,
+        "cols": 3,
+        "eligible": [True, True, True],
+        "score": [3.0, 2.0, 1.0],
+        "ascending": False,
+        "top_n": 1,
+        "position_limit": 1.0,
+    }
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: pool.execute("rank_selection", payload, timeout=30),
+                    range(8),
+                )
+            )
+        processes = pool.processes
+    finally:
+        pool.close(graceful=True)
+
+    assert all(result["selected_indices"] == [[0]] for result in results)
+    assert all(process is not None for process in processes)
+    assert processes[0] is not processes[1]
+
+
 def test_engine_service_accepts_cancel_while_request_is_running():
     from concurrent.futures import ThreadPoolExecutor
 
@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 from jsonschema import Draft202012Validator
 
-from app.api.shared_chart_series import SharedChartSeriesStore
+from app.api.shared_chart_series import SharedChartSeriesStore, select_series_window
 from app.runtime.registry import AppRegistry
 
 
@@ -85,6 +85,12 @@ def test_plot_and_overview_indexes_share_identical_curve_storage(tmp_path: Path)
     assert store.materialize_plot_bundle(run_id, plot_index) == plot
     assert store.materialize_metrics_overview(run_id, overview_index) == overview
 
+    levels = [{"max_points": 3, "indices": [0, 1]}]
+    lod_index = store.compact_plot_bundle(run_id, plot, lod={"candidate-a": levels})
+    assert store.materialize_plot_bundle(run_id, lod_index) == plot
+    with_lod = store.materialize_plot_bundle(run_id, lod_index, include_lod=True)
+    assert with_lod["series"][0]["lod"] == levels
+
 
 def test_backtest_detail_index_externalizes_only_declared_shared_fields(
     tmp_path: Path,
@@ -109,3 +115,39 @@ def test_backtest_detail_index_externalizes_only_declared_shared_fields(
     assert "benchmark_series" not in index["payload"]
     assert index["payload"]["equity_series"] == payload["equity_series"]
     assert store.materialize_backtest_detail(run_id, index) == payload
+
+
+def test_series_window_serves_finest_fitting_lod_level(tmp_path: Path) -> None:
+    store = SharedChartSeriesStore(AppRegistry(tmp_path))
+    run_id = "run-lod"
+    x = [f"2026-01-{day:02d} {hour:02d}:00:00" for day in range(1, 31) for hour in range(24)]
+    series = {
+        "series_id": "strategy",
+        "label": "Strategy",
+        "x": x,
+        "y": [float(index) for index in range(len(x))],
+        "lod": [
+            {"max_points": 16, "indices": list(range(0, len(x), 48)) + [len(x) - 1]},
+            {"max_points": 64, "indices": list(range(0, len(x), 12)) + [len(x) - 1]},
+        ],
+    }
+
+    compact = store._compact_one_series(run_id, series)  # noqa: SLF001 - storage layout guard.
+    assert "lod" not in compact
+    restored = store._materialize_one_series(run_id, compact)  # noqa: SLF001
+    assert restored["lod"] == series["lod"]
+
+    full = select_series_window(restored)
+    month = select_series_window(restored, max_points=20)
+    week = select_series_window(restored, max_points=100, x_start="2026-01-08", x_end="2026-01-14")
+    day = select_series_window(restored, max_points=100, x_start="2026-01-10", x_end="2026-01-10")
+
+    assert "lod" not in full and full["x"] == x
+    assert len(month["x"]) == 16 and month["x"][-1] == x[-1]
+    assert week["x"] == [x[index] for index in range(7 * 24, 14 * 24, 12)]
+    assert day["x"] == x[9 * 24 : 10 * 24]
+
+    # A budget below the coarsest level is clamped to it, not strided.
+    assert select_series_window(restored, max_points=5)["x"] == month["x"]
+    bare = {key: value for key, value in restored.items() if key != "lod"}
+    assert select_series_window(bare, max_points=5)["x"] == x
@@ -813,7 +813,7 @@ def test_matrix_result_retention_zero_keeps_summary_rows_only(monkeypatch, tmp_p
     assert calls == []
 
 
-def test_large_matrix_retention_uses_bounded_rust_batches_before_winner_replay(
+def test_large_matrix_retention_keeps_winners_inside_bounded_rust_batches(
     monkeypatch, tmp_path
 ):
     runner = UnifiedBacktestRunnerBacktester()
@@ -837,12 +837,17 @@ def test_large_matrix_retention_uses_bounded_rust_batches_before_winner_replay(
         chunk = list(kwargs["variants"])
         ids = [item["config"]["strategy_id"] for item in chunk]
         calls.append(ids)
+        assert kwargs["retain_top"] == 2
+        winners = sorted(
+            chunk,
+            key=lambda item: -item["config"]["resolved_params"]["period"],
+        )[: kwargs["retain_top"]]
         results = [
             SimpleNamespace(
                 strategy_id=str(item["config"]["strategy_id"]),
                 config=item["config"],
             )
-            for strategy_id, item in zip(ids, chunk)
+            for item in winners
         ]
         rows = [
             {
@@ -872,11 +877,7 @@ def test_large_matrix_retention_uses_bounded_rust_batches_before_winner_replay(
         engine_request=None,
     )
 
-    assert [len(chunk) for chunk in calls] == [3, 3, 3, 1, 2]
-    assert calls[-1] == [
-        "bounded_matrix:parameter_matrix:period_8",
-        "bounded_matrix:parameter_matrix:period_9",
-    ]
+    assert [len(chunk) for chunk in calls] == [3, 3, 3, 1]
     assert [result.strategy_id for result in retained] == [
         "bounded_matrix:parameter_matrix:period_9",
         "bounded_matrix:parameter_matrix:period_8",
@@ -1122,3 +1123,38 @@ def test_execution_weight_parser_rejects_invalid_values() -> None:
         runner._normalized_weight_map({"QQQ": "invalid"})
     with pytest.raises(ValueError, match="must be finite"):
         runner._normalized_weight_map({"QQQ": float("nan")})
+
+
+def test_matrix_result_cache_serves_rerun_with_fresh_retention_labels(monkeypatch, tmp_path):
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_BYTES", str(1 << 24))
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_PATH", str(tmp_path / "results.sqlite3"))
+    dispatched = []
+    original_dispatch = UnifiedBacktestRunnerBacktester._dispatch_portfolio_rust_batch
+
+    def counting_dispatch(self, **kwargs):
+        dispatched.append((len(kwargs["variants"]), kwargs.get("retain_top")))
+        return original_dispatch(self, **kwargs)
+
+    monkeypatch.setattr(
+        UnifiedBacktestRunnerBacktester,
+        "_dispatch_portfolio_rust_batch",
+        counting_dispatch,
+    )
+    config = _with_bounded_matrix(
+        _load_example("strategy-run-qqq-yfinance-daily-sma-cross-matrix-example.json")
+    )
+
+    first = _run_example(config, tmp_path / "first")
+    dispatch_count = len(dispatched)
+    config["fill_model"]["matrix_result_retention"] = 1
+    second = _run_example(config, tmp_path / "second")
+
+    assert len(dispatched) == dispatch_count
+    first_rows = first["portfolio_matrix_summary"]["rows"]
+    second_rows = second["portfolio_matrix_summary"]["rows"]
+    assert [row["result_materialization"] for row in first_rows].count("full") == 4
+    assert [row["result_materialization"] for row in second_rows].count("full") == 1
+    assert [row["strategy_id"] for row in second_rows] == [row["strategy_id"] for row in first_rows]
+    assert len(second["portfolio_results"]) == 1
+    assert second["portfolio_results"][0].feature_cache["result_cache_hit"] == 1
+    _assert_full_result_bundle(second, 1)
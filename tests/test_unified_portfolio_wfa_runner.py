@@ -1417,11 +1417,240 @@ def test_unified_portfolio_wfa_can_optimize_single_asset_position_state_strategy
     assert result.selected_optimum["wfa_row_type"].unique().tolist() == ["selected_optimum"]
 
 
-def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
-    runner_mod = importlib.import_module(
-        "validation_workflow.UnifiedPortfolioWFARunner_validation_workflow"
+def test_unified_portfolio_wfa_parallel_windows_match_sequential_order(monkeypatch):
+    runner_mod = importlib.import_module("validation_workflow.UnifiedPortfolioWFARunner_validation_workflow")
+
+    def fake_rust_candidates(self, *, candidates, market_data, **_kwargs):
+        dates = market_data["close"].index
+        returns = [0.0] + [0.01 * (1 + idx % 3) for idx in range(max(len(dates) - 1, 0))]
+        return [
+            SimpleNamespace(
+                strategy_id=candidate["candidate_id"],
+                config={**dict(candidate.get("config") or {}), "strategy_id": candidate["candidate_id"]},
+                equity_curve=pd.DataFrame(
+                    {
+                        "Time": dates,
+                        "Session_label": self.execution_timeline.reindex(dates)[
+                            "session_label"
+                        ].astype(str).tolist(),
+                        "Equity_value": [
+                            100.0 + idx - (2.0 if idx > 0 and idx % 5 == 0 else 0.0)
+                            for idx in range(len(dates))
+                        ],
+                        "Portfolio_return": returns,
+                        "Turnover": [0.0 for _ in dates],
+                        "Trade_cost": [0.0 for _ in dates],
+                        "Selected_count": [1 for _ in dates],
+                        "Gross_exposure": [1.0 for _ in dates],
+                        "Cash_weight": [0.0 for _ in dates],
+                        "Weight_AAA": [1.0 for _ in dates],
+                        "Contribution_AAA": returns,
+                    }
+                ),
+                rebalance_audit=pd.DataFrame(),
+                risk_gate_events=pd.DataFrame(),
+                validation_report={"accounting_fast_path": "rust_test_double"},
+            )
+            for candidate in candidates
+        ]
+
+    monkeypatch.setattr(
+        runner_mod.UnifiedPortfolioWFARunner,
+        "_run_candidates_with_rust",
+        fake_rust_candidates,
     )
-    bridge_mod = importlib.import_module("backtester.UnifiedBacktestRunner_backtester")
+    strategy_config = _canonical_strategy_config(
+        {
+            "metadata": {"strategy_id": "parallel_window_probe"},
+            "universe": {"symbols": ["AAA"]},
+            "computed_fields": [],
+            "rebalance": {"trigger": {"op": "calendar.every_session"}},
+            "allocation": {"method": "fixed_weights", "weights": {"AAA": 1.0}},
+            "fill_model": {"cost": {"transaction_cost": 0.0, "slippage": 0.0}},
+        }
+    )
+
+    def run(max_parallel_windows):
+        return _wfa_runner(
+            runner_mod,
+            market_data={"close": _market_data()["close"][["AAA"]]},
+            strategy_config=strategy_config,
+            wfa_config={
+                "windowing": {
+                    "train_size": 35,
+                    "test_size": 10,
+                    "step_size": 10,
+                    "max_parallel_windows": max_parallel_windows,
+                },
+                "optimizer": {"objectives": ["sharpe", "calmar"]},
+            },
+        ).run()
+
+    sequential = run(1)
+    parallel = run(3)
+
+    pd.testing.assert_frame_equal(parallel.selected_optimum, sequential.selected_optimum)
+    pd.testing.assert_frame_equal(
+        parallel.candidate_diagnostics, sequential.candidate_diagnostics
+    )
+    assert [item["backtest_id"] for item in parallel.window_backtests] == [
+        item["backtest_id"] for item in sequential.window_backtests
+    ]
+    assert parallel.metadata["warmup_projection"] == sequential.metadata["warmup_projection"]
+    scheduler = parallel.metadata["window_scheduler"]
+    assert scheduler["max_parallel_windows"] == 3
+    assert scheduler["peak_inflight_windows"] > 1
+    assert [item["window_id"] for item in scheduler["windows"]] == list(
+        range(1, parallel.metadata["window_count"] + 1)
+    )
+    assert all(item["market_data_bytes"] > 0 for item in scheduler["windows"])
+    assert sequential.metadata["window_scheduler"]["peak_inflight_windows"] == 1
+
+
+def test_wfa_window_scheduler_admits_windows_within_memory_budget():
+    scheduler_mod = importlib.import_module(
+        "validation_workflow.WFAWindowScheduler_validation_workflow"
+    )
+    scheduler = scheduler_mod.WFAWindowScheduler(
+        max_parallel_windows=4,
+        memory_budget_bytes=100,
+    )
+    sizes = {1: 40, 2: 40, 3: 90, 4: 250, 5: 10}
+
+    outcomes = scheduler.run(
+        list(sizes),
+        prepare=lambda window_id: (window_id * 10, sizes[window_id]),
+        execute=lambda window_id, prepared: (window_id, prepared),
+    )
+
+    assert outcomes == [(window_id, window_id * 10) for window_id in sizes]
+    report = scheduler.report()
+    assert report["peak_inflight_bytes"] <= 250
+    assert report["peak_inflight_windows"] <= 2
+    assert [item["market_data_bytes"] for item in report["windows"]] == list(sizes.values())
+
+
+def test_wfa_window_scheduler_raises_earliest_failed_window():
+    scheduler_mod = importlib.import_module(
+        "validation_workflow.WFAWindowScheduler_validation_workflow"
+    )
+    scheduler = scheduler_mod.WFAWindowScheduler(max_parallel_windows=3)
+
+    def execute(window_id, _prepared):
+        if window_id >= 2:
+            raise RuntimeError(f"window {window_id} failed")
+        return window_id
+
+    with pytest.raises(RuntimeError, match="window 2 failed"):
+        scheduler.run([1, 2, 3], prepare=lambda window_id: (None, 1), execute=execute)
+
+
+def test_unified_portfolio_wfa_optuna_optimizer_trains_asked_batches(monkeypatch):
+    runner_mod = importlib.import_module("validation_workflow.UnifiedPortfolioWFARunner_validation_workflow")
+    train_batches = []
+
+    def fake_rust_candidates(
+        self,
+        *,
+        candidates,
+        market_data,
+        run_id_base,
+        run_scope,
+        evaluation_start,
+        evaluation_end,
+    ):
+        del run_id_base, evaluation_start, evaluation_end
+        if run_scope == "validation_train_window":
+            train_batches.append([candidate["params"]["lookback"] for candidate in candidates])
+        dates = market_data["close"].index
+        results = []
+        for candidate in candidates:
+            drift = 0.002 * candidate["params"]["lookback"]
+            returns = [0.0] + [
+                drift if idx % 3 else -0.004 for idx in range(1, len(dates))
+            ]
+            equity = pd.DataFrame(
+                {
+                    "Time": dates,
+                    "Session_label": self.execution_timeline.reindex(dates)[
+                        "session_label"
+                    ].astype(str).tolist(),
+                    "Equity_value": (100.0 * (1.0 + pd.Series(returns)).cumprod()).tolist(),
+                    "Portfolio_return": returns,
+                    "Turnover": [0.0 for _ in dates],
+                    "Trade_cost": [0.0 for _ in dates],
+                    "Selected_count": [1 for _ in dates],
+                    "Gross_exposure": [1.0 for _ in dates],
+                    "Cash_weight": [0.0 for _ in dates],
+                    "Weight_AAA": [1.0 for _ in dates],
+                    "Contribution_AAA": returns,
+                }
+            )
+            candidate_config = dict(candidate.get("config") or {})
+            candidate_config["strategy_id"] = candidate["candidate_id"]
+            results.append(
+                SimpleNamespace(
+                    strategy_id=candidate["candidate_id"],
+                    config=candidate_config,
+                    equity_curve=equity,
+                    rebalance_audit=pd.DataFrame(),
+                    risk_gate_events=pd.DataFrame(),
+                    validation_report={"accounting_fast_path": "rust_test_double"},
+                )
+            )
+        return results
+
+    monkeypatch.setattr(
+        runner_mod.UnifiedPortfolioWFARunner,
+        "_run_candidates_with_rust",
+        fake_rust_candidates,
+    )
+
+    strategy_config = {
+        "metadata": {"strategy_id": "optuna_probe"},
+        "universe": {"symbols": ["AAA"]},
+        "parameter_domains": {"lookback": [2, 4, 6, 8, 10]},
+        "computed_fields": [
+            {
+                "name": "momentum",
+                "op": "indicator.momentum",
+                "source": "close",
+                "period": {"param_ref": "lookback"},
+            }
+        ],
+        "rebalance": {"trigger": {"op": "calendar.every_session"}},
+        "allocation": {"method": "fixed_weights", "weights": {"AAA": 1.0}},
+        "fill_model": {"cost": {"transaction_cost": 0.0, "slippage": 0.0}},
+    }
+    result = _wfa_runner(runner_mod,
+        market_data={"close": _market_data()["close"][["AAA"]]},
+        strategy_config=_canonical_strategy_config(strategy_config),
+        wfa_config={
+            "windowing": {"train_size": 35, "test_size": 10, "step_size": 20},
+            "optimizer": {
+                "type": "optuna",
+                "sampler": "tpe",
+                "objectives": ["sharpe"],
+                "n_trials": 4,
+                "n_startup_trials": 2,
+                "batch_size": 2,
+                "pruner": "none",
+                "random_seed": 7,
+            },
+        },
+    ).run()
+
+    studies = result.metadata["optuna_studies"]
+    assert [study["window_id"] for study in studies] == [1, 2, 3]
+    assert all(study["batches"] == 2 and study["constant_liar"] for study in studies)
+    assert all(1 <= len(batch) <= 2 for batch in train_batches)
+    trained = [study["trained_candidate_count"] for study in studies]
+    assert result.selected_optimum["candidate_count"].tolist() == trained
+    assert result.metadata["candidate_budget_method"] == "optuna_search"
+    assert result.metadata["total_candidate_count"] == 5
+
+
+def _bounded_wfa_probe_runner(runner_mod):
     dates = pd.date_range("2023-01-02", periods=40, freq="B")
     close = pd.DataFrame(
         {"QQQ": [100.0 + idx * 0.2 + (idx % 7) * 0.3 for idx in range(len(dates))]},
@@ -1479,7 +1708,7 @@ def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
             "cost": {"transaction_cost": 0.0, "slippage": 0.0},
         },
     }
-    runner = _wfa_runner(
+    return _wfa_runner(
         runner_mod,
         market_data={"close": close, "open": close},
         strategy_config=_canonical_strategy_config(strategy_config),
@@ -1487,12 +1716,23 @@ def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
             "windowing": {"train_size": 20, "test_size": 5, "step_size": 5}
         },
     )
+
+
+def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
+    runner_mod = importlib.import_module(
+        "validation_workflow.UnifiedPortfolioWFARunner_validation_workflow"
+    )
+    bridge_mod = importlib.import_module("backtester.UnifiedBacktestRunner_backtester")
+    runner = _bounded_wfa_probe_runner(runner_mod)
     call_sizes = []
+    bundle_windows = []
 
     def fake_matrix_batch(self, **kwargs):
         del self
         variants = list(kwargs["variants"])
         call_sizes.append(len(variants))
+        bundle = kwargs["market_data_bundle"]
+        bundle_windows.append((bundle.manifest_path, bundle.market_data_window()))
         return [
             SimpleNamespace(strategy_id=item["config"]["strategy_id"])
             for item in variants
@@ -1514,6 +1754,9 @@ def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
     )
 
     assert call_sizes == [2, 2, 1]
+    assert bundle_windows == [
+        (runner.market_data_bundle.manifest_path, {"start_row": 0, "end_row": 40})
+    ] * 3
     assert results is not None
     assert len(results) == 5
     assert all(
@@ -1524,6 +1767,78 @@ def test_unified_portfolio_wfa_splits_large_rust_candidate_batches(monkeypatch):
     )
 
 
+def test_unified_portfolio_wfa_reuses_cached_candidates_across_runs(monkeypatch, tmp_path):
+    runner_mod = importlib.import_module(
+        "validation_workflow.UnifiedPortfolioWFARunner_validation_workflow"
+    )
+    bridge_mod = importlib.import_module("backtester.UnifiedBacktestRunner_backtester")
+    result_mod = importlib.import_module("backtester.BacktestResult_backtester")
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_BYTES", str(1 << 24))
+    monkeypatch.setenv("LO2CIN4BT_RESULT_CACHE_PATH", str(tmp_path / "results.sqlite3"))
+    runner = _bounded_wfa_probe_runner(runner_mod)
+    dispatched = []
+
+    def fake_dispatch(self, **kwargs):
+        del self
+        variants = list(kwargs["variants"])
+        dispatched.append(len(variants))
+        results = []
+        rows = []
+        for offset, variant in enumerate(variants):
+            strategy_id = variant["candidate_id"]
+            equity = pd.DataFrame({"equity": [100.0, 101.0 + offset]})
+            results.append(
+                result_mod.MultiAssetBacktestResult(
+                    strategy_id=strategy_id,
+                    equity_curve=equity,
+                    holdings=pd.DataFrame(),
+                    rebalance_audit=pd.DataFrame(),
+                    rebalance_trades=pd.DataFrame(),
+                    feature_cache={"computed": 2},
+                    config=dict(variant["config"]),
+                    validation_report={"status": "valid"},
+                )
+            )
+            rows.append(
+                {
+                    "strategy_id": strategy_id,
+                    "backtest_id": strategy_id,
+                    "final_equity": 101.0 + offset,
+                }
+            )
+        return results, rows, []
+
+    monkeypatch.setattr(
+        bridge_mod.UnifiedBacktestRunnerBacktester,
+        "_dispatch_portfolio_rust_batch",
+        fake_dispatch,
+    )
+
+    def run():
+        return runner._run_candidates_with_rust(
+            candidates=runner._candidate_configs(),
+            market_data=runner.market_data,
+            run_id_base="cached_wfa",
+            run_scope="validation_train_window",
+            evaluation_start=pd.Timestamp("2023-01-02"),
+            evaluation_end=pd.Timestamp("2023-02-24"),
+        )
+
+    first = run()
+    second = run()
+
+    assert dispatched == [2, 2, 1]
+    assert [result.strategy_id for result in second] == [
+        result.strategy_id for result in first
+    ]
+    assert all(result.feature_cache["result_cache_hit"] == 1 for result in second)
+    assert all(
+        result.validation_report["result_cache"]["status"] == "hit" for result in second
+    )
+    for cached, fresh in zip(second, first):
+        pd.testing.assert_frame_equal(cached.equity_curve, fresh.equity_curve)
+
+
 def test_unified_portfolio_wfa_exporter_separates_selected_and_diagnostics(tmp_path):
     runner_mod = importlib.import_module("validation_workflow.UnifiedPortfolioWFARunner_validation_workflow")
     exporter_mod = importlib.import_module("validation_workflow.UnifiedPortfolioWFAExporter_validation_workflow")
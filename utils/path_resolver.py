@@ -54,6 +54,8 @@ def app_outputs_paths(repo_root: Path) -> dict[str, Path]:
         "screenshots": app_root / "screenshots",
         "stage_status": app_root / "stage_status",
         "latest_runs": app_root / "latest_runs.json",
+        "run_index": app_root / "run_index.sqlite3",
+        "batch_journal": app_root / "batch_journal.sqlite3",
     }
 
 
@@ -61,7 +63,7 @@ def ensure_app_outputs_structure(repo_root: Path) -> dict[str, Path]:
     """Ensure canonical app output folders exist and return their paths."""
     paths = app_outputs_paths(repo_root)
     for key, path in paths.items():
-        if key == "latest_runs":
+        if key in {"latest_runs", "run_index", "batch_journal"}:
             continue
         path.mkdir(parents=True, exist_ok=True)
     if not paths["latest_runs"].exists():
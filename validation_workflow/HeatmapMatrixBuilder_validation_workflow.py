@@ -5,6 +5,8 @@ from collections import defaultdict
 import math
 from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
 from validation_workflow.RobustSelector_validation_workflow import RobustSelector
 from validation_workflow.WFAAcceptanceEvaluator_validation_workflow import WFAAcceptanceEvaluator
 
@@ -83,6 +85,8 @@ class HeatmapMatrixBuilder:
     WFA_PACK_STRATEGIES = ["minimal", "balanced", "stability_first", "cluster_coverage"]
     DEFAULT_WFA_PACK_STRATEGY = "balanced"
     DEFAULT_RANKING_PROFILE = "balanced"
+    PLATEAU_NEIGHBOR_DISTANCE = 20.0
+    PLATEAU_BLOCK_ELEMENTS = 1 << 21
     RANKING_PROFILES: ClassVar[Dict[str, Dict[str, Any]]] = {
         "balanced": {
             "weights": {
@@ -371,11 +375,10 @@ class HeatmapMatrixBuilder:
             if values and score_value is not None:
                 cell_scores[key] = score_value
         sorted_cells = sorted(cell_scores.items(), key=lambda item: item[1], reverse=True)
+        cell_plateau_scores = self._cell_plateau_scores(cell_scores)
         plateau_scores: Dict[str, float] = {}
         for key, backtest_ids in cell_backtests.items():
-            neighbors = self._neighbor_values(key, cell_scores)
-            center_score = cell_scores.get(key)
-            score = self._compute_plateau_score(center_score, neighbors)
+            score = cell_plateau_scores[key]
             for backtest_id in backtest_ids:
                 plateau_scores[backtest_id] = score
 
@@ -385,7 +388,7 @@ class HeatmapMatrixBuilder:
                 "y": cell_key[1],
                 "score": float(score),
                 "sample_count": len(cell_backtests.get(cell_key, [])),
-                "plateau_score": self._compute_plateau_score(score, self._neighbor_values(cell_key, cell_scores)),
+                "plateau_score": cell_plateau_scores[cell_key],
             }
             for cell_key, score in sorted_cells[:12]
         ]
@@ -394,44 +397,85 @@ class HeatmapMatrixBuilder:
             "top_cells": top_cells,
         }
 
-    def _neighbor_values(
+    def _cell_plateau_scores(
         self,
-        cell_key: Tuple[Any, Any],
         cell_scores: Dict[Tuple[Any, Any], float],
-    ) -> List[float]:
-        x_value, y_value = cell_key
-        neighbors: List[float] = []
-        for (other_x, other_y), score in cell_scores.items():
-            if other_x == x_value and other_y == y_value:
-                continue
+    ) -> Dict[Tuple[Any, Any], float]:
+        """Score every cell against the cells within ``PLATEAU_NEIGHBOR_DISTANCE``.
+
+        Cells are hashed into square buckets one neighbor distance wide, so all
+        neighbors of a cell sit in its own bucket or the eight around it.  Each
+        bucket is scored against that 3x3 block in vectorized passes instead of
+        comparing every cell with every other cell.  Cells whose coordinates are
+        not numeric have no neighbors and score 0.
+        """
+
+        keys = list(cell_scores)
+        scores = np.array([cell_scores[key] for key in keys], dtype=float)
+        coords = np.full((len(keys), 2), np.nan)
+        for position, (x_value, y_value) in enumerate(keys):
             try:
-                x_distance = abs(float(other_x) - float(x_value))
-                y_distance = abs(float(other_y) - float(y_value))
-                if x_distance <= 1e-9 and y_distance <= 1e-9:
-                    continue
-                if x_distance <= 20 and y_distance <= 20:
-                    neighbors.append(score)
+                coords[position] = (float(x_value), float(y_value))
             except (TypeError, ValueError):
                 continue
-        return neighbors
+        plateau = np.zeros(len(keys))
+        # A hair wider than the distance keeps boundary neighbors in adjacent buckets.
+        bucket_width = self.PLATEAU_NEIGHBOR_DISTANCE * (1.0 + 1e-9)
+        buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for position in np.flatnonzero(np.isfinite(coords).all(axis=1)).tolist():
+            cell_x, cell_y = np.floor(coords[position] / bucket_width)
+            buckets[(int(cell_x), int(cell_y))].append(position)
+        for (bucket_x, bucket_y), members in buckets.items():
+            block = np.array(
+                [
+                    position
+                    for offset_x in (-1, 0, 1)
+                    for offset_y in (-1, 0, 1)
+                    for position in buckets.get((bucket_x + offset_x, bucket_y + offset_y), ())
+                ]
+            )
+            step = max(1, self.PLATEAU_BLOCK_ELEMENTS // len(block))
+            for start in range(0, len(members), step):
+                centers = np.array(members[start : start + step])
+                plateau[centers] = self._plateau_scores_against_block(
+                    center_coords=coords[centers],
+                    center_scores=scores[centers],
+                    block_coords=coords[block],
+                    block_scores=scores[block],
+                )
+        return {key: round(float(plateau[position]), 4) for position, key in enumerate(keys)}
 
-    @staticmethod
-    def _compute_plateau_score(center_score: Optional[float], neighbors: List[float]) -> float:
-        if center_score is None or not neighbors:
-            return 0.0
-        neighbor_mean = _safe_mean(neighbors)
-        if neighbor_mean is None:
-            return 0.0
-        neighbor_std = _safe_pstdev(neighbors)
-        threshold = center_score * 0.9 if center_score >= 0 else center_score * 1.1
-        if center_score >= 0:
-            passing = [value for value in neighbors if value >= threshold]
-        else:
-            passing = [value for value in neighbors if value >= center_score]
-        support = len(passing) / len(neighbors)
-        baseline = max(abs(center_score), 1.0)
-        stability = max(0.0, 1.0 - (neighbor_std / baseline))
-        return round((support * 0.6) + (stability * 0.4), 4)
+    def _plateau_scores_against_block(
+        self,
+        *,
+        center_coords: np.ndarray,
+        center_scores: np.ndarray,
+        block_coords: np.ndarray,
+        block_scores: np.ndarray,
+    ) -> np.ndarray:
+        x_distance = np.abs(block_coords[None, :, 0] - center_coords[:, None, 0])
+        y_distance = np.abs(block_coords[None, :, 1] - center_coords[:, None, 1])
+        neighbors = (
+            (x_distance <= self.PLATEAU_NEIGHBOR_DISTANCE)
+            & (y_distance <= self.PLATEAU_NEIGHBOR_DISTANCE)
+            & ~((x_distance <= 1e-9) & (y_distance <= 1e-9))
+        )
+        del x_distance, y_distance
+        counts = neighbors.sum(axis=1)
+        divisor = np.maximum(counts, 1)
+        # Moments are taken around the block mean to keep the variance well conditioned.
+        shift = float(block_scores.mean()) if block_scores.size else 0.0
+        shifted = block_scores - shift
+        weights = neighbors.astype(float)
+        shifted_mean = (weights @ shifted) / divisor
+        variance = np.maximum((weights @ (shifted**2)) / divisor - shifted_mean**2, 0.0)
+        del weights
+        neighbor_std = np.where(counts > 1, np.sqrt(variance), 0.0)
+        threshold = np.where(center_scores >= 0, center_scores * 0.9, center_scores)
+        support = (neighbors & (block_scores[None, :] >= threshold[:, None])).sum(axis=1) / divisor
+        baseline = np.maximum(np.abs(center_scores), 1.0)
+        stability = np.maximum(0.0, 1.0 - (neighbor_std / baseline))
+        return np.where(counts > 0, (support * 0.6) + (stability * 0.4), 0.0)
 
     def _build_stability_score(self, row: Dict[str, Any]) -> float:
         plateau = _required_float(row, "local_plateau_score")
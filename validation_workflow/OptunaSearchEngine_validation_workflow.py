@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 import optuna
 from optuna.samplers import GPSampler, NSGAIISampler, TPESampler
@@ -41,22 +42,8 @@ class OptunaSearchEngine:
         search_space: Iterable[SearchSpaceField | Dict[str, Any]],
         objective_fn: Callable[[Dict[str, Any], optuna.trial.Trial], float | List[float]],
     ) -> Dict[str, Any]:
-        mode = str(self.optimizer_config.get("mode", "single_objective")).strip().lower()
-        sampler_name = str(self.optimizer_config.get("sampler", "tpe")).strip().lower()
-        pruner_name = str(self.optimizer_config.get("pruner", "hyperband")).strip().lower()
-        n_trials = int(self.optimizer_config.get("n_trials", 50))
         timeout_seconds = self.optimizer_config.get("timeout_seconds")
-        directions = self._resolve_directions(mode)
-
-        study = optuna.create_study(
-            study_name=study_name,
-            directions=directions if len(directions) > 1 else None,
-            direction=directions[0] if len(directions) == 1 else None,
-            sampler=self._build_sampler(sampler_name),
-            pruner=self._build_pruner(pruner_name),
-            storage=self._storage_url(study_name),
-            load_if_exists=True,
-        )
+        study = self._create_study(study_name, constant_liar=False)
         normalized_space = [self._normalize_field(field) for field in search_space]
 
         def wrapped_objective(trial: optuna.trial.Trial):
@@ -66,15 +53,95 @@ class OptunaSearchEngine:
 
         study.optimize(
             wrapped_objective,
-            n_trials=n_trials,
+            n_trials=self._n_trials(),
             timeout=int(timeout_seconds) if timeout_seconds else None,
         )
+        return self._study_payload(study_name, study)
+
+    def optimize_batched(
+        self,
+        *,
+        study_name: str,
+        search_space: Iterable[SearchSpaceField | Dict[str, Any]],
+        batch_objective_fn: Callable[[List[Dict[str, Any]]], Sequence[Optional[float | List[float]]]],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Ask ``batch_size`` trials at once and tell all results back.
+
+        ``batch_objective_fn`` receives every suggested parameter set of one
+        batch so the caller can expand them into a single grouped engine batch.
+        It returns one value (or value list) per parameter set, in order;
+        ``None`` marks that trial as failed.  A TPE sampler uses the
+        constant-liar heuristic by default so trials asked together do not
+        collapse onto the same suggestion; the payload reports
+        ``constant_liar`` only for TPE, the one sampler that supports it.
+        Every asked trial is told before the next batch, or
+        marked failed if the batch raises, so SQLite storage never keeps
+        orphaned RUNNING trials.
+        """
+        size = self._batch_size(batch_size)
+        uses_tpe = self._uses_tpe(self._sampler_name())
+        constant_liar = uses_tpe and bool(self.optimizer_config.get("constant_liar", size > 1))
+        study = self._create_study(study_name, constant_liar=constant_liar)
+        normalized_space = [self._normalize_field(field) for field in search_space]
+        n_trials = self._n_trials()
+        timeout_seconds = self.optimizer_config.get("timeout_seconds")
+        deadline = (
+            time.monotonic() + float(timeout_seconds) if timeout_seconds else None
+        )
+        batches = 0
+        asked = 0
+        while asked < n_trials and (deadline is None or time.monotonic() < deadline):
+            trials = [study.ask() for _ in range(min(size, n_trials - asked))]
+            asked += len(trials)
+            try:
+                params = [
+                    {field.name: self._suggest(trial, field) for field in normalized_space}
+                    for trial in trials
+                ]
+                values = list(batch_objective_fn(params))
+                if len(values) != len(trials):
+                    raise ValueError(
+                        f"Batch objective returned {len(values)} results for {len(trials)} trials"
+                    )
+            except Exception:
+                for trial in trials:
+                    study.tell(trial, state=TrialState.FAIL)
+                raise
+            for trial, value in zip(trials, values):
+                if value is None:
+                    study.tell(trial, state=TrialState.FAIL)
+                else:
+                    study.tell(trial, value)
+            batches += 1
+        payload = self._study_payload(study_name, study)
+        payload["batch_size"] = size
+        payload["batches"] = batches
+        if uses_tpe:
+            payload["constant_liar"] = constant_liar
+        return payload
+
+    def _create_study(self, study_name: str, *, constant_liar: bool) -> optuna.study.Study:
+        directions = self._resolve_directions(self._mode())
+        return optuna.create_study(
+            study_name=study_name,
+            directions=directions if len(directions) > 1 else None,
+            direction=directions[0] if len(directions) == 1 else None,
+            sampler=self._build_sampler(self._sampler_name(), constant_liar=constant_liar),
+            pruner=self._build_pruner(self._pruner_name()),
+            storage=self._storage_url(study_name),
+            load_if_exists=True,
+        )
+
+    def _study_payload(self, study_name: str, study: optuna.study.Study) -> Dict[str, Any]:
+        mode = self._mode()
+        directions = self._resolve_directions(mode)
         completed_trials = [trial for trial in study.trials if trial.state == TrialState.COMPLETE]
         payload: Dict[str, Any] = {
             "study_name": study_name,
             "mode": mode,
-            "sampler": sampler_name,
-            "pruner": pruner_name,
+            "sampler": self._sampler_name(),
+            "pruner": self._pruner_name(),
             "n_trials": len(study.trials),
             "completed_trials": len(completed_trials),
             "failed_trials": len([trial for trial in study.trials if trial.state == TrialState.FAIL]),
@@ -88,7 +155,27 @@ class OptunaSearchEngine:
             payload["pareto_front"] = [self._serialize_trial(trial) for trial in getattr(study, "best_trials", [])]
         return payload
 
-    def _build_sampler(self, sampler_name: str):
+    def _mode(self) -> str:
+        return str(self.optimizer_config.get("mode", "single_objective")).strip().lower()
+
+    def _sampler_name(self) -> str:
+        return str(self.optimizer_config.get("sampler", "tpe")).strip().lower()
+
+    def _pruner_name(self) -> str:
+        return str(self.optimizer_config.get("pruner", "hyperband")).strip().lower()
+
+    def _n_trials(self) -> int:
+        return int(self.optimizer_config.get("n_trials", 50))
+
+    def _batch_size(self, batch_size: Optional[int]) -> int:
+        raw = batch_size if batch_size is not None else self.optimizer_config.get("batch_size", 1)
+        return max(1, int(raw or 1))
+
+    @staticmethod
+    def _uses_tpe(sampler_name: str) -> bool:
+        return sampler_name not in {"nsga2", "gp"}
+
+    def _build_sampler(self, sampler_name: str, *, constant_liar: bool = False):
         seed = self.optimizer_config.get("random_seed", 42)
         startup = int(self.optimizer_config.get("n_startup_trials", 20))
         multivariate = bool(self.optimizer_config.get("multivariate", True))
@@ -100,6 +187,7 @@ class OptunaSearchEngine:
             seed=seed,
             n_startup_trials=startup,
             multivariate=multivariate,
+            constant_liar=constant_liar,
         )
 
     @staticmethod
@@ -4,7 +4,9 @@ This runner is deliberately backend-only.  It executes the selected-optimum WFA
 contract against the unified Rust EngineRequest service:
 
 1. enumerate candidate policies from strategy parameter domains;
-2. run every candidate inside the IS/train window;
+2. run every candidate inside the IS/train window, or, with an
+   ``optimizer.type="optuna"`` block, the candidates an Optuna study asks for
+   in batches;
 3. select rank 1 by objective;
 4. run only that selected policy on the paired OOS/test window.
 """
@@ -17,6 +19,7 @@ import json
 import math
 from pathlib import Path
 import tempfile
+import threading
 from typing import Any, Dict, List, Optional, cast
 
 import numpy as np
@@ -33,17 +36,19 @@ from backtester.EngineRequest_backtester import (
 from backtester.StrategyRunConfig_backtester import (
     expand_parameter_combinations,
     normalize_strategy_run_config,
+    parameter_domain_values,
 )
 from backtester.UnifiedBacktestRunner_backtester import UnifiedBacktestRunnerBacktester
-from dataloader.market_data_bundle import (
-    ExternalMarketData,
-    ExecutionStreamSpec,
-    MarketDataBundle,
-    SessionWindow,
-    build_market_data_bundle,
-)
-from dataloader.market_data_loader import market_data_spec_from_requirements
+from dataloader.market_data_bundle import MarketDataBundle
 from metricstracker.MetricConfig_metricstracker import resolve_metric_config
+from validation_workflow.OptunaSearchEngine_validation_workflow import (
+    OptunaSearchEngine,
+)
+from validation_workflow.WFAWindowScheduler_validation_workflow import (
+    WFAWindowScheduler,
+)
+
+_OPTUNA_DEFAULT_BATCH_SIZE = 8
 
 
 @dataclass
@@ -112,6 +117,7 @@ class UnifiedPortfolioWFARunner:
         self.selection_constraints = self._resolve_selection_constraints()
         self._last_windowing_metadata: Dict[str, Any] = {}
         self._metrics_annualization: Dict[str, Any] = {}
+        self._metrics_annualization_lock = threading.Lock()
         self._warmup_projection_evidence: List[Dict[str, Any]] = []
         self._derived_bar_cache_evidence: List[Dict[str, Any]] = []
 
@@ -124,121 +130,42 @@ class UnifiedPortfolioWFARunner:
         selected_rows: List[Dict[str, Any]] = []
         diagnostic_rows: List[Dict[str, Any]] = []
         window_backtests: List[Dict[str, Any]] = []
+        optuna_studies: List[Dict[str, Any]] = []
         train_backend_counts: Dict[str, int] = {}
 
-        for window_id, window in enumerate(windows, start=1):
-            train_warmup = self._required_warmup_sessions(window["train_start"])
-            test_warmup = self._required_warmup_sessions(window["test_start"])
-            self._warmup_projection_evidence.extend(
-                [
-                    {
-                        "window_id": window_id,
-                        "scope": "train",
-                        **train_warmup,
-                    },
-                    {
-                        "window_id": window_id,
-                        "scope": "test",
-                        **test_warmup,
-                    },
-                ]
-            )
-            train_data = self._slice_market_data(
-                window["train_start"],
-                window["train_end"],
-                warmup_sessions=int(train_warmup["required_execution_sessions"]),
+        scheduler: WFAWindowScheduler[Dict[str, Any], Optional[Dict[str, Any]]] = (
+            WFAWindowScheduler(
+                max_parallel_windows=self._max_parallel_windows(len(windows)),
+                memory_budget_bytes=self._window_memory_budget_bytes(),
             )
-            test_data = self._slice_market_data(
-                window["test_start"],
-                window["test_end"],
-                warmup_sessions=int(test_warmup["required_execution_sessions"]),
-            )
-            if train_data["close"].empty or test_data["close"].empty:
-                continue
-            oos_cache: Dict[str, Dict[str, Any]] = {}
-
-            train_results, train_backend = self._run_train_candidates(
+        )
+        outcomes = scheduler.run(
+            list(range(1, len(windows) + 1)),
+            prepare=lambda window_id: self._prepare_window(
+                window_id, windows[window_id - 1]
+            ),
+            execute=lambda window_id, prepared: self._run_window(
+                window_id,
+                prepared,
                 candidates=candidates,
-                train_data=train_data,
-                train_size=self._evaluation_session_count(
-                    window["train_start"], window["train_end"]
-                ),
-                window_id=window_id,
-                evaluation_start=window["train_start"],
-                evaluation_end=window["train_end"],
-            )
+                all_candidates=all_candidates,
+                budget_metadata=budget_metadata,
+                workflow=workflow,
+            ),
+        )
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            train_backend = outcome["train_backend"]
             train_backend_counts[train_backend] = train_backend_counts.get(train_backend, 0) + 1
-            for item in train_results:
-                validation = getattr(item.get("train_result"), "validation_report", {})
-                cache = (
-                    validation.get("derived_bar_cache")
-                    if isinstance(validation, dict)
-                    else None
-                )
-                if isinstance(cache, dict) and cache not in self._derived_bar_cache_evidence:
+            for cache in outcome["derived_bar_caches"]:
+                if cache not in self._derived_bar_cache_evidence:
                     self._derived_bar_cache_evidence.append(copy.deepcopy(cache))
-            for item in train_results:
-                diagnostic_rows.append(
-                    self._candidate_row(
-                        window_id=window_id,
-                        window=window,
-                        candidate=item["candidate"],
-                        metrics=item["metrics"],
-                        viability=item["viability"],
-                        train_backend=train_backend,
-                    )
-                )
-
-            for objective in self.objectives:
-                selected = self._select_candidate(train_results, objective)
-                cached_oos = self._oos_result_for_candidate(
-                    cache=oos_cache,
-                    candidate=selected["candidate"],
-                    test_data=test_data,
-                    evaluation_start=window["test_start"],
-                    evaluation_end=window["test_end"],
-                )
-                test_result = copy.deepcopy(cached_oos["result"])
-                backtest_id = self._window_backtest_id(
-                    window_id=window_id,
-                    objective=objective,
-                    params=selected["candidate"]["params"],
-                )
-                self._tag_window_backtest_result(
-                    test_result,
-                    backtest_id=backtest_id,
-                    window_id=window_id,
-                    objective=objective,
-                    window=window,
-                    params=selected["candidate"]["params"],
-                    workflow=workflow,
-                )
-                selected_rows.append(
-                    self._selected_row(
-                        window_id=window_id,
-                        window=window,
-                        objective=objective,
-                        selected=selected,
-                        test_result=test_result,
-                        oos_metrics=dict(cached_oos["metrics"]),
-                        candidate_count=len(candidates),
-                        total_candidate_count=len(all_candidates),
-                        candidate_budget_metadata=budget_metadata,
-                        workflow=workflow,
-                    )
-                )
-                window_backtests.append(
-                    {
-                        "window_id": window_id,
-                        "objective": objective,
-                        "backtest_id": backtest_id,
-                        "params": selected["candidate"]["params"],
-                        "is_equity_curve": selected["train_result"].equity_curve,
-                        "oos_equity_curve": test_result.equity_curve,
-                        "oos_portfolio_snapshot": self._portfolio_snapshot(test_result),
-                        "oos_result": test_result,
-                    }
-                )
+            diagnostic_rows.extend(outcome["diagnostic_rows"])
+            selected_rows.extend(outcome["selected_rows"])
+            window_backtests.extend(outcome["window_backtests"])
+            if outcome["optuna_study"] is not None:
+                optuna_studies.append(outcome["optuna_study"])
 
         selected_frame = pd.DataFrame(selected_rows)
         diagnostic_frame = pd.DataFrame(diagnostic_rows)
@@ -264,7 +191,9 @@ class UnifiedPortfolioWFARunner:
                 ),
                 "selection_constraints": self.selection_constraints,
                 "window_count": len(windows),
+                "window_scheduler": scheduler.report(),
                 "train_backend_counts": train_backend_counts,
+                **({"optuna_studies": optuna_studies} if optuna_studies else {}),
                 "market_data_bundle_id": self.market_data_bundle.bundle_id,
                 "market_data_bundle_hash": self.market_data_bundle.content_hash,
                 "market_data_bundle_manifest": str(self.market_data_bundle.manifest_path),
@@ -273,6 +202,182 @@ class UnifiedPortfolioWFARunner:
             },
         )
 
+    def _prepare_window(
+        self, window_id: int, window: Dict[str, pd.Timestamp]
+    ) -> tuple[Dict[str, Any], int]:
+        """Project warmup and slice one window; runs in window order."""
+        train_warmup = self._required_warmup_sessions(window["train_start"])
+        test_warmup = self._required_warmup_sessions(window["test_start"])
+        self._warmup_projection_evidence.extend(
+            [
+                {
+                    "window_id": window_id,
+                    "scope": "train",
+                    **train_warmup,
+                },
+                {
+                    "window_id": window_id,
+                    "scope": "test",
+                    **test_warmup,
+                },
+            ]
+        )
+        train_data = self._slice_market_data(
+            window["train_start"],
+            window["train_end"],
+            warmup_sessions=int(train_warmup["required_execution_sessions"]),
+        )
+        test_data = self._slice_market_data(
+            window["test_start"],
+            window["test_end"],
+            warmup_sessions=int(test_warmup["required_execution_sessions"]),
+        )
+        window_bytes = sum(
+            int(frame.memory_usage(index=True, deep=True).sum())
+            for frame in (*train_data.values(), *test_data.values())
+        )
+        return {
+            "window": window,
+            "train_data": train_data,
+            "test_data": test_data,
+        }, window_bytes
+
+    def _run_window(
+        self,
+        window_id: int,
+        prepared: Dict[str, Any],
+        *,
+        candidates: List[Dict[str, Any]],
+        all_candidates: List[Dict[str, Any]],
+        budget_metadata: Dict[str, Any],
+        workflow: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Run train candidates and selected OOS policies for one window.
+
+        Returns the rows this window contributes, or ``None`` when either
+        slice is empty.  Shared runner state is only touched by the caller
+        when outcomes are merged, so windows can run concurrently.
+        """
+        window = prepared["window"]
+        train_data = prepared["train_data"]
+        test_data = prepared["test_data"]
+        if train_data["close"].empty or test_data["close"].empty:
+            return None
+        oos_cache: Dict[str, Dict[str, Any]] = {}
+        selected_rows: List[Dict[str, Any]] = []
+        window_backtests: List[Dict[str, Any]] = []
+
+        train_kwargs: Dict[str, Any] = {
+            "candidates": candidates,
+            "train_data": train_data,
+            "train_size": self._evaluation_session_count(
+                window["train_start"], window["train_end"]
+            ),
+            "window_id": window_id,
+            "evaluation_start": window["train_start"],
+            "evaluation_end": window["train_end"],
+        }
+        optimizer = self._optuna_optimizer()
+        optuna_study: Optional[Dict[str, Any]] = None
+        if optimizer is not None:
+            train_results, train_backend, optuna_study = (
+                self._run_optuna_train_candidates(optimizer, **train_kwargs)
+            )
+        else:
+            train_results, train_backend = self._run_train_candidates(**train_kwargs)
+        derived_bar_caches: List[Dict[str, Any]] = []
+        for item in train_results:
+            validation = getattr(item.get("train_result"), "validation_report", {})
+            cache = (
+                validation.get("derived_bar_cache")
+                if isinstance(validation, dict)
+                else None
+            )
+            if isinstance(cache, dict):
+                derived_bar_caches.append(cache)
+        diagnostic_rows = [
+            self._candidate_row(
+                window_id=window_id,
+                window=window,
+                candidate=item["candidate"],
+                metrics=item["metrics"],
+                viability=item["viability"],
+                train_backend=train_backend,
+            )
+            for item in train_results
+        ]
+
+        for objective in self.objectives:
+            selected = self._select_candidate(train_results, objective)
+            cached_oos = self._oos_result_for_candidate(
+                cache=oos_cache,
+                candidate=selected["candidate"],
+                test_data=test_data,
+                evaluation_start=window["test_start"],
+                evaluation_end=window["test_end"],
+            )
+            test_result = copy.deepcopy(cached_oos["result"])
+            backtest_id = self._window_backtest_id(
+                window_id=window_id,
+                objective=objective,
+                params=selected["candidate"]["params"],
+            )
+            self._tag_window_backtest_result(
+                test_result,
+                backtest_id=backtest_id,
+                window_id=window_id,
+                objective=objective,
+                window=window,
+                params=selected["candidate"]["params"],
+                workflow=workflow,
+            )
+            selected_rows.append(
+                self._selected_row(
+                    window_id=window_id,
+                    window=window,
+                    objective=objective,
+                    selected=selected,
+                    test_result=test_result,
+                    oos_metrics=dict(cached_oos["metrics"]),
+                    candidate_count=len(train_results),
+                    total_candidate_count=len(all_candidates),
+                    candidate_budget_metadata=budget_metadata,
+                    workflow=workflow,
+                )
+            )
+            window_backtests.append(
+                {
+                    "window_id": window_id,
+                    "objective": objective,
+                    "backtest_id": backtest_id,
+                    "params": selected["candidate"]["params"],
+                    "is_equity_curve": selected["train_result"].equity_curve,
+                    "oos_equity_curve": test_result.equity_curve,
+                    "oos_portfolio_snapshot": self._portfolio_snapshot(test_result),
+                    "oos_result": test_result,
+                }
+            )
+        return {
+            "train_backend": train_backend,
+            "derived_bar_caches": derived_bar_caches,
+            "diagnostic_rows": diagnostic_rows,
+            "selected_rows": selected_rows,
+            "window_backtests": window_backtests,
+            "optuna_study": optuna_study,
+        }
+
+    def _max_parallel_windows(self, window_count: int) -> int:
+        windowing = self.wfa_config.get("windowing", {}) if isinstance(self.wfa_config.get("windowing"), dict) else {}
+        return self._positive_int(
+            windowing.get("max_parallel_windows"),
+            default=WFAWindowScheduler.default_parallelism(window_count),
+        )
+
+    def _window_memory_budget_bytes(self) -> Optional[int]:
+        windowing = self.wfa_config.get("windowing", {}) if isinstance(self.wfa_config.get("windowing"), dict) else {}
+        budget_mb = self._positive_int(windowing.get("window_memory_budget_mb"), default=0)
+        return budget_mb * 1024 * 1024 if budget_mb > 0 else None
+
     def _run_train_candidates(
         self,
         *,
@@ -308,6 +413,108 @@ class UnifiedPortfolioWFARunner:
             "train-window artifacts; WFA has no Python engine fallback"
         )
 
+    def _optuna_optimizer(self) -> Optional[Dict[str, Any]]:
+        """The optimizer block when it asks Optuna to search the parameter grid."""
+        optimizer = self.wfa_config.get("optimizer", {}) if isinstance(self.wfa_config.get("optimizer"), dict) else {}
+        if str(optimizer.get("type") or "").strip().lower() != "optuna":
+            return None
+        domains = self.strategy_config.get("parameter_domains")
+        if not isinstance(domains, dict) or not domains:
+            return None
+        return optimizer
+
+    def _run_optuna_train_candidates(
+        self,
+        optimizer: Dict[str, Any],
+        *,
+        candidates: List[Dict[str, Any]],
+        train_data: Dict[str, pd.DataFrame],
+        train_size: int,
+        window_id: int,
+        evaluation_start: pd.Timestamp,
+        evaluation_end: pd.Timestamp,
+    ) -> tuple[List[Dict[str, Any]], str, Dict[str, Any]]:
+        """Train the grid candidates an Optuna study asks for.
+
+        Every asked batch maps onto grid candidates and trains the unseen ones
+        as one Rust batch; a repeated suggestion reuses its earlier score.
+        Trials are scored on the first objective, and only the candidates
+        trained here enter selection.
+        """
+        by_suffix = {
+            canonical_parameter_suffix(candidate["params"]): candidate
+            for candidate in candidates
+        }
+        domains = self.strategy_config["parameter_domains"]
+        search_space = [
+            {
+                "name": str(name),
+                "type": "categorical",
+                "choices": parameter_domain_values(spec),
+            }
+            for name, spec in domains.items()
+        ]
+        metric_key = self._objective_metric_key(self.objectives[0])
+        trained: Dict[str, Dict[str, Any]] = {}
+        backends: List[str] = []
+
+        def batch_objective(params_list: List[Dict[str, Any]]) -> List[Optional[float]]:
+            asked = [by_suffix[canonical_parameter_suffix(params)] for params in params_list]
+            batch: List[Dict[str, Any]] = []
+            for candidate in asked:
+                if candidate["candidate_id"] not in trained and candidate not in batch:
+                    batch.append(candidate)
+            if batch:
+                items, backend = self._run_train_candidates(
+                    candidates=batch,
+                    train_data=train_data,
+                    train_size=train_size,
+                    window_id=window_id,
+                    evaluation_start=evaluation_start,
+                    evaluation_end=evaluation_end,
+                )
+                backends.append(backend)
+                for candidate, item in zip(batch, items):
+                    trained[candidate["candidate_id"]] = item
+            return [
+                self._finite_float(
+                    trained[candidate["candidate_id"]]["metrics"].get(metric_key)
+                )
+                for candidate in asked
+            ]
+
+        engine_config = {
+            **optimizer,
+            "mode": "single_objective",
+            "random_seed": self._nonnegative_int(
+                self._first_present(optimizer.get("random_seed"), self.wfa_config.get("random_seed")),
+                default=42,
+            ),
+        }
+        study = OptunaSearchEngine(engine_config).optimize_batched(
+            study_name=f"{self.workflow_id}_window_{window_id:03d}",
+            search_space=search_space,
+            batch_objective_fn=batch_objective,
+            batch_size=self._positive_int(
+                optimizer.get("batch_size"), default=_OPTUNA_DEFAULT_BATCH_SIZE
+            ),
+        )
+        summary = {
+            "window_id": window_id,
+            "objective": metric_key,
+            "sampler": study["sampler"],
+            "n_trials": study["n_trials"],
+            "completed_trials": study["completed_trials"],
+            "batch_size": study["batch_size"],
+            "batches": study["batches"],
+            "trained_candidate_count": len(trained),
+        }
+        if "constant_liar" in study:
+            summary["constant_liar"] = study["constant_liar"]
+        if not trained:
+            raise ValueError("Optuna search trained no WFA candidates")
+        return list(trained.values()), backends[0], summary
+
     def _oos_result_for_candidate(
         self,
         *,
@@ -388,22 +595,10 @@ class UnifiedPortfolioWFARunner:
             candidate_count=len(variants),
             portfolio_config=first_config,
         )
+        market_data_bundle = self._market_data_bundle_window(market_data)
         results: List[Any] = []
-        with tempfile.TemporaryDirectory(prefix="lo2cin4bt-wfa-bundle-") as temporary_root:
+        with tempfile.TemporaryDirectory(prefix="lo2cin4bt-wfa-results-") as temporary_root:
             root = Path(temporary_root)
-            slice_spec = market_data_spec_from_requirements(
-                base_request["data_requirements"],
-                base_request["strategy"]["stream_binding"],
-            )
-            source_manifest = self.market_data_bundle.read_manifest()
-            slice_spec["adjustment_policy"] = source_manifest["lineage"][
-                "adjustment_policy"
-            ]
-            market_data_bundle = build_market_data_bundle(
-                self._external_market_data_slice(market_data),
-                spec=slice_spec,
-                output_root=root / "market_data_bundle",
-            )
             for chunk_index, start in enumerate(range(0, len(variants), chunk_size)):
                 chunk = variants[start : start + chunk_size]
                 chunk_config = dict(cast(Dict[str, Any], chunk[0]["config"]))
@@ -446,33 +641,24 @@ class UnifiedPortfolioWFARunner:
             return min(candidate_count, 16)
         return min(candidate_count, max(1, size))
 
-    def _external_market_data_slice(
+    def _market_data_bundle_window(
         self,
         market_data: Dict[str, pd.DataFrame],
-    ) -> ExternalMarketData:
-        manifest = self.market_data_bundle.read_manifest()
-        execution_stream = ExecutionStreamSpec.from_mapping(
-            manifest["execution_stream"]
-        )
+    ) -> MarketDataBundle:
+        """Reference a window slice as a row range of the parent bundle."""
         close = market_data.get("close")
         if not isinstance(close, pd.DataFrame) or close.empty:
             raise ValueError("WFA market-data slice requires close")
-        timeline = self.market_data_bundle.load_execution_timeline().reindex(close.index)
-        if timeline.isna().any().any():
+        positions = self.execution_timeline.index.get_indexer(close.index)
+        start_row = int(positions[0])
+        if start_row < 0 or not np.array_equal(
+            positions, np.arange(start_row, start_row + len(positions))
+        ):
             raise ValueError(
-                "WFA market-data slice does not align with the execution timeline"
+                "WFA market-data slice must be a contiguous range of the execution timeline"
             )
-        labels = set(str(item) for item in timeline["session_label"].tolist())
-        windows = [
-            SessionWindow.from_mapping(item)
-            for item in manifest["session_windows"]
-            if str(item.get("session_label") or "") in labels
-        ]
-        return ExternalMarketData(
-            frames=market_data,
-            execution_stream=execution_stream,
-            execution_timeline=timeline,
-            session_windows=windows,
+        return self.market_data_bundle.with_row_window(
+            start_row, start_row + len(positions)
         )
 
     def _candidate_engine_config(
@@ -628,7 +814,8 @@ class UnifiedPortfolioWFARunner:
             self.wfa_config.get("candidate_limit"),
         )
         budget = self._positive_int(raw_budget, default=0)
-        if budget <= 0 or budget >= len(candidates):
+        # An Optuna study searches the whole grid; n_trials bounds its trials.
+        if budget <= 0 or budget >= len(candidates) or self._optuna_optimizer() is not None:
             return candidates
         seed = self._nonnegative_int(
             self._first_present(optimizer.get("random_seed"), self.wfa_config.get("random_seed")),
@@ -657,7 +844,10 @@ class UnifiedPortfolioWFARunner:
             self._first_present(optimizer.get("random_seed"), self.wfa_config.get("random_seed")),
             default=42,
         )
-        method = "seeded_random_sample" if applied else "full_grid"
+        if self._optuna_optimizer() is not None:
+            method = "optuna_search" if applied else "full_grid"
+        else:
+            method = "seeded_random_sample" if applied else "full_grid"
         return {
             "candidate_budget": budget if budget > 0 else None,
             "candidate_budget_applied": applied,
@@ -1468,9 +1658,10 @@ class UnifiedPortfolioWFARunner:
         annualization = row.get("Annualization")
         if not isinstance(annualization, dict):
             raise ValueError("WFA Rust metrics did not return annualization evidence")
-        if self._metrics_annualization and self._metrics_annualization != annualization:
-            raise ValueError("WFA Rust metrics annualization contract changed within one run")
-        self._metrics_annualization = copy.deepcopy(annualization)
+        with self._metrics_annualization_lock:
+            if self._metrics_annualization and self._metrics_annualization != annualization:
+                raise ValueError("WFA Rust metrics annualization contract changed within one run")
+            self._metrics_annualization = copy.deepcopy(annualization)
 
         def required_finite(metric_name: str) -> float:
             parsed = UnifiedPortfolioWFARunner._finite_float(row.get(metric_name))
@@ -0,0 +1,153 @@
+"""Bounded concurrent scheduler for independent WFA windows.
+
+WFA windows only share read-only market data, so their train/OOS engine runs
+can overlap on the engine service worker pool.  The scheduler prepares windows
+in order on the calling thread, admits them while both the parallelism cap and
+the market-data memory budget allow, and returns outcomes in window order so
+the exported rows stay byte-identical to a sequential run.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+PreparedT = TypeVar("PreparedT")
+OutcomeT = TypeVar("OutcomeT")
+
+
+class WFAWindowScheduler(Generic[PreparedT, OutcomeT]):
+    """Run prepared windows concurrently and merge outcomes deterministically.
+
+    ``prepare(window_id)`` runs on the calling thread in window order and returns
+    the prepared state plus its resident market-data bytes.  ``execute`` runs on
+    a worker thread.  A window is admitted once fewer than
+    ``max_parallel_windows`` are in flight and its bytes fit in the remaining
+    ``memory_budget_bytes``; a window that exceeds the budget on its own still
+    runs, alone, so the schedule always makes progress.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_parallel_windows: int,
+        memory_budget_bytes: Optional[int] = None,
+    ) -> None:
+        self.max_parallel_windows = max(1, int(max_parallel_windows))
+        self.memory_budget_bytes = (
+            None if memory_budget_bytes is None else max(0, int(memory_budget_bytes))
+        )
+        self._windows: Dict[int, Dict[str, Any]] = {}
+        self._peak_inflight_windows = 0
+        self._peak_inflight_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_parallelism(window_count: int) -> int:
+        return max(1, min(int(window_count), os.cpu_count() or 1))
+
+    def run(
+        self,
+        window_ids: List[int],
+        *,
+        prepare: Callable[[int], Tuple[PreparedT, int]],
+        execute: Callable[[int, PreparedT], OutcomeT],
+    ) -> List[OutcomeT]:
+        if self.max_parallel_windows == 1 or len(window_ids) <= 1:
+            return [
+                self._execute_tracked(window_id, *prepare(window_id), execute)
+                for window_id in window_ids
+            ]
+
+        outcomes: Dict[int, OutcomeT] = {}
+        failures: Dict[int, BaseException] = {}
+        inflight: Dict[Future[OutcomeT], Tuple[int, int]] = {}
+        inflight_bytes = 0
+        pending = list(window_ids)
+        prepared: Optional[Tuple[int, PreparedT, int]] = None
+
+        def collect(done: set[Future[OutcomeT]]) -> None:
+            nonlocal inflight_bytes
+            for future in done:
+                window_id, window_bytes = inflight.pop(future)
+                inflight_bytes -= window_bytes
+                error = future.exception()
+                if error is not None:
+                    failures[window_id] = error
+                else:
+                    outcomes[window_id] = future.result()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_windows,
+            thread_name_prefix="lo2cin4bt-wfa-window",
+        ) as executor:
+            while (pending or prepared is not None) and not failures:
+                if prepared is None:
+                    window_id = pending.pop(0)
+                    try:
+                        state, window_bytes = prepare(window_id)
+                    except BaseException as exc:  # noqa: BLE001 - re-raised in order below
+                        failures[window_id] = exc
+                        break
+                    prepared = (window_id, state, max(0, int(window_bytes)))
+                window_id, state, window_bytes = prepared
+                if inflight and not self._admits(len(inflight), inflight_bytes, window_bytes):
+                    done, _ = wait(list(inflight), return_when=FIRST_COMPLETED)
+                    collect(done)
+                    continue
+                future = executor.submit(
+                    self._execute_tracked, window_id, state, window_bytes, execute
+                )
+                inflight[future] = (window_id, window_bytes)
+                inflight_bytes += window_bytes
+                self._peak_inflight_windows = max(self._peak_inflight_windows, len(inflight))
+                self._peak_inflight_bytes = max(self._peak_inflight_bytes, inflight_bytes)
+                prepared = None
+            if inflight:
+                done, _ = wait(list(inflight))
+                collect(done)
+
+        if failures:
+            raise failures[min(failures)]
+        return [outcomes[window_id] for window_id in window_ids]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "schema_version": "wfa_window_scheduler.v1",
+            "max_parallel_windows": self.max_parallel_windows,
+            "memory_budget_bytes": self.memory_budget_bytes,
+            "peak_inflight_windows": self._peak_inflight_windows,
+            "peak_inflight_bytes": self._peak_inflight_bytes,
+            "windows": [self._windows[key] for key in sorted(self._windows)],
+        }
+
+    def _admits(self, inflight_count: int, inflight_bytes: int, window_bytes: int) -> bool:
+        if inflight_count >= self.max_parallel_windows:
+            return False
+        if self.memory_budget_bytes is None:
+            return True
+        return inflight_bytes + window_bytes <= self.memory_budget_bytes
+
+    def _execute_tracked(
+        self,
+        window_id: int,
+        state: PreparedT,
+        window_bytes: int,
+        execute: Callable[[int, PreparedT], OutcomeT],
+    ) -> OutcomeT:
+        if self.max_parallel_windows == 1:
+            self._peak_inflight_windows = 1
+            self._peak_inflight_bytes = max(self._peak_inflight_bytes, window_bytes)
+        started = time.perf_counter()
+        try:
+            return execute(window_id, state)
+        finally:
+            with self._lock:
+                self._windows[window_id] = {
+                    "window_id": window_id,
+                    "market_data_bytes": window_bytes,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+                }